@@ -46,12 +46,27 @@ try { $expected = co_token(); } catch (Throwable $e) { be_json_response(503, ['s
 if (!hash_equals($expected, co_header_token())) { be_json_response(401, ['status'=>'error','message'=>'Content Ops ingest access denied.']); }
 $raw = file_get_contents('php://input') ?: '';
 if (strlen($raw) > 5 * 1024 * 1024) { be_json_response(413, ['status'=>'error','message'=>'Payload too large.']); }
-$payload = json_decode($raw, true);
-if (!is_array($payload)) { be_json_response(400, ['status'=>'error','message'=>'Invalid JSON.']); }
-$runs = isset($payload['runs']) && is_array($payload['runs']) ? $payload['runs'] : [$payload];
+// Bulk-Modus: gzip-komprimiertes NDJSON, eine Run-Payload pro Zeile.
+if (stripos(be_request_header('Content-Encoding'), 'gzip') !== false) {
+    $raw = @gzdecode($raw, 20 * 1024 * 1024);
+    if (!is_string($raw)) { be_json_response(400, ['status'=>'error','message'=>'Invalid gzip body.']); }
+}
+if (stripos((string)($_SERVER['CONTENT_TYPE'] ?? ''), 'application/x-ndjson') !== false) {
+    $runs = [];
+    foreach (preg_split('/\r?\n/', $raw) ?: [] as $line) {
+        if (trim($line) === '') { continue; }
+        $run = json_decode($line, true);
+        if (!is_array($run)) { be_json_response(400, ['status'=>'error','message'=>'Invalid NDJSON line.']); }
+        $runs[] = $run;
+    }
+} else {
+    $payload = json_decode($raw, true);
+    if (!is_array($payload)) { be_json_response(400, ['status'=>'error','message'=>'Invalid JSON.']); }
+    $runs = isset($payload['runs']) && is_array($payload['runs']) ? $payload['runs'] : [$payload];
+}
 
 try {
-    $pdo = be_db(); co_schema($pdo); $pdo->beginTransaction(); $stored = 0;
+    $pdo = be_db(); co_schema($pdo); $pdo->beginTransaction(); $stored = 0; $confirmed = [];
     $runStmt = $pdo->prepare("INSERT INTO content_ops_run (run_fingerprint,generated_at_utc,environment,branch_name,workflow_name,github_run_id,github_run_url,source_mode,status,action_required,summary_json,metrics_json,findings_json) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?) ON DUPLICATE KEY UPDATE generated_at_utc=VALUES(generated_at_utc),status=VALUES(status),action_required=VALUES(action_required),summary_json=VALUES(summary_json),metrics_json=VALUES(metrics_json),findings_json=VALUES(findings_json)");
     $metricStmt = $pdo->prepare("INSERT INTO content_ops_metric_daily (metric_date,environment,metric_key,metric_scope,dimension_key,metric_value,source_mode,run_fingerprint,dimensions_json) VALUES (?,?,?,?,?,?,?,?,?) ON DUPLICATE KEY UPDATE metric_value=VALUES(metric_value),dimensions_json=VALUES(dimensions_json)");
     $findStmt = $pdo->prepare("INSERT INTO content_ops_action_log (action_fingerprint,generated_at_utc,environment,source_mode,source_workflow,action_type,finding_type,entity_type,entity_id,title,severity,confidence,user_action_required,status,run_fingerprint,details_json) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?) ON DUPLICATE KEY UPDATE severity=VALUES(severity),confidence=VALUES(confidence),user_action_required=VALUES(user_action_required),details_json=VALUES(details_json)");
@@ -62,13 +77,13 @@ try {
         if ($fp === '' || $mode === '') { continue; }
         $generated = co_dt((string)($run['generated_at_utc'] ?? '')); $date = substr($generated, 0, 10); $env = co_key((string)($run['environment'] ?? 'unknown'), 32) ?: 'unknown';
         $metrics = is_array($run['metrics'] ?? null) ? $run['metrics'] : []; $findings = is_array($run['findings'] ?? null) ? $run['findings'] : []; $effects = is_array($run['rule_effects'] ?? null) ? $run['rule_effects'] : [];
-        $runStmt->execute([$fp,$generated,$env,co_key((string)($run['branch']??''),64),co_text((string)($run['workflow']??''),191),co_text((string)($run['github_run_id']??''),64),co_text((string)($run['github_run_url']??''),512),$mode,co_key((string)($run['status']??'ok'),80),!empty($run['action_required'])?1:0,co_json(is_array($run['summary']??null)?$run['summary']:[]),co_json($metrics),co_json(array_slice($findings,0,300))]);
+        $runStmt->execute([$fp,$generated,$env,co_key((string)($run['branch']??''),64),co_text((string)($run['workflow']??''),191),co_text((string)($run['github_run_id']??''),64),co_text((string)($run['github_run_url']??''),512),$mode,co_key((string)($run['status']??'ok'),80),!empty($run['action_required'])?1:0,co_json(is_array($run['summary']??null)?$run['summary']:[]),co_json($metrics),co_json($findings)]);
         foreach ($metrics as $m) { if (!is_array($m)) { continue; } $mk=co_key((string)($m['metric_key']??''),160); if ($mk==='') { continue; } $metricStmt->execute([$date,$env,$mk,co_key((string)($m['metric_scope']??'run'),80)?:'run',co_text((string)($m['dimension_key']??''),191),(float)($m['metric_value']??0),$mode,$fp,co_json(is_array($m['dimensions']??null)?$m['dimensions']:[])]); }
         foreach ($findings as $f) { if (!is_array($f)) continue; $manual=!empty($f['user_action_required']); $findStmt->execute([co_finding_fp($env,$mode,$f),$generated,$env,$mode,co_text((string)($f['source_workflow']??''),191),co_key((string)($f['safe_action']??'observe'),120)?:'observe',co_key((string)($f['finding_type']??''),191),co_key((string)($f['entity_type']??'system'),80)?:'system',co_text((string)($f['entity_id']??''),191),co_text((string)($f['title']??''),255),co_key((string)($f['severity']??'info'),40)?:'info',co_key((string)($f['confidence']??'observed'),80)?:'observed',$manual?1:0,$manual?'open':'auto_routed',$fp,co_json(is_array($f['details']??null)?$f['details']:[])]); }
         foreach ($effects as $e) { if (!is_array($e)) continue; $rk=co_text((string)($e['rule_key']??''),191); if ($rk==='') continue; $effStmt->execute([$date,$env,$rk,co_key((string)($e['rule_type']??''),80),co_key((string)($e['rule_class']??''),120),(int)($e['applied_count']??0),(int)($e['prevented_count']??0),(int)($e['recurrence_count']??0),(int)($e['false_positive_count']??0),$mode,$fp,co_json(is_array($e['details']??null)?$e['details']:[])]); }
-        $stored++;
+        $stored++; $confirmed[] = $fp;
     }
-    $pdo->commit(); be_json_response(200, ['status'=>'ok','stored_runs'=>$stored]);
+    $pdo->commit(); be_json_response(200, ['status'=>'ok','stored_runs'=>$stored,'confirmed'=>$confirmed]);
 } catch (Throwable $e) {
     if (isset($pdo) && $pdo instanceof PDO && $pdo->inTransaction()) { $pdo->rollBack(); }
     be_json_response(500, ['status'=>'error','message'=>'Content Ops ingest failed.','error_class'=>get_class($e),'error_message'=>$e->getMessage()]);
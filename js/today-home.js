@@ -197,6 +197,40 @@
     }
   }
 
+  /* === BEGIN BLOCK: TODAY_EVENT_FEED_SHARD_V1 | Zweck: Heute lädt nur den kleinen 28-Tage-Shard aus dem Event-Feed-Manifest statt des kompletten events.json; Umfang: Fallback auf /data/events.json, wenn Manifest/Shard fehlen oder das Fenster den Bewertungshorizont der Empfehlungen nicht mehr abdeckt === */
+  const EVENT_FEED_MANIFEST_URL = "/data/event-feed/manifest.json";
+  // recommendations.js bewertet Events bis 21 Tage voraus positiv; der Shard muss diesen Horizont vollständig enthalten.
+  const EVENT_FEED_MIN_WINDOW_DAYS = 21;
+
+  async function fetchJsonImmutable(url) {
+    try {
+      // Shard-Namen enthalten den Inhaltshash: Browser-/SW-Cache darf sie unverändert weiterverwenden.
+      const response = await fetch(url, { cache: "force-cache" });
+      if (!response.ok) {
+        throw new Error(`${url} failed: ${response.status}`);
+      }
+      return await response.json();
+    } catch (error) {
+      console.warn("[TodayHome] Event feed shard failed:", url, error);
+      return null;
+    }
+  }
+
+  async function fetchTodayEventFeed() {
+    const manifest = await fetchJsonNoStore(EVENT_FEED_MANIFEST_URL, false);
+    const nextDays = manifest?.next_days;
+    const today = dateKey(new Date());
+    const needed = dateKey(addDays(new Date(), EVENT_FEED_MIN_WINDOW_DAYS));
+
+    if (typeof nextDays?.path === "string" && nextDays.from <= today && nextDays.until >= needed) {
+      const shard = await fetchJsonImmutable(nextDays.path);
+      if (Array.isArray(shard)) return shard;
+    }
+
+    return fetchJsonNoStore("/data/events.json", false);
+  }
+  /* === END BLOCK: TODAY_EVENT_FEED_SHARD_V1 === */
+
   function extractEvents(payload) {
     if (Array.isArray(payload)) return payload;
     if (Array.isArray(payload?.events)) return payload.events;
@@ -1641,7 +1675,7 @@
 
   async function loadData() {
     const [eventPayload, approvedPayload, offerPayload, visualPoolPayload, activityVisualPoolPayload, bathingStatusPayload] = await Promise.all([
-      fetchJsonNoStore("/data/events.json", false),
+      fetchTodayEventFeed(),
       fetchJsonNoStore("/api/events/public.php", false),
       fetchJsonNoStore("/data/offers.json", true),
       fetchJsonNoStore("/data/event_visual_pool.json", false),
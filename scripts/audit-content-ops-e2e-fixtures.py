@@ -2,9 +2,11 @@
 # === BEGIN FILE: scripts/audit-content-ops-e2e-fixtures.py | Zweck: echter E2E-Fixture-Guard fuer Content-Ops-Normalisierung, Metriken, Findings und RuleEffects ===
 from __future__ import annotations
 
+import argparse
 import importlib.util
 import json
 import sys
+import time
 from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Any
@@ -102,7 +104,37 @@ def add(checks: list[dict[str, Any]], check_id: str, area: str, ok: bool, messag
     })
 
 
+def benchmark(content_report: dict[str, Any], rounds: int) -> dict[str, Any]:
+    """Normalisiert die Content-Fixture-Issues rounds-mal vervielfacht und misst die Klassifikation."""
+    from content_ops_decisions import clear_decision_caches, decision_cache_stats
+    from content_ops_visual_feedback import clear_visual_caches, visual_cache_stats
+
+    issues = []
+    for index in range(rounds):
+        for item in content_report["issues"]:
+            issues.append({**item, "content_id": f"{item.get('content_id', '')}-{index}", "title": f"{item.get('title', '')} {index % 50}"})
+    path = TMP / "benchmark-content-quality-report.json"
+    write_json(path, {**content_report, "issues": issues})
+    clear_decision_caches()
+    clear_visual_caches()
+    started = time.perf_counter()
+    payload = control.normalize_content_audit(path)
+    seconds = time.perf_counter() - started
+    return {
+        "issues": len(issues),
+        "findings": len(payload.findings),
+        "seconds": round(seconds, 4),
+        "us_per_issue": round(seconds * 1_000_000 / max(len(issues), 1), 1),
+        "decision_memo": decision_cache_stats()["effect_memo"],
+        "visual_memo": visual_cache_stats()["classify_memo"],
+        "visual_token_ranks": visual_cache_stats()["token_ranks"],
+    }
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description="E2E-Fixture-Guard fuer Content Ops")
+    parser.add_argument("--benchmark", type=int, default=0, metavar="ROUNDS", help="Content-Fixtures ROUNDS-mal vervielfacht normalisieren und Laufzeit/Memo-Treffer berichten.")
+    args = parser.parse_args()
     TMP.mkdir(parents=True, exist_ok=True)
     checks: list[dict[str, Any]] = []
 
@@ -283,11 +315,16 @@ def main() -> None:
         "checks": checks,
     }
 
+    if args.benchmark > 0:
+        report["benchmark"] = benchmark(content_report, args.benchmark)
+
     REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
     REPORT_PATH.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
     print(f"content_ops_e2e_fixtures={report['status']}")
     print(json.dumps(report["summary"], ensure_ascii=False))
+    if "benchmark" in report:
+        print(json.dumps({"benchmark": report["benchmark"]}, ensure_ascii=False))
     for item in failures:
         print(f"FAIL {item['id']}: {item['message']}")
         print(json.dumps(item.get("details") or {}, ensure_ascii=False))
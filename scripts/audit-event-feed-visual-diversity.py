@@ -19,6 +19,8 @@ if str(SCRIPT_DIR) not in sys.path:
 from event_visual_keys import infer_event_visual_key, normalize_event_visual_key
 from event_visual_motifs import (
     EVENT_VISUAL_MOTIF_RULES,
+    EventVisualPoolIndex,
+    event_visual_pool_index,
     fallback_event_visual_motif,
     infer_event_visual_fit,
     normalize_event_visual_motif,
@@ -222,18 +224,13 @@ def normalize_asset_url(src: Any) -> str:
     return "/" + value.lstrip("./")
 
 
-def build_ready_pools(pool_payload: Mapping[str, Any]) -> Dict[str, List[Dict[str, str]]]:
+def build_ready_pools(pool_index: EventVisualPoolIndex) -> Dict[str, List[Dict[str, str]]]:
     out: Dict[str, List[Dict[str, str]]] = {}
-    pools = pool_payload.get("pools") if isinstance(pool_payload, Mapping) else {}
-    if not isinstance(pools, Mapping):
-        return out
-
-    for raw_key, pool in pools.items():
+    for raw_key in pool_index.visual_keys:
         visual_key = normalize_event_visual_key(raw_key)
-        images = pool.get("images") if isinstance(pool, Mapping) else []
         ready: List[Dict[str, str]] = []
-        for image in images if isinstance(images, list) else []:
-            if not isinstance(image, Mapping) or not is_ready_image(image):
+        for image in pool_index.ready_images(raw_key):
+            if not is_ready_image(image):
                 continue
             ready.append(
                 {
@@ -385,7 +382,7 @@ def pick_visual(groups: Sequence[Sequence[Mapping[str, Any]]], seed: str, used_f
 def resolve_visual(
     item: Mapping[str, Any],
     ready_pools: Mapping[str, Sequence[Mapping[str, Any]]],
-    pool_payload: Mapping[str, Any],
+    pool_payload: EventVisualPoolIndex | Mapping[str, Any],
     usage_by_scope: Dict[str, set[str]],
     recent: deque[str],
     min_motif_diversity: int,
@@ -467,7 +464,8 @@ def audit(args: argparse.Namespace) -> int:
         sortable.append((day, parse_time_minutes(item.get("time")), norm(item.get("title")), item))
     sortable.sort(key=lambda row: (row[0], row[1], row[2]))
 
-    ready_pools = build_ready_pools(pool_payload)
+    pool_index = event_visual_pool_index(pool_payload)
+    ready_pools = build_ready_pools(pool_index)
     usage_by_scope: Dict[str, set[str]] = defaultdict(set)
     recent: deque[str] = deque(maxlen=args.window)
     rendered: List[Dict[str, Any]] = []
@@ -476,7 +474,7 @@ def audit(args: argparse.Namespace) -> int:
         visual_key, visual_motif, visual, candidate_count, match_tier = resolve_visual(
             item=item,
             ready_pools=ready_pools,
-            pool_payload=pool_payload,
+            pool_payload=pool_index,
             usage_by_scope=usage_by_scope,
             recent=recent,
             min_motif_diversity=args.min_motif_diversity,
@@ -33,7 +33,7 @@ CHECKS = [
         ],
     ),
     (
-        "scripts/build-event-detail-pages.py",
+        "scripts/event_detail_pages.py",
         [
             "/config.js?v=2026-07-03-event-impact-v1",
             "data-impact-object-type=\"event\"",
@@ -15,6 +15,7 @@ if str(SCRIPT_DIR) not in sys.path:
 from event_visual_keys import ALLOWED_EVENT_VISUAL_KEYS, infer_event_visual_key, normalize_event_visual_key
 from event_visual_motifs import (
     EVENT_VISUAL_MOTIF_RULES,
+    EventVisualPoolIndex,
     fallback_event_visual_motif,
     infer_event_visual_fit,
     normalize_event_visual_motif,
@@ -186,6 +187,7 @@ def main() -> int:
     motif_distribution = Counter()
     asset_status_distribution = Counter()
     source_counts = Counter()
+    pool_index = EventVisualPoolIndex(manifest)  # einmal pro Lauf statt pro Event
     for item in iter_event_like_items():
         fit = infer_event_visual_fit(
             title=item.get("title", ""),
@@ -194,7 +196,7 @@ def main() -> int:
             location=item.get("location", ""),
             visual_key=item.get("visual_key", ""),
             visual_motif=item.get("visual_motif", ""),
-            pool_payload=manifest,
+            pool_payload=pool_index,
         )
         distribution[fit["visual_key"]] += 1
         motif_distribution[(fit["visual_key"], fit["visual_motif"])] += 1
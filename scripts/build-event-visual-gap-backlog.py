@@ -14,7 +14,7 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 if str(SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPT_DIR))
 
-from event_visual_motifs import infer_event_visual_fit, load_event_visual_pool
+from event_visual_motifs import EventVisualPoolIndex, infer_event_visual_fit, load_event_visual_pool
 from content_ops_visual_feedback import classify_visual_issue, load_visual_feedback_contract
 
 OUT_PATH = ROOT / "data" / "event_visual_gap_backlog.tsv"
@@ -124,6 +124,7 @@ def priority_for(fit: Dict[str, str], item: Dict[str, str]) -> str:
 
 def build_rows(items: Iterable[Dict[str, str]]) -> List[Dict[str, str]]:
     pool = load_event_visual_pool()
+    pool_index = EventVisualPoolIndex(pool)  # einmal pro Lauf statt pro Event
     feedback_contract = load_visual_feedback_contract()
     rows_by_gap: Dict[str, Dict[str, str]] = {}
     for item in items:
@@ -132,7 +133,7 @@ def build_rows(items: Iterable[Dict[str, str]]) -> List[Dict[str, str]]:
         fit = infer_event_visual_fit(
             title=item.get("title", ""), description=item.get("description", ""),
             category=item.get("category", ""), location=item.get("location", ""),
-            visual_key=item.get("visual_key", ""), visual_motif=item.get("visual_motif", ""), pool_payload=pool,
+            visual_key=item.get("visual_key", ""), visual_motif=item.get("visual_motif", ""), pool_payload=pool_index,
         )
         visual_key = fit.get("visual_key", "")
         visual_motif = fit.get("visual_motif", "")
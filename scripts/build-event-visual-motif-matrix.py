@@ -16,6 +16,7 @@ if str(SCRIPT_DIR) not in sys.path:
 
 from event_visual_motifs import (  # noqa: E402
     EVENT_VISUAL_MOTIF_RULES,
+    EventVisualPoolIndex,
     event_visual_motif_role,
     infer_event_visual_fit,
     load_event_visual_pool,
@@ -205,6 +206,7 @@ def priority_for(pair: Tuple[str, str], needed_count: int, action: str) -> str:
 
 def infer_needed_by_motif(events: Iterable[Mapping[str, str]], pool_payload: Mapping[str, Any]) -> Dict[Tuple[str, str], List[Dict[str, str]]]:
     out: Dict[Tuple[str, str], List[Dict[str, str]]] = defaultdict(list)
+    pool_index = EventVisualPoolIndex(pool_payload)  # einmal pro Lauf statt pro Event
     for item in events:
         fit = infer_event_visual_fit(
             title=item.get("title", ""),
@@ -213,7 +215,7 @@ def infer_needed_by_motif(events: Iterable[Mapping[str, str]], pool_payload: Map
             location=item.get("location", ""),
             visual_key=item.get("visual_key", ""),
             visual_motif=item.get("visual_motif", ""),
-            pool_payload=pool_payload,
+            pool_payload=pool_index,
         )
         key = normalize_event_visual_key(fit.get("visual_key", ""))
         motif = normalize_event_visual_motif(fit.get("visual_motif", ""), key)
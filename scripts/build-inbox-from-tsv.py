@@ -24,7 +24,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from event_visual_keys import infer_event_visual_key, normalize_event_visual_key
-from event_visual_motifs import infer_event_visual_fit
+from event_visual_motifs import infer_event_visual_fit, load_event_visual_pool_index
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -177,6 +177,7 @@ def main() -> None:
 
     items: List[InboxItem] = []
     warnings_missing_open_url = 0
+    pool_index = load_event_visual_pool_index()  # einmal pro Lauf statt pro Zeile
 
     for idx, raw in enumerate(rows, start=2):  # Header ist Zeile 1
         data = {k: normalize_text(v) for k, v in raw.items()}
@@ -229,6 +230,7 @@ def main() -> None:
             location=data.get("location", ""),
             visual_key=local_visual_key or model_visual_key,
             visual_motif=data.get("visual_motif", ""),
+            pool_payload=pool_index,
         )
 
         items.append(
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# === BEGIN FILE: scripts/build-site-data.py | Zweck: ein Deploy-Schritt fuer alle Event-Artefakte aus einem einzigen TSV-Lesevorgang: events.json, Event-Detailseiten, Detailseiten-Manifest und optional Sitemap-Ergaenzungen; Umfang: komplette Datei ===
+"""Single-pass site data build: events.tsv -> events.json + detail pages + manifest.
+
+Before, the deploy ran ``build-events-from-tsv.py`` (parse + validate TSV,
+write events.json) and then ``build-event-detail-pages.py`` (re-read and
+rewrite events.json, re-read events.tsv for recently expired pages). This entry
+point reads the TSV once, validates it with the same ``event_builder`` rules and
+hands the in-memory feed to ``event_detail_pages``; events.json is serialized
+exactly once. Both old scripts stay as compatible wrappers.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import event_builder
+import event_detail_pages
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Events-TSV einmal lesen und events.json, Detailseiten und Manifest erzeugen.")
+    parser.add_argument("--full", action="store_true", help="Alle generierten Detailseiten loeschen und neu schreiben statt inkrementell.")
+    parser.add_argument("--jobs", type=int, default=1, help="Parallele Render-Prozesse und Schreib-Threads (1 = sequenziell).")
+    parser.add_argument("--sitemap", default="", help="Optional: Sitemap-Datei, an die aktive Detailseiten-URLs angehaengt werden.")
+    args = parser.parse_args(argv)
+
+    event_builder.configure_entrypoint()
+    started = time.perf_counter()
+    rows = event_builder.read_tsv(event_builder.TSV_PATH)
+    feed = event_builder.build_feed(rows)
+    validated = time.perf_counter()
+
+    manifest = event_detail_pages.build_detail_pages(feed, rows, full=args.full, jobs=args.jobs)
+    event_builder.write_feed(feed)
+
+    if args.sitemap:
+        added = event_detail_pages.augment_sitemap(Path(args.sitemap), manifest)
+        print(f"✅ Sitemap erweitert: {added} aktive Event-Detailseiten ergänzt.")
+
+    print(
+        f"⏱️ Site-Daten: {len(rows)} TSV-Zeilen einmal gelesen, "
+        f"Validierung {(validated - started) * 1000:.0f} ms, gesamt {(time.perf_counter() - started) * 1000:.0f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+# === END FILE: scripts/build-site-data.py ===
@@ -22,17 +22,27 @@ import html
 import json
 import re
 import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 SCRIPT_VERSION = "BATHING_WATER_GUARD_V2_SAFE_WRITEBACK"
 USER_AGENT = "BocholtErlebenBathingWaterGuard/1.0 (+https://bocholt-erleben.de)"
 REQUEST_TIMEOUT_SECONDS = 25
+FETCH_WORKERS = 6
+FETCH_PER_HOST = 2
+# Minimum spacing between request starts on the same host (replaces the old
+# fixed pause between groups).
+FETCH_HOST_DELAY_SECONDS = 0.2
+RESPONSE_CACHE_VERSION = 1
 
 # The NRW endpoint exposes sample rows as a DataTables JSON response. V2 source
 # discovery found this endpoint through browser/XHR inspection. `jahrDiff=0`
@@ -218,6 +228,7 @@ class SourceResult:
     warnings: List[str] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
     raw_signals: Dict[str, Any] = field(default_factory=dict)
+    fetch: Dict[str, Any] = field(default_factory=dict)
 
 
 GROUPS: List[GroupConfig] = [
@@ -427,6 +438,113 @@ def request_url(url: str, *, accept: str = "*/*") -> Tuple[int, str, str]:
     return status, content_type, text
 
 
+class SourceResponseCache:
+    """Day-scoped on-disk cache of successful source responses.
+
+    Entries are keyed by UTC day, NRW `jahrDiff` and URL, so a re-run on the
+    same day reuses the responses instead of hitting the sources again. Failed
+    fetches are never cached and are retried on the next run.
+    """
+
+    def __init__(self, path: Optional[Path], day: Optional[dt.date] = None) -> None:
+        self.path = path
+        self.day = (day or dt.datetime.now(dt.timezone.utc).date()).isoformat()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if path is not None and path.exists():
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            if isinstance(payload, dict) and payload.get("version") == RESPONSE_CACHE_VERSION and payload.get("day") == self.day:
+                entries = payload.get("entries")
+                if isinstance(entries, dict):
+                    self.entries = {str(key): value for key, value in entries.items() if isinstance(value, dict)}
+
+    def key(self, url: str) -> str:
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)
+        year_diff = (query.get("jahrDiff") or [""])[0]
+        return f"{self.day}|jahrDiff={year_diff}|{url}"
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self.entries.get(self.key(url))
+
+    def store(self, url: str, response: Tuple[int, str, str], *, fetched_at: str, latency_ms: float) -> None:
+        status, content_type, text = response
+        with self._lock:
+            self.entries[self.key(url)] = {
+                "url": url,
+                "status": status,
+                "content_type": content_type,
+                "text": text,
+                "fetched_at": fetched_at,
+                "latency_ms": latency_ms,
+            }
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        ensure_parent(self.path)
+        with self._lock:
+            payload = {"version": RESPONSE_CACHE_VERSION, "day": self.day, "entries": dict(sorted(self.entries.items()))}
+        self.path.write_text(json.dumps(payload, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+class SourceFetcher:
+    """Thread-safe `request_url` front end with per-host limits and the response cache."""
+
+    def __init__(
+        self,
+        cache: Optional[SourceResponseCache] = None,
+        *,
+        per_host: int = FETCH_PER_HOST,
+        host_delay: float = FETCH_HOST_DELAY_SECONDS,
+    ) -> None:
+        self.cache = cache
+        self.per_host = max(1, per_host)
+        self.host_delay = max(0.0, host_delay)
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_next_start: Dict[str, float] = {}
+
+    @contextmanager
+    def _host_slot(self, host: str) -> Iterator[None]:
+        with self._lock:
+            slot = self._host_slots.setdefault(host, threading.BoundedSemaphore(self.per_host))
+        with slot:
+            with self._lock:
+                now = time.monotonic()
+                start_at = max(now, self._host_next_start.get(host, now))
+                self._host_next_start[host] = start_at + self.host_delay
+            if start_at > now:
+                time.sleep(start_at - now)
+            yield
+
+    def get(self, url: str, *, accept: str = "*/*", info: Optional[Dict[str, Any]] = None) -> Tuple[int, str, str]:
+        """Same contract as `request_url`; fills `info` with host, cache use and latency."""
+        info = info if info is not None else {}
+        info["host"] = urllib.parse.urlsplit(url).netloc.lower()
+        cached = self.cache.lookup(url) if self.cache is not None else None
+        if cached is not None:
+            info.update({"cache": "hit", "fetched_at": cached.get("fetched_at"), "latency_ms": cached.get("latency_ms")})
+            return int(cached.get("status") or 200), str(cached.get("content_type") or ""), str(cached.get("text") or "")
+        with self._host_slot(info["host"]):
+            fetched_at = today_utc_iso()
+            started = time.perf_counter()
+            try:
+                response = request_url(url, accept=accept)
+            finally:
+                info.update({
+                    "cache": "miss" if self.cache is not None else "disabled",
+                    "fetched_at": fetched_at,
+                    "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+                })
+        if self.cache is not None:
+            self.cache.store(url, response, fetched_at=fetched_at, latency_ms=info["latency_ms"])
+        return response
+
+
 def nrw_datatables_url(nrw_id: int, *, year_diff: int = 0) -> str:
     base = f"https://db.badegewaesser.nrw.de/badegewaesser-nrw/{nrw_id}/probenahmeMesswertInternets/dt"
     params: List[Tuple[str, str]] = [("jahrDiff", str(year_diff)), ("draw", "1")]
@@ -509,12 +627,19 @@ def evaluate_nrw_row(row: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def check_nrw_source(source: SourceConfig, today: dt.date, max_age_days: int, warn_age_days: int) -> SourceResult:
+def check_nrw_source(
+    source: SourceConfig,
+    today: dt.date,
+    max_age_days: int,
+    warn_age_days: int,
+    *,
+    fetch: Callable[..., Tuple[int, str, str]] = request_url,
+) -> SourceResult:
     checked_at = today_utc_iso()
     assert source.nrw_id is not None
     url = nrw_datatables_url(source.nrw_id, year_diff=0)
     try:
-        status, content_type, text = request_url(url, accept="application/json,text/javascript,*/*")
+        status, content_type, text = fetch(url, accept="application/json,text/javascript,*/*")
     except Exception as exc:  # noqa: BLE001 - report-only guard should not crash the workflow.
         return SourceResult(
             source_id=source.id,
@@ -640,10 +765,10 @@ def check_nrw_source(source: SourceConfig, today: dt.date, max_age_days: int, wa
     )
 
 
-def check_zwemwater_source(source: SourceConfig, today: dt.date) -> SourceResult:
+def check_zwemwater_source(source: SourceConfig, today: dt.date, *, fetch: Callable[..., Tuple[int, str, str]] = request_url) -> SourceResult:
     checked_at = today_utc_iso()
     try:
-        status, content_type, text = request_url(source.url, accept="text/html,*/*")
+        status, content_type, text = fetch(source.url, accept="text/html,*/*")
     except Exception as exc:  # noqa: BLE001
         return SourceResult(
             source_id=source.id,
@@ -749,7 +874,7 @@ def find_local_signals(plain: str) -> Dict[str, List[str]]:
     }
 
 
-def check_local_suitability_source(source: SourceConfig, today: dt.date) -> SourceResult:
+def check_local_suitability_source(source: SourceConfig, today: dt.date, *, fetch: Callable[..., Tuple[int, str, str]] = request_url) -> SourceResult:
     checked_at = today_utc_iso()
     valid_until = parse_iso_date_optional(source.valid_until)
     if valid_until and today > valid_until:
@@ -768,7 +893,7 @@ def check_local_suitability_source(source: SourceConfig, today: dt.date) -> Sour
             raw_signals={"valid_until": source.valid_until},
         )
     try:
-        status, content_type, text = request_url(source.url, accept="text/html,*/*")
+        status, content_type, text = fetch(source.url, accept="text/html,*/*")
     except Exception as exc:  # noqa: BLE001
         return SourceResult(
             source_id=source.id,
@@ -854,14 +979,26 @@ def check_local_suitability_source(source: SourceConfig, today: dt.date) -> Sour
     )
 
 
-def check_source(source: SourceConfig, today: dt.date, max_age_days: int, warn_age_days: int) -> SourceResult:
+def check_source(
+    source: SourceConfig,
+    today: dt.date,
+    max_age_days: int,
+    warn_age_days: int,
+    *,
+    fetcher: Optional[SourceFetcher] = None,
+) -> SourceResult:
+    fetch_info: Dict[str, Any] = {}
+    fetch = partial((fetcher or SourceFetcher()).get, info=fetch_info)
     if source.type == "nrw_datatables":
-        return check_nrw_source(source, today, max_age_days, warn_age_days)
-    if source.type == "zwemwater_page":
-        return check_zwemwater_source(source, today)
-    if source.type == "local_suitability_page":
-        return check_local_suitability_source(source, today)
-    raise ValueError(f"Unsupported source type: {source.type}")
+        result = check_nrw_source(source, today, max_age_days, warn_age_days, fetch=fetch)
+    elif source.type == "zwemwater_page":
+        result = check_zwemwater_source(source, today, fetch=fetch)
+    elif source.type == "local_suitability_page":
+        result = check_local_suitability_source(source, today, fetch=fetch)
+    else:
+        raise ValueError(f"Unsupported source type: {source.type}")
+    result.fetch = fetch_info
+    return result
 
 
 def aggregate_dimension_state(
@@ -926,6 +1063,7 @@ def result_to_dict(result: SourceResult) -> Dict[str, Any]:
         "warnings": result.warnings,
         "errors": result.errors,
         "raw_signals": result.raw_signals,
+        "fetch": result.fetch,
     }
 
 
@@ -1057,16 +1195,42 @@ def build_public_status_data(report: Dict[str, Any]) -> Dict[str, Any]:
         "items": items,
     }
 
-def build_report(today: dt.date, max_age_days: int, warn_age_days: int) -> Dict[str, Any]:
+def check_all_sources(
+    today: dt.date,
+    max_age_days: int,
+    warn_age_days: int,
+    *,
+    fetcher: SourceFetcher,
+    workers: int = FETCH_WORKERS,
+) -> Dict[str, SourceResult]:
+    """Check every configured source concurrently; results are keyed by source id."""
+    sources = [source for group in GROUPS for source in [*group.sources, *group.local_sources]]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            source.id: pool.submit(check_source, source, today, max_age_days, warn_age_days, fetcher=fetcher)
+            for source in sources
+        }
+        return {source_id: future.result() for source_id, future in futures.items()}
+
+
+def build_report(
+    today: dt.date,
+    max_age_days: int,
+    warn_age_days: int,
+    *,
+    fetcher: Optional[SourceFetcher] = None,
+    workers: int = FETCH_WORKERS,
+) -> Dict[str, Any]:
     generated_at = today_utc_iso()
     groups_output: List[Dict[str, Any]] = []
     all_source_results: List[SourceResult] = []
+    results_by_source = check_all_sources(today, max_age_days, warn_age_days, fetcher=fetcher or SourceFetcher(), workers=workers)
     for group in GROUPS:
         active_season = in_season(today, group.season_start, group.season_end)
-        water_results = [check_source(source, today, max_age_days, warn_age_days) for source in group.sources]
+        water_results = [results_by_source[source.id] for source in group.sources]
         # Local suitability is intentionally separate from lab/legal water status.
         # It can suppress an active recommendation even if water values are `ok`.
-        local_results = [check_source(source, today, max_age_days, warn_age_days) for source in group.local_sources]
+        local_results = [results_by_source[source.id] for source in group.local_sources]
         source_results = water_results + local_results
         all_source_results.extend(source_results)
         water_state, water_confidence, water_reason = aggregate_dimension_state(
@@ -1101,8 +1265,6 @@ def build_report(today: dt.date, max_age_days: int, warn_age_days: int) -> Dict[
                 "local_suitability_sources": [result_to_dict(result) for result in local_results],
             }
         )
-        # Be polite to external sources and avoid a burst of requests.
-        time.sleep(0.2)
     counts: Dict[str, int] = {state: 0 for state in ["ok", "watch", "blocked", "unknown", "out_of_season"]}
     for group in groups_output:
         counts[group["state"]] = counts.get(group["state"], 0) + 1
@@ -1188,6 +1350,9 @@ def render_markdown(report: Dict[str, Any]) -> str:
             lines.append(f"- Reason: {source['reason']}")
             lines.append(f"- Source URL: `{source['source_url']}`")
             lines.append(f"- Rows seen: `{source['rows_seen']}`")
+            fetch_info = source.get("fetch") or {}
+            if fetch_info:
+                lines.append(f"- Fetch: `{fetch_info.get('latency_ms')} ms` (cache `{fetch_info.get('cache')}`, host `{fetch_info.get('host')}`)")
             if source.get("latest_sample_date"):
                 lines.append(f"- Latest sample: `{source['latest_sample_date']}` (`{source.get('latest_sample_age_days')}` days old)")
             if source.get("latest_sample"):
@@ -1224,11 +1389,18 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("--out-json", default="bathing-water-status-guard.json")
     parser.add_argument("--out-md", default="bathing-water-status-guard.md")
     parser.add_argument("--write-data", default="", help="Optional path for generated frontend status data, e.g. data/bathing_water_status.json.")
+    parser.add_argument("--response-cache", default=".cache/bathing-water-source-responses.json", help="Day-scoped source response cache; empty disables it.")
+    parser.add_argument("--workers", type=int, default=FETCH_WORKERS, help="Concurrent source checks.")
+    parser.add_argument("--per-host", type=int, default=FETCH_PER_HOST, help="Concurrent requests per source host.")
     args = parser.parse_args(argv)
     today = parse_today(args.today)
     if args.warn_measurement_age_days > args.max_measurement_age_days:
         parser.error("--warn-measurement-age-days must be <= --max-measurement-age-days")
-    report = build_report(today, args.max_measurement_age_days, args.warn_measurement_age_days)
+    cache = SourceResponseCache(Path(args.response_cache)) if args.response_cache else None
+    fetcher = SourceFetcher(cache, per_host=args.per_host)
+    report = build_report(today, args.max_measurement_age_days, args.warn_measurement_age_days, fetcher=fetcher, workers=args.workers)
+    if cache is not None:
+        cache.save()
     out_json = Path(args.out_json)
     out_md = Path(args.out_md)
     ensure_parent(out_json)
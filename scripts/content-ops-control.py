@@ -7,10 +7,11 @@ import hashlib
 import json
 import os
 import sys
+import time
 from dataclasses import asdict, dataclass, field
 from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from content_ops_decisions import resolve_decision_class, target_effect
 from content_ops_visual_feedback import classify_visual_issue
@@ -318,15 +319,55 @@ def missing_source_payload(source_mode: str, missing_path: Path, workflow_label:
     return payload
 
 
-def normalize_content_audit(report_path: Path) -> RunPayload:
-    if not report_path.exists():
-        return missing_source_payload("content_quality_audit", report_path, "Content Quality Audit")
+# === BEGIN BLOCK: CONTENT_AUDIT_ISSUE_STREAM_V1 | Zweck: Audit-Issues zeilenweise aus NDJSON statt aus dem Gesamtreport ===
+# Beobachtungen (auto_routed) werden nur bis zu dieser Zahl als Finding gehalten; Aufgaben immer.
+MAX_OBSERVATION_FINDINGS = safe_int(os.environ.get("CONTENT_OPS_MAX_OBSERVATION_FINDINGS"), 2000)
+
+
+def iter_ndjson(path: Path) -> Iterator[Dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as handle:
+        for number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as exc:
+                print(f"⚠️ NDJSON-Zeile nicht lesbar: {path}:{number}: {exc}", file=sys.stderr)
+                continue
+            if isinstance(row, dict):
+                yield row
+
+
+def issues_ndjson_for_report(report_path: Path) -> Path:
+    """Issue stream content-quality-audit writes next to report_path (...-report.json -> ...-issues.ndjson)."""
+    name = report_path.name
+    if name.endswith("-report.json"):
+        return report_path.with_name(name[: -len("-report.json")] + "-issues.ndjson")
+    return report_path.with_name(f"{report_path.stem}.issues.ndjson")
+
+
+def open_content_audit(report_path: Path, issues_path: Optional[Path]) -> Tuple[Dict[str, Any], Iterable[Any]]:
+    """Report header and an issue iterator; prefers the NDJSON issue stream when it is at least as new as the report."""
+    if issues_path is not None and issues_path.exists():
+        if not report_path.exists() or issues_path.stat().st_mtime >= report_path.stat().st_mtime:
+            rows = iter_ndjson(issues_path)
+            first = next(rows, None)
+            if first is not None and isinstance(first.get("_report"), dict):
+                return first["_report"], rows
+            print(f"⚠️ NDJSON ohne Report-Kopf, nutze {report_path}", file=sys.stderr)
     report = load_json(report_path, {}) or {}
+    return report, report.get("issues") or []
+# === END BLOCK: CONTENT_AUDIT_ISSUE_STREAM_V1 ===
+
+
+def normalize_content_audit(report_path: Path, issues_path: Optional[Path] = None) -> RunPayload:
+    if not report_path.exists() and (issues_path is None or not issues_path.exists()):
+        return missing_source_payload("content_quality_audit", report_path, "Content Quality Audit")
+    report, issues = open_content_audit(report_path, issues_path)
     meta = report.get("meta") or {}
     summary = report.get("summary") or {}
     counts = summary.get("counts") or {}
     by_action_route = summary.get("by_action_route") or {}
-    issues = report.get("issues") or []
     observations_summary = report.get("observations_summary") or {}
     verification = report.get("verification_summary") or {}
     search_feedback_summary = report.get("search_feedback_summary") or {}
@@ -336,44 +377,17 @@ def normalize_content_audit(report_path: Path) -> RunPayload:
     visual_problem_counts: Dict[str, int] = {}
     visual_followup_counts: Dict[str, int] = {}
     visual_decision_class_counts: Dict[str, int] = {}
+    issue_count = 0
+    observation_findings = 0
+    observations_dropped = 0
 
     payload = RunPayload(source_mode="content_quality_audit")
-    payload.summary = {
-        "scope": meta.get("scope", norm(os.environ.get("AUDIT_SCOPE"))),
-        "generated_at": meta.get("generated_at", ""),
-        "issue_total": summary.get("total", len(issues)),
-        "counts": counts,
-        "by_action_route": by_action_route,
-        "observations": observations_summary,
-        "verification": verification,
-        "search_feedback": search_feedback_summary,
-        "visual_feedback": visual_feedback_summary,
-    }
-
-    payload.metrics.extend([
-        metric("content.audit.issues_total", summary.get("total", len(issues)), scope="audit", audit_scope=payload.summary.get("scope")),
-        metric("content.audit.observations_total", observations_summary.get("total", 0), scope="audit"),
-        metric("content.audit.ai_candidates_total", meta.get("ai_candidates_total", verification.get("ai_candidates_total", 0)), scope="audit"),
-        metric("content.audit.ai_candidates_selected", meta.get("ai_candidates_selected", verification.get("ai_candidates_selected", 0)), scope="audit"),
-        metric("content.audit.ai_candidates_deferred_by_budget", meta.get("ai_candidates_deferred_by_budget", verification.get("ai_candidates_deferred_by_budget", 0)), scope="audit"),
-        metric("content.audit.verification_cache_hits", meta.get("verification_cache_hits", verification.get("cache_hits", 0)), scope="audit"),
-        metric("content.audit.search_feedback_signals", meta.get("search_feedback_signals", 0), scope="audit"),
-        metric("content.audit.search_feedback_rules_active", meta.get("search_feedback_rules_active", 0), scope="audit"),
-        metric("content.audit.visual_feedback_signals", meta.get("visual_feedback_signals", 0), scope="audit"),
-        metric("content.audit.visual_feedback_asset_gaps", meta.get("visual_feedback_asset_gaps", 0), scope="audit"),
-        metric("content.audit.visual_feedback_search_relevant", meta.get("visual_feedback_search_relevant", 0), scope="audit"),
-    ])
-    add_counter_metrics(payload.metrics, "content.audit.severity", counts, scope="audit")
-    add_counter_metrics(payload.metrics, "content.audit.action_route", by_action_route, scope="audit")
-    add_counter_metrics(payload.metrics, "content.audit.process_category", summary.get("by_process_category") or {}, scope="audit")
-    add_counter_metrics(payload.metrics, "content.audit.correction_owner", summary.get("by_correction_owner") or {}, scope="audit")
-    add_counter_metrics(payload.metrics, "content.audit.observation_status", observations_summary.get("by_status") or {}, scope="audit")
-    add_counter_metrics(payload.metrics, "content.audit.visual_route", visual_feedback_summary.get("route_counts") or {}, scope="audit")
 
     action_required = False
     for item in issues:
         if not isinstance(item, dict):
             continue
+        issue_count += 1
         safe_action, user_action_required = route_content_issue(item)
         decision_row = decision_row_from_content_issue(item, safe_action, user_action_required)
         decision_inferred = not norm(item.get("decision_class")) and bool(norm(decision_row.get("decision_class")))
@@ -407,6 +421,11 @@ def normalize_content_audit(report_path: Path) -> RunPayload:
 
         if user_action_required:
             action_required = True
+        elif observation_findings >= MAX_OBSERVATION_FINDINGS:
+            observations_dropped += 1
+            continue
+        else:
+            observation_findings += 1
         payload.findings.append(Finding(
             finding_type=norm(item.get("issue_code")) or "content_issue",
             entity_type=norm(item.get("content_type")) or "content",
@@ -443,6 +462,40 @@ def normalize_content_audit(report_path: Path) -> RunPayload:
             },
         ))
 
+    payload.summary = {
+        "scope": meta.get("scope", norm(os.environ.get("AUDIT_SCOPE"))),
+        "generated_at": meta.get("generated_at", ""),
+        "issue_total": summary.get("total", issue_count),
+        "counts": counts,
+        "by_action_route": by_action_route,
+        "observations": observations_summary,
+        "verification": verification,
+        "search_feedback": search_feedback_summary,
+        "visual_feedback": visual_feedback_summary,
+        "observation_findings_dropped": observations_dropped,
+    }
+
+    payload.metrics.extend([
+        metric("content.audit.issues_total", summary.get("total", issue_count), scope="audit", audit_scope=payload.summary.get("scope")),
+        metric("content.audit.observations_total", observations_summary.get("total", 0), scope="audit"),
+        metric("content.audit.ai_candidates_total", meta.get("ai_candidates_total", verification.get("ai_candidates_total", 0)), scope="audit"),
+        metric("content.audit.ai_candidates_selected", meta.get("ai_candidates_selected", verification.get("ai_candidates_selected", 0)), scope="audit"),
+        metric("content.audit.ai_candidates_deferred_by_budget", meta.get("ai_candidates_deferred_by_budget", verification.get("ai_candidates_deferred_by_budget", 0)), scope="audit"),
+        metric("content.audit.verification_cache_hits", meta.get("verification_cache_hits", verification.get("cache_hits", 0)), scope="audit"),
+        metric("content.audit.search_feedback_signals", meta.get("search_feedback_signals", 0), scope="audit"),
+        metric("content.audit.search_feedback_rules_active", meta.get("search_feedback_rules_active", 0), scope="audit"),
+        metric("content.audit.visual_feedback_signals", meta.get("visual_feedback_signals", 0), scope="audit"),
+        metric("content.audit.visual_feedback_asset_gaps", meta.get("visual_feedback_asset_gaps", 0), scope="audit"),
+        metric("content.audit.visual_feedback_search_relevant", meta.get("visual_feedback_search_relevant", 0), scope="audit"),
+        metric("content.audit.observation_findings_dropped", observations_dropped, scope="audit"),
+    ])
+    add_counter_metrics(payload.metrics, "content.audit.severity", counts, scope="audit")
+    add_counter_metrics(payload.metrics, "content.audit.action_route", by_action_route, scope="audit")
+    add_counter_metrics(payload.metrics, "content.audit.process_category", summary.get("by_process_category") or {}, scope="audit")
+    add_counter_metrics(payload.metrics, "content.audit.correction_owner", summary.get("by_correction_owner") or {}, scope="audit")
+    add_counter_metrics(payload.metrics, "content.audit.observation_status", observations_summary.get("by_status") or {}, scope="audit")
+    add_counter_metrics(payload.metrics, "content.audit.visual_route", visual_feedback_summary.get("route_counts") or {}, scope="audit")
+
     payload.summary["decision_class_counts"] = decision_class_counts
     payload.summary["decision_effect_counts"] = decision_effect_counts
     payload.summary["visual_problem_counts"] = visual_problem_counts
@@ -849,7 +902,7 @@ def db_config() -> Optional[Dict[str, Any]]:
         "password": password,
         "port": safe_int(port, 3306),
         "charset": "utf8mb4",
-        "autocommit": True,
+        "autocommit": False,
     }
 
 
@@ -945,126 +998,217 @@ SCHEMA_SQL = [
 ]
 
 
-def persist_sql(payload: RunPayload) -> str:
-    cfg = db_config()
-    if cfg is None:
-        return "skipped_db_env_missing"
+# Die DDL laeuft nur, wenn sich SCHEMA_SQL geaendert hat; die Version ist der Hash der normalisierten Statements.
+SCHEMA_KEY = "content_ops"
+SCHEMA_VERSION = sha256_text("\n".join(" ".join(statement.split()) for statement in SCHEMA_SQL))[:16]
+SCHEMA_VERSION_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS content_ops_schema_version (
+      schema_key VARCHAR(64) NOT NULL,
+      schema_version VARCHAR(64) NOT NULL DEFAULT '',
+      applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+      PRIMARY KEY (schema_key)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """
+# pymysql schreibt executemany() mit "INSERT ... VALUES (%s,...)" in mehrzeilige INSERTs um;
+# die Batches begrenzen zusaetzlich die Statementgroesse.
+SQL_BATCH_ROWS = 500
+
+RUN_INSERT_SQL = """
+    INSERT INTO content_ops_run
+      (run_fingerprint, generated_at_utc, environment, branch_name, workflow_name, github_run_id, github_run_url, source_mode, status, action_required, summary_json, metrics_json, findings_json)
+    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+    ON DUPLICATE KEY UPDATE
+      generated_at_utc=VALUES(generated_at_utc), status=VALUES(status), action_required=VALUES(action_required), summary_json=VALUES(summary_json), metrics_json=VALUES(metrics_json), findings_json=VALUES(findings_json)
+    """
+METRIC_INSERT_SQL = """
+    INSERT INTO content_ops_metric_daily
+      (metric_date, environment, metric_key, metric_scope, dimension_key, metric_value, source_mode, run_fingerprint, dimensions_json)
+    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
+    ON DUPLICATE KEY UPDATE metric_value=VALUES(metric_value), dimensions_json=VALUES(dimensions_json)
+    """
+ACTION_INSERT_SQL = """
+    INSERT INTO content_ops_action_log
+      (action_fingerprint, generated_at_utc, environment, source_mode, source_workflow, action_type, finding_type, entity_type, entity_id, title, severity, confidence, user_action_required, status, run_fingerprint, details_json)
+    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+    ON DUPLICATE KEY UPDATE severity=VALUES(severity), confidence=VALUES(confidence), user_action_required=VALUES(user_action_required), details_json=VALUES(details_json)
+    """
+RULE_EFFECT_INSERT_SQL = """
+    INSERT INTO feedback_rule_effectiveness_daily
+      (metric_date, environment, rule_key, rule_type, rule_class, applied_count, prevented_count, recurrence_count, false_positive_count, source_mode, run_fingerprint, details_json)
+    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+    ON DUPLICATE KEY UPDATE applied_count=VALUES(applied_count), prevented_count=VALUES(prevented_count), recurrence_count=VALUES(recurrence_count), false_positive_count=VALUES(false_positive_count), details_json=VALUES(details_json)
+    """
+
+
+@dataclass
+class SqlTableStats:
+    rows: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class SqlPersistResult:
+    status: str
+    schema_applied: bool = False
+    tables: Dict[str, SqlTableStats] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    def summary_lines(self) -> List[str]:
+        if not self.tables:
+            return []
+        lines = [f"- sql_schema: `{'applied' if self.schema_applied else 'cached'} {SCHEMA_VERSION}`"]
+        for table, stats in self.tables.items():
+            lines.append(f"- sql.{table}: `{stats.rows} rows, {stats.batches} batches, {stats.seconds * 1000:.0f} ms`")
+        lines.append(f"- sql_total: `{self.seconds * 1000:.0f} ms`")
+        return lines
+
+
+def ensure_schema(cur: Any) -> bool:
+    """Run SCHEMA_SQL only if the stored schema version differs; returns True if DDL ran."""
     try:
-        import pymysql  # type: ignore
-    except Exception as exc:
-        return f"skipped_pymysql_missing:{type(exc).__name__}"
+        cur.execute("SELECT schema_version FROM content_ops_schema_version WHERE schema_key=%s", (SCHEMA_KEY,))
+        row = cur.fetchone()
+    except Exception:
+        row = None  # Versionstabelle existiert noch nicht
+    if row and row[0] == SCHEMA_VERSION:
+        return False
+    cur.execute(SCHEMA_VERSION_TABLE_SQL)
+    for statement in SCHEMA_SQL:
+        cur.execute(statement)
+    cur.execute(
+        "INSERT INTO content_ops_schema_version (schema_key, schema_version) VALUES (%s,%s) "
+        "ON DUPLICATE KEY UPDATE schema_version=VALUES(schema_version)",
+        (SCHEMA_KEY, SCHEMA_VERSION),
+    )
+    return True
+
 
+def sql_rows(payload: RunPayload) -> List[Tuple[str, str, List[Tuple[Any, ...]]]]:
+    """(table, insert statement, parameter rows) in write order."""
     run_fp = payload.run_fingerprint()
     environment = env_name()
     generated = payload.generated_at_utc.replace("Z", "").replace("T", " ")[:19]
     metric_date = generated[:10]
-    workflow = norm(os.environ.get("GITHUB_WORKFLOW"))
-    run_id = norm(os.environ.get("GITHUB_RUN_ID"))
+    run_row = (
+        run_fp,
+        generated,
+        environment,
+        branch_name(),
+        norm(os.environ.get("GITHUB_WORKFLOW")),
+        norm(os.environ.get("GITHUB_RUN_ID")),
+        github_run_url(),
+        payload.source_mode,
+        payload.status,
+        1 if payload.action_required else 0,
+        compact_json(payload.summary),
+        compact_json([asdict(item) for item in payload.metrics]),
+        # payload.findings ist bereits beim Einlesen begrenzt (MAX_OBSERVATION_FINDINGS, Aufgaben immer).
+        compact_json([asdict(item) for item in payload.findings]),
+    )
+    metric_rows = [
+        (
+            metric_date,
+            environment,
+            item.metric_key[:160],
+            item.metric_scope[:80],
+            item.dimension_key[:191],
+            item.metric_value,
+            payload.source_mode,
+            run_fp,
+            compact_json(item.dimensions),
+        )
+        for item in payload.metrics
+    ]
+    action_rows = [
+        (
+            finding.fingerprint(environment),
+            generated,
+            environment,
+            payload.source_mode,
+            finding.source_workflow[:191],
+            finding.safe_action[:120],
+            finding.finding_type[:191],
+            finding.entity_type[:80],
+            finding.entity_id[:191],
+            finding.title[:255],
+            finding.severity[:40],
+            finding.confidence[:80],
+            1 if finding.user_action_required else 0,
+            "open" if finding.user_action_required else "auto_routed",
+            run_fp,
+            compact_json(finding.details),
+        )
+        for finding in payload.findings
+    ]
+    rule_rows = [
+        (
+            metric_date,
+            environment,
+            effect.rule_key[:191],
+            effect.rule_type[:80],
+            effect.rule_class[:120],
+            int(effect.applied_count),
+            int(effect.prevented_count),
+            int(effect.recurrence_count),
+            int(effect.false_positive_count),
+            payload.source_mode,
+            run_fp,
+            compact_json(effect.details),
+        )
+        for effect in payload.rule_effects
+    ]
+    return [
+        ("content_ops_run", RUN_INSERT_SQL, [run_row]),
+        ("content_ops_metric_daily", METRIC_INSERT_SQL, metric_rows),
+        ("content_ops_action_log", ACTION_INSERT_SQL, action_rows),
+        ("feedback_rule_effectiveness_daily", RULE_EFFECT_INSERT_SQL, rule_rows),
+    ]
+
+
+def write_sql(conn: Any, payload: RunPayload, batch_rows: int = SQL_BATCH_ROWS) -> SqlPersistResult:
+    """Schema check, then all rows of the run in one transaction (commit or rollback)."""
+    result = SqlPersistResult(status="persisted_sql")
+    started = time.perf_counter()
+    with conn.cursor() as cur:
+        # MySQL committet DDL implizit, deshalb laeuft der Schemaschritt vor der Datentransaktion.
+        result.schema_applied = ensure_schema(cur)
+        conn.commit()
+        try:
+            for table, statement, rows in sql_rows(payload):
+                stats = result.tables.setdefault(table, SqlTableStats())
+                table_started = time.perf_counter()
+                for offset in range(0, len(rows), batch_rows):
+                    batch = rows[offset:offset + batch_rows]
+                    cur.executemany(statement, batch)
+                    stats.rows += len(batch)
+                    stats.batches += 1
+                stats.seconds = time.perf_counter() - table_started
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def persist_sql(payload: RunPayload, connect: Optional[Callable[[], Any]] = None) -> SqlPersistResult:
+    if connect is None:
+        cfg = db_config()
+        if cfg is None:
+            return SqlPersistResult(status="skipped_db_env_missing")
+        try:
+            import pymysql  # type: ignore
+        except Exception as exc:
+            return SqlPersistResult(status=f"skipped_pymysql_missing:{type(exc).__name__}")
+        connect = lambda: pymysql.connect(**cfg)  # noqa: E731
+
     conn = None
     try:
-        conn = pymysql.connect(**cfg)
-        with conn.cursor() as cur:
-            for statement in SCHEMA_SQL:
-                cur.execute(statement)
-            cur.execute(
-                """
-                INSERT INTO content_ops_run
-                  (run_fingerprint, generated_at_utc, environment, branch_name, workflow_name, github_run_id, github_run_url, source_mode, status, action_required, summary_json, metrics_json, findings_json)
-                VALUES
-                  (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                ON DUPLICATE KEY UPDATE
-                  generated_at_utc=VALUES(generated_at_utc), status=VALUES(status), action_required=VALUES(action_required), summary_json=VALUES(summary_json), metrics_json=VALUES(metrics_json), findings_json=VALUES(findings_json)
-                """,
-                (
-                    run_fp,
-                    generated,
-                    environment,
-                    branch_name(),
-                    workflow,
-                    run_id,
-                    github_run_url(),
-                    payload.source_mode,
-                    payload.status,
-                    1 if payload.action_required else 0,
-                    compact_json(payload.summary),
-                    compact_json([asdict(item) for item in payload.metrics]),
-                    compact_json([asdict(item) for item in payload.findings[:300]]),
-                ),
-            )
-            for item in payload.metrics:
-                cur.execute(
-                    """
-                    INSERT INTO content_ops_metric_daily
-                      (metric_date, environment, metric_key, metric_scope, dimension_key, metric_value, source_mode, run_fingerprint, dimensions_json)
-                    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                    ON DUPLICATE KEY UPDATE metric_value=VALUES(metric_value), dimensions_json=VALUES(dimensions_json)
-                    """,
-                    (
-                        metric_date,
-                        environment,
-                        item.metric_key[:160],
-                        item.metric_scope[:80],
-                        item.dimension_key[:191],
-                        item.metric_value,
-                        payload.source_mode,
-                        run_fp,
-                        compact_json(item.dimensions),
-                    ),
-                )
-            for finding in payload.findings:
-                action_fp = finding.fingerprint(environment)
-                cur.execute(
-                    """
-                    INSERT INTO content_ops_action_log
-                      (action_fingerprint, generated_at_utc, environment, source_mode, source_workflow, action_type, finding_type, entity_type, entity_id, title, severity, confidence, user_action_required, status, run_fingerprint, details_json)
-                    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                    ON DUPLICATE KEY UPDATE severity=VALUES(severity), confidence=VALUES(confidence), user_action_required=VALUES(user_action_required), details_json=VALUES(details_json)
-                    """,
-                    (
-                        action_fp,
-                        generated,
-                        environment,
-                        payload.source_mode,
-                        finding.source_workflow[:191],
-                        finding.safe_action[:120],
-                        finding.finding_type[:191],
-                        finding.entity_type[:80],
-                        finding.entity_id[:191],
-                        finding.title[:255],
-                        finding.severity[:40],
-                        finding.confidence[:80],
-                        1 if finding.user_action_required else 0,
-                        "open" if finding.user_action_required else "auto_routed",
-                        run_fp,
-                        compact_json(finding.details),
-                    ),
-                )
-            for effect in payload.rule_effects:
-                cur.execute(
-                    """
-                    INSERT INTO feedback_rule_effectiveness_daily
-                      (metric_date, environment, rule_key, rule_type, rule_class, applied_count, prevented_count, recurrence_count, false_positive_count, source_mode, run_fingerprint, details_json)
-                    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                    ON DUPLICATE KEY UPDATE applied_count=VALUES(applied_count), prevented_count=VALUES(prevented_count), recurrence_count=VALUES(recurrence_count), false_positive_count=VALUES(false_positive_count), details_json=VALUES(details_json)
-                    """,
-                    (
-                        metric_date,
-                        environment,
-                        effect.rule_key[:191],
-                        effect.rule_type[:80],
-                        effect.rule_class[:120],
-                        int(effect.applied_count),
-                        int(effect.prevented_count),
-                        int(effect.recurrence_count),
-                        int(effect.false_positive_count),
-                        payload.source_mode,
-                        run_fp,
-                        compact_json(effect.details),
-                    ),
-                )
-        return "persisted_sql"
+        conn = connect()
+        return write_sql(conn, payload)
     except Exception as exc:
-        return f"skipped_sql_error:{type(exc).__name__}:{exc}"
+        return SqlPersistResult(status=f"skipped_sql_error:{type(exc).__name__}:{exc}")
     finally:
         if conn is not None:
             try:
@@ -1096,7 +1240,7 @@ def write_outputs(payload: RunPayload, output_dir: Path) -> None:
     write_json(output_dir / "latest.json", result)
 
 
-def write_step_summary(payload: RunPayload, sql_status: str) -> None:
+def write_step_summary(payload: RunPayload, sql_result: SqlPersistResult) -> None:
     lines = [
         "## Content Ops Decision & Impact",
         "",
@@ -1106,7 +1250,8 @@ def write_step_summary(payload: RunPayload, sql_status: str) -> None:
         f"- metrics: `{len(payload.metrics)}`",
         f"- findings: `{len(payload.findings)}`",
         f"- rule_effects: `{len(payload.rule_effects)}`",
-        f"- sql: `{sql_status}`",
+        f"- sql: `{sql_result.status}`",
+        *sql_result.summary_lines(),
         "",
         "### Key summary",
         "",
@@ -1124,7 +1269,12 @@ def write_step_summary(payload: RunPayload, sql_status: str) -> None:
 
 def resolve_payload(args: argparse.Namespace) -> RunPayload:
     if args.mode == "record-audit":
-        return normalize_content_audit(ROOT / args.report_json)
+        report_path = ROOT / args.report_json
+        if args.issues_ndjson is None:
+            issues_path: Optional[Path] = issues_ndjson_for_report(report_path)
+        else:
+            issues_path = ROOT / args.issues_ndjson if args.issues_ndjson else None
+        return normalize_content_audit(report_path, issues_path)
     if args.mode == "record-weekly-ki":
         return normalize_weekly_ki(ROOT / args.weekly_diagnostics_json, ROOT / args.manual_json)
     if args.mode == "record-manual-intake":
@@ -1140,6 +1290,7 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Bocholt erleben Content Ops Decision & Impact Engine")
     parser.add_argument("mode", choices=["record-audit", "record-weekly-ki", "record-manual-intake", "record-inbox-cleanup", "record-growth"])
     parser.add_argument("--report-json", default="data/content-quality-report.json")
+    parser.add_argument("--issues-ndjson", default=None, help="Issue-Stream des Audits (Standard: neben --report-json, ...-issues.ndjson); wird genutzt, wenn er mindestens so neu wie der Report ist. Leerer Wert deaktiviert den Stream.")
     parser.add_argument("--weekly-diagnostics-json", default=".tmp/weekly-ki-eventsuche/weekly_event_diagnostics.json")
     parser.add_argument("--manual-json", default="data/inbox_manual.json")
     parser.add_argument("--manual-intake-summary-json", default="data/manual-ki-intake-summary.json")
@@ -1152,10 +1303,10 @@ def main() -> None:
     payload = resolve_payload(args)
     output_dir = ROOT / args.output_dir
     write_outputs(payload, output_dir)
-    sql_status = persist_sql(payload)
-    write_step_summary(payload, sql_status)
-    if args.fail_on_sql_error and sql_status.startswith("skipped_sql_error"):
-        raise SystemExit(sql_status)
+    sql_result = persist_sql(payload)
+    write_step_summary(payload, sql_result)
+    if args.fail_on_sql_error and sql_result.status.startswith("skipped_sql_error"):
+        raise SystemExit(sql_result.status)
 
 
 if __name__ == "__main__":
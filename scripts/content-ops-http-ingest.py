@@ -3,16 +3,27 @@
 from __future__ import annotations
 
 import argparse
+import gzip
+import http.client
 import json
 import os
 import sys
-import urllib.error
-import urllib.request
+import time
+import urllib.parse
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_INPUTS = [ROOT / "data" / "content-ops"]
+DEFAULT_LEDGER = ROOT / ".cache" / "content-ops-ingest-ledger.json"
+USER_AGENT = "bocholt-content-ops-http-ingest/1.1"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Unkomprimierte NDJSON-Groesse je Bulk-Request; der Endpunkt dekodiert hoechstens 20 MB.
+BULK_MAX_RAW_BYTES = 4 * 1024 * 1024
+# Aeltere Endpunkte ohne NDJSON-Unterstuetzung antworten mit 400/415; dann wird einzeln gesendet.
+BULK_FALLBACK_STATUSES = {400, 415}
+LEDGER_MAX_ENTRIES = 5000
 
 
 def norm(value: Any) -> str:
@@ -55,37 +66,152 @@ def collect_payloads(inputs: Iterable[Path]) -> List[Tuple[Path, Dict[str, Any]]
     return payloads
 
 
-def post_payload(url: str, token: str, payload: Dict[str, Any], timeout: int) -> Dict[str, Any]:
-    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
-    request = urllib.request.Request(
-        url,
-        data=body,
-        method="POST",
-        headers={
-            "Accept": "application/json",
-            "Content-Type": "application/json; charset=utf-8",
-            "Authorization": f"Bearer {token}",
-            "X-BE-Content-Ops-Token": token,
-            "User-Agent": "bocholt-content-ops-http-ingest/1.0",
-        },
-    )
+def parse_response(text: str) -> Dict[str, Any]:
     try:
-        with urllib.request.urlopen(request, timeout=timeout) as response:
+        data = json.loads(text) if text else {}
+    except Exception:
+        return {"raw_response": text[:1000]}
+    return data if isinstance(data, dict) else {"raw_response": text[:1000]}
+
+
+class IngestConnection:
+    """One keep-alive HTTP(S) connection to the ingest endpoint; reconnects after errors or Connection: close."""
+
+    def __init__(self, url: str, timeout: int) -> None:
+        parts = urllib.parse.urlsplit(url)
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.netloc = parts.netloc
+        self.path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self.timeout = timeout
+        self.conn: Optional[http.client.HTTPConnection] = None
+        self.connects = 0
+        self.requests = 0
+
+    def post(self, body: bytes, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], str]:
+        if self.conn is None:
+            self.conn = self.connection_class(self.netloc, timeout=self.timeout)
+            self.connects += 1
+        try:
+            self.conn.request("POST", self.path, body=body, headers=headers)
+            response = self.conn.getresponse()
             text = response.read().decode("utf-8", errors="replace")
-            try:
-                data = json.loads(text) if text else {}
-            except Exception:
-                data = {"raw_response": text[:1000]}
-            return {"ok": 200 <= response.status < 300, "status_code": response.status, "response": data}
-    except urllib.error.HTTPError as exc:
-        text = exc.read().decode("utf-8", errors="replace") if exc.fp else ""
+        except (OSError, http.client.HTTPException):
+            self.close()
+            raise
+        finally:
+            self.requests += 1
+        if response.will_close:
+            self.close()
+        return response.status, {key.lower(): value for key, value in response.getheaders()}, text
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def retry_delay(attempt: int, backoff: float, retry_after: str) -> float:
+    if retry_after.isdigit():
+        return min(float(retry_after), 60.0)
+    return min(backoff * (2 ** attempt), 30.0)
+
+
+def post_with_retry(
+    connection: IngestConnection,
+    body: bytes,
+    headers: Dict[str, str],
+    retries: int,
+    backoff: float,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Dict[str, Any]:
+    """POST with exponential backoff on 429/5xx and connection errors."""
+    attempt = 0
+    while True:
         try:
-            data = json.loads(text) if text else {}
-        except Exception:
-            data = {"raw_response": text[:1000]}
-        return {"ok": False, "status_code": exc.code, "response": data}
-    except Exception as exc:
-        return {"ok": False, "status_code": 0, "response": {"error_class": type(exc).__name__, "error_message": str(exc)}}
+            status, response_headers, text = connection.post(body, headers)
+            result = {"ok": 200 <= status < 300, "status_code": status, "response": parse_response(text)}
+            retry_after = norm(response_headers.get("retry-after"))
+            retryable = status in RETRY_STATUSES
+        except (OSError, http.client.HTTPException) as exc:
+            result = {"ok": False, "status_code": 0, "response": {"error_class": type(exc).__name__, "error_message": str(exc)}}
+            retry_after = ""
+            retryable = True
+        result["attempts"] = attempt + 1
+        if not retryable or attempt >= retries:
+            return result
+        delay = retry_delay(attempt, backoff, retry_after)
+        print(f"⚠️ Content-Ops-Ingest HTTP {result['status_code']}, neuer Versuch in {delay:.1f}s", file=sys.stderr)
+        sleep(delay)
+        attempt += 1
+
+
+def request_headers(token: str, content_type: str) -> Dict[str, str]:
+    return {
+        "Accept": "application/json",
+        "Content-Type": content_type,
+        "Authorization": f"Bearer {token}",
+        "X-BE-Content-Ops-Token": token,
+        "User-Agent": USER_AGENT,
+        "Connection": "keep-alive",
+    }
+
+
+def post_payload(connection: IngestConnection, token: str, payload: Dict[str, Any], retries: int, backoff: float) -> Dict[str, Any]:
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return post_with_retry(connection, body, request_headers(token, "application/json; charset=utf-8"), retries, backoff)
+
+
+# === BEGIN BLOCK: BULK_NDJSON_INGEST_V1 | Zweck: mehrere Payloads als gzip-NDJSON in einem Request, Ledger bestaetigter Runs ===
+def bulk_batches(payloads: List[Tuple[Path, Dict[str, Any]]], max_raw_bytes: int = BULK_MAX_RAW_BYTES) -> List[Tuple[List[Tuple[Path, Dict[str, Any]]], bytes]]:
+    """Group payloads into NDJSON bodies of at most max_raw_bytes (uncompressed; a single larger payload gets its own batch)."""
+    batches: List[Tuple[List[Tuple[Path, Dict[str, Any]]], bytes]] = []
+    items: List[Tuple[Path, Dict[str, Any]]] = []
+    lines: List[bytes] = []
+    size = 0
+    for item in payloads:
+        line = json.dumps(item[1], ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+        if items and size + len(line) > max_raw_bytes:
+            batches.append((items, b"".join(lines)))
+            items, lines, size = [], [], 0
+        items.append(item)
+        lines.append(line)
+        size += len(line)
+    if items:
+        batches.append((items, b"".join(lines)))
+    return batches
+
+
+def post_bulk(connection: IngestConnection, token: str, ndjson: bytes, retries: int, backoff: float) -> Dict[str, Any]:
+    headers = request_headers(token, "application/x-ndjson; charset=utf-8")
+    headers["Content-Encoding"] = "gzip"
+    return post_with_retry(connection, gzip.compress(ndjson, compresslevel=6, mtime=0), headers, retries, backoff)
+
+
+def load_ledger(path: Path, url: str) -> Dict[str, str]:
+    """run_fingerprint -> confirmed_at for runs the endpoint at url already stored."""
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    confirmed = raw.get("endpoints", {}).get(url, {}) if isinstance(raw, dict) else {}
+    if not isinstance(confirmed, dict):
+        return {}
+    return {fp: confirmed_at for fp, confirmed_at in confirmed.items() if norm(fp)}
+
+
+def save_ledger(path: Path, url: str, confirmed: Dict[str, str]) -> None:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        raw = {}
+    endpoints = raw.get("endpoints", {}) if isinstance(raw, dict) else {}
+    newest = sorted(confirmed.items(), key=lambda entry: entry[1])[-LEDGER_MAX_ENTRIES:]
+    endpoints[url] = dict(newest)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f"{path.name}.tmp")
+    temp.write_text(json.dumps({"version": 1, "endpoints": endpoints}, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    temp.replace(path)
+# === END BLOCK: BULK_NDJSON_INGEST_V1 ===
 
 
 def write_step_summary(status: str, rows: List[Dict[str, Any]]) -> None:
@@ -116,6 +242,12 @@ def main() -> None:
     parser.add_argument("--url", default=norm(os.environ.get("CONTENT_OPS_INGEST_URL")))
     parser.add_argument("--token", default=norm(os.environ.get("CONTENT_OPS_INGEST_TOKEN")))
     parser.add_argument("--timeout", type=int, default=int(norm(os.environ.get("CONTENT_OPS_INGEST_TIMEOUT")) or "25"))
+    parser.add_argument("--bulk", action="store_true", default=norm(os.environ.get("CONTENT_OPS_INGEST_BULK")) == "1",
+                        help="Alle Payloads als gzip-NDJSON in moeglichst wenigen Requests senden.")
+    parser.add_argument("--retries", type=int, default=4, help="Neue Versuche bei 429/5xx und Verbindungsfehlern.")
+    parser.add_argument("--backoff", type=float, default=1.0, help="Basiswartezeit in Sekunden (verdoppelt sich je Versuch).")
+    parser.add_argument("--ledger", default=norm(os.environ.get("CONTENT_OPS_INGEST_LEDGER")) or str(DEFAULT_LEDGER.relative_to(ROOT)),
+                        help="JSON-Datei mit bereits bestaetigten run_fingerprints; leer deaktiviert den Ledger.")
     parser.add_argument("--fail-on-error", action="store_true")
     args = parser.parse_args()
 
@@ -131,23 +263,64 @@ def main() -> None:
         write_step_summary("skipped_no_payloads", [])
         return
 
+    ledger_path = Path(args.ledger) if args.ledger else None
+    if ledger_path is not None and not ledger_path.is_absolute():
+        ledger_path = ROOT / ledger_path
+    confirmed = load_ledger(ledger_path, args.url) if ledger_path else {}
+
     rows: List[Dict[str, Any]] = []
     errors = 0
-    for path, payload in payloads:
-        result = post_payload(args.url, args.token, payload, args.timeout)
-        ok = bool(result.get("ok"))
+
+    def record(path: Path, payload: Dict[str, Any], result: Dict[str, Any], ok: bool, label: str) -> None:
+        nonlocal errors
+        run_fp = norm(payload.get("run_fingerprint"))
         if not ok:
             errors += 1
+        elif run_fp:
+            # Ohne Fingerprint laesst sich ein Payload nicht wiedererkennen: nicht im Ledger vermerken.
+            confirmed[run_fp] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         row = {
             "path": str(path.relative_to(ROOT) if path.is_relative_to(ROOT) else path),
             "source_mode": payload.get("source_mode"),
             "run_fingerprint": payload.get("run_fingerprint"),
-            "result": "persisted_http_ingest" if ok else f"failed_http_ingest:{result.get('status_code')}",
+            "result": label if ok else f"failed_http_ingest:{result.get('status_code')}",
+            "attempts": result.get("attempts", 0),
             "response": result.get("response"),
         }
         rows.append(row)
         print(json.dumps(row, ensure_ascii=False, sort_keys=True))
 
+    pending: List[Tuple[Path, Dict[str, Any]]] = []
+    for path, payload in payloads:
+        run_fp = norm(payload.get("run_fingerprint"))
+        if run_fp and run_fp in confirmed:
+            record(path, payload, {"response": {}}, True, "skipped_already_confirmed")
+        else:
+            pending.append((path, payload))
+
+    connection = IngestConnection(args.url, args.timeout)
+    single: List[Tuple[Path, Dict[str, Any]]] = [] if args.bulk else pending
+    try:
+        if args.bulk:
+            for items, ndjson in bulk_batches(pending):
+                result = post_bulk(connection, args.token, ndjson, args.retries, args.backoff)
+                if result.get("status_code") in BULK_FALLBACK_STATUSES:
+                    single.extend(items)
+                    continue
+                response = result.get("response") or {}
+                stored = {norm(fp) for fp in response.get("confirmed", [])} if isinstance(response.get("confirmed"), list) else None
+                for path, payload in items:
+                    ok = bool(result.get("ok")) and (stored is None or norm(payload.get("run_fingerprint")) in stored)
+                    record(path, payload, result, ok, "persisted_http_ingest_bulk")
+        for path, payload in single:
+            result = post_payload(connection, args.token, payload, args.retries, args.backoff)
+            record(path, payload, result, bool(result.get("ok")), "persisted_http_ingest")
+    finally:
+        connection.close()
+        if ledger_path is not None:
+            save_ledger(ledger_path, args.url, confirmed)
+
+    print(f"HTTP-Ingest: {connection.requests} Requests ueber {connection.connects} Verbindung(en)")
     status = "persisted_http_ingest" if errors == 0 else f"partial_http_ingest_errors:{errors}"
     write_step_summary(status, rows)
     if errors and args.fail_on_error:
@@ -3,28 +3,36 @@
 from __future__ import annotations
 
 import argparse
+import base64
+import codecs
 import csv
 from collections import Counter
 import hashlib
-import html
 import json
 import os
 import re
 import socket
 import ssl
 import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
-from datetime import date, datetime, timedelta
+from functools import lru_cache
+from html.parser import HTMLParser
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
 from urllib.request import Request, urlopen
 
-from event_visual_keys import infer_event_visual_key, normalize_event_visual_key
+from event_identity import canonical_identity_url, load_event_identity_contract
+from event_visual_keys import normalize_event_visual_key
 from event_visual_motifs import (
+    VisualClassifier,
     event_visual_motif_role,
-    infer_event_visual_fit,
     normalize_event_visual_motif,
 )
 from event_description_quality import evaluate_event_description
@@ -35,6 +43,7 @@ RE_TIME = re.compile(r"^\s*(\d{1,2})[:.](\d{2})(?:\s*[-–]\s*(\d{1,2})[:.](\d{2
 HTTP_TIMEOUT_SECONDS = 12
 SOURCE_TEXT_TIMEOUT_SECONDS = 10
 SOURCE_TEXT_MAX_BYTES = 350_000
+SOURCE_TEXT_CHUNK_BYTES = 64 * 1024
 
 GERMAN_MONTHS = {
     1: ("januar", "jan"),
@@ -64,7 +73,15 @@ GENERIC_LOCATION_WORDS = {
 }
 
 
-SOURCE_TEXT_CACHE: Dict[str, Tuple[str, str, str]] = {}
+SOURCE_TEXT_CACHE: Dict[str, Tuple[str, str, "SourceText"]] = {}
+URL_CHECK_CACHE: Dict[str, Tuple[str, str]] = {}
+NETWORK_PREFETCH_WORKERS = 8
+NETWORK_PREFETCH_PER_HOST = 2
+NETWORK_PREFETCH_HOST_DELAY_SECONDS = 0.2
+HTTP_EVIDENCE_CACHE_VERSION = 2
+HTTP_EVIDENCE_CACHE_RETENTION_DAYS = 45
+# TTL je Ergebnisstatus: stabile Treffer lange, transiente Warnungen kurz.
+HTTP_EVIDENCE_CACHE_TTL_HOURS = {"ok": 72, "redirect": 72, "critical": 20, "warning": 4}
 
 SEVERITY_RANK = {
     "critical": 0,
@@ -1084,6 +1101,12 @@ def activity_direct_image_status(offer: Dict[str, Any]) -> str:
     return "direct_image_present"
 
 
+@lru_cache(maxsize=1)
+def shared_ssl_context() -> ssl.SSLContext:
+    # Laden des CA-Stores kostet ~40 ms CPU unter dem GIL; ein Kontext reicht fuer alle Threads.
+    return ssl.create_default_context()
+
+
 def check_url(url: str) -> Tuple[str, str]:
     """Returns (status, detail). status: ok|redirect|warning|critical."""
     url = norm(url)
@@ -1091,105 +1114,508 @@ def check_url(url: str) -> Tuple[str, str]:
         return "warning", "url_empty"
     if not is_http_url(url):
         return "warning", "url_not_http"
+    if url in URL_CHECK_CACHE:
+        return URL_CHECK_CACHE[url]
+
+    cached = HTTP_EVIDENCE_CACHE.lookup("check", url)
+    if cached and cached["fresh"]:
+        result = (cached["status"], cached["detail"])
+    else:
+        status, detail, validators = fetch_url_check(url, cached["validators"] if cached else {})
+        if status == "not_modified" and cached:
+            result = (cached["status"], cached["detail"])
+            HTTP_EVIDENCE_CACHE.revalidated("check", url, validators)
+        else:
+            result = (status, detail) if status != "not_modified" else ("ok", detail)
+            HTTP_EVIDENCE_CACHE.store("check", url, result, validators)
+    URL_CHECK_CACHE[url] = result
+    return result
+
+
+def response_validators(headers: Any) -> Dict[str, str]:
+    if headers is None:
+        return {}
+    return {
+        "etag": norm(headers.get("ETag")),
+        "last_modified": norm(headers.get("Last-Modified")),
+    }
+
+
+def conditional_headers(validators: Dict[str, str]) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
 
+def fetch_url_check(url: str, validators: Optional[Dict[str, str]] = None) -> Tuple[str, str, Dict[str, str]]:
+    """Returns (status, detail, validators); status not_modified answers a conditional request."""
     headers = {
         "User-Agent": "Bocholt-Erleben-ContentQualityGuard/1.0 (+https://bocholt-erleben.de)",
         "Accept": "text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8",
+        **conditional_headers(validators or {}),
     }
 
     for method in ("HEAD", "GET"):
         try:
             request = Request(url, method=method, headers=headers)
-            with urlopen(request, timeout=HTTP_TIMEOUT_SECONDS, context=ssl.create_default_context()) as response:
+            with urlopen(request, timeout=HTTP_TIMEOUT_SECONDS, context=shared_ssl_context()) as response:
                 code = getattr(response, "status", 0) or 0
                 final_url = response.geturl()
+                fresh_validators = response_validators(response.headers)
                 if 200 <= code < 400:
                     if final_url and final_url.rstrip("/") != url.rstrip("/"):
-                        return "redirect", f"{code} -> {final_url}"
-                    return "ok", str(code)
+                        return "redirect", f"{code} -> {final_url}", fresh_validators
+                    return "ok", str(code), fresh_validators
                 if 400 <= code < 500:
-                    return "critical", str(code)
+                    return "critical", str(code), {}
                 if code >= 500:
-                    return "warning", str(code)
+                    return "warning", str(code), {}
         except HTTPError as exc:
+            if exc.code == 304:
+                return "not_modified", "304", response_validators(exc.headers)
             if method == "HEAD" and exc.code in {403, 405, 406}:
                 continue
             if 400 <= exc.code < 500:
-                return "critical", str(exc.code)
-            return "warning", str(exc.code)
+                return "critical", str(exc.code), {}
+            return "warning", str(exc.code), {}
         except (TimeoutError, socket.timeout, URLError, OSError, ssl.SSLError) as exc:
             if method == "HEAD":
                 continue
-            return "warning", f"{type(exc).__name__}: {exc}"
+            return "warning", f"{type(exc).__name__}: {exc}", {}
 
-    return "warning", "url_check_unknown"
+    return "warning", "url_check_unknown", {}
 
 
-def text_probe_url(url: str) -> Tuple[str, str, str]:
+def text_probe_url(url: str) -> Tuple[str, str, "SourceText"]:
     """Fetch readable page text for evidence checks without changing data.
 
-    Returns (status, detail, text). status: ok|warning|critical.
+    Returns (status, detail, text). status: ok|warning|critical. text is the
+    evidence-normalized SourceText (lowercase, umlauts folded, token set).
     This is deliberately separate from check_url: a source may be reachable but
     not text-readable by the bot. That should usually be an observation, not an
     immediate user task.
     """
     url = norm(url)
     if not is_http_url(url):
-        return "warning", "url_not_http", ""
+        return "warning", "url_not_http", EMPTY_SOURCE_TEXT
     if url in SOURCE_TEXT_CACHE:
         return SOURCE_TEXT_CACHE[url]
 
+    cached = HTTP_EVIDENCE_CACHE.lookup("text", url)
+    if cached and cached["fresh"]:
+        result = (cached["status"], cached["detail"], cached["text"])
+    else:
+        status, detail, text, validators = fetch_source_text(url, cached["validators"] if cached else {})
+        if status == "not_modified" and cached:
+            result = (cached["status"], cached["detail"], cached["text"])
+            HTTP_EVIDENCE_CACHE.revalidated("text", url, validators)
+        else:
+            result = (status, detail, text) if status != "not_modified" else ("warning", f"{detail}: no_text", EMPTY_SOURCE_TEXT)
+            HTTP_EVIDENCE_CACHE.store("text", url, result, validators)
+    SOURCE_TEXT_CACHE[url] = result
+    return result
+
+
+def fetch_source_text(url: str, validators: Optional[Dict[str, str]] = None) -> Tuple[str, str, "SourceText", Dict[str, str]]:
     headers = {
         "User-Agent": "Bocholt-Erleben-ContentEvidenceProbe/1.0 (+https://bocholt-erleben.de)",
         "Accept": "text/html,application/xhtml+xml,text/plain;q=0.9,*/*;q=0.7",
+        **conditional_headers(validators or {}),
     }
     try:
         request = Request(url, method="GET", headers=headers)
-        with urlopen(request, timeout=SOURCE_TEXT_TIMEOUT_SECONDS, context=ssl.create_default_context()) as response:
+        with urlopen(request, timeout=SOURCE_TEXT_TIMEOUT_SECONDS, context=shared_ssl_context()) as response:
             code = getattr(response, "status", 0) or 0
-            raw = response.read(SOURCE_TEXT_MAX_BYTES)
             content_type = (response.headers.get("content-type") or "").lower()
             charset_match = re.search(r"charset=([^;]+)", content_type)
             charset = charset_match.group(1).strip() if charset_match else "utf-8"
-            try:
-                body = raw.decode(charset, errors="ignore")
-            except LookupError:
-                body = raw.decode("utf-8", errors="ignore")
-            text = html_to_text(body)
-            status = "ok" if 200 <= code < 400 and text else "warning"
-            detail = str(code) if text else f"{code}: no_text"
-            SOURCE_TEXT_CACHE[url] = (status, detail, text)
-            return SOURCE_TEXT_CACHE[url]
+            text = extract_source_text(read_source_chunks(response), charset)
+            status = "ok" if 200 <= code < 400 and text.text else "warning"
+            detail = str(code) if text.text else f"{code}: no_text"
+            return status, detail, text, response_validators(response.headers) if status == "ok" else {}
     except HTTPError as exc:
-        result = ("critical" if 400 <= exc.code < 500 else "warning", str(exc.code), "")
+        if exc.code == 304:
+            return "not_modified", "304", EMPTY_SOURCE_TEXT, response_validators(exc.headers)
+        return "critical" if 400 <= exc.code < 500 else "warning", str(exc.code), EMPTY_SOURCE_TEXT, {}
     except (TimeoutError, socket.timeout, URLError, OSError, ssl.SSLError) as exc:
-        result = ("warning", f"{type(exc).__name__}: {exc}", "")
-    SOURCE_TEXT_CACHE[url] = result
-    return result
+        return "warning", f"{type(exc).__name__}: {exc}", EMPTY_SOURCE_TEXT, {}
 
 
-def html_to_text(value: str) -> str:
-    value = re.sub(r"<script\b[^>]*>.*?</script>", " ", value, flags=re.I | re.S)
-    value = re.sub(r"<style\b[^>]*>.*?</style>", " ", value, flags=re.I | re.S)
-    value = re.sub(r"<[^>]+>", " ", value)
-    value = html.unescape(value)
-    value = re.sub(r"\s+", " ", value)
-    return value.strip()
+# === BEGIN BLOCK: HTTP_EVIDENCE_CACHE_V1 | Zweck: persistenter Cache fuer check_url/text_probe_url-Ergebnisse mit ETag/Last-Modified-Revalidierung und TTL je Ergebnisstatus; Umfang: JSON-Datei, per Workflow-Artefakt/Cache wiederherstellbar, aendert keine fachlichen Daten ===
+class HttpEvidenceCache:
+    """URL check and source text results keyed by canonical URL.
 
+    Entries younger than their TTL are served without a request. Older entries
+    with ETag/Last-Modified are revalidated with If-None-Match /
+    If-Modified-Since, so an unchanged source costs one 304 round-trip. Source
+    text is stored zlib-compressed and base64-encoded.
+    """
 
-def evidence_text(value: str) -> str:
-    text = norm(value).lower()
-    replacements = {
-        "ä": "ae",
-        "ö": "oe",
-        "ü": "ue",
-        "ß": "ss",
-        "–": "-",
-        "—": "-",
+    def __init__(self, path: Optional[Path] = None, *, now: Optional[datetime] = None) -> None:
+        self.path = path
+        self.now = now or datetime.now(timezone.utc)
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.stats: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    @classmethod
+    def load(cls, path: Optional[Path], *, now: Optional[datetime] = None) -> "HttpEvidenceCache":
+        cache = cls(path, now=now)
+        if path is None:
+            return cache
+        try:
+            data = load_json(path, required=False)
+        except (OSError, ValueError):
+            data = None
+        items = data.get("items") if isinstance(data, dict) and data.get("version") == HTTP_EVIDENCE_CACHE_VERSION else None
+        if isinstance(items, dict):
+            cache.items = {str(key): value for key, value in items.items() if isinstance(value, dict)}
+        cache.stats["entries_loaded"] = len(cache.items)
+        return cache
+
+    @staticmethod
+    def key(url: str) -> str:
+        return canonical_identity_url(url, load_event_identity_contract())
+
+    def lookup(self, kind: str, url: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self.items.get(self.key(url)) or {}
+            result = entry.get(kind)
+            if not isinstance(result, dict):
+                self.stats[f"{kind}_miss"] += 1
+                return None
+            fresh = norm(result.get("expires_at")) > self.now.isoformat(timespec="seconds")
+            self.stats[f"{kind}_fresh" if fresh else f"{kind}_stale"] += 1
+            revalidatable = norm(result.get("status")) in {"ok", "redirect"}
+            out = {
+                "fresh": fresh,
+                "status": norm(result.get("status")),
+                "detail": norm(result.get("detail")),
+                "validators": {name: norm(entry.get(name)) for name in ("etag", "last_modified")} if revalidatable else {},
+            }
+        if kind == "text":
+            out["text"] = SourceText.from_evidence_text(self._unpack_text(result.get("text_z")))
+        return out
+
+    def store(self, kind: str, url: str, result: Tuple[str, ...], validators: Dict[str, str]) -> None:
+        if not self.enabled:
+            return
+        status, detail = result[0], result[1]
+        record: Dict[str, Any] = {"status": status, "detail": detail, "checked_at": self.now.isoformat(timespec="seconds"), "expires_at": self._expires_at(status)}
+        if kind == "text":
+            record["text_z"] = self._pack_text(result[2].text if len(result) > 2 else "")
+        with self._lock:
+            entry = self.items.setdefault(self.key(url), {})
+            entry["url"] = url
+            entry[kind] = record
+            for name in ("etag", "last_modified"):
+                if validators.get(name):
+                    entry[name] = validators[name]
+            self.stats[f"{kind}_stored"] += 1
+
+    def revalidated(self, kind: str, url: str, validators: Dict[str, str]) -> None:
+        with self._lock:
+            entry = self.items.get(self.key(url)) or {}
+            record = entry.get(kind)
+            if not isinstance(record, dict):
+                return
+            record["checked_at"] = self.now.isoformat(timespec="seconds")
+            record["expires_at"] = self._expires_at(norm(record.get("status")))
+            for name in ("etag", "last_modified"):
+                if validators.get(name):
+                    entry[name] = validators[name]
+            self.stats[f"{kind}_not_modified"] += 1
+
+    def save(self) -> None:
+        if not self.enabled:
+            return
+        cutoff = (self.now - timedelta(days=HTTP_EVIDENCE_CACHE_RETENTION_DAYS)).isoformat(timespec="seconds")
+        with self._lock:
+            items = {
+                key: entry
+                for key, entry in sorted(self.items.items())
+                if max(norm((entry.get(kind) or {}).get("checked_at")) for kind in ("check", "text")) >= cutoff
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": HTTP_EVIDENCE_CACHE_VERSION, "generated_at": self.now.isoformat(timespec="seconds"), "items": items}
+        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+        self.stats["entries_saved"] = len(items)
+
+    def _expires_at(self, status: str) -> str:
+        hours = HTTP_EVIDENCE_CACHE_TTL_HOURS.get(status, min(HTTP_EVIDENCE_CACHE_TTL_HOURS.values()))
+        return (self.now + timedelta(hours=hours)).isoformat(timespec="seconds")
+
+    @staticmethod
+    def _pack_text(text: str) -> str:
+        if not text:
+            return ""
+        return base64.b64encode(zlib.compress(text.encode("utf-8"), 6)).decode("ascii")
+
+    @staticmethod
+    def _unpack_text(value: Any) -> str:
+        if not value:
+            return ""
+        try:
+            return zlib.decompress(base64.b64decode(str(value))).decode("utf-8")
+        except (ValueError, zlib.error):
+            return ""
+
+
+HTTP_EVIDENCE_CACHE = HttpEvidenceCache()
+# === END BLOCK: HTTP_EVIDENCE_CACHE_V1 ===
+
+
+# === BEGIN BLOCK: NETWORK_PREFETCH_V1 | Zweck: sammelt alle im Audit geprueften URLs vorab, prueft sie parallel mit Host-Limit/Hoeflichkeitspause und befuellt URL_CHECK_CACHE/SOURCE_TEXT_CACHE | Umfang: reine Beschleunigung, die Zeilenschleifen bleiben sequenziell und damit deterministisch ===
+def event_network_targets(
+    rows: List[Dict[str, str]],
+    source_suggestions: Dict[str, Dict[str, str]],
+    today: date,
+    horizon_days: int,
+    scope: str,
+) -> Tuple[List[str], List[str]]:
+    """Return (check_url targets, text_probe_url targets) that audit_event_rows will request.
+
+    Mirrors the row filters of audit_event_rows. A miss here only costs a
+    sequential fetch later; the results never depend on the prefetch.
+    """
+    horizon_end = today + timedelta(days=horizon_days)
+    check_urls: List[str] = []
+    text_urls: List[str] = []
+    for row in rows:
+        url = norm(row.get("source_url") or row.get("url") or row.get("event_url"))
+        start_date = parse_iso_date(norm(row.get("date") or row.get("start_date")))
+        if not start_date:
+            continue
+        end_date_value = norm(row.get("endDate") or row.get("end_date"))
+        end_date = parse_iso_date(end_date_value) if end_date_value else start_date
+        if end_date and end_date < today:
+            continue
+        in_daily_window = today <= start_date <= horizon_end
+        if scope == "daily" and not in_daily_window:
+            continue
+        if not is_http_url(url):
+            continue
+        if is_download_document_url(url) or is_ticket_portal_url(url):
+            suggested_url = source_suggestion_for_event(row, source_suggestions).get("suggested_url", "")
+            if is_http_url(suggested_url):
+                text_urls.append(suggested_url)
+            continue
+        check_urls.append(url)
+        if in_daily_window:
+            text_urls.append(url)
+    return check_urls, text_urls
+
+
+def activity_network_targets(offers: Any) -> List[str]:
+    """Return the check_url targets (source pages and remote images) of audit_activities."""
+    urls: List[str] = []
+    for offer in offers if isinstance(offers, list) else []:
+        if not isinstance(offer, dict):
+            continue
+        image = norm(offer.get("image"))
+        if is_http_url(image):
+            urls.append(image)
+        opening_status = offer.get("opening_status") if isinstance(offer.get("opening_status"), dict) else {}
+        source_url = norm(opening_status.get("source_url")) if opening_status else ""
+        source_url = source_url or norm(offer.get("url"))
+        if is_http_url(source_url):
+            urls.append(source_url)
+    return urls
+
+
+def interleave_by_host(jobs: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    by_host: Dict[str, List[Tuple[str, str]]] = {}
+    for job in jobs:
+        by_host.setdefault(url_host(job[1]), []).append(job)
+    queues = list(by_host.values())
+    out: List[Tuple[str, str]] = []
+    for position in range(max((len(queue) for queue in queues), default=0)):
+        out.extend(queue[position] for queue in queues if position < len(queue))
+    return out
+
+
+def prefetch_network_checks(
+    check_urls: Iterable[str],
+    text_urls: Iterable[str] = (),
+    *,
+    workers: int = NETWORK_PREFETCH_WORKERS,
+    per_host: int = NETWORK_PREFETCH_PER_HOST,
+    host_delay: float = NETWORK_PREFETCH_HOST_DELAY_SECONDS,
+) -> Dict[str, int]:
+    """Run deduplicated URL checks/text probes concurrently and fill the process caches.
+
+    At most per_host requests run against one host at a time and consecutive
+    request starts per host are host_delay seconds apart. Jobs are interleaved
+    across hosts so a single large host does not block the worker pool.
+    """
+    jobs = [("check", url) for url in dict.fromkeys(norm(url) for url in check_urls) if is_http_url(url) and url not in URL_CHECK_CACHE]
+    jobs += [("text", url) for url in dict.fromkeys(norm(url) for url in text_urls) if is_http_url(url) and url not in SOURCE_TEXT_CACHE]
+    jobs = interleave_by_host(jobs)
+    lock = threading.Lock()
+    host_slots: Dict[str, threading.BoundedSemaphore] = {}
+    host_next_start: Dict[str, float] = {}
+
+    def run(job: Tuple[str, str]) -> None:
+        kind, url = job
+        host = url_host(url)
+        with lock:
+            slot = host_slots.setdefault(host, threading.BoundedSemaphore(max(1, per_host)))
+        with slot:
+            with lock:
+                start_at = max(time.monotonic(), host_next_start.get(host, 0.0))
+                host_next_start[host] = start_at + max(0.0, host_delay)
+            wait = start_at - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            if kind == "check":
+                check_url(url)
+            else:
+                text_probe_url(url)
+
+    if jobs:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            list(executor.map(run, jobs))
+    return {
+        "check_urls": sum(1 for kind, _url in jobs if kind == "check"),
+        "text_urls": sum(1 for kind, _url in jobs if kind == "text"),
+        "hosts": len(host_slots),
     }
-    for src, target in replacements.items():
-        text = text.replace(src, target)
-    return re.sub(r"\s+", " ", text)
+# === END BLOCK: NETWORK_PREFETCH_V1 ===
+
+
+# === BEGIN BLOCK: SOURCE_TEXT_EXTRACTOR_V1 | Zweck: liest Quellseiten in Chunks, verwirft script/style und liefert in einem Durchlauf den fuer Faktenproben normalisierten Text plus Token-Menge | Umfang: ersetzt Regex-HTML-Bereinigung und wiederholte evidence_text-Laeufe je Feldpruefung ===
+EVIDENCE_TEXT_TRANSLATION = str.maketrans({
+    "ä": "ae",
+    "ö": "oe",
+    "ü": "ue",
+    "ß": "ss",
+    "–": "-",
+    "—": "-",
+})
+RE_EVIDENCE_TOKEN = re.compile(r"[a-z0-9][a-z0-9-]+")
+SOURCE_TEXT_SKIP_TAGS = frozenset({"script", "style"})
+
+
+def evidence_text(value: str) -> str:
+    return re.sub(r"\s+", " ", norm(value).lower().translate(EVIDENCE_TEXT_TRANSLATION))
+
+
+def evidence_tokens(text: str) -> set[str]:
+    tokens: set[str] = set()
+    for token in RE_EVIDENCE_TOKEN.findall(text):
+        tokens.add(token)
+        if "-" in token:
+            tokens.update(part for part in token.split("-") if part)
+    return tokens
+
+
+@dataclass(frozen=True)
+class SourceText:
+    """Evidence-normalized page text and the word tokens it contains.
+
+    Token hits are a fast path only: every token is a substring of text, so
+    field checks fall back to a substring scan and keep their old results.
+    """
+
+    text: str = ""
+    tokens: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_evidence_text(cls, text: str) -> "SourceText":
+        return cls(text, frozenset(evidence_tokens(text)))
+
+
+EMPTY_SOURCE_TEXT = SourceText()
+
+
+class SourceTextExtractor(HTMLParser):
+    """Incremental HTML-to-evidence-text parser fed with decoded response chunks.
+
+    HTMLParser may split one text run across feed() calls, so data is buffered
+    until the next markup boundary; the result does not depend on chunk sizes.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._skip_depth = 0
+        self._pending: list[str] = []
+        self._parts: list[str] = []
+        self._tokens: set[str] = set()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        self._flush()
+        if tag in SOURCE_TEXT_SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        self._flush()
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush()
+        if tag in SOURCE_TEXT_SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
+    def handle_decl(self, decl: str) -> None:
+        self._flush()
+
+    def handle_pi(self, data: str) -> None:
+        self._flush()
+
+    def unknown_decl(self, data: str) -> None:
+        self._flush()
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._pending.append(data)
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        piece = " ".join("".join(self._pending).lower().translate(EVIDENCE_TEXT_TRANSLATION).split())
+        self._pending.clear()
+        if piece:
+            self._parts.append(piece)
+            self._tokens.update(evidence_tokens(piece))
+
+    def result(self) -> SourceText:
+        self.close()
+        self._flush()
+        return SourceText(" ".join(self._parts), frozenset(self._tokens))
+
+
+def read_source_chunks(response: Any, limit: int = SOURCE_TEXT_MAX_BYTES) -> Iterable[bytes]:
+    remaining = limit
+    while remaining > 0:
+        chunk = response.read(min(SOURCE_TEXT_CHUNK_BYTES, remaining))
+        if not chunk:
+            return
+        remaining -= len(chunk)
+        yield chunk
+
+
+def extract_source_text(chunks: Iterable[bytes], charset: str = "utf-8") -> SourceText:
+    try:
+        decoder = codecs.getincrementaldecoder(charset)(errors="ignore")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    extractor = SourceTextExtractor()
+    for chunk in chunks:
+        extractor.feed(decoder.decode(chunk))
+    extractor.feed(decoder.decode(b"", final=True))
+    return extractor.result()
+# === END BLOCK: SOURCE_TEXT_EXTRACTOR_V1 ===
 
 
 def significant_tokens(value: str, *, min_len: int = 4, max_tokens: int = 8) -> list[str]:
@@ -1207,11 +1633,10 @@ def significant_tokens(value: str, *, min_len: int = 4, max_tokens: int = 8) ->
     return tokens
 
 
-def text_has_tokens(text: str, tokens: list[str], *, minimum: int = 1) -> bool:
-    haystack = evidence_text(text)
+def text_has_tokens(text: SourceText, tokens: list[str], *, minimum: int = 1) -> bool:
     hits = 0
     for token in tokens:
-        if token and token in haystack:
+        if token and (token in text.tokens or token in text.text):
             hits += 1
         if hits >= minimum:
             return True
@@ -1262,18 +1687,17 @@ def time_variants(value: str) -> list[str]:
     return [evidence_text(v) for v in variants]
 
 
-def text_has_any_variant(text: str, variants: list[str]) -> bool:
-    haystack = evidence_text(text)
-    return any(variant and variant in haystack for variant in variants)
+def text_has_any_variant(text: SourceText, variants: list[str]) -> bool:
+    return any(variant and (variant in text.tokens or variant in text.text) for variant in variants)
 
 
-def source_text_has_time_hint(text: str) -> bool:
+def source_text_has_time_hint(text: SourceText) -> bool:
     """Detect plausible event-time hints in source text when the dataset has no time value.
 
     This is intentionally only a hint. It must not auto-write event times because
     page footers, opening hours or unrelated programme blocks can contain times.
     """
-    haystack = evidence_text(text)
+    haystack = text.text
     if not haystack:
         return False
     return bool(re.search(r"\b(?:[01]?\d|2[0-3])[:.][0-5]\d(?:\s*(?:uhr|uur))?\b|\b(?:[01]?\d|2[0-3])\s*(?:uhr|uur)\b", haystack))
@@ -1392,7 +1816,7 @@ def evaluate_event_source_evidence(row: Dict[str, str], source_system: str, evid
         }
 
     status, detail, text = text_probe_url(evidence_url)
-    if status != "ok" or not text:
+    if status != "ok" or not text.text:
         add_observation(
             content_type="event",
             source_system=source_system,
@@ -1530,7 +1954,7 @@ def evaluate_activity_source_evidence(offer: Dict[str, Any], source_url: str, *,
         }
 
     status, detail, text = text_probe_url(source_url)
-    if status != "ok" or not text:
+    if status != "ok" or not text.text:
         add_observation(
             content_type="activity",
             source_system="offers_json",
@@ -1615,21 +2039,22 @@ def event_visual_pool_payload(event_visual_pools: Dict[str, Dict[str, Any]]) ->
     return {"pools": event_visual_pools}
 
 
-def event_visual_fit_from_row(row: Dict[str, str], event_visual_pools: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+def event_visual_fit_from_row(row: Dict[str, str], visual_classifier: VisualClassifier) -> Dict[str, str]:
     visual_key = norm(row.get("visual_key"))
     visual_motif = norm(row.get("visual_motif") or row.get("image_visual_motif") or row.get("visualMotif"))
-    fit = infer_event_visual_fit(
+    visual = visual_classifier.classify(
         title=row.get("title", ""),
         description=row.get("description", ""),
         category=row.get("kategorie", ""),
         location=row.get("location", ""),
         visual_key=visual_key,
         visual_motif=visual_motif,
-        pool_payload=event_visual_pool_payload(event_visual_pools),
     )
+    fit = visual.as_fit()
     fit["visual_motif_role"] = event_visual_motif_role(fit.get("visual_key", ""), fit.get("visual_motif", ""))
     fit["source_visual_key"] = visual_key
     fit["source_visual_motif"] = visual_motif
+    fit["inferred_visual_key"] = visual.inferred_visual_key
     return fit
 
 
@@ -1739,6 +2164,7 @@ def audit_event_rows(
     seen_ids: Dict[str, str] = {}
     seen_fp: Dict[str, str] = {}
     visual_occurrences: list[Dict[str, str]] = []
+    visual_classifier = VisualClassifier(event_visual_pool_payload(event_visual_pools))
 
     horizon_end = today + timedelta(days=horizon_days)
     total_rows = len(rows)
@@ -2246,7 +2672,7 @@ def audit_event_rows(
 
         visual_key = norm(row.get("visual_key"))
         visual_motif = norm(row.get("visual_motif") or row.get("image_visual_motif") or row.get("visualMotif"))
-        visual_fit = event_visual_fit_from_row(row, event_visual_pools)
+        visual_fit = event_visual_fit_from_row(row, visual_classifier)
         suggested_visual_key = norm(visual_fit.get("visual_key"))
         suggested_visual_motif = norm(visual_fit.get("visual_motif"))
         suggested_visual_motif_role = norm(visual_fit.get("visual_motif_role"))
@@ -2303,12 +2729,7 @@ def audit_event_rows(
                 ))
         else:
             normalized_visual_key = normalize_event_visual_key(visual_key) or visual_key
-            inferred_visual_key = infer_event_visual_key(
-                title=row.get("title"),
-                description=row.get("description"),
-                category=row.get("kategorie"),
-                location=row.get("location"),
-            )
+            inferred_visual_key = norm(visual_fit.get("inferred_visual_key"))
             if inferred_visual_key and normalized_visual_key != inferred_visual_key:
                 add_observation(
                     content_type="event",
@@ -3725,16 +4146,52 @@ def write_json_report(
 ) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     payload = {
+        **report_header(issues, meta, search_feedback, visual_feedback),
+        "issues": [asdict(item) for item in issues],
+        "observations": [asdict(item) for item in OBSERVATIONS],
+    }
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def report_header(
+    issues: List[Issue],
+    meta: Dict[str, Any],
+    search_feedback: Dict[str, Any] | None = None,
+    visual_feedback: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
+    return {
         "meta": meta,
         "summary": summarize(issues),
         "verification_summary": dict(VERIFICATION_STATS),
         "observations_summary": summarize_observations(OBSERVATIONS),
         "search_feedback_summary": (search_feedback or {}).get("summary", {}),
         "visual_feedback_summary": (visual_feedback or {}).get("summary", {}),
-        "issues": [asdict(item) for item in issues],
-        "observations": [asdict(item) for item in OBSERVATIONS],
     }
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def issues_ndjson_for_report(report_path: Path) -> Path:
+    """Issue stream next to the JSON report (...-report.json -> ...-issues.ndjson); content-ops-control derives the same path."""
+    name = report_path.name
+    if name.endswith("-report.json"):
+        return report_path.with_name(name[: -len("-report.json")] + "-issues.ndjson")
+    return report_path.with_name(f"{report_path.stem}.issues.ndjson")
+
+
+def write_issues_ndjson(
+    path: Path,
+    issues: List[Issue],
+    meta: Dict[str, Any],
+    search_feedback: Dict[str, Any] | None = None,
+    visual_feedback: Dict[str, Any] | None = None,
+) -> None:
+    """Report header as {"_report": ...} in line 1, then one issue per line for streaming consumers (content-ops-control)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f"{path.name}.tmp")
+    with temp.open("w", encoding="utf-8") as handle:
+        handle.write(json.dumps({"_report": report_header(issues, meta, search_feedback, visual_feedback)}, ensure_ascii=False) + "\n")
+        for item in issues:
+            handle.write(json.dumps(asdict(item), ensure_ascii=False) + "\n")
+    temp.replace(path)
 
 
 def write_markdown_report(
@@ -3847,6 +4304,7 @@ def main() -> None:
     parser.add_argument("--activity-visual-pool", default="data/activity_visual_pool.json")
     parser.add_argument("--output-json", default="data/content-quality-report.json")
     parser.add_argument("--output-md", default="data/content-quality-report.md")
+    parser.add_argument("--output-issues-ndjson", default=None, help="Issues als NDJSON fuer content-ops-control (Standard: neben --output-json, ...-issues.ndjson); leerer Wert deaktiviert die Datei.")
     parser.add_argument("--verification-cache-json", default="data/content-verification-cache.json")
     parser.add_argument("--ai-candidates-json", default="data/content-ai-verification-candidates.json")
     parser.add_argument("--search-feedback-json", default="data/content-search-feedback.json")
@@ -3855,6 +4313,9 @@ def main() -> None:
     parser.add_argument("--base-url", default="https://bocholt-erleben.de")
     parser.add_argument("--horizon-days", type=int, default=14)
     parser.add_argument("--network", action="store_true")
+    parser.add_argument("--network-workers", type=int, default=NETWORK_PREFETCH_WORKERS)
+    parser.add_argument("--network-per-host", type=int, default=NETWORK_PREFETCH_PER_HOST)
+    parser.add_argument("--http-cache-json", default=".cache/content-http-evidence-cache.json", help="Persistenter HTTP-Evidenz-Cache; leerer Wert deaktiviert ihn.")
     parser.add_argument("--fail-on-critical", action="store_true")
     args = parser.parse_args()
 
@@ -3876,6 +4337,25 @@ def main() -> None:
     db_event_rows = load_db_events(ROOT / args.db_events_json)
     log_checkpoint(f"content rows loaded: sheet_events={len(event_rows)} ({event_source}), db_events={len(db_event_rows)}")
 
+    global HTTP_EVIDENCE_CACHE
+    if args.network and norm(args.http_cache_json):
+        HTTP_EVIDENCE_CACHE = HttpEvidenceCache.load(ROOT / args.http_cache_json)
+        log_checkpoint(f"http evidence cache loaded: {args.http_cache_json}, entries={len(HTTP_EVIDENCE_CACHE.items)}")
+
+    if args.network:
+        check_urls: List[str] = []
+        text_urls: List[str] = []
+        for rows in (event_rows, db_event_rows):
+            row_check_urls, row_text_urls = event_network_targets(rows, source_suggestions, today, args.horizon_days, args.scope)
+            check_urls.extend(row_check_urls)
+            text_urls.extend(row_text_urls)
+        if args.scope in {"deploy-gate", "full"}:
+            offers_payload = load_json(ROOT / args.offers_json, required=False) or {}
+            check_urls.extend(activity_network_targets(offers_payload.get("offers") if isinstance(offers_payload, dict) else []))
+        log_checkpoint(f"network prefetch start: check_urls={len(check_urls)}, text_urls={len(text_urls)}, workers={args.network_workers}, per_host={args.network_per_host}")
+        prefetch_stats = prefetch_network_checks(check_urls, text_urls, workers=args.network_workers, per_host=args.network_per_host)
+        log_checkpoint(f"network prefetch done: unique_checks={prefetch_stats['check_urls']}, unique_text_probes={prefetch_stats['text_urls']}, hosts={prefetch_stats['hosts']}")
+
     issues: List[Issue] = []
     if not event_rows:
         issues.append(issue(
@@ -3933,6 +4413,10 @@ def main() -> None:
 
     issues.sort(key=lambda x: (SEVERITY_RANK.get(x.severity, 9), x.workbench_group, x.content_type, x.date, x.title, x.issue_code))
 
+    if HTTP_EVIDENCE_CACHE.enabled:
+        HTTP_EVIDENCE_CACHE.save()
+        log_checkpoint(f"http evidence cache saved: {args.http_cache_json}, stats={dict(sorted(HTTP_EVIDENCE_CACHE.stats.items()))}")
+
     meta = {
         "generated_at": datetime.now().isoformat(timespec="seconds"),
         "scope": args.scope,
@@ -3943,6 +4427,7 @@ def main() -> None:
         "base_url": args.base_url,
         "source_suggestions_loaded": len(source_suggestions),
         "verification_cache_entries_loaded": len(VERIFICATION_CACHE),
+        "http_evidence_cache": dict(sorted(HTTP_EVIDENCE_CACHE.stats.items())),
         "ai_max_candidates": max(0, args.ai_max_candidates),
     }
 
@@ -3967,6 +4452,10 @@ def main() -> None:
 
     log_checkpoint("write reports start")
     write_json_report(ROOT / args.output_json, issues, meta, search_feedback, visual_feedback)
+    if args.output_issues_ndjson is None:
+        write_issues_ndjson(issues_ndjson_for_report(ROOT / args.output_json), issues, meta, search_feedback, visual_feedback)
+    elif args.output_issues_ndjson:
+        write_issues_ndjson(ROOT / args.output_issues_ndjson, issues, meta, search_feedback, visual_feedback)
     write_markdown_report(ROOT / args.output_md, issues, meta, search_feedback, visual_feedback)
     write_ai_candidates_report(ROOT / args.ai_candidates_json, candidates, meta)
     write_search_feedback_report(ROOT / args.search_feedback_json, search_feedback)
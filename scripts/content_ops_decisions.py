@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import json
 import re
+from dataclasses import dataclass
 from datetime import date, datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_CONTRACT_PATH = ROOT / "data" / "content_ops_decision_classes.json"
@@ -36,54 +38,101 @@ def load_decision_contract(path: str = str(DEFAULT_CONTRACT_PATH)) -> dict[str,
     return json.loads(p.read_text(encoding="utf-8"))
 
 
-def resolve_decision_class(row: dict[str, Any], contract: dict[str, Any] | None = None) -> str:
-    contract = contract or load_decision_contract()
-    classes = contract.get("decision_classes") or {}
-    aliases = contract.get("status_aliases") or {}
+# === BEGIN BLOCK: DECISION_CONTRACT_TABLES_V1 | Zweck: Vertrag einmal in Lookup-Tabellen uebersetzen; heisse Aufrufe ohne Meta-Kopien ===
+ALIAS_FIELDS = ("status", "review_status", "action_state", "decision", "resolution_type")
+SNOOZE_DATE_FIELDS = ("suppress_until", "recheck_at", "next_review_at")
+EFFECT_KEY_FIELDS = ("decision_class",) + ALIAS_FIELDS + SNOOZE_DATE_FIELDS
+EMPTY_META: Mapping[str, Any] = MappingProxyType({})
 
-    explicit = norm_token(row.get("decision_class"))
-    if explicit in classes:
-        return explicit
 
-    for field in ("status", "review_status", "action_state", "decision", "resolution_type"):
-        token = norm_token(row.get(field))
-        if token in aliases:
-            return str(aliases[token])
-    return ""
+@dataclass(frozen=True, eq=False)
+class DecisionTables:
+    classes: Mapping[str, Mapping[str, Any]]  # decision_class -> eingefrorene Meta
+    aliases: Mapping[str, str]  # Status-Alias -> decision_class
 
 
-def decision_meta(decision_class: str, contract: dict[str, Any] | None = None) -> dict[str, Any]:
-    contract = contract or load_decision_contract()
-    return dict((contract.get("decision_classes") or {}).get(decision_class, {}))
+def compile_decision_contract(contract: dict[str, Any]) -> DecisionTables:
+    classes = {str(name): MappingProxyType(dict(meta or {})) for name, meta in (contract.get("decision_classes") or {}).items()}
+    aliases = {str(alias): str(cls) for alias, cls in (contract.get("status_aliases") or {}).items()}
+    return DecisionTables(classes=MappingProxyType(classes), aliases=MappingProxyType(aliases))
 
 
-def is_suppression_active(row: dict[str, Any], today: date | None = None, contract: dict[str, Any] | None = None) -> bool:
-    today = today or date.today()
+_COMPILED: list[tuple[dict[str, Any], DecisionTables]] = []
+
+
+def decision_tables(contract: dict[str, Any] | None = None) -> DecisionTables:
+    """Compiled tables for the last contract object used; a contract must not be mutated after its first use."""
     contract = contract or load_decision_contract()
-    cls = resolve_decision_class(row, contract)
-    meta = decision_meta(cls, contract)
+    if _COMPILED and _COMPILED[0][0] is contract:
+        return _COMPILED[0][1]
+    tables = compile_decision_contract(contract)
+    _COMPILED[:] = [(contract, tables)]
+    return tables
+
 
+def _resolve(row: Mapping[str, Any], tables: DecisionTables) -> str:
+    explicit = norm_token(row.get("decision_class"))
+    if explicit in tables.classes:
+        return explicit
+    for field in ALIAS_FIELDS:
+        token = norm_token(row.get(field))
+        if token in tables.aliases:
+            return tables.aliases[token]
+    return ""
+
+
+def _suppressed(row: Mapping[str, Any], cls: str, meta: Mapping[str, Any], today: date) -> bool:
     if cls == "snoozed":
         until = parse_day(row.get("suppress_until") or row.get("recheck_at") or row.get("next_review_at"))
         return bool(until and until >= today)
-
     return bool(meta.get("suppresses_reopen", False))
 
 
-def target_effect(row: dict[str, Any], today: date | None = None, contract: dict[str, Any] | None = None) -> dict[str, Any]:
-    today = today or date.today()
-    contract = contract or load_decision_contract()
-    cls = resolve_decision_class(row, contract)
-    meta = decision_meta(cls, contract)
-    return {
+@lru_cache(maxsize=4096)
+def _effect(tables: DecisionTables, today: date, values: tuple[str, ...]) -> Mapping[str, Any]:
+    row = dict(zip(EFFECT_KEY_FIELDS, values))
+    cls = _resolve(row, tables)
+    meta = tables.classes.get(cls, EMPTY_META)
+    return MappingProxyType({
         "decision_class": cls,
         "task_state": meta.get("task_state", "open"),
         "default_effect": meta.get("default_effect", "manual_review"),
-        "suppress": is_suppression_active(row, today, contract),
+        "suppress": _suppressed(row, cls, meta, today),
         "recheck": bool(meta.get("requires_recheck", False)),
         "watch_effect": bool(meta.get("requires_effect_watch", False)),
         "needs_task": meta.get("task_state") == "open",
-    }
+    })
+
+
+def decision_cache_stats() -> dict[str, Any]:
+    """Treffer/Fehlgriffe des Wirkungs-Memos (fuer Benchmarks und Reports)."""
+    return {"effect_memo": _effect.cache_info()._asdict()}
+
+
+def clear_decision_caches() -> None:
+    _effect.cache_clear()
+    _COMPILED.clear()
+# === END BLOCK: DECISION_CONTRACT_TABLES_V1 ===
+
+
+def resolve_decision_class(row: dict[str, Any], contract: dict[str, Any] | None = None) -> str:
+    return _resolve(row, decision_tables(contract))
+
+
+def decision_meta(decision_class: str, contract: dict[str, Any] | None = None) -> dict[str, Any]:
+    return dict(decision_tables(contract).classes.get(decision_class, EMPTY_META))
+
+
+def is_suppression_active(row: dict[str, Any], today: date | None = None, contract: dict[str, Any] | None = None) -> bool:
+    tables = decision_tables(contract)
+    cls = _resolve(row, tables)
+    return _suppressed(row, cls, tables.classes.get(cls, EMPTY_META), today or date.today())
+
+
+def target_effect(row: dict[str, Any], today: date | None = None, contract: dict[str, Any] | None = None) -> dict[str, Any]:
+    # Memo-Schluessel sind nur die Felder, die Klasse und Unterdrueckung bestimmen (als Text wie in norm_token/parse_day).
+    values = tuple(str(row.get(field) or "") for field in EFFECT_KEY_FIELDS)
+    return dict(_effect(decision_tables(contract), today or date.today(), values))
 
 
 def rule_quality_metric_keys(contract: dict[str, Any] | None = None) -> list[str]:
@@ -94,6 +143,10 @@ def rule_quality_metric_keys(contract: dict[str, Any] | None = None) -> list[str
 __all__ = [
     "DEFAULT_CONTRACT_PATH",
     "load_decision_contract",
+    "compile_decision_contract",
+    "decision_tables",
+    "decision_cache_stats",
+    "clear_decision_caches",
     "norm_token",
     "parse_day",
     "resolve_decision_class",
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import json
 import re
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_CONTRACT_PATH = ROOT / "data" / "content_ops_visual_feedback_contract.json"
@@ -24,9 +26,61 @@ def load_visual_feedback_contract(path: str = str(DEFAULT_CONTRACT_PATH)) -> dic
     return json.loads(Path(path).read_text(encoding="utf-8"))
 
 
+# === BEGIN BLOCK: VISUAL_CONTRACT_TABLES_V1 | Zweck: Problemtyp-Ergebnisse vorberechnet, Textregeln je Feldwert gecacht ===
+# Regeln in Prioritaet (Rang); ein Token matcht, wenn er in einem normalisierten Feldwert vorkommt.
+# Feldwerte sind Tokens ohne Leerzeichen, daher entspricht die Suche je Feld der Suche im alten Text-Blob.
+VISUAL_TEXT_RULES: tuple[tuple[int, str, tuple[str, ...]], ...] = (
+    (0, "accepted", ("accepted", "valid_visual", "visual_ok")),
+    (1, "source_or_rights_issue", ("rights", "copyright", "license", "lizenz", "quelle", "source_rights")),
+    (2, "asset_missing", ("asset_gap", "asset_missing", "missing_asset", "no_asset", "fallback_missing", "image_missing")),
+    (3, "asset_low_quality", ("low_quality", "bad_quality", "blurry", "blurred", "remaster", "crop_bad", "upscale")),
+    (4, "visual_key_wrong", ("visual_key_wrong", "key_wrong", "wrong_key", "resolver", "mapping_wrong")),
+    (6, "visual_motif_wrong", ("motif_wrong", "motiv_wrong", "motif_fit", "motiv_passt_nicht", "motif_mismatch", "visual_motif")),
+    (7, "visual_review", ("visual",)),
+)
+ASSET_GAP_STATUSES = frozenset({"missing", "gap", "asset_gap", "missing_asset"})
+ASSET_GAP_RANK = 2
+KEY_MISMATCH_RANK = 5
+RANK_PROBLEM_TYPES = {rank: problem for rank, problem, _ in VISUAL_TEXT_RULES} | {KEY_MISMATCH_RANK: "visual_key_wrong"}
+NO_MATCH_RANK = 99
+_RULE_PATTERNS = tuple((rank, re.compile("|".join(re.escape(token) for token in tokens))) for rank, _, tokens in VISUAL_TEXT_RULES)
+
+# (Feldname, Alternativen) in der Reihenfolge des frueheren Text-Blobs.
+TEXT_FIELDS: tuple[tuple[str, ...], ...] = (
+    ("issue_code",),
+    ("process_category",),
+    ("action_route", "safe_action", "route"),
+    ("visual_asset_status", "asset_status"),
+    ("visual_key", "current_visual_key"),
+    ("suggested_visual_key",),
+    ("title",),
+    ("recommended_action",),
+    ("decision_note",),
+    ("visual_motif_status",),
+    ("motif_fit",),
+)
+EXPLICIT_FIELDS = ("visual_problem_type", "problem_type", "visual_issue_type")
+KEY_FIELDS = EXPLICIT_FIELDS + tuple(name for names in TEXT_FIELDS for name in names)
+
+EMPTY_RESULT: Mapping[str, Any] = MappingProxyType({
+    "problem_type": "",
+    "decision_class": "",
+    "default_effect": "",
+    "followup_route": "",
+    "requires_task": False,
+    "label": "",
+})
+
+
+@dataclass(frozen=True, eq=False)
+class VisualTables:
+    problem_types: frozenset[str]  # Problemtypen des Vertrags (explizite Angaben)
+    results: Mapping[str, Mapping[str, Any]]  # problem_type -> fertiges Ergebnis
+
+
 def _contract_result(problem_type: str, contract: dict[str, Any]) -> dict[str, Any]:
     problem_types = contract.get("problem_types") or {}
-    meta = dict(problem_types.get(problem_type) or problem_types.get("visual_review") or {})
+    meta = problem_types.get(problem_type) or problem_types.get("visual_review") or {}
     return {
         "problem_type": problem_type if problem_type in problem_types else "visual_review",
         "decision_class": str(meta.get("decision_class") or "needs_visual_fix"),
@@ -37,64 +91,85 @@ def _contract_result(problem_type: str, contract: dict[str, Any]) -> dict[str, A
     }
 
 
-def classify_visual_issue(row: dict[str, Any], contract: dict[str, Any] | None = None) -> dict[str, Any]:
-    contract = contract or load_visual_feedback_contract()
-    problem_types = contract.get("problem_types") or {}
+def compile_visual_contract(contract: dict[str, Any]) -> VisualTables:
+    problem_types = frozenset(contract.get("problem_types") or {})
+    results = {name: MappingProxyType(_contract_result(name, contract)) for name in problem_types | set(RANK_PROBLEM_TYPES.values())}
+    return VisualTables(problem_types=problem_types, results=MappingProxyType(results))
+
+
+_COMPILED: list[tuple[dict[str, Any], VisualTables]] = []
+
 
-    explicit = norm_token(row.get("visual_problem_type") or row.get("problem_type") or row.get("visual_issue_type"))
-    if explicit in problem_types:
-        return _contract_result(explicit, contract)
-
-    issue_code = norm_token(row.get("issue_code"))
-    category = norm_token(row.get("process_category"))
-    route = norm_token(row.get("action_route") or row.get("safe_action") or row.get("route"))
-    asset_status = norm_token(row.get("visual_asset_status") or row.get("asset_status"))
-    visual_key = norm_token(row.get("visual_key") or row.get("current_visual_key"))
-    suggested_key = norm_token(row.get("suggested_visual_key"))
-    text = " ".join([
-        issue_code,
-        category,
-        route,
-        asset_status,
-        visual_key,
-        suggested_key,
-        norm_token(row.get("title")),
-        norm_token(row.get("recommended_action")),
-        norm_token(row.get("decision_note")),
-        norm_token(row.get("visual_motif_status")),
-        norm_token(row.get("motif_fit")),
-    ])
-
-    if any(token in text for token in ("accepted", "valid_visual", "visual_ok")):
-        return _contract_result("accepted", contract)
-    if any(token in text for token in ("rights", "copyright", "license", "lizenz", "quelle", "source_rights")):
-        return _contract_result("source_or_rights_issue", contract)
-    if any(token in text for token in ("asset_gap", "asset_missing", "missing_asset", "no_asset", "fallback_missing", "image_missing")) or asset_status in {"missing", "gap", "asset_gap", "missing_asset"}:
-        return _contract_result("asset_missing", contract)
-    if any(token in text for token in ("low_quality", "bad_quality", "blurry", "blurred", "remaster", "crop_bad", "upscale")):
-        return _contract_result("asset_low_quality", contract)
-    if any(token in text for token in ("visual_key_wrong", "key_wrong", "wrong_key", "resolver", "mapping_wrong")):
-        return _contract_result("visual_key_wrong", contract)
+def visual_tables(contract: dict[str, Any] | None = None) -> VisualTables:
+    """Compiled tables for the last contract object used; a contract must not be mutated after its first use."""
+    contract = contract or load_visual_feedback_contract()
+    if _COMPILED and _COMPILED[0][0] is contract:
+        return _COMPILED[0][1]
+    tables = compile_visual_contract(contract)
+    _COMPILED[:] = [(contract, tables)]
+    return tables
+
+
+@lru_cache(maxsize=8192)
+def token_rank(token: str) -> int:
+    """Rank of the first text rule matching a normalized field value; issue codes and categories repeat, so this is mostly a dict hit."""
+    for rank, pattern in _RULE_PATTERNS:
+        if pattern.search(token):
+            return rank
+    return NO_MATCH_RANK
+
+
+@lru_cache(maxsize=8192)
+def _norm_cached(value: str) -> str:
+    return norm_token(value)
+
+
+@lru_cache(maxsize=4096)
+def _classify(tables: VisualTables, values: tuple[str, ...]) -> Mapping[str, Any]:
+    row = dict(zip(KEY_FIELDS, values))
+    explicit = _norm_cached(next((row[name] for name in EXPLICIT_FIELDS if row[name]), ""))
+    if explicit in tables.problem_types:
+        return tables.results[explicit]
+    tokens = [_norm_cached(next((row[name] for name in names if row[name]), "")) for names in TEXT_FIELDS]
+    rank = min((token_rank(token) for token in tokens if token), default=NO_MATCH_RANK)
+    asset_status, visual_key, suggested_key = tokens[3], tokens[4], tokens[5]
+    if asset_status in ASSET_GAP_STATUSES:
+        rank = min(rank, ASSET_GAP_RANK)
     if suggested_key and visual_key and suggested_key != visual_key:
-        return _contract_result("visual_key_wrong", contract)
-    if any(token in text for token in ("motif_wrong", "motiv_wrong", "motif_fit", "motiv_passt_nicht", "motif_mismatch", "visual_motif")):
-        return _contract_result("visual_motif_wrong", contract)
-    if "visual" in text:
-        return _contract_result("visual_review", contract)
+        rank = min(rank, KEY_MISMATCH_RANK)
+    if rank == NO_MATCH_RANK:
+        return EMPTY_RESULT
+    return tables.results[RANK_PROBLEM_TYPES[rank]]
+
 
+def visual_cache_stats() -> dict[str, Any]:
+    """Treffer/Fehlgriffe der Klassifikations- und Token-Memos (fuer Benchmarks und Reports)."""
     return {
-        "problem_type": "",
-        "decision_class": "",
-        "default_effect": "",
-        "followup_route": "",
-        "requires_task": False,
-        "label": "",
+        "classify_memo": _classify.cache_info()._asdict(),
+        "token_ranks": token_rank.cache_info()._asdict(),
+        "normalized_values": _norm_cached.cache_info()._asdict(),
     }
 
 
+def clear_visual_caches() -> None:
+    for cached in (_classify, token_rank, _norm_cached):
+        cached.cache_clear()
+    _COMPILED.clear()
+# === END BLOCK: VISUAL_CONTRACT_TABLES_V1 ===
+
+
+def classify_visual_issue(row: dict[str, Any], contract: dict[str, Any] | None = None) -> dict[str, Any]:
+    values = tuple(str(row.get(name) or "") for name in KEY_FIELDS)
+    return dict(_classify(visual_tables(contract), values))
+
+
 __all__ = [
     "DEFAULT_CONTRACT_PATH",
     "load_visual_feedback_contract",
+    "compile_visual_contract",
+    "visual_tables",
+    "visual_cache_stats",
+    "clear_visual_caches",
     "classify_visual_issue",
     "norm_token",
 ]
@@ -25,11 +25,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
-from event_visual_keys import infer_event_visual_key, normalize_event_visual_key, resolve_event_visual_key, should_prefer_inferred_event_visual_key
-from event_visual_motifs import infer_event_visual_motif, normalize_event_visual_motif
+from event_visual_keys import normalize_event_visual_key, should_prefer_inferred_event_visual_key
+from event_visual_motifs import VisualClassifier
 from event_description_quality import apply_description_override, load_description_overrides
 from event_public_contract import PUBLIC_FIELDS, normalize_public_event, schema_eligible
-from event_identity import find_best_event_match
+from event_identity import EventIdentityIndex
+from event_feed_shards import FEED_SHARD_NEXT_DAYS, write_event_feed_shards
 
 ROOT = Path(__file__).resolve().parents[1]
 TSV_PATH = ROOT / "data" / "events.tsv"
@@ -314,9 +315,8 @@ def read_tsv(path: Path) -> List[Dict[str, str]]:
         return rows
 
 
-def main() -> None:
-    rows = read_tsv(TSV_PATH)
-
+def build_feed(rows: List[Dict[str, str]]) -> List[Dict[str, object]]:
+    """Validate TSV rows (fail-fast) and return the sorted public feed items for events.json."""
     # Header-Check
     header = set(rows[0].keys()) if rows else set()
     missing = [f for f in REQUIRED_FIELDS if f not in header]
@@ -329,7 +329,8 @@ def main() -> None:
     seen_ids = set()
     seen_fingerprints = set()
     seen_url_occurrences = set()
-    published_identity_rows: List[Dict[str, str]] = []
+    published_identity_index = EventIdentityIndex()
+    visual_classifier = VisualClassifier()
     skipped_expired_events = 0
 
     today_date = datetime.now().date()
@@ -437,34 +438,24 @@ def main() -> None:
         seen_fingerprints.add(fp)
 
         manual_visual_key = normalize_event_visual_key(data.get("visual_key", ""))
-        inferred_visual_key = infer_event_visual_key(
-            title=data["title"],
-            description=data.get("description", ""),
-            category=cat,
-            location=data["location"],
-        )
-        visual_key = resolve_event_visual_key(
+        visual = visual_classifier.classify(
             title=data["title"],
             description=data.get("description", ""),
             category=cat,
             location=data["location"],
             visual_key=manual_visual_key,
             visual_motif=data.get("visual_motif", ""),
+            with_asset_status=False,
         )
-        if manual_visual_key and should_prefer_inferred_event_visual_key(manual_visual_key, inferred_visual_key, data.get("visual_motif", "")):
+        visual_key = visual.visual_key
+        if manual_visual_key and should_prefer_inferred_event_visual_key(manual_visual_key, visual.inferred_visual_key, data.get("visual_motif", "")):
             warn(
                 f"Zeile {idx}: visual_key {manual_visual_key!r} wirkt zu breit; "
                 f"nutze abgeleiteten Eventtyp {visual_key!r} fuer {data['title']!r}."
             )
-        visual_motif = normalize_event_visual_motif(data.get("visual_motif", ""), visual_key) or infer_event_visual_motif(
-            title=data["title"],
-            description=data.get("description", ""),
-            category=cat,
-            location=data["location"],
-            visual_key=visual_key,
-        )
+        visual_motif = visual.visual_motif
 
-        identity_match = find_best_event_match(data, published_identity_rows)
+        identity_match = published_identity_index.find_best(data)
         if identity_match.get("status") in {"possible", "exact", "identity_conflict"}:
             fail(
                 f"Zeile {idx}: semantische Event-Dublette zu "
@@ -472,7 +463,7 @@ def main() -> None:
                 f"({identity_match.get('reason') or identity_match.get('status')}). "
                 "Bitte die kanonischen Zeilen in Events beziehungsweise Events_Staging klären."
             )
-        published_identity_rows.append(dict(data))
+        published_identity_index.add(dict(data))
 
         events.append(
             EventRow(
@@ -556,14 +547,52 @@ def main() -> None:
 
         out.append(item)
 
-    OUT_JSON_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUT_JSON_PATH.write_text(json.dumps(out, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
         # === BEGIN BLOCK: REPORT_SKIPPED_EXPIRED_EVENTS_V2 | Zweck: CI-Log für automatisch entfernte abgelaufene Events inklusive Mehrtagesevents | Umfang: ersetzt nur die Log-Ausgabe ===
     if skipped_expired_events:
         print(f"ℹ️ Hinweis: {skipped_expired_events} abgelaufene Events wurden nicht veröffentlicht.")
     # === END BLOCK: REPORT_SKIPPED_EXPIRED_EVENTS_V2 ===
+    print(f"ℹ️ Event-Identität Cache (hits/lookups): {published_identity_index.normalizer.cache_summary()}")
+    return out
+
+
+def write_feed(out: List[Dict[str, object]]) -> None:
+    OUT_JSON_PATH.parent.mkdir(parents=True, exist_ok=True)
+    OUT_JSON_PATH.write_text(json.dumps(out, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
     print(f"✅ OK: {len(out)} Events geschrieben: {OUT_JSON_PATH}")
 
+    # Kompakter Index + Monats-/28-Tage-Shards fuer Seiten, die nicht den ganzen Feed brauchen.
+    shards = write_event_feed_shards(out, OUT_JSON_PATH.parent / "event-feed")
+    print(
+        f"✅ Event-Feed-Shards: Index {shards['index']['bytes']} Bytes, "
+        f"{len(shards['months'])} Monats-Shards, naechste {FEED_SHARD_NEXT_DAYS} Tage {shards['next_days']['count']} Events "
+        f"({shards['next_days']['bytes']} Bytes statt {OUT_JSON_PATH.stat().st_size} Bytes events.json)"
+    )
+
+
+# === BEGIN BLOCK: EVENT_BUILDER_ENTRYPOINT_CONTRACT_V1 | Zweck: oeffentlicher Zeitvertrag und test-only Pfad-Overrides fuer alle CLI-Einstiege (build-events-from-tsv.py, build-site-data.py); Umfang: nur Modul-Konfiguration ===
+EVENT_TIME_RE = re.compile(
+    r"^\s*(\d{1,2})[:.](\d{2})(?:\s*[-–]\s*(\d{1,2})[:.](\d{2}))?(?:\s*Uhr)?\s*$",
+    re.IGNORECASE,
+)
+
+
+def configure_entrypoint() -> None:
+    """Apply the public time contract and optional test-only file overrides."""
+    global RE_TIME, TSV_PATH, OUT_JSON_PATH
+    RE_TIME = EVENT_TIME_RE
+
+    tsv_override = os.environ.get("BE_EVENT_BUILDER_TSV_PATH", "").strip()
+    json_override = os.environ.get("BE_EVENT_BUILDER_JSON_PATH", "").strip()
+    if tsv_override:
+        TSV_PATH = Path(tsv_override)
+    if json_override:
+        OUT_JSON_PATH = Path(json_override)
+# === END BLOCK: EVENT_BUILDER_ENTRYPOINT_CONTRACT_V1 ===
+
+
+def main() -> None:
+    write_feed(build_feed(read_tsv(TSV_PATH)))
+
 
 if __name__ == "__main__":
     main()
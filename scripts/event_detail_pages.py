@@ -0,0 +1,1134 @@
+"""Generate canonical, shareable event detail pages from generated runtime data.
+
+The Events sheet remains the source of truth. This module only turns generated
+runtime artifacts into deploy-only HTML pages so events can be shared, indexed
+and later measured without changing the in-app detail panel flow.
+
+``build-site-data.py`` calls :func:`build_detail_pages` with its in-memory
+feed; ``build-event-detail-pages.py`` is the standalone CLI on events.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import html
+import json
+import os
+import re
+import multiprocessing
+import shutil
+import threading
+import time
+import unicodedata
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import quote_plus, urlparse
+from event_public_contract import build_offer_schema, normalize_public_event, numeric_price, public_http_url
+from event_visual_motifs import load_event_visual_pool_index
+
+ROOT = Path(__file__).resolve().parents[1]
+EVENTS_JSON = ROOT / "data" / "events.json"
+EVENTS_TSV = ROOT / "data" / "events.tsv"
+VISUAL_POOL_JSON = ROOT / "data" / "event_visual_pool.json"
+EVENTS_DIR = ROOT / "events"
+MANIFEST_PATH = ROOT / "data" / "event_detail_pages.json"
+SITE_ORIGIN = os.environ.get("SITE_ORIGIN", "https://bocholt-erleben.de").rstrip("/")
+RETENTION_DAYS = 60
+STYLE_VERSION = "2026-06-22-css-governance-v1"
+DETAIL_PAGE_CSS_VERSION = "2026-07-03-event-detail-scroll-share-v1"
+# Bump when render_page output changes; the page hash also covers the renderer
+# sources, so a forgotten bump only costs a full rewrite, never a stale page.
+DETAIL_PAGE_TEMPLATE_VERSION = "2026-10-16-incremental-v1"
+GENERATED_MARKER = ".generated-event-detail"
+RENDERER_SOURCES = (Path(__file__).resolve(), Path(__file__).resolve().parent / "event_public_contract.py")
+
+RE_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+RE_TIME = re.compile(r"\b(\d{1,2})[:.](\d{2})\b")
+
+
+@dataclass(frozen=True)
+class DetailEvent:
+    id: str
+    slug: str
+    detail_path: str
+    detail_url: str
+    title: str
+    date: str
+    end_date: str
+    time: str
+    city: str
+    location: str
+    category: str
+    description: str
+    external_url: str
+    reporting_target_type: str
+    reporting_target_id: str
+    reporting_target_title: str
+    visual_key: str
+    visual_motif: str
+    image_src: str
+    image_alt: str
+    is_past: bool
+    noindex: bool
+    public: Dict[str, Any]
+
+
+def normalize_text(value: Any) -> str:
+    text = "" if value is None else str(value)
+    text = text.replace("\u00a0", " ")
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def escape(value: Any) -> str:
+    return html.escape(normalize_text(value), quote=True)
+
+
+def escape_attr_multiline(value: Any) -> str:
+    """Escape attribute values and keep line breaks HTML-attribute-safe."""
+    return escape(value).replace("\n", "&#10;")
+
+
+def normalize_slug_part(value: Any) -> str:
+    text = normalize_text(value).lower()
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    replacements = {
+        "ä": "ae",
+        "ö": "oe",
+        "ü": "ue",
+        "ß": "ss",
+        "æ": "ae",
+        "ø": "oe",
+    }
+    for src, target in replacements.items():
+        text = text.replace(src, target)
+    text = re.sub(r"[^a-z0-9]+", "-", text)
+    text = re.sub(r"-+", "-", text).strip("-")
+    return text[:96].strip("-") or "event"
+
+
+def normalize_lookup_key(value: Any) -> str:
+    return re.sub(
+        r"_+",
+        "_",
+        re.sub(r"[^a-z0-9_]", "", re.sub(r"[\s-]+", "_", normalize_text(value).lower())),
+    ).strip("_")
+
+
+def parse_iso_date(value: Any) -> Optional[date]:
+    raw = normalize_text(value)
+    if not RE_DATE.match(raw):
+        return None
+    try:
+        return date.fromisoformat(raw)
+    except ValueError:
+        return None
+
+
+def format_date_de(value: str) -> str:
+    parsed = parse_iso_date(value)
+    if not parsed:
+        return normalize_text(value)
+    return parsed.strftime("%d.%m.%Y")
+
+
+def format_date_long(value: str) -> str:
+    parsed = parse_iso_date(value)
+    if not parsed:
+        return normalize_text(value)
+    weekdays = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
+    months = [
+        "Januar", "Februar", "März", "April", "Mai", "Juni",
+        "Juli", "August", "September", "Oktober", "November", "Dezember",
+    ]
+    return f"{weekdays[parsed.weekday()]}, {parsed.day}. {months[parsed.month - 1]} {parsed.year}"
+
+
+def extract_time(value: str) -> str:
+    match = RE_TIME.search(normalize_text(value))
+    if not match:
+        return ""
+    return f"{int(match.group(1)):02d}:{match.group(2)}"
+
+
+def build_start_date(event: DetailEvent) -> str:
+    start_time = extract_time(event.time)
+    if start_time:
+        return f"{event.date}T{start_time}:00+02:00"
+    return event.date
+
+
+def build_end_date(event: DetailEvent) -> str:
+    return event.end_date or event.date
+
+
+def truncate(value: str, limit: int) -> str:
+    text = re.sub(r"\s+", " ", normalize_text(value))
+    if len(text) <= limit:
+        return text
+    return text[: max(0, limit - 1)].rstrip(" .,;:-") + "…"
+
+
+def normalize_http_url(value: Any) -> str:
+    raw = normalize_text(value)
+    if not raw:
+        return ""
+    if raw.startswith("http://") or raw.startswith("https://"):
+        return raw
+    if raw.startswith("www."):
+        return "https://" + raw
+    return ""
+
+
+
+# === BEGIN BLOCK: EVENT_DETAIL_PUBLIC_SOURCE_URL_GUARD_V1 | Zweck: verhindert direkte Download-/PDF-Links als CTA auf generierten Event-Detailseiten; Umfang: nur URL-Normalisierung fuer Detailseiten, keine Sheet-Schreiboperation ===
+DOCUMENT_URL_RE = re.compile(r"(?:\.pdf|\.docx?|\.xlsx?|\.pptx?)(?:$|[?#])", re.I)
+DOWNLOAD_QUERY_RE = re.compile(r"(?:^|[?&])download(?:=1|=true|&|$)", re.I)
+CURATED_SAFE_SOURCE_URLS_BY_ID = {
+    "rosenbergfestival-2026-09-26": "https://www.bocholt.de/Interkulturellewoche",
+}
+
+
+def is_download_document_url(value: Any) -> bool:
+    url = normalize_text(value).lower()
+    if not url:
+        return False
+    if DOCUMENT_URL_RE.search(url):
+        return True
+    if DOWNLOAD_QUERY_RE.search(url):
+        return True
+    if "/bocholt_media/" in url and any(ext in url for ext in (".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx")):
+        return True
+    return False
+
+
+def curated_safe_source_url(raw: Dict[str, Any]) -> str:
+    event_id = normalize_text(raw.get("id"))
+    if event_id in CURATED_SAFE_SOURCE_URLS_BY_ID:
+        return CURATED_SAFE_SOURCE_URLS_BY_ID[event_id]
+    haystack = " ".join(
+        normalize_text(raw.get(key)).lower()
+        for key in ("title", "description", "beschreibung", "location", "ort", "kategorie", "category")
+    )
+    if "rosenbergfestival" in haystack or ("rosenberg" in haystack and "interkulturelle woche" in haystack):
+        return "https://www.bocholt.de/Interkulturellewoche"
+    return ""
+
+
+def normalize_public_external_url(raw: Dict[str, Any]) -> str:
+    candidate = normalize_http_url(raw.get("url") or raw.get("website") or raw.get("source_url") or raw.get("sourceUrl"))
+    if not candidate:
+        return ""
+    if not is_download_document_url(candidate):
+        return candidate
+    return normalize_http_url(curated_safe_source_url(raw))
+# === END BLOCK: EVENT_DETAIL_PUBLIC_SOURCE_URL_GUARD_V1 ===
+
+
+def absolute_url(path_or_url: str) -> str:
+    raw = normalize_text(path_or_url)
+    if not raw:
+        return ""
+    if raw.startswith("http://") or raw.startswith("https://"):
+        return raw
+    if raw.startswith("/"):
+        return SITE_ORIGIN + raw
+    return SITE_ORIGIN + "/" + raw
+
+
+def detail_path_for_event(raw: Dict[str, Any]) -> str:
+    existing = normalize_text(raw.get("detail_path") or raw.get("detailPath"))
+    if existing.startswith("/events/") and existing.endswith("/"):
+        return existing
+    ev_id = normalize_slug_part(raw.get("id"))
+    title = normalize_slug_part(raw.get("title") or raw.get("eventName") or "event")
+    date_value = normalize_text(raw.get("date") or raw.get("datum"))
+    slug = ev_id if ev_id else "-".join(part for part in (title, date_value) if part)
+    slug = normalize_slug_part(slug)
+    return f"/events/{slug}/"
+
+
+def read_json_array(path: Path) -> List[Dict[str, Any]]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if isinstance(data, list):
+        return [item for item in data if isinstance(item, dict)]
+    if isinstance(data, dict) and isinstance(data.get("events"), list):
+        return [item for item in data["events"] if isinstance(item, dict)]
+    return []
+
+
+def read_tsv(path: Path) -> List[Dict[str, str]]:
+    if not path.exists():
+        return []
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        return [
+            {str(k): normalize_text(v) for k, v in row.items() if k is not None}
+            for row in csv.DictReader(handle, delimiter="\t")
+            if any(normalize_text(v) for v in row.values())
+        ]
+
+
+def clean_generated_event_dirs(keep: Iterable[str] = ()) -> List[str]:
+    """Remove generated detail page folders except the slugs in keep; returns removed slugs."""
+    if not EVENTS_DIR.exists():
+        return []
+    keep_slugs = set(keep)
+    removed: List[str] = []
+    for child in sorted(EVENTS_DIR.iterdir()):
+        if child.is_dir() and child.name not in keep_slugs and (child / GENERATED_MARKER).exists():
+            shutil.rmtree(child)
+            removed.append(child.name)
+    return removed
+
+
+def build_visual_index() -> Dict[str, List[Dict[str, str]]]:
+    if not VISUAL_POOL_JSON.exists():
+        return {}
+    try:
+        pool_index = load_event_visual_pool_index(VISUAL_POOL_JSON)
+    except Exception:
+        return {}
+
+    index: Dict[str, List[Dict[str, str]]] = {}
+    for visual_key in pool_index.visual_keys:
+        key = normalize_lookup_key(visual_key)
+        if not key:
+            continue
+        ready: List[Dict[str, str]] = []
+        for image in pool_index.ready_images(visual_key):
+            src = normalize_text(image.get("src"))
+            if not src.startswith("/assets/event-visuals/"):
+                continue
+            ready.append({
+                "src": src,
+                "alt": normalize_text(image.get("alt")),
+                "visual_motif": normalize_lookup_key(image.get("visual_motif") or image.get("visualMotif")),
+                "visual_motif_role": normalize_lookup_key(image.get("visual_motif_role") or image.get("visualMotifRole")),
+            })
+        if ready:
+            index[key] = ready
+    return index
+
+
+def choose_visual(raw: Dict[str, Any], visual_index: Dict[str, List[Dict[str, str]]]) -> tuple[str, str]:
+    visual_key = normalize_lookup_key(raw.get("visual_key") or raw.get("visualKey") or raw.get("image_visual_key"))
+    visual_motif = normalize_lookup_key(raw.get("visual_motif") or raw.get("visualMotif") or raw.get("image_visual_motif"))
+    pool = visual_index.get(visual_key) or []
+
+    if pool and visual_motif:
+        exact = [image for image in pool if image.get("visual_motif") == visual_motif]
+        if exact:
+            return exact[0]["src"], exact[0].get("alt") or ""
+
+    if pool:
+        fallback = [image for image in pool if image.get("visual_motif_role") == "fallback"]
+        selected = (fallback or pool)[0]
+        return selected["src"], selected.get("alt") or ""
+
+    return "/assets/event-visuals/default-city-02-16x9.webp", "Symbolisches Stadtmotiv für Bocholt erleben"
+
+
+def build_detail_event(raw: Dict[str, Any], is_past: bool, noindex: bool, visual_index: Dict[str, List[Dict[str, str]]]) -> Optional[DetailEvent]:
+    title = normalize_text(raw.get("title") or raw.get("eventName"))
+    event_id = normalize_text(raw.get("id"))
+    event_date = normalize_text(raw.get("date") or raw.get("datum"))
+    parsed_date = parse_iso_date(event_date)
+    if not title or not event_id or not parsed_date:
+        return None
+
+    end_date = normalize_text(raw.get("endDate") or raw.get("end_date"))
+    if end_date and not parse_iso_date(end_date):
+        end_date = ""
+
+    detail_path = detail_path_for_event(raw)
+    slug = detail_path.strip("/").split("/")[-1]
+    image_src, image_alt = choose_visual(raw, visual_index)
+    if not image_alt:
+        image_alt = f"Symbolisches Eventbild zu {title}"
+
+    return DetailEvent(
+        id=event_id,
+        slug=slug,
+        detail_path=detail_path,
+        detail_url=absolute_url(detail_path),
+        title=title,
+        date=event_date,
+        end_date=end_date,
+        time=normalize_text(raw.get("time") or raw.get("uhrzeit") or raw.get("startzeit")),
+        city=normalize_text(raw.get("city") or "Bocholt") or "Bocholt",
+        location=normalize_text(raw.get("location") or raw.get("ort")),
+        category=normalize_text(raw.get("kategorie") or raw.get("category")),
+        description=normalize_text(raw.get("description") or raw.get("beschreibung")),
+        external_url=normalize_public_external_url(raw),
+        reporting_target_type=normalize_lookup_key(raw.get("reporting_target_type") or raw.get("reportingTargetType")),
+        reporting_target_id=normalize_text(raw.get("reporting_target_id") or raw.get("reportingTargetId")),
+        reporting_target_title=normalize_text(raw.get("reporting_target_title") or raw.get("reportingTargetTitle")),
+        visual_key=normalize_lookup_key(raw.get("visual_key") or raw.get("visualKey")),
+        visual_motif=normalize_lookup_key(raw.get("visual_motif") or raw.get("visualMotif")),
+        image_src=image_src,
+        image_alt=image_alt,
+        is_past=is_past,
+        noindex=noindex,
+        public=normalize_public_event(raw),
+    )
+
+
+def build_recent_past_events(
+    active_ids: set[str],
+    visual_index: Dict[str, List[Dict[str, str]]],
+    rows: Optional[List[Dict[str, str]]] = None,
+) -> List[DetailEvent]:
+    """Past events still inside the retention window; rows defaults to a fresh read of events.tsv."""
+    if rows is None:
+        rows = read_tsv(EVENTS_TSV)
+    if not rows:
+        return []
+    today = date.today()
+    cutoff = today - timedelta(days=RETENTION_DAYS)
+    out: List[DetailEvent] = []
+
+    for row in rows:
+        event_id = normalize_text(row.get("id"))
+        if not event_id or event_id in active_ids:
+            continue
+        start = parse_iso_date(row.get("date"))
+        if not start:
+            continue
+        end = parse_iso_date(row.get("endDate")) or start
+        if cutoff <= end < today:
+            event = build_detail_event(row, is_past=True, noindex=True, visual_index=visual_index)
+            if event:
+                out.append(event)
+    return out
+
+
+def event_date_line(event: DetailEvent) -> str:
+    if event.end_date and event.end_date != event.date:
+        base = f"{format_date_long(event.date)} bis {format_date_long(event.end_date)}"
+    else:
+        base = format_date_long(event.date)
+    if event.time:
+        return f"{base} · {event.time}"
+    return base
+
+
+def build_maps_url(event: DetailEvent) -> str:
+    query = " ".join(part for part in [event.location, event.city] if part).strip()
+    if not query:
+        return ""
+    return f"https://www.google.com/maps/search/?api=1&query={quote_plus(query)}"
+
+
+def host_label(value: str) -> str:
+    raw = normalize_http_url(value)
+    if not raw:
+        return ""
+    try:
+        parsed = urlparse(raw)
+        host = (parsed.netloc or "").lower().removeprefix("www.")
+    except Exception:
+        return "Veranstaltungsseite"
+    if host.endswith("bocholt.de"):
+        return "Stadt Bocholt"
+    return host or "Veranstaltungsseite"
+
+
+def event_place_line(event: DetailEvent) -> str:
+    location = normalize_text(event.location)
+    city = normalize_text(event.city)
+    if location and city and city.lower() not in location.lower():
+        return f"{location} · {city}"
+    return location or city
+
+
+def json_ld(event: DetailEvent, offers: Optional[List[Dict[str, Any]]] = None) -> str:
+    payload: Dict[str, Any] = {
+        "@context": "https://schema.org",
+        "@type": "Event",
+        "name": event.title,
+        "startDate": build_start_date(event),
+        "endDate": build_end_date(event),
+        "eventStatus": "https://schema.org/EventScheduled",
+        "eventAttendanceMode": "https://schema.org/OfflineEventAttendanceMode",
+        "url": event.detail_url,
+        "image": [absolute_url(event.image_src)] if event.image_src else [],
+        "location": {
+            "@type": "Place",
+            "name": event.location or event.city,
+            "address": " · ".join(part for part in [event.location, event.city] if part),
+        },
+    }
+    if event.description:
+        payload["description"] = truncate(event.description, 280)
+    if offers is None:
+        offers = build_offer_schema(event.public)
+    if offers:
+        payload["offers"] = offers[0] if len(offers) == 1 else offers
+    organizer_type = normalize_text(event.public.get("organizer_type"))
+    if event.public.get("organizer_name") and organizer_type in {"Organization", "Person"}:
+        payload["organizer"] = {"@type": organizer_type, "name": event.public["organizer_name"]}
+        organizer_url = public_http_url(event.public.get("organizer_url"))
+        if organizer_url: payload["organizer"]["url"] = organizer_url
+    performer_type = normalize_text(event.public.get("performer_type"))
+    if event.public.get("performer_name") and performer_type in {"Person", "PerformingGroup", "MusicGroup"}:
+        payload["performer"] = {"@type": performer_type, "name": event.public["performer_name"]}
+        performer_url = public_http_url(event.public.get("performer_url"))
+        if performer_url: payload["performer"]["url"] = performer_url
+    return json.dumps(payload, ensure_ascii=False, indent=2)
+
+
+# === BEGIN BLOCK: EVENT_DETAIL_PAGE_TEMPLATE_V1 | Zweck: Detailseiten-Layout einmal in statischen Text und {{slot}}-Platzhalter zerlegen, pro Event nur noch escapte Werte und bedingte Fragmente berechnen; Umfang: render_page und seine Fragmente, Ausgabe byte-identisch zur bisherigen f-String-Fassung ===
+RE_TEMPLATE_SLOT = re.compile(r"\{\{([a-z_]+)\}\}")
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """Static skeleton as a %-format string; slots names the values in placeholder order."""
+
+    pattern: str
+    slots: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_values", itemgetter(*self.slots) if len(self.slots) > 1 else lambda values: tuple(values[slot] for slot in self.slots))
+
+    def render(self, values: Dict[str, str]) -> str:
+        return self.pattern % self._values(values)
+
+
+def compile_template(source: str, **static: str) -> CompiledTemplate:
+    """Split a {{slot}} skeleton once; static values (and nested skeletons) are baked in first."""
+    for name, value in static.items():
+        source = source.replace("{{" + name + "}}", value)
+    parts = RE_TEMPLATE_SLOT.split(source)
+    return CompiledTemplate(
+        pattern="%s".join(part.replace("%", "%%") for part in parts[::2]),
+        slots=tuple(parts[1::2]),
+    )
+
+
+ROBOTS_NOINDEX_HTML = '<meta name="robots" content="noindex,follow">\n'
+
+EXPIRED_NOTICE_HTML = """
+              <section class="event-detail-notice" aria-label="Vergangene Veranstaltung">
+                <strong>Diese Veranstaltung ist bereits vorbei.</strong>
+                <span>Aktuelle Termine findest du in der Eventübersicht.</span>
+              </section>
+        """
+
+FREE_ADMISSION_HTML = '<p class="event-admission" data-admission-status="free"><strong>Eintritt:</strong> kostenlos · 0 EUR</p>'
+
+SOURCE_LINK_SKELETON = """
+              <a class="detail-link" href="{{external_url}}" target="_blank" rel="noopener" data-impact-action="website_click" data-impact-outbound-type="website" data-impact-destination-url="{{external_url}}">
+                <span class="detail-link-label">Eventquelle</span>
+                <span class="detail-link-value">{{source_host}}</span>
+                <span class="detail-link-ext" data-ui-icon="external" aria-hidden="true"></span>
+              </a>
+        """
+
+TRUST_LINKS_SKELETON = """
+            <div class="detail-links detail-links--trust" aria-label="Quellen und Nachweise">
+              {{source_link}}
+            </div>
+        """
+
+LOCATION_LINK_SKELETON = """
+                <a class="detail-meta-row is-location" href="{{maps_url}}" target="_blank" rel="noopener" aria-label="Ort in Karten öffnen" data-impact-action="maps_click" data-impact-outbound-type="maps" data-impact-destination-url="{{maps_url}}">
+                  <span class="detail-meta-icon" data-ui-icon="pin" aria-hidden="true"></span>
+                  <span class="detail-meta-text">{{place_line}}</span>
+                  <span class="detail-meta-ext" data-ui-icon="external" aria-hidden="true"></span>
+                </a>
+        """
+
+LOCATION_STATIC_SKELETON = """
+                <div class="detail-meta-row is-location is-static" aria-label="Ort">
+                  <span class="detail-meta-icon" data-ui-icon="pin" aria-hidden="true"></span>
+                  <span class="detail-meta-text">{{place_line}}</span>
+                </div>
+        """
+
+CALENDAR_ACTION_SKELETON = """
+          <button
+            class="detail-actionbar-btn is-icon"
+            type="button"
+            title="Kalender"
+            aria-label="Kalender"
+            data-calendar-title="{{title}}"
+            data-calendar-date="{{date}}"
+            data-calendar-time="{{time}}"
+            data-calendar-location="{{place_line}}"
+            data-calendar-description="{{description_text}}"
+          >
+            <span data-ui-icon="calendar" aria-hidden="true"></span>
+            <span class="detail-sr-only">Kalender</span>
+          </button>
+        """
+
+OVERVIEW_ACTION_HTML = """
+          <a class="detail-actionbar-btn is-icon" href="/events/" title="Events" aria-label="Aktuelle Events ansehen">
+            <span data-ui-icon="calendar-days" aria-hidden="true"></span>
+            <span class="detail-sr-only">Aktuelle Events ansehen</span>
+          </a>
+        """
+
+SHARE_ACTION_SKELETON = """
+          <button
+            class="detail-actionbar-btn is-icon"
+            type="button"
+            title="Teilen"
+            aria-label="Teilen"
+            data-share-title="{{title}}"
+            data-share-text="{{share_text}}"
+            data-share-url="{{detail_url}}"
+            data-impact-action="event_share_click"
+          >
+            <span data-ui-icon="share" aria-hidden="true"></span>
+            <span class="detail-sr-only">Teilen</span>
+          </button>
+    """
+
+ACTIONBAR_SKELETON = """
+        <div id="detail-actionbar-slot" class="event-detail-public-actionbar" aria-label="Aktionen">
+          {{primary_action}}
+          {{share_action}}
+        </div>
+    """
+
+PAGE_SKELETON = """<!DOCTYPE html>
+<html lang="de">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<link rel="canonical" href="{{detail_url}}">
+{{robots_meta}}<title>{{page_title}}</title>
+<meta name="description" content="{{meta_description}}">
+<meta property="og:locale" content="de_DE">
+<meta property="og:site_name" content="Bocholt erleben">
+<meta property="og:type" content="article">
+<meta property="og:url" content="{{detail_url}}">
+<meta property="og:title" content="{{page_title}}">
+<meta property="og:description" content="{{meta_description}}">
+<meta property="og:image" content="{{image_url}}">
+<meta name="twitter:card" content="summary_large_image">
+<meta name="twitter:title" content="{{page_title}}">
+<meta name="twitter:description" content="{{meta_description}}">
+<meta name="twitter:image" content="{{image_url}}">
+<link rel="manifest" href="/manifest.json">
+<meta name="theme-color" content="#EEF1E3">
+<link rel="icon" type="image/png" sizes="32x32" href="/icons/favicon/icon-32.png">
+<link rel="icon" type="image/x-icon" href="/favicon.ico">
+<link rel="apple-touch-icon" sizes="180x180" href="/apple-touch-icon.png">
+<link rel="stylesheet" href="/css/style.css?v={{style_version}}">
+<link rel="stylesheet" href="/css/pages.css?v={{css_version}}">
+{{schema}}
+</head>
+<body class="page-route-events event-detail-page">
+<header class="app-header">
+  <a class="header-left" href="/" aria-label="Bocholt erleben Startseite">
+    <img src="/icons/app/icon-192.png" alt="Bocholt erleben Logo" class="app-logo">
+    <span class="app-title">Bocholt erleben</span>
+  </a>
+</header>
+<div id="desktop-section-nav-root"></div>
+<main class="event-detail-main">
+  <section id="event-detail-panel" class="event-detail-public" data-detail-type="event" aria-label="Eventdetails" data-event-id="{{event_id}}" data-impact-object-type="event" data-impact-entity-id="{{event_id}}" data-impact-entity-title="{{title}}" data-impact-source-context="public_detail_page" data-impact-reporting-target-type="{{reporting_target_type}}" data-impact-reporting-target-id="{{reporting_target_id}}" data-impact-reporting-target-title="{{reporting_target_title}}">
+    <div class="detail-panel-content event-detail-public-surface">
+      <div class="detail-panel-body">
+        <div id="detail-content">
+          <div class="detail-panel-inner">
+            <figure class="event-detail-media" aria-label="Eventbild">
+              <img class="event-detail-media__img" src="{{image_src}}" alt="{{image_alt}}" loading="eager" decoding="async" width="1200" height="675">
+            </figure>
+            <div class="detail-header">
+              <div class="detail-title-row">
+                <h1 class="detail-title">{{title}}</h1>
+              </div>
+              <div class="detail-meta-rows" aria-label="Event-Infos">
+                {{location_meta}}
+                <div class="detail-meta-row is-datetime" aria-label="Datum und Uhrzeit">
+                  <span class="detail-meta-icon" data-ui-icon="calendar" aria-hidden="true"></span>
+                  <span class="detail-meta-text">{{date_line}}</span>
+                </div>
+              </div>
+              {{expired_notice}}
+            </div>
+            {{description}}
+            {{admission}}
+            {{trust_links}}
+          </div>
+        </div>
+      </div>
+      {{actionbar}}
+    </div>
+  </section>
+</main>
+<footer data-site-footer></footer>
+<div id="bottom-tabbar-root"></div>
+<script src="/config.js?v=2026-07-03-event-impact-v1"></script>
+<script src="/js/icons.js?v=2026-06-15-image-attribution-v7"></script>
+<script src="/js/bottom-tabbar.js?v=2026-05-29-today-nav-v1"></script>
+<script src="/js/site-footer.js?v=2026-06-15-image-attribution-v7"></script>
+<script>
+(function () {
+  if (window.Icons && typeof window.Icons.hydrate === 'function') {
+    window.Icons.hydrate(document);
+  }
+
+  var impactRoot = document.querySelector('[data-impact-object-type="event"]');
+
+  function impactPayload(extra) {
+    extra = extra || {};
+    if (!impactRoot) return extra;
+    return Object.assign({
+      entityType: 'event',
+      entityId: impactRoot.getAttribute('data-impact-entity-id') || '',
+      entityTitle: impactRoot.getAttribute('data-impact-entity-title') || document.title,
+      sourceContext: impactRoot.getAttribute('data-impact-source-context') || 'public_detail_page',
+      reportingTargetType: impactRoot.getAttribute('data-impact-reporting-target-type') || '',
+      reportingTargetId: impactRoot.getAttribute('data-impact-reporting-target-id') || '',
+      reportingTargetTitle: impactRoot.getAttribute('data-impact-reporting-target-title') || ''
+    }, extra);
+  }
+
+  function trackValueMetric(metricKey, payload) {
+    if (window.BEAnalytics && typeof window.BEAnalytics.trackValueMetric === 'function') {
+      window.BEAnalytics.trackValueMetric(metricKey, payload || impactPayload());
+    }
+  }
+
+  function trackOutbound(button) {
+    if (!button) return;
+    var outboundType = button.getAttribute('data-impact-outbound-type') || 'website';
+    var destinationUrl = button.getAttribute('data-impact-destination-url') || button.href || '';
+    var payload = impactPayload({
+      outboundType: outboundType,
+      destinationUrl: destinationUrl
+    });
+    if (window.BEAnalytics && typeof window.BEAnalytics.trackOutboundClick === 'function') {
+      window.BEAnalytics.trackOutboundClick(payload);
+    } else {
+      trackValueMetric(outboundType === 'maps' ? 'maps_click' : 'website_click', payload);
+    }
+  }
+
+  trackValueMetric('event_detail_view', impactPayload());
+
+  document.querySelectorAll('[data-impact-outbound-type]').forEach(function (button) {
+    button.addEventListener('click', function () { trackOutbound(button); }, { capture: true });
+  });
+
+  function calendarDateRange(date, time) {
+    var cleanDate = String(date || '').replaceAll('-', '');
+    if (!cleanDate) return '';
+    var match = String(time || '').match(/([0-9]{1,2})[:.]([0-9]{2})/);
+    if (!match) return cleanDate + '/' + cleanDate;
+    var hour = String(match[1]).padStart(2, '0');
+    var minute = String(match[2]).padStart(2, '0');
+    var start = cleanDate + 'T' + hour + minute + '00';
+    return start + '/' + start;
+  }
+
+  document.querySelectorAll('[data-calendar-date]').forEach(function (button) {
+    button.addEventListener('click', function () {
+      var params = new URLSearchParams();
+      params.set('action', 'TEMPLATE');
+      params.set('text', button.getAttribute('data-calendar-title') || document.title);
+      params.set('dates', calendarDateRange(button.getAttribute('data-calendar-date'), button.getAttribute('data-calendar-time')));
+      var locationText = button.getAttribute('data-calendar-location') || '';
+      var description = button.getAttribute('data-calendar-description') || '';
+      if (locationText) params.set('location', locationText);
+      if (description) params.set('details', description);
+      window.open('https://calendar.google.com/calendar/render?' + params.toString(), '_blank', 'noopener');
+    });
+  });
+
+  var shareButton = document.querySelector('[data-share-url]');
+  if (!shareButton) return;
+  shareButton.addEventListener('click', async function () {
+    var title = shareButton.getAttribute('data-share-title') || document.title;
+    var text = shareButton.getAttribute('data-share-text') || '';
+    var url = shareButton.getAttribute('data-share-url') || location.href;
+    var sharePayload = impactPayload({ destinationUrl: url });
+    try {
+      if (navigator.share) {
+        await navigator.share({ title: title, text: text, url: url });
+        if (window.BEAnalytics && typeof window.BEAnalytics.trackShareAction === 'function') {
+          window.BEAnalytics.trackShareAction(sharePayload);
+        } else {
+          trackValueMetric('event_share_click', sharePayload);
+        }
+        return;
+      }
+    } catch (error) {
+      if (error && (error.name === 'AbortError' || error.name === 'NotAllowedError')) return;
+    }
+    try {
+      if (navigator.clipboard) {
+        await navigator.clipboard.writeText([text, url].filter(Boolean).join('\\n'));
+        trackValueMetric('event_copy_link', sharePayload);
+      }
+    } catch (_) {}
+  });
+})();
+</script>
+</body>
+</html>
+"""
+
+TRUST_LINKS_TEMPLATE = compile_template(TRUST_LINKS_SKELETON, source_link=SOURCE_LINK_SKELETON)
+LOCATION_LINK_TEMPLATE = compile_template(LOCATION_LINK_SKELETON)
+LOCATION_STATIC_TEMPLATE = compile_template(LOCATION_STATIC_SKELETON)
+CALENDAR_ACTION_TEMPLATE = compile_template(CALENDAR_ACTION_SKELETON)
+
+
+@lru_cache(maxsize=4)
+def page_template(style_version: str, css_version: str) -> CompiledTemplate:
+    """Whole page skeleton with the asset versions baked in; compiled once per version pair."""
+    return compile_template(
+        PAGE_SKELETON,
+        actionbar=ACTIONBAR_SKELETON,
+        share_action=SHARE_ACTION_SKELETON,
+        style_version=style_version,
+        css_version=css_version,
+    )
+
+
+def admission_html(event: DetailEvent, schema_offers: List[Dict[str, Any]]) -> str:
+    admission_status = normalize_text(event.public.get("admission_status"))
+    if admission_status == "paid" and schema_offers:
+        rows = []
+        for offer in schema_offers:
+            extras = []
+            if offer.get("availability"): extras.append(offer["availability"].rsplit("/", 1)[-1])
+            if offer.get("validFrom"): extras.append(f"gültig ab {offer['validFrom']}")
+            extra = f" · {' · '.join(extras)}" if extras else ""
+            rows.append(f'<li>{escape(offer["price"])} {escape(offer["priceCurrency"])}{extra} <a href="{escape(offer["url"])}" target="_blank" rel="noopener">Tickets</a></li>')
+        return f'<section class="event-admission" data-admission-status="paid"><strong>Eintritt und Tickets:</strong><ul>{"".join(rows)}</ul></section>'
+    if admission_status == "free" and schema_offers:
+        return FREE_ADMISSION_HTML
+    if admission_status == "paid":
+        price = numeric_price(event.public.get("price"))
+        currency = normalize_text(event.public.get("price_currency"))
+        price_text = f"{price} {currency}; " if price is not None and re.fullmatch(r"[A-Z]{3}", currency) else "kostenpflichtig; "
+        return f'<p class="event-admission" data-admission-status="paid"><strong>Eintritt:</strong> {escape(price_text)}keine verifizierten Ticketdaten vorhanden</p>'
+    return ""
+
+
+def render_page(event: DetailEvent) -> str:
+    description = escape(event.description)
+    date_line = event_date_line(event)
+    # schema_eligible() is "has offers"; build them once for admission and JSON-LD.
+    schema_offers = build_offer_schema(event.public)
+    values = {
+        "detail_url": escape(event.detail_url),
+        "robots_meta": ROBOTS_NOINDEX_HTML if event.noindex else "",
+        "page_title": escape(f"{event.title} – Bocholt erleben"),
+        "meta_description": escape(truncate(event.description or f"{event.title}: Termin, Ort und weiterführende Informationen auf Bocholt erleben.", 155)),
+        "image_url": escape(absolute_url(event.image_src)),
+        "schema": f'<script type="application/ld+json">\n{json_ld(event, schema_offers)}\n</script>' if schema_offers else "",
+        "event_id": escape(event.id),
+        "title": escape(event.title),
+        "reporting_target_type": escape(event.reporting_target_type),
+        "reporting_target_id": escape(event.reporting_target_id),
+        "reporting_target_title": escape(event.reporting_target_title),
+        "image_src": escape(event.image_src),
+        "image_alt": escape(event.image_alt),
+        "place_line": escape(event_place_line(event)),
+        "date_line": escape(date_line),
+        "date": escape(event.date),
+        "time": escape(event.time),
+        "description_text": description,
+        "share_text": escape_attr_multiline(f"{event.title}\n{date_line}"),
+        "expired_notice": EXPIRED_NOTICE_HTML if event.is_past else "",
+        "description": f'<div class="detail-description">{description}</div>' if event.description else "",
+        "admission": admission_html(event, schema_offers),
+        "trust_links": "",
+    }
+
+    maps_url = build_maps_url(event)
+    if maps_url and not event.is_past:
+        values["maps_url"] = escape(maps_url)
+        values["location_meta"] = LOCATION_LINK_TEMPLATE.render(values)
+    else:
+        values["location_meta"] = LOCATION_STATIC_TEMPLATE.render(values)
+
+    if event.external_url and not event.is_past:
+        values["external_url"] = escape(event.external_url)
+        values["source_host"] = escape(host_label(event.external_url))
+        values["trust_links"] = TRUST_LINKS_TEMPLATE.render(values)
+
+    if event.is_past:
+        values["primary_action"] = OVERVIEW_ACTION_HTML
+    elif event.date:
+        values["primary_action"] = CALENDAR_ACTION_TEMPLATE.render(values)
+    else:
+        values["primary_action"] = ""
+
+    return page_template(STYLE_VERSION, DETAIL_PAGE_CSS_VERSION).render(values)
+# === END BLOCK: EVENT_DETAIL_PAGE_TEMPLATE_V1 ===
+
+
+@lru_cache(maxsize=1)
+def renderer_digest() -> str:
+    digest = hashlib.sha256()
+    for path in RENDERER_SOURCES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def page_hash(event: DetailEvent) -> str:
+    """Content key of one detail page: event data plus everything render_page depends on."""
+    payload = {
+        "event": asdict(event),
+        "site_origin": SITE_ORIGIN,
+        "style_version": STYLE_VERSION,
+        "detail_page_css_version": DETAIL_PAGE_CSS_VERSION,
+        "template_version": DETAIL_PAGE_TEMPLATE_VERSION,
+        "renderer": renderer_digest(),
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def load_previous_page_hashes() -> Dict[str, str]:
+    if not MANIFEST_PATH.exists():
+        return {}
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    pages = manifest.get("pages") if isinstance(manifest, dict) else None
+    if not isinstance(pages, list):
+        return {}
+    return {
+        normalize_text(page.get("slug")): normalize_text(page.get("hash"))
+        for page in pages
+        if isinstance(page, dict) and page.get("slug") and page.get("hash")
+    }
+
+
+def write_text_if_changed(path: Path, text: str) -> bool:
+    """Atomically replace path (temp file + rename) unless it already holds these bytes."""
+    data = text.encode("utf-8")
+    if path.exists() and path.read_bytes() == data:
+        return False
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return True
+
+
+def write_rendered_page(event: DetailEvent, page_html: str) -> bool:
+    """Write one rendered page; files whose bytes do not change are left untouched."""
+    target_dir = EVENTS_DIR / event.slug
+    target_dir.mkdir(parents=True, exist_ok=True)
+    write_text_if_changed(target_dir / GENERATED_MARKER, "generated by scripts/build-event-detail-pages.py\n")
+    return write_text_if_changed(target_dir / "index.html", page_html)
+
+
+def write_page(event: DetailEvent) -> bool:
+    return write_rendered_page(event, render_page(event))
+
+
+def page_is_current(event: DetailEvent, expected_hash: str, previous_hashes: Dict[str, str]) -> bool:
+    target_dir = EVENTS_DIR / event.slug
+    return (
+        previous_hashes.get(event.slug) == expected_hash
+        and (target_dir / "index.html").is_file()
+        and (target_dir / GENERATED_MARKER).is_file()
+    )
+
+
+def render_pages(events: List[DetailEvent], jobs: int) -> List[str]:
+    """render_page is pure string formatting, so larger batches go through a process pool."""
+    if jobs <= 1 or len(events) < 2:
+        return [render_page(event) for event in events]
+    # fork keeps module globals (SITE_ORIGIN, patched paths) and works for the
+    # hyphenated script name, which spawn could not re-import.
+    context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+    chunksize = max(1, len(events) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        return list(pool.map(render_page, events, chunksize=chunksize))
+
+
+def write_pages(
+    pages: List[DetailEvent],
+    hashes: Dict[str, str],
+    *,
+    full: bool,
+    jobs: int = 1,
+    timings: Optional[Dict[str, float]] = None,
+) -> Dict[str, int]:
+    """Write detail pages; incremental runs skip pages whose hash matches the last manifest."""
+    timings = timings if timings is not None else {}
+    previous_hashes = {} if full else load_previous_page_hashes()
+    removed = clean_generated_event_dirs(keep=() if full else hashes.keys())
+    pending = [event for event in pages if not page_is_current(event, hashes[event.slug], previous_hashes)]
+
+    started = time.perf_counter()
+    rendered = render_pages(pending, jobs)
+    timings["render"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if jobs > 1 and len(pending) > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            written = list(pool.map(write_rendered_page, pending, rendered))
+    else:
+        written = [write_rendered_page(event, page_html) for event, page_html in zip(pending, rendered)]
+    timings["write"] = time.perf_counter() - started
+
+    return {
+        "written": sum(written),
+        "unchanged": len(pages) - sum(written),
+        "removed": sum(1 for slug in removed if slug not in hashes),
+    }
+
+
+def unique_events(events: Iterable[DetailEvent]) -> List[DetailEvent]:
+    seen: set[str] = set()
+    out: List[DetailEvent] = []
+    for event in events:
+        if event.slug in seen:
+            continue
+        seen.add(event.slug)
+        out.append(event)
+    return out
+
+
+def build_detail_pages(
+    active_raw: List[Dict[str, Any]],
+    tsv_rows: Optional[List[Dict[str, str]]] = None,
+    *,
+    full: bool = False,
+    jobs: int = 1,
+) -> Dict[str, Any]:
+    """Write detail pages and the manifest from in-memory feed rows; returns the manifest.
+
+    active_raw is annotated in place with detail_path/detail_url so the caller
+    can serialize events.json once. tsv_rows are the (already read) events.tsv
+    rows used for recently expired pages.
+    """
+    jobs = max(1, jobs)
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
+    visual_index = build_visual_index()
+    active: List[DetailEvent] = []
+    for item in active_raw:
+        # Ensure active event detail fields exist in the generated feed as source of truth.
+        detail_path = detail_path_for_event(item)
+        item["detail_path"] = detail_path
+        item["detail_url"] = absolute_url(detail_path)
+        event = build_detail_event(item, is_past=False, noindex=False, visual_index=visual_index)
+        if event:
+            active.append(event)
+
+    active_ids = {event.id for event in active}
+    recent_past = build_recent_past_events(active_ids, visual_index, tsv_rows)
+    all_pages = unique_events([*active, *recent_past])
+
+    hashes = {event.slug: page_hash(event) for event in all_pages}
+    timings["index"] = time.perf_counter() - started
+    stats = write_pages(all_pages, hashes, full=full, jobs=jobs, timings=timings)
+
+    started = time.perf_counter()
+    manifest = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
+        "site_origin": SITE_ORIGIN,
+        "retention_days": RETENTION_DAYS,
+        "style_version": STYLE_VERSION,
+        "detail_page_css_version": DETAIL_PAGE_CSS_VERSION,
+        "template_version": DETAIL_PAGE_TEMPLATE_VERSION,
+        "active_count": len(active),
+        "recent_past_count": len(recent_past),
+        "pages": [
+            {
+                "id": event.id,
+                "title": event.title,
+                "date": event.date,
+                "endDate": event.end_date,
+                "slug": event.slug,
+                "path": event.detail_path,
+                "url": event.detail_url,
+                "active": not event.is_past,
+                "noindex": event.noindex,
+                "hash": hashes[event.slug],
+            }
+            for event in all_pages
+        ],
+    }
+    MANIFEST_PATH.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    timings["manifest"] = time.perf_counter() - started
+
+    print(f"✅ OK: {len(all_pages)} Event-Detailseiten erzeugt ({len(active)} aktiv, {len(recent_past)} kuerzlich abgelaufen).")
+    mode = "voll" if full else "inkrementell"
+    print(f"✅ Schreibmodus {mode}: {stats['written']} geschrieben, {stats['unchanged']} unveraendert, {stats['removed']} verwaiste Slugs entfernt.")
+    phases = ", ".join(f"{name}={timings.get(name, 0.0) * 1000:.0f} ms" for name in ("index", "render", "write", "manifest"))
+    print(f"⏱️ Phasen (jobs={jobs}): {phases}")
+    print(f"✅ Manifest: {MANIFEST_PATH}")
+    return manifest
+
+
+# === BEGIN BLOCK: EVENT_DETAIL_SITEMAP_ADDITIONS_V1 | Zweck: aktive, indexierbare Detailseiten aus dem Manifest an eine Deploy-Sitemap anhaengen; Umfang: gemeinsam genutzt von build-site-data.py und augment-sitemap-event-details.py ===
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def sitemap_event_urls(manifest: Dict[str, Any]) -> List[str]:
+    pages = manifest.get("pages", []) if isinstance(manifest, dict) else []
+    return [
+        str(page.get("url") or "").strip()
+        for page in pages
+        if page.get("active") and not page.get("noindex") and str(page.get("url") or "").strip()
+    ]
+
+
+def augment_sitemap(sitemap_path: Path, manifest: Dict[str, Any]) -> int:
+    """Append detail page URLs missing from the sitemap; returns the number of added URLs."""
+    ET.register_namespace("", SITEMAP_NS)
+    tree = ET.parse(sitemap_path)
+    root = tree.getroot()
+    existing = {loc.text.strip() for loc in root.findall(f"{{{SITEMAP_NS}}}url/{{{SITEMAP_NS}}}loc") if loc.text}
+    today = date.today().isoformat()
+    added = 0
+
+    for url in sitemap_event_urls(manifest):
+        if url in existing:
+            continue
+        url_el = ET.SubElement(root, f"{{{SITEMAP_NS}}}url")
+        ET.SubElement(url_el, f"{{{SITEMAP_NS}}}loc").text = url
+        ET.SubElement(url_el, f"{{{SITEMAP_NS}}}lastmod").text = today
+        ET.SubElement(url_el, f"{{{SITEMAP_NS}}}changefreq").text = "daily"
+        ET.SubElement(url_el, f"{{{SITEMAP_NS}}}priority").text = "0.70"
+        existing.add(url)
+        added += 1
+
+    tree.write(sitemap_path, encoding="utf-8", xml_declaration=True)
+    return added
+# === END BLOCK: EVENT_DETAIL_SITEMAP_ADDITIONS_V1 ===
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate canonical event detail pages.")
+    parser.add_argument("--full", action="store_true", help="Alle generierten Detailseiten loeschen und neu schreiben statt inkrementell.")
+    parser.add_argument("--jobs", type=int, default=1, help="Parallele Render-Prozesse und Schreib-Threads (1 = sequenziell).")
+    args = parser.parse_args(argv)
+    if not EVENTS_JSON.exists():
+        raise SystemExit(f"Missing {EVENTS_JSON}")
+
+    active_raw = read_json_array(EVENTS_JSON)
+    build_detail_pages(active_raw, read_tsv(EVENTS_TSV), full=args.full, jobs=args.jobs)
+    EVENTS_JSON.write_text(json.dumps(active_raw, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
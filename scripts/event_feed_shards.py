@@ -0,0 +1,99 @@
+"""Date-sharded public event feed written next to ``data/events.json``.
+
+``events.json`` stays the complete feed. In addition the builder writes into
+``data/event-feed/``:
+
+- ``index.<hash>.json``: compact list (id, date, endDate, time, kategorie,
+  visual_key, title) for all published events,
+- ``month-YYYY-MM.<hash>.json``: full feed items grouped by start month,
+- ``next-28-days.<hash>.json``: full feed items overlapping today + 27 days
+  (covers the 21-day scoring horizon of ``js/recommendations.js`` with a
+  week of slack for a stale manifest),
+- ``manifest.json``: the only unhashed file, pointing at the current shards.
+
+Shard names carry a prefix of the SHA-256 of their bytes, so clients may cache
+them immutably; only the manifest has to be revalidated.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+FEED_SHARD_VERSION = 1
+FEED_SHARD_PUBLIC_PREFIX = "/data/event-feed/"
+FEED_SHARD_MANIFEST = "manifest.json"
+FEED_SHARD_NEXT_DAYS = 28
+FEED_SHARD_HASH_CHARS = 12
+INDEX_FIELDS = ("id", "date", "endDate", "time", "kategorie", "visual_key", "title")
+RE_SHARD_FILE = re.compile(r"^(?:index|next-\d+-days|month-\d{4}-\d{2})\.[0-9a-f]+\.json$")
+
+
+def compact_json(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def index_entry(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: item[field] for field in INDEX_FIELDS if item.get(field)}
+
+
+def overlaps(item: Dict[str, Any], start: str, end: str) -> bool:
+    """ISO strings compare like dates; endDate defaults to date."""
+    first = str(item.get("date") or "")
+    last = str(item.get("endDate") or first)
+    return bool(first) and first <= end and last >= start
+
+
+def build_shards(items: Iterable[Dict[str, Any]], today: date) -> Dict[str, Any]:
+    """Shard payloads keyed by file stem; month keys keep the sorted feed order."""
+    feed = list(items)
+    until = today + timedelta(days=FEED_SHARD_NEXT_DAYS - 1)
+    months: Dict[str, List[Dict[str, Any]]] = {}
+    for item in feed:
+        months.setdefault(str(item.get("date") or "")[:7], []).append(item)
+
+    shards: Dict[str, Any] = {"index": [index_entry(item) for item in feed]}
+    shards[f"next-{FEED_SHARD_NEXT_DAYS}-days"] = [item for item in feed if overlaps(item, today.isoformat(), until.isoformat())]
+    for month in sorted(key for key in months if key):
+        shards[f"month-{month}"] = months[month]
+    return shards
+
+
+def write_event_feed_shards(items: List[Dict[str, Any]], out_dir: Path, today: Optional[date] = None) -> Dict[str, Any]:
+    """Write hashed shards + manifest into out_dir, prune shards of older builds; returns the manifest."""
+    today = today or date.today()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    entries: Dict[str, Dict[str, Any]] = {}
+    for stem, payload in build_shards(items, today).items():
+        data = compact_json(payload)
+        digest = hashlib.sha256(data).hexdigest()
+        name = f"{stem}.{digest[:FEED_SHARD_HASH_CHARS]}.json"
+        path = out_dir / name
+        if not path.exists() or path.read_bytes() != data:
+            path.write_bytes(data)
+        entries[stem] = {"path": FEED_SHARD_PUBLIC_PREFIX + name, "sha256": digest, "count": len(payload), "bytes": len(data)}
+
+    next_days = entries.pop(f"next-{FEED_SHARD_NEXT_DAYS}-days")
+    manifest = {
+        "version": FEED_SHARD_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
+        "event_count": len(items),
+        "index": entries.pop("index"),
+        "next_days": {
+            **next_days,
+            "from": today.isoformat(),
+            "until": (today + timedelta(days=FEED_SHARD_NEXT_DAYS - 1)).isoformat(),
+        },
+        "months": [{"month": stem.removeprefix("month-"), **entry} for stem, entry in entries.items()],
+    }
+    (out_dir / FEED_SHARD_MANIFEST).write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+    # Prune only after the new manifest is in place; foreign files stay untouched.
+    current = {entry["path"].rsplit("/", 1)[-1] for entry in [manifest["index"], manifest["next_days"], *manifest["months"]]}
+    for path in out_dir.iterdir():
+        if path.is_file() and RE_SHARD_FILE.match(path.name) and path.name not in current:
+            path.unlink()
+    return manifest
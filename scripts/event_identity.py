@@ -4,32 +4,94 @@ import json
 import math
 import re
 import unicodedata
+from dataclasses import dataclass
 from datetime import date, datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Iterable, Mapping
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_CONTRACT_PATH = ROOT / "data" / "event_identity_contract.json"
+NORMALIZER_CACHE_SIZE = 8192
+
+RE_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+RE_SPACE = re.compile(r"\s+")
+RE_TITLE_YEAR = re.compile(r"20\d{2}")
 
 
 def _text(value: Any) -> str:
     return str(value or "").strip()
 
 
-def load_event_identity_contract(path: Path | None = None) -> dict[str, Any]:
-    contract_path = path or DEFAULT_CONTRACT_PATH
-    payload = json.loads(contract_path.read_text(encoding="utf-8"))
-    if not isinstance(payload, dict):
-        raise ValueError("event_identity_contract.json must contain an object")
-    weights = payload.get("weights")
-    if not isinstance(weights, dict) or not math.isclose(
-        sum(float(weights.get(key, 0.0)) for key in ("title", "location", "city", "source_host")),
-        1.0,
-        abs_tol=1e-9,
-    ):
-        raise ValueError("event identity weights must sum to 1.0")
-    return payload
+WEIGHT_KEYS = ("title", "location", "city", "source_host")
+
+
+@dataclass(frozen=True)
+class EventIdentityContract:
+    """Validated, immutable view of data/event_identity_contract.json."""
+
+    version: int
+    review_threshold: float
+    weights: Mapping[str, float]
+    min_shared_title_tokens: int
+    single_token_title_cap: float
+    stopwords: frozenset[str]
+    token_aliases: Mapping[str, str]
+    tracking_parameters: frozenset[str]
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> EventIdentityContract:
+        if not isinstance(payload, Mapping):
+            raise ValueError("event_identity_contract.json must contain an object")
+        weights = payload.get("weights")
+        if not isinstance(weights, Mapping) or not math.isclose(
+            sum(float(weights.get(key, 0.0)) for key in WEIGHT_KEYS),
+            1.0,
+            abs_tol=1e-9,
+        ):
+            raise ValueError("event identity weights must sum to 1.0")
+        if "review_threshold" not in payload:
+            raise ValueError("event identity contract needs a review_threshold")
+        return cls(
+            version=int(payload.get("version", 0)),
+            review_threshold=float(payload["review_threshold"]),
+            weights=MappingProxyType({key: float(weights.get(key, 0.0)) for key in WEIGHT_KEYS}),
+            min_shared_title_tokens=int(payload.get("min_shared_title_tokens", 2)),
+            single_token_title_cap=float(payload.get("single_token_title_cap", 0.58)),
+            stopwords=frozenset(str(word) for word in payload.get("stopwords") or []),
+            token_aliases=MappingProxyType({str(key): str(value) for key, value in dict(payload.get("token_aliases") or {}).items()}),
+            tracking_parameters=frozenset(str(name) for name in payload.get("tracking_parameters") or []),
+        )
+
+    @cached_property
+    def normalizer(self) -> EventIdentityNormalizer:
+        return EventIdentityNormalizer(self)
+
+
+_CONTRACT_CACHE: dict[Path, tuple[tuple[int, int], EventIdentityContract]] = {}
+
+
+def load_event_identity_contract(path: Path | None = None) -> EventIdentityContract:
+    """Return the process-wide contract instance, reloaded only when the file changes."""
+    contract_path = Path(path or DEFAULT_CONTRACT_PATH).resolve()
+    stat = contract_path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONTRACT_CACHE.get(contract_path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    contract = EventIdentityContract.from_payload(json.loads(contract_path.read_text(encoding="utf-8")))
+    _CONTRACT_CACHE[contract_path] = (stamp, contract)
+    return contract
+
+
+def event_identity_contract(contract: EventIdentityContract | Mapping[str, Any] | None = None) -> EventIdentityContract:
+    if isinstance(contract, EventIdentityContract):
+        return contract
+    if contract is None:
+        return load_event_identity_contract()
+    return EventIdentityContract.from_payload(contract)
 
 
 def normalize_identity_text(value: Any) -> str:
@@ -37,12 +99,20 @@ def normalize_identity_text(value: Any) -> str:
     raw = raw.replace("ä", "ae").replace("ö", "oe").replace("ü", "ue").replace("ß", "ss")
     raw = unicodedata.normalize("NFKD", raw)
     raw = "".join(ch for ch in raw if not unicodedata.combining(ch))
-    raw = re.sub(r"[^a-z0-9]+", " ", raw)
-    return re.sub(r"\s+", " ", raw).strip()
+    raw = RE_NON_ALNUM.sub(" ", raw)
+    return RE_SPACE.sub(" ", raw).strip()
+
 
+def canonical_identity_url(raw: Any, contract: EventIdentityContract | Mapping[str, Any] | None = None) -> str:
+    if isinstance(contract, EventIdentityContract):
+        tracking = contract.tracking_parameters
+    else:
+        tracking = frozenset((contract or {}).get("tracking_parameters") or [])
+    return _canonical_url(_text(raw), tracking)
 
-def canonical_identity_url(raw: Any, contract: Mapping[str, Any] | None = None) -> str:
-    value = re.sub(r"\s+", "", _text(raw))
+
+def _canonical_url(raw: str, tracking: frozenset[str]) -> str:
+    value = RE_SPACE.sub("", raw)
     if not value:
         return ""
     if "://" not in value:
@@ -51,7 +121,6 @@ def canonical_identity_url(raw: Any, contract: Mapping[str, Any] | None = None)
         parsed = urlparse(value)
     except Exception:
         return value.rstrip("/")
-    tracking = set((contract or {}).get("tracking_parameters") or [])
     kept = []
     for key, item_value in parse_qsl(parsed.query, keep_blank_values=True):
         lower = key.lower().strip()
@@ -67,8 +136,11 @@ def canonical_identity_url(raw: Any, contract: Mapping[str, Any] | None = None)
     return urlunparse(cleaned).rstrip("/")
 
 
-def identity_url_host(raw: Any, contract: Mapping[str, Any] | None = None) -> str:
-    url = canonical_identity_url(raw, contract)
+def identity_url_host(raw: Any, contract: EventIdentityContract | Mapping[str, Any] | None = None) -> str:
+    return _canonical_url_host(canonical_identity_url(raw, contract))
+
+
+def _canonical_url_host(url: str) -> str:
     if not url:
         return ""
     host = urlparse(url).netloc.lower()
@@ -104,37 +176,121 @@ def _parse_day(raw: str) -> date | None:
         return None
 
 
-def _date_ranges_overlap(a: Mapping[str, str], b: Mapping[str, str]) -> bool:
-    a_start = _parse_day(a.get("date", ""))
-    b_start = _parse_day(b.get("date", ""))
-    if a_start is None or b_start is None:
-        return False
-    a_end = _parse_day(a.get("end_date", "")) or a_start
-    b_end = _parse_day(b.get("end_date", "")) or b_start
-    return a_start <= b_end and b_start <= a_end
-
-
-def _tokens(value: str, contract: Mapping[str, Any], *, title: bool = False) -> set[str]:
-    stopwords = set(contract.get("stopwords") or []) if title else set()
-    aliases = dict(contract.get("token_aliases") or {})
-    result: set[str] = set()
-    for token in normalize_identity_text(value).split():
-        token = aliases.get(token, token)
-        if not token or token in stopwords:
-            continue
-        if title and re.fullmatch(r"20\d{2}", token):
-            continue
-        result.add(token)
-    return result
+def _day_range(fields: Mapping[str, str]) -> tuple[date, date] | None:
+    start = _parse_day(fields.get("date", ""))
+    if start is None:
+        return None
+    return start, _parse_day(fields.get("end_date", "")) or start
+
 
+def _day_ranges_overlap(a: tuple[date, date] | None, b: tuple[date, date] | None) -> bool:
+    if a is None or b is None:
+        return False
+    return a[0] <= b[1] and b[0] <= a[1]
+
+
+@dataclass(frozen=True)
+class _IdentityRecord:
+    fields: Mapping[str, str]
+    id_norm: str
+    title_norm: str
+    title_tokens: frozenset[str]
+    location_norm: str
+    location_tokens: frozenset[str]
+    city_norm: str
+    url: str
+    host: str
+    days: tuple[date, date] | None
+
+
+class EventIdentityNormalizer:
+    """Contract-bound, memoized text, token and URL normalization.
+
+    Stopwords, aliases and tracking parameters are resolved once from the
+    contract; normalized text, token sets, canonical URLs and hosts are kept in
+    bounded LRU caches whose hit/miss counters are exposed via cache_stats().
+    """
+
+    def __init__(self, contract: EventIdentityContract, *, cache_size: int = NORMALIZER_CACHE_SIZE) -> None:
+        self.contract = contract
+        self.stopwords = contract.stopwords
+        self.aliases = contract.token_aliases
+        self.tracking_parameters = contract.tracking_parameters
+        self._caches = {
+            "text": lru_cache(maxsize=cache_size)(normalize_identity_text),
+            "tokens": lru_cache(maxsize=cache_size)(self._uncached_tokens),
+            "url": lru_cache(maxsize=cache_size)(self._uncached_url),
+            "host": lru_cache(maxsize=cache_size)(_canonical_url_host),
+        }
 
-def _token_similarity(a: str, b: str, contract: Mapping[str, Any], *, title: bool = False) -> tuple[float, int]:
-    a_norm = normalize_identity_text(a)
-    b_norm = normalize_identity_text(b)
+    def text(self, value: Any) -> str:
+        return self._caches["text"](_text(value))
+
+    def tokens(self, value: Any, *, title: bool = False) -> frozenset[str]:
+        return self._caches["tokens"](self.text(value), title)
+
+    def url(self, value: Any) -> str:
+        return self._caches["url"](_text(value))
+
+    def host(self, value: Any) -> str:
+        return self._caches["host"](self.url(value))
+
+    def _uncached_tokens(self, normalized: str, title: bool) -> frozenset[str]:
+        stopwords = self.stopwords if title else frozenset()
+        result: set[str] = set()
+        for token in normalized.split():
+            token = self.aliases.get(token, token)
+            if not token or token in stopwords:
+                continue
+            if title and RE_TITLE_YEAR.fullmatch(token):
+                continue
+            result.add(token)
+        return frozenset(result)
+
+    def _uncached_url(self, value: str) -> str:
+        return _canonical_url(value, self.tracking_parameters)
+
+    def record(self, item: Mapping[str, Any]) -> _IdentityRecord:
+        fields = _event_fields(item)
+        url = self.url(fields["url"])
+        return _IdentityRecord(
+            fields=fields,
+            id_norm=self.text(fields["id"]),
+            title_norm=self.text(fields["title"]),
+            title_tokens=self.tokens(fields["title"], title=True),
+            location_norm=self.text(fields["location"]),
+            location_tokens=self.tokens(fields["location"]),
+            city_norm=self.text(fields["city"]),
+            url=url,
+            host=self._caches["host"](url),
+            days=_day_range(fields),
+        )
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        stats: dict[str, dict[str, int]] = {}
+        for name, cache in self._caches.items():
+            info = cache.cache_info()
+            stats[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+        return stats
+
+    def cache_summary(self) -> str:
+        return " ".join(
+            f"{name}={values['hits']}/{values['hits'] + values['misses']}"
+            for name, values in self.cache_stats().items()
+        )
+
+
+def _token_similarity(
+    a_norm: str,
+    a_tokens: frozenset[str],
+    b_norm: str,
+    b_tokens: frozenset[str],
+    contract: EventIdentityContract,
+    *,
+    title: bool = False,
+) -> tuple[float, int]:
     if a_norm and a_norm == b_norm:
-        return 1.0, max(1, len(_tokens(a, contract, title=title)))
-    a_tokens = _tokens(a, contract, title=title)
-    b_tokens = _tokens(b, contract, title=title)
+        return 1.0, max(1, len(a_tokens))
     if not a_tokens or not b_tokens:
         return 0.0, 0
     shared = len(a_tokens & b_tokens)
@@ -143,24 +299,26 @@ def _token_similarity(a: str, b: str, contract: Mapping[str, Any], *, title: boo
     dice = (2.0 * shared) / (len(a_tokens) + len(b_tokens))
     containment = shared / min(len(a_tokens), len(b_tokens))
     score = max(dice, containment)
-    if title and shared < int(contract.get("min_shared_title_tokens", 2)):
-        score = min(score, float(contract.get("single_token_title_cap", 0.58)))
+    if title and shared < contract.min_shared_title_tokens:
+        score = min(score, contract.single_token_title_cap)
     return score, shared
 
 
-def _score(candidate: Mapping[str, str], existing: Mapping[str, str], contract: Mapping[str, Any]) -> tuple[float, dict[str, Any]]:
-    title_score, shared_title_tokens = _token_similarity(candidate["title"], existing["title"], contract, title=True)
-    location_score, _ = _token_similarity(candidate["location"], existing["location"], contract)
-    city_score = 1.0 if normalize_identity_text(candidate["city"]) and normalize_identity_text(candidate["city"]) == normalize_identity_text(existing["city"]) else 0.0
-    candidate_host = identity_url_host(candidate["url"], contract)
-    existing_host = identity_url_host(existing["url"], contract)
-    source_host_score = 1.0 if candidate_host and candidate_host == existing_host else 0.0
-    weights = contract["weights"]
+def _score(candidate: _IdentityRecord, existing: _IdentityRecord, contract: EventIdentityContract) -> tuple[float, dict[str, Any]]:
+    title_score, shared_title_tokens = _token_similarity(
+        candidate.title_norm, candidate.title_tokens, existing.title_norm, existing.title_tokens, contract, title=True
+    )
+    location_score, _ = _token_similarity(
+        candidate.location_norm, candidate.location_tokens, existing.location_norm, existing.location_tokens, contract
+    )
+    city_score = 1.0 if candidate.city_norm and candidate.city_norm == existing.city_norm else 0.0
+    source_host_score = 1.0 if candidate.host and candidate.host == existing.host else 0.0
+    weights = contract.weights
     total = (
-        float(weights["title"]) * title_score
-        + float(weights["location"]) * location_score
-        + float(weights["city"]) * city_score
-        + float(weights["source_host"]) * source_host_score
+        weights["title"] * title_score
+        + weights["location"] * location_score
+        + weights["city"] * city_score
+        + weights["source_host"] * source_host_score
     )
     return total, {
         "title_score": title_score,
@@ -187,28 +345,33 @@ def _result(status: str = "none", **kwargs: Any) -> dict[str, Any]:
     }
 
 
-def compare_event_identity(candidate_item: Mapping[str, Any], existing_item: Mapping[str, Any], contract: Mapping[str, Any] | None = None) -> dict[str, Any]:
-    cfg = dict(contract or load_event_identity_contract())
-    candidate = _event_fields(candidate_item)
-    existing = _event_fields(existing_item)
-    same_id = bool(candidate["id"] and existing["id"] and normalize_identity_text(candidate["id"]) == normalize_identity_text(existing["id"]))
-    date_overlap = _date_ranges_overlap(candidate, existing)
+def compare_event_identity(
+    candidate_item: Mapping[str, Any],
+    existing_item: Mapping[str, Any],
+    contract: EventIdentityContract | Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    normalizer = event_identity_contract(contract).normalizer
+    return _compare_records(normalizer.record(candidate_item), normalizer.record(existing_item), normalizer.contract)
+
+
+def _compare_records(candidate: _IdentityRecord, existing: _IdentityRecord, cfg: EventIdentityContract) -> dict[str, Any]:
+    same_id = bool(candidate.fields["id"] and existing.fields["id"] and candidate.id_norm == existing.id_norm)
+    date_overlap = _day_ranges_overlap(candidate.days, existing.days)
     if not same_id and not date_overlap:
         return _result()
 
     score, details = _score(candidate, existing, cfg)
-    candidate_url = canonical_identity_url(candidate["url"], cfg)
-    existing_url = canonical_identity_url(existing["url"], cfg)
-    same_url = bool(candidate_url and candidate_url == existing_url)
-    same_title = bool(normalize_identity_text(candidate["title"]) and normalize_identity_text(candidate["title"]) == normalize_identity_text(existing["title"]))
-    same_location = bool(normalize_identity_text(candidate["location"]) and normalize_identity_text(candidate["location"]) == normalize_identity_text(existing["location"]))
+    existing_url = existing.url
+    same_url = bool(candidate.url and candidate.url == existing_url)
+    same_title = bool(candidate.title_norm and candidate.title_norm == existing.title_norm)
+    same_location = bool(candidate.location_norm and candidate.location_norm == existing.location_norm)
 
     status = "none"
     match_type = ""
     reason = ""
     confidence = ""
     if same_id:
-        if date_overlap and (same_url or (details["title_score"] >= float(cfg["review_threshold"]) and score >= float(cfg["review_threshold"]))):
+        if date_overlap and (same_url or (details["title_score"] >= cfg.review_threshold and score >= cfg.review_threshold)):
             status = "same_identity"
             match_type = "same_event_id"
             reason = "Die stabile Event-ID ist bereits vorhanden und die fachlichen Merkmale passen zum selben Event."
@@ -229,8 +392,8 @@ def compare_event_identity(candidate_item: Mapping[str, Any], existing_item: Map
         match_type = "same_source_url_and_date"
         reason = "Dieselbe kanonische Quelle und derselbe Termin sind bereits vorhanden; die abweichende Bezeichnung muss fachlich geprüft werden."
         confidence = "high"
-        score = max(score, float(cfg["review_threshold"]))
-    elif score >= float(cfg["review_threshold"]) and details["shared_title_tokens"] >= int(cfg.get("min_shared_title_tokens", 2)):
+        score = max(score, cfg.review_threshold)
+    elif score >= cfg.review_threshold and details["shared_title_tokens"] >= cfg.min_shared_title_tokens:
         status = "possible"
         match_type = "semantic_title_date_context"
         reason = "Termin und prägende Titelbegriffe stimmen stark überein; Ort, Stadt oder Quellkontext stützen den Verdacht."
@@ -240,10 +403,10 @@ def compare_event_identity(candidate_item: Mapping[str, Any], existing_item: Map
         return _result()
     return _result(
         status,
-        matched_event_id=existing["id"],
-        matched_event_title=existing["title"],
-        matched_event_date=existing["date"],
-        matched_event_location=existing["location"],
+        matched_event_id=existing.fields["id"],
+        matched_event_title=existing.fields["title"],
+        matched_event_date=existing.fields["date"],
+        matched_event_location=existing.fields["location"],
         matched_event_url=existing_url,
         score=round(min(1.0, max(0.0, score)), 3),
         match_type=match_type,
@@ -281,21 +444,109 @@ def event_rows_from_sheet_values(values: Iterable[Iterable[Any]]) -> list[dict[s
     return result
 
 
-def find_best_event_match(candidate: Mapping[str, Any], existing_events: Iterable[Mapping[str, Any]], contract: Mapping[str, Any] | None = None) -> dict[str, Any]:
-    cfg = dict(contract or load_event_identity_contract())
-    rank = {"none": 0, "possible": 1, "same_identity": 2, "exact": 3, "identity_conflict": 4}
+_STATUS_RANK = {"none": 0, "possible": 1, "same_identity": 2, "exact": 3, "identity_conflict": 4}
+_MAX_BUCKET_DAYS = 62
+_MAX_LOOKUP_DAYS = 3660
+
+
+def _best_match(candidate: _IdentityRecord, existing_records: Iterable[_IdentityRecord], cfg: EventIdentityContract) -> dict[str, Any]:
     best = _result()
-    for existing in existing_events:
-        if not isinstance(existing, Mapping):
-            continue
-        result = compare_event_identity(candidate, existing, cfg)
-        current_key = (rank.get(result["status"], 0), float(result.get("score", 0.0)), result.get("matched_event_id", ""))
-        best_key = (rank.get(best["status"], 0), float(best.get("score", 0.0)), best.get("matched_event_id", ""))
+    best_key = (0, 0.0, "")
+    for existing in existing_records:
+        result = _compare_records(candidate, existing, cfg)
+        current_key = (_STATUS_RANK.get(result["status"], 0), float(result.get("score", 0.0)), result.get("matched_event_id", ""))
         if current_key > best_key:
             best = result
+            best_key = current_key
     return best
 
 
+def find_best_event_match(
+    candidate: Mapping[str, Any],
+    existing_events: Iterable[Mapping[str, Any]],
+    contract: EventIdentityContract | Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    normalizer = event_identity_contract(contract).normalizer
+    records = (normalizer.record(existing) for existing in existing_events if isinstance(existing, Mapping))
+    return _best_match(normalizer.record(candidate), records, normalizer.contract)
+
+
+def _day_buckets(days: tuple[date, date] | None) -> range:
+    if days is None:
+        return range(0)
+    first, last = min(days), max(days)
+    return range(first.toordinal(), last.toordinal() + 1)
+
+
+def _month_buckets(days: tuple[date, date] | None) -> range:
+    if days is None:
+        return range(0)
+    first, last = min(days), max(days)
+    return range(first.year * 12 + first.month - 1, last.year * 12 + last.month)
+
+
+class EventIdentityIndex:
+    """Incremental lookup structure with the same results as find_best_event_match.
+
+    Every row is normalized once on add() through the shared
+    EventIdentityNormalizer. A row can only reach a status other
+    than "none" through the same stable ID or an overlapping date range, so
+    lookups score just the rows sharing the ID, a day bucket or (for ranges
+    longer than _MAX_BUCKET_DAYS) a month bucket, in insertion order. A shared
+    canonical URL alone never matches, which is why URLs are pre-normalized but
+    not blocked on.
+    """
+
+    def __init__(
+        self,
+        existing_events: Iterable[Mapping[str, Any]] = (),
+        contract: EventIdentityContract | Mapping[str, Any] | None = None,
+        *,
+        normalizer: EventIdentityNormalizer | None = None,
+    ) -> None:
+        self.normalizer = normalizer or event_identity_contract(contract).normalizer
+        self.contract = self.normalizer.contract
+        self._records: list[_IdentityRecord] = []
+        self._by_id: dict[str, list[int]] = {}
+        self._by_day: dict[int, list[int]] = {}
+        self._by_month: dict[int, list[int]] = {}
+        for existing in existing_events:
+            self.add(existing)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, item: Mapping[str, Any]) -> None:
+        if not isinstance(item, Mapping):
+            return
+        record = self.normalizer.record(item)
+        position = len(self._records)
+        self._records.append(record)
+        if record.fields["id"]:
+            self._by_id.setdefault(record.id_norm, []).append(position)
+        days = _day_buckets(record.days)
+        buckets, table = (days, self._by_day) if len(days) <= _MAX_BUCKET_DAYS else (_month_buckets(record.days), self._by_month)
+        for bucket in buckets:
+            table.setdefault(bucket, []).append(position)
+
+    def _positions(self, record: _IdentityRecord) -> Iterable[int]:
+        days = _day_buckets(record.days)
+        if len(days) > _MAX_LOOKUP_DAYS:
+            return range(len(self._records))
+        positions: set[int] = set()
+        if record.fields["id"]:
+            positions.update(self._by_id.get(record.id_norm, ()))
+        for day in days:
+            positions.update(self._by_day.get(day, ()))
+        for month in _month_buckets(record.days):
+            positions.update(self._by_month.get(month, ()))
+        return sorted(positions)
+
+    def find_best(self, candidate: Mapping[str, Any]) -> dict[str, Any]:
+        record = self.normalizer.record(candidate)
+        return _best_match(record, (self._records[position] for position in self._positions(record)), self.contract)
+
+
 def apply_event_identity_match(candidate: Mapping[str, Any], match: Mapping[str, Any], *, allow_same_identity: bool = False) -> dict[str, Any]:
     enriched = dict(candidate)
     status = _text(match.get("status"))
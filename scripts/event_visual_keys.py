@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import re
+import unicodedata
+from typing import Iterable
 
 ALLOWED_EVENT_VISUAL_KEYS = {
     "textile_machines_industry",
@@ -56,7 +58,12 @@ LEGACY_VISUAL_KEY_MAP = {
 
 
 def _norm(value: object) -> str:
-    return str(value or "").strip().lower()
+    text = str(value or "").replace("\u00a0", " ")
+    return unicodedata.normalize("NFC", text).strip().lower()
+
+
+def event_visual_haystack(title: object = "", description: object = "", category: object = "", location: object = "") -> str:
+    return " ".join([_norm(title), _norm(description), _norm(category), _norm(location)]).strip()
 
 
 def _clean_key(value: object) -> str:
@@ -110,235 +117,201 @@ def resolve_event_visual_key(
     return manual or inferred
 
 
-def infer_event_visual_key(title: object = "", description: object = "", category: object = "", location: object = "") -> str:
-    """Return a stable V3.1 visual key for event image pool selection.
-
-    Priority contract:
-    - strong event type markers first
-    - then format/topic markers
-    - category fallback only after specific rules
-    - location never overrides a clearly detected event type
-    """
-
-    title_text = _norm(title)
-    description_text = _norm(description)
-    category_text = _norm(category)
-    location_text = _norm(location)
-    haystack = " ".join([title_text, description_text, category_text, location_text]).strip()
-
-    if not haystack:
-        return "default_city"
-
-    def match(*patterns: str) -> bool:
-        return any(re.search(pattern, haystack, flags=re.IGNORECASE) for pattern in patterns)
-
+# Prioritaetsvertrag fuer infer_event_visual_key: die erste passende Regel gewinnt.
+# - starke Eventtyp-Marker zuerst
+# - dann Format-/Themenmarker
+# - Kategorie-Fallback erst nach den spezifischen Regeln (CATEGORY_VISUAL_KEY_FALLBACKS)
+# - der Ort ueberschreibt nie einen klar erkannten Eventtyp
+EVENT_VISUAL_KEY_RULES: tuple[tuple[str, str], ...] = (
     # 1) Sehr starke, eindeutige Eventtypen zuerst.
-    if match(r"\b(oldtimer(?:festival|treffen)?|classic cars?|veteranenfahrzeug|fahrzeugtreffen|autoschau)\b"):
-        return "vehicle_classic"
-
-    if match(r"\b([a-zäöüß]*schützenfest|[a-zäöüß]*schuetzenfest|thronball|vogelschießen|vogelschiessen|schützenverein|schuetzenverein)\b"):
-        return "shooting_festival_tradition"
-
-    if match(r"\b(rosenmontagszug|rosenmontag|karnevalszug|karnevalsumzug|festzug|umzug|parade|csd)\b"):
-        return "parade_festzug"
-
-    if match(r"\b(kirmes|jahrmarkt|funfair|fahrgeschäft|fahrgeschaeft|riesenrad|autoscooter)\b"):
-        return "kirmes_funfair"
-
-    if match(r"\b(farm\s*&\s*country\s*fair|country\s*fair|landpartie|landmesse)\b"):
-        return "country_fair_rural"
-
-    if match(r"\b(boekenmarkt|herfstboekenmarkt|zomerboekenmarkt|büchermarkt|buechermarkt|buchmarkt|antiquariat)\b"):
-        return "book_market"
-
-    if match(r"\b(weinfest|wijnfeest|wine tasting|street ?food|food ?festival|city food festival|genuss|kulinarik|kulinarisch)\b"):
-        return "food_drink_festival"
-
-    if match(r"\b(gesundheitstage|gesundheitsprogramm|gesundheitsmesse|gesundheitsaktion|gesundheitsforum)\b"):
-        return "business_messe_info"
-
-    if match(r"\b(aaltendagen|innenstadtsommer|bokeltsen treff|verkaufsoffener sonntag|quartierfest|stadtteilfest)\b"):
-        return "city_festival_street"
-
-    if match(r"\b(krammarkt|stoffmarkt|flohmarkt|trödelmarkt|troedelmarkt|wochenmarkt|grenzmarkt|marktstände|marktstaende|martinsmarkt)\b"):
-        return "market_stalls"
-
+    ("vehicle_classic", r"\b(oldtimer(?:festival|treffen)?|classic cars?|veteranenfahrzeug|fahrzeugtreffen|autoschau)\b"),
+    ("shooting_festival_tradition", r"\b([a-zäöüß]*schützenfest|[a-zäöüß]*schuetzenfest|thronball|vogelschießen|vogelschiessen|schützenverein|schuetzenverein)\b"),
+    ("parade_festzug", r"\b(rosenmontagszug|rosenmontag|karnevalszug|karnevalsumzug|festzug|umzug|parade|csd)\b"),
+    ("kirmes_funfair", r"\b(kirmes|jahrmarkt|funfair|fahrgeschäft|fahrgeschaeft|riesenrad|autoscooter)\b"),
+    ("country_fair_rural", r"\b(farm\s*&\s*country\s*fair|country\s*fair|landpartie|landmesse)\b"),
+    ("book_market", r"\b(boekenmarkt|herfstboekenmarkt|zomerboekenmarkt|büchermarkt|buechermarkt|buchmarkt|antiquariat)\b"),
+    ("food_drink_festival", r"\b(weinfest|wijnfeest|wine tasting|street ?food|food ?festival|city food festival|genuss|kulinarik|kulinarisch)\b"),
+    ("business_messe_info", r"\b(gesundheitstage|gesundheitsprogramm|gesundheitsmesse|gesundheitsaktion|gesundheitsforum)\b"),
+    ("city_festival_street", r"\b(aaltendagen|innenstadtsommer|bokeltsen treff|verkaufsoffener sonntag|quartierfest|stadtteilfest)\b"),
+    ("market_stalls", r"\b(krammarkt|stoffmarkt|flohmarkt|trödelmarkt|troedelmarkt|wochenmarkt|grenzmarkt|marktstände|marktstaende|martinsmarkt)\b"),
     # 2) Sehr starke Bühnen-, Kunst-, Festival-, Musik- und Sprachformate vor Textil-/Museums-Location.
     # Beispiel: Lachnacht im TextilWerk bleibt Comedy, nicht Textilmaschinen.
     # Beispiel: Kunstmarkt mit Live-Musik bleibt Kunstmarkt, nicht Live-Musik.
-    if match(r"\b(kunstausstellung|kunstmarkt|cityart|vernissage|galerie|kreativausstellung|schloss ringenberg)\b"):
-        return "art_exhibition_gallery"
-
+    ("art_exhibition_gallery", r"\b(kunstausstellung|kunstmarkt|cityart|vernissage|galerie|kreativausstellung|schloss ringenberg)\b"),
     # Festival-/Open-Air-Gesamtformate vor Einzelkonzert-Regeln.
-    if match(r"\b(aasee[- ]?festival|open air am marktplatz|open[- ]?air[- ]?festival|festivalgelände|festivalgelaende|kulturtage)\b"):
-        return "open_air_festival"
-
-    if match(r"\b(k[- ]?pop|sing ?& ?dance|dance workshop|tanzworkshop|musikworkshop|dance camp)\b"):
-        return "dance_music_workshop"
-
-    if match(r"\b(kindertheater|puppenspieltage|puppenspiel|puppentheater|figurentheater|kinderoper|vorlese(stunde|zeit)|märchenerzäh|maerchenerzaehl|bären[- ]?geschichten|baeren[- ]?geschichten|ei der welt)\b"):
-        return "kids_stage_story"
-
-    if match(r"\b(comedy|kabarett|lachnacht|stand[- ]?up|kleinkunst)\b"):
-        return "comedy_cabaret"
-
-    if match(r"\b(filmvorführung|filmvorfuehrung|film|kino|open[- ]?air[- ]?kino|kinoabend|filmabend|dokufilm)\b"):
-        return "film_screening"
-
-    if match(r"\b(lesung|literatur|autorengespräch|autorengespraech|gedichte|poetry|poesie)\b"):
-        return "literature_reading_talk"
-
-    if match(r"\b(orgel|oratorium|chor|chorkonzert|kammermusik|klassik|quartett|quartet|kirchenkonzert|sinfonie)\b"):
-        return "classical_music"
-
-    if match(r"\b(konzert|open[- ]?air[- ]?konzert|live[- ]?musik|live[- ]?bands?|bands?|jazz|song[- ]?slam|songslam|tribute|unplugged|dj|pop|rock|musikschulfest)\b"):
-        return "live_music_stage"
-
-    if match(r"\b(theater|theaterabend|schauspiel|schauspielabend|bühnenstück|buehnenstueck|bühnenfassung|buehnenfassung|theaterbühne|theaterbuehne|komödie|komoedie|musical)\b"):
-        return "theater_stage"
-
-    if match(r"\b(living history|in szene gesetzt)\b"):
-        return "local_history_heritage"
-
+    ("open_air_festival", r"\b(aasee[- ]?festival|open air am marktplatz|open[- ]?air[- ]?festival|festivalgelände|festivalgelaende|kulturtage)\b"),
+    ("dance_music_workshop", r"\b(k[- ]?pop|sing ?& ?dance|dance workshop|tanzworkshop|musikworkshop|dance camp)\b"),
+    ("kids_stage_story", r"\b(kindertheater|puppenspieltage|puppenspiel|puppentheater|figurentheater|kinderoper|vorlese(stunde|zeit)|märchenerzäh|maerchenerzaehl|bären[- ]?geschichten|baeren[- ]?geschichten|ei der welt)\b"),
+    ("comedy_cabaret", r"\b(comedy|kabarett|lachnacht|stand[- ]?up|kleinkunst)\b"),
+    ("film_screening", r"\b(filmvorführung|filmvorfuehrung|film|kino|open[- ]?air[- ]?kino|kinoabend|filmabend|dokufilm)\b"),
+    ("literature_reading_talk", r"\b(lesung|literatur|autorengespräch|autorengespraech|gedichte|poetry|poesie)\b"),
+    ("classical_music", r"\b(orgel|oratorium|chor|chorkonzert|kammermusik|klassik|quartett|quartet|kirchenkonzert|sinfonie)\b"),
+    ("live_music_stage", r"\b(konzert|open[- ]?air[- ]?konzert|live[- ]?musik|live[- ]?bands?|bands?|jazz|song[- ]?slam|songslam|tribute|unplugged|dj|pop|rock|musikschulfest)\b"),
+    ("theater_stage", r"\b(theater|theaterabend|schauspiel|schauspielabend|bühnenstück|buehnenstueck|bühnenfassung|buehnenfassung|theaterbühne|theaterbuehne|komödie|komoedie|musical)\b"),
+    ("local_history_heritage", r"\b(living history|in szene gesetzt)\b"),
     # 3) Kultur/Textil: konkreter Ausstellungstyp vor TextilWerk-/Spinnerei-Location.
-    if match(r"\b(ibena|textile leidenschaft|textile revolution|textile vergangenheit|textile zukunft|stoffe für die zukunft|stoffe fuer die zukunft|nachhaltige stoffe|textilausstellung|textildesign|stoffdesign|behind beauty)\b"):
-        return "textile_exhibition_design"
-
-    if match(r"\b(maschinen[- ]?mittwoch|drossel[- ]?donnerstag|spinnerei|weberei|industriekultur|textilmaschinen?)\b"):
-        return "textile_machines_industry"
-
-    if match(r"\b(kunstausstellung|kunstmarkt|vernissage|galerie|kreativausstellung|schloss ringenberg)\b"):
-        return "art_exhibition_gallery"
-
-    if match(r"\b(aasee[- ]?festival|open[- ]?air[- ]?festival|festivalgelände|festivalgelaende|kulturtage)\b"):
-        return "open_air_festival"
-
+    ("textile_exhibition_design", r"\b(ibena|textile leidenschaft|textile revolution|textile vergangenheit|textile zukunft|stoffe für die zukunft|stoffe fuer die zukunft|nachhaltige stoffe|textilausstellung|textildesign|stoffdesign|behind beauty)\b"),
+    ("textile_machines_industry", r"\b(maschinen[- ]?mittwoch|drossel[- ]?donnerstag|spinnerei|weberei|industriekultur|textilmaschinen?)\b"),
+    ("art_exhibition_gallery", r"\b(kunstausstellung|kunstmarkt|vernissage|galerie|kreativausstellung|schloss ringenberg)\b"),
+    ("open_air_festival", r"\b(aasee[- ]?festival|open[- ]?air[- ]?festival|festivalgelände|festivalgelaende|kulturtage)\b"),
     # Sichtbarer Motiv-Fit: Führungen/Touren sind nicht automatisch Aktivtouren.
     # Historische, thematische und sagenbezogene Orts-/Stadtführungen müssen vor Aktiv-/Natur-Regeln greifen.
     # Generische Begriffe wie "Tour" oder "Rundgang" reichen allein nicht.
-    if match(r"\b(stadtführung|stadtfuehrung|stadtführungen|stadtfuehrungen|nachtwächter|nachtwaechter|kiepenkerl|promenadenführung|promenadenfuehrung|klumpenführung|klumpenfuehrung|themenführung|themenfuehrung|sagensafari|sagenführung|sagenfuehrung|sagenhafte|dichter[- ]?rundgang|historische führung|historische fuehrung|szenische stadtführung|szenische stadtfuehrung|kostümierte stadtführung|kostuemierte stadtfuehrung)\b"):
-        return "city_tour_history"
-
+    ("city_tour_history", r"\b(stadtführung|stadtfuehrung|stadtführungen|stadtfuehrungen|nachtwächter|nachtwaechter|kiepenkerl|promenadenführung|promenadenfuehrung|klumpenführung|klumpenfuehrung|themenführung|themenfuehrung|sagensafari|sagenführung|sagenfuehrung|sagenhafte|dichter[- ]?rundgang|historische führung|historische fuehrung|szenische stadtführung|szenische stadtfuehrung|kostümierte stadtführung|kostuemierte stadtfuehrung)\b"),
     # Echte Aktivtouren bleiben Aktivtouren, auch wenn die Kategorie "Natur & Draußen" ist.
-    if match(r"\b(fahrradtour|radtour|rad[- ]?tour|segway(?:tour(?:en)?)?|wanderung|wandern|spaziergang)\b"):
-        return "active_route_tour"
-
-    if match(r"\b(fledermaus|naturführung|naturfuehrung|wildlife|wildpark|wasser|pröbstingsee|proebstingsee|aasee|garten|natur|umwelt)\b"):
-        return "nature_learning_wildlife"
-
+    ("active_route_tour", r"\b(fahrradtour|radtour|rad[- ]?tour|segway(?:tour(?:en)?)?|wanderung|wandern|spaziergang)\b"),
+    ("nature_learning_wildlife", r"\b(fledermaus|naturführung|naturfuehrung|wildlife|wildpark|wasser|pröbstingsee|proebstingsee|aasee|garten|natur|umwelt)\b"),
     # 3) Bühne, Sprache, Film.
-    if match(r"\b(k[- ]?pop|sing ?& ?dance|dance workshop|tanzworkshop|musikworkshop|dance camp)\b"):
-        return "dance_music_workshop"
-
-    if match(r"\b(kindertheater|puppenspieltage|puppenspiel|puppentheater|figurentheater|kinderoper|vorlese(stunde|zeit)|märchenerzäh|maerchenerzaehl|bären[- ]?geschichten|baeren[- ]?geschichten|ei der welt)\b"):
-        return "kids_stage_story"
-
-    if match(r"\b(comedy|kabarett|lachnacht|stand[- ]?up|kleinkunst)\b"):
-        return "comedy_cabaret"
-
-    if match(r"\b(filmvorführung|filmvorfuehrung|film|kino|open[- ]?air[- ]?kino|kinoabend|filmabend|dokufilm)\b"):
-        return "film_screening"
-
-    if match(r"\b(lesung|literatur|autorengespräch|autorengespraech|gedichte|poetry|poesie)\b"):
-        return "literature_reading_talk"
-
-    if match(r"\b(orgel|oratorium|chor|chorkonzert|kammermusik|klassik|quartett|quartet|kirchenkonzert|sinfonie)\b"):
-        return "classical_music"
-
-    if match(r"\b(aasee[- ]?festival|open[- ]?air[- ]?festival|festivalgelände|festivalgelaende|kulturtage)\b"):
-        return "open_air_festival"
-
-    if match(r"\b(konzert|open[- ]?air[- ]?konzert|live[- ]?musik|live[- ]?bands?|bands?|jazz|song[- ]?slam|songslam|tribute|unplugged|dj|pop|rock|musikschulfest)\b"):
-        return "live_music_stage"
-
-    if match(r"\b(theater|theaterabend|schauspiel|schauspielabend|bühnenstück|buehnenstueck|bühnenfassung|buehnenfassung|theaterbühne|theaterbuehne|komödie|komoedie|musical)\b"):
-        return "theater_stage"
-
+    ("dance_music_workshop", r"\b(k[- ]?pop|sing ?& ?dance|dance workshop|tanzworkshop|musikworkshop|dance camp)\b"),
+    ("kids_stage_story", r"\b(kindertheater|puppenspieltage|puppenspiel|puppentheater|figurentheater|kinderoper|vorlese(stunde|zeit)|märchenerzäh|maerchenerzaehl|bären[- ]?geschichten|baeren[- ]?geschichten|ei der welt)\b"),
+    ("comedy_cabaret", r"\b(comedy|kabarett|lachnacht|stand[- ]?up|kleinkunst)\b"),
+    ("film_screening", r"\b(filmvorführung|filmvorfuehrung|film|kino|open[- ]?air[- ]?kino|kinoabend|filmabend|dokufilm)\b"),
+    ("literature_reading_talk", r"\b(lesung|literatur|autorengespräch|autorengespraech|gedichte|poetry|poesie)\b"),
+    ("classical_music", r"\b(orgel|oratorium|chor|chorkonzert|kammermusik|klassik|quartett|quartet|kirchenkonzert|sinfonie)\b"),
+    ("open_air_festival", r"\b(aasee[- ]?festival|open[- ]?air[- ]?festival|festivalgelände|festivalgelaende|kulturtage)\b"),
+    ("live_music_stage", r"\b(konzert|open[- ]?air[- ]?konzert|live[- ]?musik|live[- ]?bands?|bands?|jazz|song[- ]?slam|songslam|tribute|unplugged|dj|pop|rock|musikschulfest)\b"),
+    ("theater_stage", r"\b(theater|theaterabend|schauspiel|schauspielabend|bühnenstück|buehnenstueck|bühnenfassung|buehnenfassung|theaterbühne|theaterbuehne|komödie|komoedie|musical)\b"),
     # 4) Feste, Stadtleben, Familie.
     # Familien-/Kinderfeste zuerst, damit Weltkindertagsfest nicht als leeres Stadtfestbild endet.
-    if match(r"\b(weltkindertag(?:sfest)?|kinderfest|familienfest|familienprogramm|spielfest|jugendfarm|ostereiersuche|playfountain|play fountain|wasserspaß|wasserspass|wasserspiel|wasserspielfläche|wasserspielflaeche)\b"):
-        return "family_play_outdoor"
-
-    if match(r"\b(stadtfest|cityfest|verkaufsoffen|lichtersonntag|aktionstag|innenstadtfest|tag der offenen tür|tag der offenen tuer)\b"):
-        return "city_festival_street"
-
-    if match(r"\b(kindertrödel|kinderflohmarkt)\b"):
-        return "family_play_outdoor"
-
+    ("family_play_outdoor", r"\b(weltkindertag(?:sfest)?|kinderfest|familienfest|familienprogramm|spielfest|jugendfarm|ostereiersuche|playfountain|play fountain|wasserspaß|wasserspass|wasserspiel|wasserspielfläche|wasserspielflaeche)\b"),
+    ("city_festival_street", r"\b(stadtfest|cityfest|verkaufsoffen|lichtersonntag|aktionstag|innenstadtfest|tag der offenen tür|tag der offenen tuer)\b"),
+    ("family_play_outdoor", r"\b(kindertrödel|kinderflohmarkt)\b"),
     # 5) Workshops, Lernen, Mitmachen.
-    if match(r"\b(k[- ]?pop|sing ?& ?dance|dance workshop|tanzworkshop|musikworkshop|dance camp)\b"):
-        return "dance_music_workshop"
-
-    if match(r"\b(junge uni|wissenschaft|ökosystem|oekosystem|experiment|forsch(er|en)|lernwerkstatt)\b"):
-        return "learning_science_workshop"
-
-    if match(r"\b(markterschließung|markterschliessung|unternehmen|netzwerk|gründung|gruendung|infoabend|informationsabend|gesundheitsberufemesse|berufsmesse)\b"):
-        return "business_messe_info"
-
-    if match(r"\b(workshop|escape game|pokemon|pokémon|bastel|kreativ|malen|zeichnen|handwerk|nähen|naehen|töpfer|toepfer|maker)\b"):
-        return "creative_making_workshop"
-
+    ("dance_music_workshop", r"\b(k[- ]?pop|sing ?& ?dance|dance workshop|tanzworkshop|musikworkshop|dance camp)\b"),
+    ("learning_science_workshop", r"\b(junge uni|wissenschaft|ökosystem|oekosystem|experiment|forsch(er|en)|lernwerkstatt)\b"),
+    ("business_messe_info", r"\b(markterschließung|markterschliessung|unternehmen|netzwerk|gründung|gruendung|infoabend|informationsabend|gesundheitsberufemesse|berufsmesse)\b"),
+    ("creative_making_workshop", r"\b(workshop|escape game|pokemon|pokémon|bastel|kreativ|malen|zeichnen|handwerk|nähen|naehen|töpfer|toepfer|maker)\b"),
     # 6) Sport, Tour, Natur.
-    if match(r"\b(citylauf|abendlauf|lauf|marathon|halbmarathon|running)\b"):
-        return "running_event"
-
-    if match(r"\b(münsterlandgiro|muensterlandgiro|profiradsport|giro|radrennen|radsport|bike race|fahrrad[- ]?frühling|fahrrad[- ]?fruehling)\b"):
-        return "cycling_event"
-
-    if match(r"\b(darts|fechten|turnier|meisterschaft|hallen(sport)?|wettkampf)\b"):
-        return "indoor_sport_competition"
-
-    if match(r"\b(stadtführung|stadtfuehrung|stadtführungen|stadtfuehrungen|nachtwächter|nachtwaechter|kiepenkerl|promenadenführung|promenadenfuehrung|klumpenführung|klumpenfuehrung|themenführung|themenfuehrung|sagensafari|sagenführung|sagenfuehrung|sagenhafte|dichter[- ]?rundgang|historische führung|historische fuehrung|szenische stadtführung|szenische stadtfuehrung|kostümierte stadtführung|kostuemierte stadtfuehrung)\b"):
-        return "city_tour_history"
-
-    if match(r"\b(fahrradtour|radtour|rad[- ]?tour|segway(?:tour(?:en)?)?|wanderung|wandern|spaziergang)\b"):
-        return "active_route_tour"
-
-    if match(r"\b(fledermaus|naturführung|naturfuehrung|wildlife|wildpark|wasser|pröbstingsee|proebstingsee|aasee|garten|natur|umwelt)\b"):
-        return "nature_learning_wildlife"
-
+    ("running_event", r"\b(citylauf|abendlauf|lauf|marathon|halbmarathon|running)\b"),
+    ("cycling_event", r"\b(münsterlandgiro|muensterlandgiro|profiradsport|giro|radrennen|radsport|bike race|fahrrad[- ]?frühling|fahrrad[- ]?fruehling)\b"),
+    ("indoor_sport_competition", r"\b(darts|fechten|turnier|meisterschaft|hallen(sport)?|wettkampf)\b"),
+    ("city_tour_history", r"\b(stadtführung|stadtfuehrung|stadtführungen|stadtfuehrungen|nachtwächter|nachtwaechter|kiepenkerl|promenadenführung|promenadenfuehrung|klumpenführung|klumpenfuehrung|themenführung|themenfuehrung|sagensafari|sagenführung|sagenfuehrung|sagenhafte|dichter[- ]?rundgang|historische führung|historische fuehrung|szenische stadtführung|szenische stadtfuehrung|kostümierte stadtführung|kostuemierte stadtfuehrung)\b"),
+    ("active_route_tour", r"\b(fahrradtour|radtour|rad[- ]?tour|segway(?:tour(?:en)?)?|wanderung|wandern|spaziergang)\b"),
+    ("nature_learning_wildlife", r"\b(fledermaus|naturführung|naturfuehrung|wildlife|wildpark|wasser|pröbstingsee|proebstingsee|aasee|garten|natur|umwelt)\b"),
     # 7) Sonstige klare Bildwelten.
-    if match(r"\b(tanz in den mai|karibische nacht|party|afterwork|abendveranstaltung|abendformat|nacht)\b"):
-        return "evening_social_party"
-
-    if match(r"\b(messe|berufsmesse|unternehmermesse|infoabend|informationsabend|gesundheitsberufemesse|netzwerkabend|gründung|gruendung)\b"):
-        return "business_messe_info"
-
-    if match(r"\b(kanaren|sieben auf einen streich|reisebericht|fotoshow|vortrag)\b"):
-        return "literature_reading_talk"
-
-    if match(r"\b(living history|in szene gesetzt)\b"):
-        return "local_history_heritage"
-
-    if match(r"\b(archiv|farb|stadtgeschichte|heimat|historisch|geschichte|museum)\b"):
-        return "local_history_heritage"
+    ("evening_social_party", r"\b(tanz in den mai|karibische nacht|party|afterwork|abendveranstaltung|abendformat|nacht)\b"),
+    ("business_messe_info", r"\b(messe|berufsmesse|unternehmermesse|infoabend|informationsabend|gesundheitsberufemesse|netzwerkabend|gründung|gruendung)\b"),
+    ("literature_reading_talk", r"\b(kanaren|sieben auf einen streich|reisebericht|fotoshow|vortrag)\b"),
+    ("local_history_heritage", r"\b(living history|in szene gesetzt)\b"),
+    ("local_history_heritage", r"\b(archiv|farb|stadtgeschichte|heimat|historisch|geschichte|museum)\b"),
+)
+
+CATEGORY_VISUAL_KEY_FALLBACKS: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("musik", "bühne", "buehne"), "live_music_stage"),
+    (("kinder", "familie"), "family_play_outdoor"),
+    (("märkte", "maerkte"), "market_stalls"),
+    (("feste",), "city_festival_street"),
+    (("sport",), "indoor_sport_competition"),
+    (("natur", "draußen", "draussen"), "nature_learning_wildlife"),
+    (("kultur", "kunst"), "local_history_heritage"),
+    (("innenstadt", "leben"), "city_festival_street"),
+)
+
+RE_WORD = re.compile(r"\w+")
+# Nach lower() entsprechen nur noch diese Zeichen unter re.IGNORECASE einem Regelbuchstaben.
+# Mit dieser Faltung laufen die vorkompilierten Regeln ohne IGNORECASE und damit ueber
+# den schnellen Literal-Pfad der re-Alternation.
+IGNORECASE_FOLD = str.maketrans({"ı": "i", "ſ": "s"})
+
+
+def fold_visual_haystack(haystack: str) -> tuple[str, frozenset[str]]:
+    """Return the case-folded haystack and its word set for CompiledVisualKeyRules."""
+    text = haystack.lower().translate(IGNORECASE_FOLD)
+    return text, frozenset(RE_WORD.findall(text))
+
+
+def _split_rule_alternatives(pattern: str) -> list[str]:
+    if not (pattern.startswith(r"\b(") and pattern.endswith(r")\b")):
+        raise ValueError(f"Visual-Key-Regel muss die Form \\b(...)\\b haben: {pattern!r}")
+    alternatives: list[str] = []
+    depth = 0
+    current = ""
+    for char in pattern[3:-3]:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == "|" and depth == 0:
+            alternatives.append(current)
+            current = ""
+        else:
+            current += char
+    alternatives.append(current)
+    if depth != 0:
+        raise ValueError(f"Visual-Key-Regel hat unausgeglichene Klammern: {pattern!r}")
+    return alternatives
+
+
+class CompiledVisualKeyRules:
+    """Single-pass evaluator for a priority-ordered (label, \\b(...)\\b pattern) table.
+
+    Whole-word alternatives become a word -> priority map checked against the
+    haystack's words. All other alternatives share one lookahead alternation in
+    priority order; each ends in an empty named group r<priority>_<n>, so every
+    word start reports the highest-priority phrase rule matching there. The
+    lowest priority over both passes is the rule a sequential re.search chain
+    would hit first.
+    """
 
-    # 8) Kategorie-Fallbacks.
-    cat = category_text
+    def __init__(self, rules: Iterable[tuple[str, str]]) -> None:
+        self.rules = tuple(rules)
+        self.word_priority: dict[str, int] = {}
+        phrases: list[str] = []
+        for priority, (_key, pattern) in enumerate(self.rules):
+            for alternative in _split_rule_alternatives(pattern):
+                if RE_WORD.fullmatch(alternative):
+                    self.word_priority.setdefault(alternative.lower(), priority)
+                else:
+                    phrases.append(f"{alternative}\\b(?P<r{priority}_{len(phrases)}>)")
+        self.phrase_pattern = re.compile(r"\b(?=" + "|".join(phrases) + ")") if phrases else None
+
+    def first_match(self, haystack: str) -> str:
+        return self.first_match_folded(*fold_visual_haystack(haystack))
+
+    def first_match_folded(self, text: str, words: Iterable[str]) -> str:
+        best = len(self.rules)
+        for word in words:
+            priority = self.word_priority.get(word, best)
+            if priority < best:
+                best = priority
+        if self.phrase_pattern is not None:
+            for match in self.phrase_pattern.finditer(text):
+                priority = int(match.lastgroup[1:].partition("_")[0])
+                if priority < best:
+                    best = priority
+        return self.rules[best][0] if best < len(self.rules) else ""
+
+
+COMPILED_EVENT_VISUAL_KEY_RULES = CompiledVisualKeyRules(EVENT_VISUAL_KEY_RULES)
 
-    if "musik" in cat or "bühne" in cat or "buehne" in cat:
-        return "live_music_stage"
 
-    if "kinder" in cat or "familie" in cat:
-        return "family_play_outdoor"
+def infer_event_visual_key(title: object = "", description: object = "", category: object = "", location: object = "") -> str:
+    """Return a stable V3.1 visual key for event image pool selection.
 
-    if "märkte" in cat or "maerkte" in cat:
-        return "market_stalls"
+    The priority contract lives in EVENT_VISUAL_KEY_RULES and
+    CATEGORY_VISUAL_KEY_FALLBACKS.
+    """
 
-    if "feste" in cat:
-        return "city_festival_street"
+    haystack = event_visual_haystack(title, description, category, location)
+    return infer_event_visual_key_from_haystack(haystack, _norm(category))
 
-    if "sport" in cat:
-        return "indoor_sport_competition"
 
-    if "natur" in cat or "draußen" in cat or "draussen" in cat:
-        return "nature_learning_wildlife"
+def infer_event_visual_key_from_haystack(
+    haystack: str,
+    category_text: str,
+    folded: tuple[str, frozenset[str]] | None = None,
+) -> str:
+    """infer_event_visual_key for callers that already hold the normalized haystack."""
+    if not haystack:
+        return "default_city"
 
-    if "kultur" in cat or "kunst" in cat:
-        return "local_history_heritage"
+    matched = COMPILED_EVENT_VISUAL_KEY_RULES.first_match_folded(*(folded or fold_visual_haystack(haystack)))
+    if matched:
+        return matched
 
-    if "innenstadt" in cat or "leben" in cat:
-        return "city_festival_street"
+    for markers, key in CATEGORY_VISUAL_KEY_FALLBACKS:
+        if any(marker in category_text for marker in markers):
+            return key
 
     return "default_city"
 
@@ -4,10 +4,18 @@ from __future__ import annotations
 import json
 import re
 import unicodedata
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
-from event_visual_keys import infer_event_visual_key, normalize_event_visual_key, resolve_event_visual_key
+from event_visual_keys import (
+    CompiledVisualKeyRules,
+    event_visual_haystack,
+    fold_visual_haystack,
+    infer_event_visual_key_from_haystack,
+    normalize_event_visual_key,
+    should_prefer_inferred_event_visual_key,
+)
 
 EVENT_VISUAL_POOL_PATH = Path(__file__).resolve().parents[1] / "data" / "event_visual_pool.json"
 
@@ -188,6 +196,132 @@ EVENT_VISUAL_MOTIF_RULES: Dict[str, Dict[str, Dict[str, str]]] = {
 }
 
 
+# Motivregeln je visual_key in Prioritaetsreihenfolge: die erste passende Regel gewinnt,
+# ohne Treffer gilt das fallback-Motiv des Keys.
+EVENT_VISUAL_MOTIF_PATTERNS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "textile_machines_industry": (
+        ("spinning_mill", r"\b(spinnerei|spinnen|spinnmaschine)\b"),
+        ("weaving_mill", r"\b(weberei|weben|webstuhl|webmaschine|maschinen[- ]?mittwoch|drossel[- ]?donnerstag)\b"),
+    ),
+    "art_exhibition_gallery": (
+        ("art_market", r"\b(kunstmarkt|cityart)\b"),
+        ("creative_exhibition", r"\b(kreativausstellung|kreativ[- ]?schmiede)\b"),
+    ),
+    "local_history_heritage": (
+        ("museum_history_exhibition", r"\b(living history|in szene gesetzt)\b"),
+        ("museum_history_exhibition", r"\b(ausstellung|museum|farb|archiv|historisch|geschichte)\b"),
+    ),
+    "city_tour_history": (
+        ("costumed_history_tour", r"\b(anno 1900|kiepenkerl|klumpenf(ü|ue)hrung|nachtw(ä|ae)chter|kost(ü|ue)m)\b"),
+        ("literary_walk", r"\b(dichter|literarisch|poesie|literatur)\b"),
+        ("neutral_guided_city_tour", r"\b(sagensafari|sagenf(ü|ue)hrung|sagenhafte|themenf(ü|ue)hrung|szenische stadtf(ü|ue)hrung)\b"),
+    ),
+    "live_music_stage": (
+        ("tribute_band", r"\b(tribute|coverband|floyd|floydbox|coltplay|abba|rocking stones)\b"),
+        ("open_air_concert", r"\b(open[- ]?air|stadtturm|bahia|borken open air)\b"),
+        ("music_school_fest", r"\b(musikschulfest|musikschule)\b"),
+        ("local_band_concert", r"\b(bands?|konzert|live|rock|pop|jazz|song[- ]?slam|songslam|unplugged)\b"),
+    ),
+    "classical_music": (
+        ("oratorio", r"\b(oratorium|elias)\b"),
+        ("organ_concert", r"\b(orgel|organ|pipes)\b"),
+        ("choir", r"\b(chor|chorkonzert|madrigalchor|domsingknaben|nacht der ch(ö|oe)re)\b"),
+        ("chamber_music", r"\b(quartett|quartet|kammermusik|ensemble)\b"),
+    ),
+    "theater_stage": (
+        ("musical_show", r"\b(musical|show)\b"),
+        ("theater_play", r"\b(theater|schauspiel|b(ü|ue)hnenst(ü|ue)ck|frankenstein|dritte mann|kanaren|lerche)\b"),
+    ),
+    "comedy_cabaret": (
+        ("cabaret_stage", r"\b(kabarett|kleinkunst|marlies blume)\b"),
+        ("standup_comedy", r"\b(comedy|lachnacht|stand[- ]?up|tobi freudenthal)\b"),
+    ),
+    "literature_reading_talk": (
+        ("poetry_performance", r"\b(poetry|lyrik|poesie|gedichte)\b"),
+        ("author_reading", r"\b(lesung|autor|buchvorstellung|gedichte)\b"),
+        ("neutral_reading_talk", r"\b(kanaren|sieben auf einen streich)\b"),
+        ("neutral_reading_talk", r"\b(vortrag|talk|gespr(ä|ae)ch|info)\b"),
+    ),
+    "kids_stage_story": (
+        ("puppet_theater", r"\b(puppenspieltage|puppenspiel|puppentheater|pettersson|figurentheater|ei der welt)\b"),
+        ("neutral_kids_stage", r"\b(vorlese|geschichte|geschichten|m(ä|ae)rchen|b(ä|ae)ren|bären[- ]?geschichten|baeren[- ]?geschichten)\b"),
+    ),
+    "city_festival_street": (
+        ("shopping_sunday", r"\b(verkaufsoffener sonntag|maiensonntag|lichtersonntag|sonntagsshopping)\b"),
+        ("district_festival", r"\b(rosenberg|quartierfest|stadtteilfest)\b"),
+        ("children_intercultural_festival", r"\b(weltkindertag|interkulturell|kinderfest)\b"),
+        ("open_house_city_services", r"\b(tag der offenen t(ü|ue)r|tourist[- ]?info|stadtb(ü|ue)cherei|archiv)\b"),
+    ),
+    "open_air_festival": (
+        ("lake_festival", r"\b(aasee[- ]?festival|see[- ]?festival)\b"),
+        ("market_square_open_air", r"\b(marktplatz|markt platz|kulturtage)\b"),
+    ),
+    "parade_festzug": (
+        ("csd_pride_parade", r"\b(csd|pride)\b"),
+        ("marching_band_procession", r"\b(blaskapelle|musikzug|spielmannszug|fanfarenzug|tambourcorps|marschkapelle)\b"),
+        ("neutral_parade", r"\b(rosenmontagszug|rosenmontag|karneval|karnevalszug)\b"),
+    ),
+    "market_stalls": (
+        ("fabric_market", r"\b(stoffmarkt|stoff market|stoffe)\b"),
+        ("flea_market", r"\b(flohmarkt|tr(ö|oe)delmarkt|hobbytr(ö|oe)del|interkultureller tr(ö|oe)del)\b"),
+        ("krammarkt_general", r"\b(krammarkt|grensmarkt|grenzmarkt)\b"),
+        ("seasonal_martinsmarkt", r"\b(martinsmarkt)\b"),
+    ),
+    "food_drink_festival": (
+        ("wine_festival", r"\b(weinfest|wijnfeest|wein|wine)\b"),
+        ("street_food_festival", r"\b(street[- ]?food|city food festival|food festival)\b"),
+        ("tasting_event", r"\b(tasting|verkostung|probe)\b"),
+    ),
+    "family_play_outdoor": (
+        ("playfountain_water_splash", r"\b(playfountain|play fountain|wasserspa(ß|ss)|wasserspiel|wasserspielfl(ä|ae)che|wasserfont(ä|ae)ne|spritzbereich|spritzfl(ä|ae)che)\b"),
+        ("children_flea_market", r"\b(kinderflohmarkt|kindertr(ö|oe)del)\b"),
+        ("egg_hunt_family", r"\b(ostern|osterei|eiersuche)\b"),
+    ),
+    "creative_making_workshop": (
+        ("escape_game", r"\b(escape|locked)\b"),
+        ("game_day", r"\b(pokemon|pok(é|e)mon|spieltag|game day)\b"),
+        ("craft_workshop", r"\b(handwerk|craft|bastel|kreativ|n(ä|ae)hen|t(ö|oe)pfer|malen|zeichnen)\b"),
+    ),
+    "learning_science_workshop": (
+        ("science_school", r"\b(junge uni|summerschool|summer school|wissenschaft|forsch)\b"),
+        ("ecology_workshop", r"\b(ökosystem|oekosystem|umwelt|natur)\b"),
+    ),
+    "active_route_tour": (
+        ("neutral_active_tour", r"\b(segway(?:tour(?:en)?)?)\b"),
+        ("guided_bike_tour", r"\b(fahrradtour|radtour|rad[- ]?tour|bike tour)\b"),
+        ("guided_walk", r"\b(wanderung|wandern|spaziergang|walk)\b"),
+    ),
+    "cycling_event": (
+        ("bike_fair", r"\b(fahrradfr(ü|ue)hling|fahrradmesse|fahrradaktion)\b"),
+        ("cycling_race", r"\b(m(ü|ue)nsterlandgiro|radrennen|profistart|radsport)\b"),
+    ),
+    "indoor_sport_competition": (
+        ("fencing", r"\b(fecht|fencing|degen|florett|s(ä|ae)bel)\b"),
+        ("darts", r"\b(darts?|dartturnier|dart[- ]?trophy)\b"),
+        ("table_tennis", r"\b(tischtennis|table tennis|pingpong|ping pong)\b"),
+        ("badminton", r"\b(badminton|federball)\b"),
+        ("handball", r"\b(handball)\b"),
+        ("volleyball", r"\b(volleyball)\b"),
+    ),
+    "nature_learning_wildlife": (
+        ("wildlife_bats", r"\b(fledermaus|bat night|bats?)\b"),
+        ("orchid_plant_tour", r"\b(orchidee|orchideen|pflanzen|plant)\b"),
+        ("animal_park_family", r"\b(anholter schweiz|tierpark|wildpark)\b"),
+        ("walking_nature_tour", r"\b(naturf(ü|ue)hrung|naturtour|sagensafari|wandert|wanderung|wasser|pr(ö|oe)bstingsee)\b"),
+    ),
+    "business_messe_info": (
+        ("health_career_fair", r"\b(gesundheitsberufemesse|gesundheitsberufe|pflegeberufe)\b"),
+        ("neutral_info_fair", r"\b(gesundheitstage|gesundheitsprogramm|gesundheitsmesse|gesundheitsaktion|gesundheitsforum)\b"),
+        ("business_fair", r"\b(markterschließung|markterschliessung|unternehmermesse|business|unternehmen|gr(ü|ue)ndung|netzwerk)\b"),
+        ("association_fair", r"\b(vereinsmesse|verein|vereine)\b"),
+        ("info_evening", r"\b(infoabend|informationsabend|kindertagespflege|beratung)\b"),
+    ),
+}
+COMPILED_EVENT_VISUAL_MOTIF_RULES: Dict[str, CompiledVisualKeyRules] = {
+    key: CompiledVisualKeyRules(rules) for key, rules in EVENT_VISUAL_MOTIF_PATTERNS.items()
+}
+
+
 def _norm(value: object) -> str:
     text = str(value or "").replace("\u00a0", " ")
     text = unicodedata.normalize("NFC", text).strip().lower()
@@ -200,14 +334,6 @@ def _clean_motif(value: object) -> str:
     return raw
 
 
-def _haystack(title: object = "", description: object = "", category: object = "", location: object = "") -> str:
-    return " ".join([_norm(title), _norm(description), _norm(category), _norm(location)]).strip()
-
-
-def _match(haystack: str, *patterns: str) -> bool:
-    return any(re.search(pattern, haystack, flags=re.IGNORECASE) for pattern in patterns)
-
-
 def allowed_event_visual_motifs(visual_key: object) -> Dict[str, Dict[str, str]]:
     key = normalize_event_visual_key(visual_key)
     return EVENT_VISUAL_MOTIF_RULES.get(key, {})
@@ -240,209 +366,6 @@ def event_visual_motif_role(visual_key: object, motif: object) -> str:
     return EVENT_VISUAL_MOTIF_RULES.get(key, {}).get(normalized_motif, {}).get("role", "")
 
 
-def infer_event_visual_motif(
-    title: object = "",
-    description: object = "",
-    category: object = "",
-    location: object = "",
-    visual_key: object = "",
-) -> str:
-    key = normalize_event_visual_key(visual_key) or infer_event_visual_key(title, description, category, location)
-    hay = _haystack(title, description, category, location)
-    if not hay:
-        return fallback_event_visual_motif(key)
-
-    if key == "textile_machines_industry":
-        if _match(hay, r"\b(spinnerei|spinnen|spinnmaschine)\b"):
-            return "spinning_mill"
-        if _match(hay, r"\b(weberei|weben|webstuhl|webmaschine|maschinen[- ]?mittwoch|drossel[- ]?donnerstag)\b"):
-            return "weaving_mill"
-
-    if key == "art_exhibition_gallery":
-        if _match(hay, r"\b(kunstmarkt|cityart)\b"):
-            return "art_market"
-        if _match(hay, r"\b(kreativausstellung|kreativ[- ]?schmiede)\b"):
-            return "creative_exhibition"
-
-    if key == "local_history_heritage":
-        if _match(hay, r"\b(living history|in szene gesetzt)\b"):
-            return "museum_history_exhibition"
-        if _match(hay, r"\b(ausstellung|museum|farb|archiv|historisch|geschichte)\b"):
-            return "museum_history_exhibition"
-
-    if key == "city_tour_history":
-        if _match(hay, r"\b(anno 1900|kiepenkerl|klumpenf(ü|ue)hrung|nachtw(ä|ae)chter|kost(ü|ue)m)\b"):
-            return "costumed_history_tour"
-        if _match(hay, r"\b(dichter|literarisch|poesie|literatur)\b"):
-            return "literary_walk"
-        if _match(hay, r"\b(sagensafari|sagenf(ü|ue)hrung|sagenhafte|themenf(ü|ue)hrung|szenische stadtf(ü|ue)hrung)\b"):
-            return "neutral_guided_city_tour"
-
-    if key == "live_music_stage":
-        if _match(hay, r"\b(tribute|coverband|floyd|floydbox|coltplay|abba|rocking stones)\b"):
-            return "tribute_band"
-        if _match(hay, r"\b(open[- ]?air|stadtturm|bahia|borken open air)\b"):
-            return "open_air_concert"
-        if _match(hay, r"\b(musikschulfest|musikschule)\b"):
-            return "music_school_fest"
-        if _match(hay, r"\b(bands?|konzert|live|rock|pop|jazz|song[- ]?slam|songslam|unplugged)\b"):
-            return "local_band_concert"
-
-    if key == "classical_music":
-        if _match(hay, r"\b(oratorium|elias)\b"):
-            return "oratorio"
-        if _match(hay, r"\b(orgel|organ|pipes)\b"):
-            return "organ_concert"
-        if _match(hay, r"\b(chor|chorkonzert|madrigalchor|domsingknaben|nacht der ch(ö|oe)re)\b"):
-            return "choir"
-        if _match(hay, r"\b(quartett|quartet|kammermusik|ensemble)\b"):
-            return "chamber_music"
-
-    if key == "theater_stage":
-        if _match(hay, r"\b(musical|show)\b"):
-            return "musical_show"
-        if _match(hay, r"\b(theater|schauspiel|b(ü|ue)hnenst(ü|ue)ck|frankenstein|dritte mann|kanaren|lerche)\b"):
-            return "theater_play"
-
-    if key == "comedy_cabaret":
-        if _match(hay, r"\b(kabarett|kleinkunst|marlies blume)\b"):
-            return "cabaret_stage"
-        if _match(hay, r"\b(comedy|lachnacht|stand[- ]?up|tobi freudenthal)\b"):
-            return "standup_comedy"
-
-    if key == "literature_reading_talk":
-        if _match(hay, r"\b(poetry|lyrik|poesie|gedichte)\b"):
-            return "poetry_performance"
-        if _match(hay, r"\b(lesung|autor|buchvorstellung|gedichte)\b"):
-            return "author_reading"
-        if _match(hay, r"\b(kanaren|sieben auf einen streich)\b"):
-            return "neutral_reading_talk"
-        if _match(hay, r"\b(vortrag|talk|gespr(ä|ae)ch|info)\b"):
-            return "neutral_reading_talk"
-
-    if key == "kids_stage_story":
-        if _match(hay, r"\b(puppenspieltage|puppenspiel|puppentheater|pettersson|figurentheater|ei der welt)\b"):
-            return "puppet_theater"
-        if _match(hay, r"\b(vorlese|geschichte|geschichten|m(ä|ae)rchen|b(ä|ae)ren|bären[- ]?geschichten|baeren[- ]?geschichten)\b"):
-            return "neutral_kids_stage"
-
-    if key == "city_festival_street":
-        if _match(hay, r"\b(verkaufsoffener sonntag|maiensonntag|lichtersonntag|sonntagsshopping)\b"):
-            return "shopping_sunday"
-        if _match(hay, r"\b(rosenberg|quartierfest|stadtteilfest)\b"):
-            return "district_festival"
-        if _match(hay, r"\b(weltkindertag|interkulturell|kinderfest)\b"):
-            return "children_intercultural_festival"
-        if _match(hay, r"\b(tag der offenen t(ü|ue)r|tourist[- ]?info|stadtb(ü|ue)cherei|archiv)\b"):
-            return "open_house_city_services"
-
-    if key == "open_air_festival":
-        if _match(hay, r"\b(aasee[- ]?festival|see[- ]?festival)\b"):
-            return "lake_festival"
-        if _match(hay, r"\b(marktplatz|markt platz|kulturtage)\b"):
-            return "market_square_open_air"
-
-    if key == "parade_festzug":
-        if _match(hay, r"\b(csd|pride)\b"):
-            return "csd_pride_parade"
-        if _match(hay, r"\b(blaskapelle|musikzug|spielmannszug|fanfarenzug|tambourcorps|marschkapelle)\b"):
-            return "marching_band_procession"
-        if _match(hay, r"\b(rosenmontagszug|rosenmontag|karneval|karnevalszug)\b"):
-            return "neutral_parade"
-
-    if key == "market_stalls":
-        if _match(hay, r"\b(stoffmarkt|stoff market|stoffe)\b"):
-            return "fabric_market"
-        if _match(hay, r"\b(flohmarkt|tr(ö|oe)delmarkt|hobbytr(ö|oe)del|interkultureller tr(ö|oe)del)\b"):
-            return "flea_market"
-        if _match(hay, r"\b(krammarkt|grensmarkt|grenzmarkt)\b"):
-            return "krammarkt_general"
-        if _match(hay, r"\b(martinsmarkt)\b"):
-            return "seasonal_martinsmarkt"
-
-    if key == "food_drink_festival":
-        if _match(hay, r"\b(weinfest|wijnfeest|wein|wine)\b"):
-            return "wine_festival"
-        if _match(hay, r"\b(street[- ]?food|city food festival|food festival)\b"):
-            return "street_food_festival"
-        if _match(hay, r"\b(tasting|verkostung|probe)\b"):
-            return "tasting_event"
-
-    if key == "family_play_outdoor":
-        if _match(hay, r"\b(playfountain|play fountain|wasserspa(ß|ss)|wasserspiel|wasserspielfl(ä|ae)che|wasserfont(ä|ae)ne|spritzbereich|spritzfl(ä|ae)che)\b"):
-            return "playfountain_water_splash"
-        if _match(hay, r"\b(kinderflohmarkt|kindertr(ö|oe)del)\b"):
-            return "children_flea_market"
-        if _match(hay, r"\b(ostern|osterei|eiersuche)\b"):
-            return "egg_hunt_family"
-
-    if key == "creative_making_workshop":
-        if _match(hay, r"\b(escape|locked)\b"):
-            return "escape_game"
-        if _match(hay, r"\b(pokemon|pok(é|e)mon|spieltag|game day)\b"):
-            return "game_day"
-        if _match(hay, r"\b(handwerk|craft|bastel|kreativ|n(ä|ae)hen|t(ö|oe)pfer|malen|zeichnen)\b"):
-            return "craft_workshop"
-
-    if key == "learning_science_workshop":
-        if _match(hay, r"\b(junge uni|summerschool|summer school|wissenschaft|forsch)\b"):
-            return "science_school"
-        if _match(hay, r"\b(ökosystem|oekosystem|umwelt|natur)\b"):
-            return "ecology_workshop"
-
-    if key == "active_route_tour":
-        if _match(hay, r"\b(segway(?:tour(?:en)?)?)\b"):
-            return "neutral_active_tour"
-        if _match(hay, r"\b(fahrradtour|radtour|rad[- ]?tour|bike tour)\b"):
-            return "guided_bike_tour"
-        if _match(hay, r"\b(wanderung|wandern|spaziergang|walk)\b"):
-            return "guided_walk"
-
-    if key == "cycling_event":
-        if _match(hay, r"\b(fahrradfr(ü|ue)hling|fahrradmesse|fahrradaktion)\b"):
-            return "bike_fair"
-        if _match(hay, r"\b(m(ü|ue)nsterlandgiro|radrennen|profistart|radsport)\b"):
-            return "cycling_race"
-
-    if key == "indoor_sport_competition":
-        if _match(hay, r"\b(fecht|fencing|degen|florett|s(ä|ae)bel)\b"):
-            return "fencing"
-        if _match(hay, r"\b(darts?|dartturnier|dart[- ]?trophy)\b"):
-            return "darts"
-        if _match(hay, r"\b(tischtennis|table tennis|pingpong|ping pong)\b"):
-            return "table_tennis"
-        if _match(hay, r"\b(badminton|federball)\b"):
-            return "badminton"
-        if _match(hay, r"\b(handball)\b"):
-            return "handball"
-        if _match(hay, r"\b(volleyball)\b"):
-            return "volleyball"
-
-    if key == "nature_learning_wildlife":
-        if _match(hay, r"\b(fledermaus|bat night|bats?)\b"):
-            return "wildlife_bats"
-        if _match(hay, r"\b(orchidee|orchideen|pflanzen|plant)\b"):
-            return "orchid_plant_tour"
-        if _match(hay, r"\b(anholter schweiz|tierpark|wildpark)\b"):
-            return "animal_park_family"
-        if _match(hay, r"\b(naturf(ü|ue)hrung|naturtour|sagensafari|wandert|wanderung|wasser|pr(ö|oe)bstingsee)\b"):
-            return "walking_nature_tour"
-
-    if key == "business_messe_info":
-        if _match(hay, r"\b(gesundheitsberufemesse|gesundheitsberufe|pflegeberufe)\b"):
-            return "health_career_fair"
-        if _match(hay, r"\b(gesundheitstage|gesundheitsprogramm|gesundheitsmesse|gesundheitsaktion|gesundheitsforum)\b"):
-            return "neutral_info_fair"
-        if _match(hay, r"\b(markterschließung|markterschliessung|unternehmermesse|business|unternehmen|gr(ü|ue)ndung|netzwerk)\b"):
-            return "business_fair"
-        if _match(hay, r"\b(vereinsmesse|verein|vereine)\b"):
-            return "association_fair"
-        if _match(hay, r"\b(infoabend|informationsabend|kindertagespflege|beratung)\b"):
-            return "info_evening"
-
-    return fallback_event_visual_motif(key)
-
-
 def load_event_visual_pool(path: Optional[Path] = None) -> Dict[str, Any]:
     pool_path = path or EVENT_VISUAL_POOL_PATH
     try:
@@ -454,27 +377,96 @@ def load_event_visual_pool(path: Optional[Path] = None) -> Dict[str, Any]:
     return payload
 
 
-def ready_motifs_for_key(pool_payload: Mapping[str, Any], visual_key: object) -> Dict[str, int]:
-    key = normalize_event_visual_key(visual_key)
-    pools = pool_payload.get("pools", {}) if isinstance(pool_payload, Mapping) else {}
-    pool = pools.get(key, {}) if isinstance(pools, Mapping) else {}
-    images = pool.get("images", []) if isinstance(pool, Mapping) else []
-    counts: Dict[str, int] = {}
-    for image in images if isinstance(images, list) else []:
-        if not isinstance(image, Mapping):
-            continue
-        if str(image.get("status") or "").strip() != "ready":
-            continue
-        motif = normalize_event_visual_motif(image.get("visual_motif", ""), key)
-        if motif:
-            counts[motif] = counts.get(motif, 0) + 1
-    return counts
+class EventVisualPoolIndex:
+    """Pre-indexed event visual pool: ready images per pool key and (visual_key, motif) ready counts."""
+
+    def __init__(self, payload: Mapping[str, Any]) -> None:
+        self.payload = payload
+        self.ready_counts: Dict[Tuple[str, str], int] = {}
+        self._ready_images: Dict[str, Tuple[Mapping[str, Any], ...]] = {}
+        self._ready_motifs: Dict[str, Dict[str, int]] = {}
+        pools = payload.get("pools", {}) if isinstance(payload, Mapping) else {}
+        for key, pool in pools.items() if isinstance(pools, Mapping) else ():
+            images = pool.get("images", []) if isinstance(pool, Mapping) else []
+            ready = tuple(
+                image
+                for image in (images if isinstance(images, list) else [])
+                if isinstance(image, Mapping) and str(image.get("status") or "").strip() == "ready"
+            )
+            counts: Dict[str, int] = {}
+            for image in ready:
+                motif = normalize_event_visual_motif(image.get("visual_motif", ""), key)
+                if motif:
+                    counts[motif] = counts.get(motif, 0) + 1
+                    self.ready_counts[(key, motif)] = counts[motif]
+            self._ready_images[key] = ready
+            self._ready_motifs[key] = counts
+
+    @property
+    def visual_keys(self) -> Tuple[str, ...]:
+        return tuple(self._ready_images)
+
+    def ready_images(self, visual_key: object) -> Tuple[Mapping[str, Any], ...]:
+        return self._ready_images.get(normalize_event_visual_key(visual_key), ())
+
+    def ready_motifs(self, visual_key: object) -> Dict[str, int]:
+        return dict(self._ready_motifs.get(normalize_event_visual_key(visual_key), {}))
+
+    def ready_count(self, visual_key: str, visual_motif: str) -> int:
+        return self.ready_counts.get((visual_key, visual_motif), 0)
+
+
+_POOL_INDEX_CACHE: Dict[Path, Tuple[Tuple[int, int], EventVisualPoolIndex]] = {}
+_PAYLOAD_INDEX_CACHE: List[Tuple[Mapping[str, Any], EventVisualPoolIndex]] = []
+
+
+def invalidate_event_visual_pool_index() -> None:
+    """Drop the cached payload index, e.g. after editing a pool payload in place."""
+    _PAYLOAD_INDEX_CACHE.clear()
+
+
+def load_event_visual_pool_index(path: Optional[Path] = None) -> EventVisualPoolIndex:
+    """Return the process-wide pool index, re-read only when the pool file changes."""
+    pool_path = Path(path or EVENT_VISUAL_POOL_PATH).resolve()
+    try:
+        stat = pool_path.stat()
+    except FileNotFoundError:
+        return EventVisualPoolIndex({"pools": {}})
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _POOL_INDEX_CACHE.get(pool_path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    index = EventVisualPoolIndex(load_event_visual_pool(pool_path))
+    _POOL_INDEX_CACHE[pool_path] = (stamp, index)
+    return index
+
+
+def event_visual_pool_index(pool: EventVisualPoolIndex | Mapping[str, Any] | None = None) -> EventVisualPoolIndex:
+    """Coerce a pool payload to its index; the last payload object passed in is indexed only once.
+
+    The slot is keyed on object identity only. Batch callers should build one
+    EventVisualPoolIndex (or VisualClassifier) per run and pass that in; code
+    that edits a payload in place calls invalidate_event_visual_pool_index().
+    """
+    if isinstance(pool, EventVisualPoolIndex):
+        return pool
+    if pool is None:
+        return load_event_visual_pool_index()
+    if _PAYLOAD_INDEX_CACHE and _PAYLOAD_INDEX_CACHE[0][0] is pool:
+        return _PAYLOAD_INDEX_CACHE[0][1]
+    index = EventVisualPoolIndex(pool)
+    _PAYLOAD_INDEX_CACHE[:] = [(pool, index)]
+    return index
+
+
+def ready_motifs_for_key(pool_payload: EventVisualPoolIndex | Mapping[str, Any], visual_key: object) -> Dict[str, int]:
+    return event_visual_pool_index(pool_payload).ready_motifs(visual_key)
 
 
 def resolve_event_visual_asset_status(
     visual_key: object,
     visual_motif: object,
-    pool_payload: Mapping[str, Any],
+    pool_payload: EventVisualPoolIndex | Mapping[str, Any],
 ) -> str:
     key = normalize_event_visual_key(visual_key)
     motif = normalize_event_visual_motif(visual_motif, key)
@@ -485,13 +477,94 @@ def resolve_event_visual_asset_status(
     if role == "review":
         return "review"
 
-    ready_counts = ready_motifs_for_key(pool_payload, key)
-    if ready_counts.get(motif, 0) > 0:
+    if event_visual_pool_index(pool_payload).ready_count(key, motif) > 0:
         return "ok"
 
     return "needs_asset"
 
 
+def _infer_motif_from_haystack(key: str, haystack: str, folded: Tuple[str, frozenset]) -> str:
+    rules = COMPILED_EVENT_VISUAL_MOTIF_RULES.get(key)
+    if haystack and rules is not None:
+        motif = rules.first_match_folded(*folded)
+        if motif:
+            return motif
+    return fallback_event_visual_motif(key)
+
+
+@dataclass(frozen=True)
+class VisualClassification:
+    visual_key: str
+    visual_motif: str
+    visual_asset_status: str
+    inferred_visual_key: str
+
+    def as_fit(self) -> Dict[str, str]:
+        return {
+            "visual_key": self.visual_key,
+            "visual_motif": self.visual_motif,
+            "visual_asset_status": self.visual_asset_status,
+        }
+
+
+class VisualClassifier:
+    """Derive visual_key, visual_motif and asset status for events in one pass.
+
+    The four text fields are normalized and case-folded once; the key rules and
+    the per-key motif rules of EVENT_VISUAL_MOTIF_PATTERNS then run on that same
+    haystack. Asset status is an O(1) lookup in the EventVisualPoolIndex; without
+    a pool_payload the mtime-cached index of event_visual_pool.json is used.
+    """
+
+    def __init__(self, pool_payload: EventVisualPoolIndex | Mapping[str, Any] | None = None) -> None:
+        self._pool_payload = pool_payload
+        self._pool_index: Optional[EventVisualPoolIndex] = None
+
+    @property
+    def pool_index(self) -> EventVisualPoolIndex:
+        if self._pool_index is None:
+            self._pool_index = event_visual_pool_index(self._pool_payload)
+        return self._pool_index
+
+    def asset_status(self, visual_key: object, visual_motif: object) -> str:
+        return resolve_event_visual_asset_status(visual_key, visual_motif, self.pool_index)
+
+    def classify(
+        self,
+        title: object = "",
+        description: object = "",
+        category: object = "",
+        location: object = "",
+        visual_key: object = "",
+        visual_motif: object = "",
+        *,
+        with_asset_status: bool = True,
+    ) -> VisualClassification:
+        haystack = event_visual_haystack(title, description, category, location)
+        folded = fold_visual_haystack(haystack)
+        inferred = infer_event_visual_key_from_haystack(haystack, _norm(category), folded)
+        manual = normalize_event_visual_key(visual_key)
+        key = manual or inferred
+        if manual and should_prefer_inferred_event_visual_key(manual, inferred, visual_motif):
+            key = inferred
+        motif = normalize_event_visual_motif(visual_motif, key) or _infer_motif_from_haystack(key, haystack, folded)
+        status = self.asset_status(key, motif) if with_asset_status else ""
+        return VisualClassification(key, motif, status, inferred)
+
+
+def infer_event_visual_motif(
+    title: object = "",
+    description: object = "",
+    category: object = "",
+    location: object = "",
+    visual_key: object = "",
+) -> str:
+    haystack = event_visual_haystack(title, description, category, location)
+    folded = fold_visual_haystack(haystack)
+    key = normalize_event_visual_key(visual_key) or infer_event_visual_key_from_haystack(haystack, _norm(category), folded)
+    return _infer_motif_from_haystack(key, haystack, folded)
+
+
 def infer_event_visual_fit(
     title: object = "",
     description: object = "",
@@ -499,22 +572,10 @@ def infer_event_visual_fit(
     location: object = "",
     visual_key: object = "",
     visual_motif: object = "",
-    pool_payload: Optional[Mapping[str, Any]] = None,
+    pool_payload: EventVisualPoolIndex | Mapping[str, Any] | None = None,
 ) -> Dict[str, str]:
-    key = resolve_event_visual_key(title, description, category, location, visual_key, visual_motif)
-    motif = normalize_event_visual_motif(visual_motif, key) or infer_event_visual_motif(
-        title=title,
-        description=description,
-        category=category,
-        location=location,
-        visual_key=key,
-    )
-    pool = pool_payload if pool_payload is not None else load_event_visual_pool()
-    return {
-        "visual_key": key,
-        "visual_motif": motif,
-        "visual_asset_status": resolve_event_visual_asset_status(key, motif, pool),
-    }
+    classifier = VisualClassifier(pool_payload)
+    return classifier.classify(title, description, category, location, visual_key, visual_motif).as_fit()
 
 
 # === END FILE: scripts/event_visual_motifs.py ===
@@ -23,13 +23,20 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from content_ops_decisions import target_effect
+from growth_inventory_index import INVENTORY_TABS, InventoryIndex, describe_rows
+from growth_metrics_cache import aggregate_ga4, aggregate_gsc, cached_daily_rows, fetch_ga4_day, fetch_gsc_day, scope_dir
+from sheets_client import SheetsClient
 
 BACKLOG_TAB = os.environ.get("GROWTH_BACKLOG_TAB", "Growth_Backlog").strip() or "Growth_Backlog"
 REPORT_TAB = os.environ.get("GROWTH_REPORT_TAB", "Growth_Intelligence_Report").strip() or "Growth_Intelligence_Report"
+HISTORY_TAB = "Inbox_Archive"
 DAYS = int(os.environ.get("GROWTH_LOOKBACK_DAYS", "30") or "30")
 MIN_IMPRESSIONS = int(os.environ.get("GROWTH_MIN_IMPRESSIONS", "40") or "40")
 MIN_SESSIONS = int(os.environ.get("GROWTH_MIN_SESSIONS", "15") or "15")
 ROOT = Path(__file__).resolve().parents[1]
+# "index": Token-Lookup im Inventar-Index; "substring": alter Teilstring-Test zum Vergleich.
+COVERAGE_MODE = os.environ.get("GROWTH_COVERAGE_MODE", "index").strip().lower() or "index"
+API_CACHE_DIR = Path(os.environ.get("GROWTH_API_CACHE_DIR", "").strip() or ROOT / ".cache" / "growth-api")
 
 BACKLOG_HEADER = [
     "id", "cluster_key", "status", "priority", "type", "title", "short_reason",
@@ -247,18 +254,13 @@ def ensure_sheet(sheets, spreadsheet_id: str, title: str, header: List[str]) ->
     ).execute()
 
 
-def values_get(sheets, spreadsheet_id: str, tab: str, rng: str = "A:ZZ") -> List[List[str]]:
-    try:
-        res = sheets.spreadsheets().values().get(spreadsheetId=spreadsheet_id, range=f"{tab}!{rng}").execute()
-        return res.get("values", []) or []
-    except HttpError as exc:
-        if exc.resp.status == 400:
-            return []
-        raise
+def values_get(client: SheetsClient, tab: str) -> List[List[str]]:
+    """Tab values; a missing tab reads as empty. Served from the run's batchGet when prefetched."""
+    return client.read_tab(tab, optional=[tab])
 
 
-def read_records(sheets, spreadsheet_id: str, tab: str) -> List[Dict[str, str]]:
-    rows = values_get(sheets, spreadsheet_id, tab)
+def read_records(client: SheetsClient, tab: str) -> List[Dict[str, str]]:
+    rows = values_get(client, tab)
     if not rows:
         return []
     header = [str(x).strip() for x in rows[0]]
@@ -353,47 +355,28 @@ def append_records(sheets, spreadsheet_id: str, tab: str, header: List[str], rec
     ).execute()
 
 
-def inventory_text(sheets, spreadsheet_id: str) -> str:
-    chunks: List[str] = []
-    for tab in ["Events", "Activities", "Aktivitaeten", "Locations"]:
-        rows = values_get(sheets, spreadsheet_id, tab)
-        for row in rows[:1000]:
-            chunks.append(" ".join(str(x) for x in row[:12]))
-    return "\n".join(chunks).lower()
+def inventory_index(client: SheetsClient) -> InventoryIndex:
+    return InventoryIndex.from_tabs({tab: values_get(client, tab) for tab in INVENTORY_TABS})
 
 
-def seems_covered(topic: str, inventory: str) -> bool:
+def seems_covered(topic: str, inventory: InventoryIndex) -> Tuple[bool, List[str]]:
+    """(covered, covering inventory rows); the substring mode reports no rows."""
     can = canonical_topic(topic)
-    words = [w for w in can.split() if len(w) >= 4]
-    if not words:
-        return False
-    return any(w in inventory for w in words)
+    if COVERAGE_MODE == "substring":
+        return inventory.covered_by_substring(can), []
+    rows = inventory.covering_rows(can)
+    return bool(rows), describe_rows(rows)
 
 
 def fetch_gsc(creds, site_url: str, start: str, end: str) -> List[Dict[str, Any]]:
     if not site_url:
         return []
     webmasters = service("searchconsole", "v1", creds)
-    body = {
-        "startDate": start,
-        "endDate": end,
-        "dimensions": ["query", "page"],
-        "rowLimit": 25000,
-        "startRow": 0,
-    }
-    res = webmasters.searchanalytics().query(siteUrl=site_url, body=body).execute()
-    rows = []
-    for r in res.get("rows", []) or []:
-        keys = r.get("keys", [])
-        rows.append({
-            "query": keys[0] if len(keys) > 0 else "",
-            "page": keys[1] if len(keys) > 1 else "",
-            "clicks": float(r.get("clicks", 0) or 0),
-            "impressions": float(r.get("impressions", 0) or 0),
-            "ctr": float(r.get("ctr", 0) or 0),
-            "position": float(r.get("position", 0) or 0),
-        })
-    return rows
+    daily, stats = cached_daily_rows(
+        scope_dir(API_CACHE_DIR, "gsc", site_url), start, end, lambda day: fetch_gsc_day(webmasters, site_url, day)
+    )
+    log(f"GSC: {stats['fetched_days']} Tage abgefragt, {stats['cached_days']} aus Cache, {len(daily)} Tageszeilen.")
+    return aggregate_gsc(daily)
 
 
 def fetch_ga4(creds, property_id: str, start: str, end: str) -> Tuple[List[Dict[str, Any]], str]:
@@ -401,14 +384,10 @@ def fetch_ga4(creds, property_id: str, start: str, end: str) -> Tuple[List[Dict[
         return [], "GA4_PROPERTY_ID nicht gesetzt; GA4 übersprungen."
     analytics = service("analyticsdata", "v1beta", creds)
     name = f"properties/{property_id}"
-    body = {
-        "dateRanges": [{"startDate": start, "endDate": end}],
-        "dimensions": [{"name": "landingPagePlusQueryString"}, {"name": "sessionDefaultChannelGroup"}],
-        "metrics": [{"name": "sessions"}, {"name": "engagementRate"}, {"name": "averageSessionDuration"}],
-        "limit": 10000,
-    }
     try:
-        res = analytics.properties().runReport(property=name, body=body).execute()
+        daily, stats = cached_daily_rows(
+            scope_dir(API_CACHE_DIR, "ga4", name), start, end, lambda day: fetch_ga4_day(analytics, name, day)
+        )
     except HttpError as exc:
         raw = ""
         try:
@@ -425,20 +404,10 @@ def fetch_ga4(creds, property_id: str, start: str, end: str) -> Tuple[List[Dict[
         return [], f"GA4 Diagnose: API-Fehler HTTP {exc.resp.status}: {raw[:500]}"
     except Exception as exc:
         return [], f"GA4 Diagnose: unerwarteter Fehler: {type(exc).__name__}: {exc}"
-    rows = []
-    for r in res.get("rows", []) or []:
-        dims = [d.get("value", "") for d in r.get("dimensionValues", [])]
-        mets = [m.get("value", "0") for m in r.get("metricValues", [])]
-        rows.append({
-            "landing_page": dims[0] if len(dims) > 0 else "",
-            "channel": dims[1] if len(dims) > 1 else "",
-            "sessions": float(mets[0] if len(mets) > 0 else 0),
-            "engagement_rate": float(mets[1] if len(mets) > 1 else 0),
-            "avg_duration": float(mets[2] if len(mets) > 2 else 0),
-        })
+    rows = aggregate_ga4(daily)
     if not rows:
         return rows, "GA4 Diagnose: API erreichbar und berechtigt, aber keine Zeilen im Zeitraum/Abfrageschema geliefert. Zeitraum, Traffic oder Datenerhebung prüfen."
-    return rows, f"GA4 Diagnose: API erreichbar; {len(rows)} Zeilen gelesen."
+    return rows, f"GA4 Diagnose: API erreichbar; {len(rows)} Zeilen gelesen ({stats['fetched_days']} Tage abgefragt, {stats['cached_days']} aus Cache)."
 
 
 def acquisition_note(topic: str) -> str:
@@ -450,7 +419,7 @@ def acquisition_note(topic: str) -> str:
     return "Akquise nur als Nebenbewertung: zuerst Content-/Nutzermehrwert prüfen."
 
 
-def build_candidates(gsc_rows: List[Dict[str, Any]], ga4_rows: List[Dict[str, Any]], inventory: str, start: str, end: str) -> List[Candidate]:
+def build_candidates(gsc_rows: List[Dict[str, Any]], ga4_rows: List[Dict[str, Any]], inventory: InventoryIndex, start: str, end: str) -> List[Candidate]:
     candidates: Dict[str, Candidate] = {}
     grouped: Dict[str, Dict[str, Any]] = {}
     for r in gsc_rows:
@@ -477,7 +446,7 @@ def build_candidates(gsc_rows: List[Dict[str, Any]], ga4_rows: List[Dict[str, An
         clicks = g["clicks"]
         ctr = clicks / impressions if impressions else 0.0
         pos = sum(g["positions"]) / max(1, len(g["positions"]))
-        covered = seems_covered(" ".join(g["raw_topics"].keys()) or topic, inventory)
+        covered, covered_by = seems_covered(" ".join(g["raw_topics"].keys()) or topic, inventory)
         top_queries = sorted(set(g["queries"]), key=lambda x: (-g["queries"].count(x), x))[:8]
         title, action, benefit, effort = recommendation_for_intent(topic, impressions, clicks, ctr, covered)
         confidence = 0.9 if topic in {"today-events", "weekend-events", "bad-weather-indoor", "family-kids", "swimming"} else 0.7
@@ -504,7 +473,7 @@ def build_candidates(gsc_rows: List[Dict[str, Any]], ga4_rows: List[Dict[str, An
             expected_benefit=benefit,
             acquisition_note=acquisition_note(" ".join(top_queries)),
             source="growth-intelligence:gsc-intent",
-            signals={"period_start": start, "period_end": end, "intent": intent, "impressions": impressions, "clicks": clicks, "ctr": ctr, "avg_position": pos, "queries": top_queries, "covered": covered, **score},
+            signals={"period_start": start, "period_end": end, "intent": intent, "impressions": impressions, "clicks": clicks, "ctr": ctr, "avg_position": pos, "queries": top_queries, "covered": covered, "covered_by": covered_by, **score},
         )
 
     for r in ga4_rows:
@@ -708,10 +677,10 @@ def build_internal_metric_candidates(rows: list[dict[str, Any]], start: str, end
     return list(candidates.values())
 
 
-def build_sheet_history_candidates(sheets, spreadsheet_id: str, start: str, end: str) -> list[Candidate]:
+def build_sheet_history_candidates(client: SheetsClient, start: str, end: str) -> list[Candidate]:
     """Use existing review/audit history as coarse signals, if tabs exist."""
     candidates: list[Candidate] = []
-    archive = read_records(sheets, spreadsheet_id, "Inbox_Archive")
+    archive = read_records(client, HISTORY_TAB)
     rejected_notes: Counter[str] = Counter()
     for r in archive:
         status = " ".join(str(r.get(k, "")).lower() for k in ["status", "decision", "review_status"])
@@ -751,12 +720,16 @@ def main() -> None:
     sheets = service("sheets", "v4", creds)
     ensure_sheet(sheets, sheet_id, BACKLOG_TAB, BACKLOG_HEADER)
     ensure_sheet(sheets, sheet_id, REPORT_TAB, REPORT_HEADER)
+    # Alle gelesenen Tabs in einem batchGet; frisch, weil dieser Lauf den Backlog fortschreibt.
+    client = SheetsClient(sheets, sheet_id)
+    read_tabs = [BACKLOG_TAB, *INVENTORY_TABS, HISTORY_TAB]
+    client.read_tabs(read_tabs, optional=read_tabs, max_age=0)
 
     end_date = dt.date.today() - dt.timedelta(days=1)
     start_date = end_date - dt.timedelta(days=DAYS - 1)
     start, end = start_date.isoformat(), end_date.isoformat()
 
-    existing = read_records(sheets, sheet_id, BACKLOG_TAB)
+    existing = read_records(client, BACKLOG_TAB)
     growth_existing_keys, growth_feedback_keys, growth_feedback = read_growth_feedback(existing)
     known_cluster_keys = set(growth_existing_keys)
     known_cluster_keys.update(growth_feedback_keys)
@@ -778,7 +751,7 @@ def main() -> None:
             known_cluster_keys.add(cluster_key("SEO-/Content-Arbeitspaket", intent["key"]))
             known_cluster_keys.add(cluster_key("SEO-Optimierung", intent["key"]))
             known_cluster_keys.add(cluster_key("Content-Lücke", intent["key"]))
-    inv = inventory_text(sheets, sheet_id)
+    inv = inventory_index(client)
 
     gsc_rows: List[Dict[str, Any]] = []
     ga4_rows: List[Dict[str, Any]] = []
@@ -809,7 +782,7 @@ def main() -> None:
         messages.append("Interne Nutzungsdaten Diagnose: value_metric_daily lieferte 0 Zeilen oder DB-Zugriff/Tabellenstruktur ist nicht verfügbar.")
     candidates = build_candidates(gsc_rows, ga4_rows, inv, start, end)
     candidates.extend(build_internal_metric_candidates(value_rows, start, end))
-    candidates.extend(build_sheet_history_candidates(sheets, sheet_id, start, end))
+    candidates.extend(build_sheet_history_candidates(client, start, end))
     candidates.extend(load_repo_visual_signals())
     created: List[Dict[str, Any]] = []
     suppressed = 0
@@ -841,6 +814,7 @@ def main() -> None:
         known_cluster_keys.add(c.cluster_key)
         time.sleep(0.01)
 
+    client.invalidate()
     append_records(sheets, sheet_id, BACKLOG_TAB, BACKLOG_HEADER, created)
     report_row = {
         "generated_at": ts,
@@ -866,6 +840,7 @@ def main() -> None:
     GROWTH_SUMMARY_PATH.parent.mkdir(parents=True, exist_ok=True)
     GROWTH_SUMMARY_PATH.write_text(json.dumps(growth_summary, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
     # === END BLOCK: GROWTH_INTELLIGENCE_CONTENT_OPS_SUMMARY_V1 ===
+    log(client.stats.summary())
     log(f"Growth Intelligence: created={len(created)} suppressed={suppressed} gsc_rows={len(gsc_rows)} ga4_rows={len(ga4_rows)} value_rows={len(value_rows)} status={status}")
     if messages:
         log("Growth Intelligence diagnostics:")
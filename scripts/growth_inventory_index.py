@@ -0,0 +1,78 @@
+"""Token index over the content inventory tabs for growth coverage checks.
+
+``growth-intelligence-backlog.py`` asks for every search topic whether the
+site already covers it. The index is built once per run from the inventory
+tabs: every cell is folded with ``normalize_identity_text`` (lowercase, umlauts
+to ae/oe/ue/ss, accents stripped) and split into tokens, each token pointing at
+the sheet rows it occurs in. A coverage check is then a handful of dict lookups
+and can name the rows that cover a topic.
+
+The previous behaviour - a substring test against one big lowercase string -
+stays available as ``covered_by_substring`` for comparison; it also matches
+inside longer words ("bad" in "badminton").
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Sequence, Set
+
+from event_identity import normalize_identity_text
+
+INVENTORY_TABS = ("Events", "Activities", "Aktivitaeten", "Locations")
+INVENTORY_MAX_ROWS = 1000
+INVENTORY_MAX_COLUMNS = 12
+MIN_TOPIC_WORD = 4
+
+
+@dataclass(frozen=True)
+class InventoryRow:
+    tab: str
+    row: int  # 1-based sheet row number
+    label: str
+
+
+@dataclass
+class InventoryIndex:
+    rows: List[InventoryRow] = field(default_factory=list)
+    tokens: Dict[str, Set[int]] = field(default_factory=dict)
+    text: str = ""  # legacy lowercase blob for the substring mode
+
+    @classmethod
+    def from_tabs(cls, tabs: Mapping[str, Sequence[Sequence[object]]]) -> "InventoryIndex":
+        """Index raw sheet values per tab; the first row of a tab is its header and is not indexed."""
+        index = cls()
+        chunks: List[str] = []
+        for tab, values in tabs.items():
+            for position, row in enumerate(values[:INVENTORY_MAX_ROWS]):
+                cells = [str(cell) for cell in row[:INVENTORY_MAX_COLUMNS]]
+                chunks.append(" ".join(cells))
+                if position == 0:
+                    continue
+                words = set(normalize_identity_text(" ".join(cells)).split())
+                if not words:
+                    continue
+                label = next((cell.strip() for cell in cells if cell.strip()), "")
+                row_id = len(index.rows)
+                index.rows.append(InventoryRow(tab=tab, row=position + 1, label=label))
+                for word in words:
+                    index.tokens.setdefault(word, set()).add(row_id)
+        index.text = "\n".join(chunks).lower()
+        return index
+
+    def covering_rows(self, topic: str) -> List[InventoryRow]:
+        """Inventory rows containing any topic word of at least MIN_TOPIC_WORD characters as a whole token."""
+        row_ids: Set[int] = set()
+        for word in topic_words(topic):
+            row_ids.update(self.tokens.get(word, ()))
+        return [self.rows[row_id] for row_id in sorted(row_ids)]
+
+    def covered_by_substring(self, topic: str) -> bool:
+        return any(word in self.text for word in topic.split() if len(word) >= MIN_TOPIC_WORD)
+
+
+def topic_words(topic: str) -> List[str]:
+    return [word for word in normalize_identity_text(topic).split() if len(word) >= MIN_TOPIC_WORD]
+
+
+def describe_rows(rows: Iterable[InventoryRow], limit: int = 5) -> List[str]:
+    return [f"{row.tab}!{row.row}: {row.label}" for row in list(rows)[:limit]]
@@ -0,0 +1,178 @@
+"""Paginated, per-day cached Search Console and GA4 report rows.
+
+The growth backlog looks at a rolling window (default 30 days). Instead of
+pulling the whole window with a single capped request on every run, each day is
+fetched on its own, page by page, and written to ``<cache>/<source>/<scope>/
+YYYY-MM-DD.jsonl``. Later runs only fetch days that are not cached yet plus the
+last ``SETTLE_DAYS`` days, which both APIs may still revise; those are never
+written to the cache. The window is then aggregated locally into the same row
+shape the single-request fetch produced.
+
+The functions only need the ``execute()`` chains of the Google API clients, so
+tests can hand in a local fake that returns fixture pages.
+"""
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+GSC_PAGE_SIZE = 25000
+GA4_PAGE_SIZE = 10000
+SETTLE_DAYS = 3
+
+DayFetcher = Callable[[str], List[Dict[str, Any]]]
+
+
+def day_range(start: str, end: str) -> List[str]:
+    first, last = dt.date.fromisoformat(start), dt.date.fromisoformat(end)
+    return [(first + dt.timedelta(days=offset)).isoformat() for offset in range((last - first).days + 1)]
+
+
+def scope_dir(cache_dir: Path, source: str, scope: str) -> Path:
+    """One folder per API source and site/property, so a changed secret never reuses foreign rows."""
+    return cache_dir / source / hashlib.sha256(scope.encode("utf-8")).hexdigest()[:12]
+
+
+def read_day(path: Path) -> List[Dict[str, Any]] | None:
+    try:
+        with path.open(encoding="utf-8") as handle:
+            return [json.loads(line) for line in handle if line.strip()]
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def write_day(path: Path, rows: List[Dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f"{path.name}.tmp")
+    with temp.open("w", encoding="utf-8") as handle:
+        for row in rows:
+            handle.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n")
+    temp.replace(path)
+
+
+def cached_daily_rows(
+    directory: Path,
+    start: str,
+    end: str,
+    fetch_day: DayFetcher,
+    today: dt.date | None = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Rows of all days in [start, end]; cached days are read, missing or unsettled days fetched."""
+    settled_until = (today or dt.date.today()) - dt.timedelta(days=SETTLE_DAYS)
+    rows: List[Dict[str, Any]] = []
+    stats = {"days": 0, "cached_days": 0, "fetched_days": 0}
+    for day in day_range(start, end):
+        stats["days"] += 1
+        path = directory / f"{day}.jsonl"
+        settled = dt.date.fromisoformat(day) <= settled_until
+        day_rows = read_day(path) if settled else None
+        if day_rows is None:
+            day_rows = fetch_day(day)
+            stats["fetched_days"] += 1
+            if settled:
+                write_day(path, day_rows)
+        else:
+            stats["cached_days"] += 1
+        rows.extend(day_rows)
+    # Days that dropped out of the window are not needed any more.
+    if directory.is_dir():
+        for path in directory.glob("*.jsonl"):
+            if path.stem < start:
+                path.unlink()
+    return rows, stats
+
+
+def fetch_gsc_day(webmasters, site_url: str, day: str, page_size: int = GSC_PAGE_SIZE) -> List[Dict[str, Any]]:
+    """All query/page rows of one day; follows startRow until a short page."""
+    rows: List[Dict[str, Any]] = []
+    while True:
+        body = {
+            "startDate": day,
+            "endDate": day,
+            "dimensions": ["query", "page"],
+            "rowLimit": page_size,
+            "startRow": len(rows),
+        }
+        page = webmasters.searchanalytics().query(siteUrl=site_url, body=body).execute().get("rows", []) or []
+        for r in page:
+            keys = r.get("keys", [])
+            rows.append({
+                "query": keys[0] if len(keys) > 0 else "",
+                "page": keys[1] if len(keys) > 1 else "",
+                "clicks": float(r.get("clicks", 0) or 0),
+                "impressions": float(r.get("impressions", 0) or 0),
+                "position": float(r.get("position", 0) or 0),
+            })
+        if len(page) < page_size:
+            return rows
+
+
+def fetch_ga4_day(analytics, property_name: str, day: str, page_size: int = GA4_PAGE_SIZE) -> List[Dict[str, Any]]:
+    """All landing page/channel rows of one day; follows offset up to the reported rowCount."""
+    rows: List[Dict[str, Any]] = []
+    while True:
+        body = {
+            "dateRanges": [{"startDate": day, "endDate": day}],
+            "dimensions": [{"name": "landingPagePlusQueryString"}, {"name": "sessionDefaultChannelGroup"}],
+            "metrics": [{"name": "sessions"}, {"name": "engagementRate"}, {"name": "averageSessionDuration"}],
+            "limit": page_size,
+            "offset": len(rows),
+        }
+        res = analytics.properties().runReport(property=property_name, body=body).execute()
+        page = res.get("rows", []) or []
+        for r in page:
+            dims = [d.get("value", "") for d in r.get("dimensionValues", [])]
+            mets = [m.get("value", "0") for m in r.get("metricValues", [])]
+            rows.append({
+                "landing_page": dims[0] if len(dims) > 0 else "",
+                "channel": dims[1] if len(dims) > 1 else "",
+                "sessions": float(mets[0] if len(mets) > 0 else 0),
+                "engagement_rate": float(mets[1] if len(mets) > 1 else 0),
+                "avg_duration": float(mets[2] if len(mets) > 2 else 0),
+            })
+        if not page or len(rows) >= int(res.get("rowCount", 0) or 0):
+            return rows
+
+
+def aggregate_gsc(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Sum clicks/impressions per (query, page); position is impression-weighted like in GSC."""
+    grouped: Dict[Tuple[str, str], Dict[str, float]] = {}
+    for r in rows:
+        g = grouped.setdefault((r["query"], r["page"]), {"clicks": 0.0, "impressions": 0.0, "weighted_position": 0.0})
+        g["clicks"] += r["clicks"]
+        g["impressions"] += r["impressions"]
+        g["weighted_position"] += r["position"] * r["impressions"]
+    return [
+        {
+            "query": query,
+            "page": page,
+            "clicks": g["clicks"],
+            "impressions": g["impressions"],
+            "ctr": g["clicks"] / g["impressions"] if g["impressions"] else 0.0,
+            "position": g["weighted_position"] / g["impressions"] if g["impressions"] else 0.0,
+        }
+        for (query, page), g in grouped.items()
+    ]
+
+
+def aggregate_ga4(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Sum sessions per (landing page, channel); rates and durations are session-weighted."""
+    grouped: Dict[Tuple[str, str], Dict[str, float]] = {}
+    for r in rows:
+        g = grouped.setdefault((r["landing_page"], r["channel"]), {"sessions": 0.0, "engaged": 0.0, "duration": 0.0})
+        g["sessions"] += r["sessions"]
+        g["engaged"] += r["engagement_rate"] * r["sessions"]
+        g["duration"] += r["avg_duration"] * r["sessions"]
+    return [
+        {
+            "landing_page": landing_page,
+            "channel": channel,
+            "sessions": g["sessions"],
+            "engagement_rate": g["engaged"] / g["sessions"] if g["sessions"] else 0.0,
+            "avg_duration": g["duration"] / g["sessions"] if g["sessions"] else 0.0,
+        }
+        for (landing_page, channel), g in grouped.items()
+    ]
@@ -29,6 +29,8 @@ from typing import Dict, List, Tuple
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 
+from sheets_client import SheetsClient
+
 
 # === BEGIN BLOCK: INBOX_CLEANUP_TAB_ENV_V1 | Zweck: erlaubt getrennte Live-/Staging-Inbox-Tabs im selben Google Sheet; Umfang: ersetzt feste Tabnamen durch optionale ENV-Werte ===
 TAB_INBOX = os.environ.get("TAB_INBOX", "Inbox").strip() or "Inbox"
@@ -87,15 +89,6 @@ def get_sheet_service() -> object:
     return build("sheets", "v4", credentials=creds, cache_discovery=False)
 
 
-def read_tab(service: object, sheet_id: str, tab_name: str) -> List[List[str]]:
-    rng = f"{tab_name}!A:ZZ"
-    try:
-        res = service.spreadsheets().values().get(spreadsheetId=sheet_id, range=rng).execute()
-        return res.get("values", []) or []
-    except Exception as e:
-        fail(f"Tab '{tab_name}' konnte nicht gelesen werden. Existiert er? ({e})")
-
-
 def append_rows(service: object, sheet_id: str, tab_name: str, rows: List[List[str]]) -> None:
     body = {"values": rows}
     service.spreadsheets().values().append(
@@ -171,8 +164,15 @@ def main() -> None:
     service = get_sheet_service()
 
     info("Lese Inbox + Inbox_Archive …")
-    inbox_values = read_tab(service, spreadsheet_id, TAB_INBOX)
-    archive_values = read_tab(service, spreadsheet_id, TAB_ARCHIVE)
+    sheets = SheetsClient(service, spreadsheet_id)
+    try:
+        # Schreibender Lauf: immer frisch lesen, Snapshots nur fuer nachfolgende Leser auffrischen.
+        tabs = sheets.read_tabs([TAB_INBOX, TAB_ARCHIVE], max_age=0)
+    except Exception as e:
+        fail(f"Tabs '{TAB_INBOX}'/'{TAB_ARCHIVE}' konnten nicht gelesen werden. Existieren sie? ({e})")
+    inbox_values = tabs[TAB_INBOX]
+    archive_values = tabs[TAB_ARCHIVE]
+    info(sheets.stats.summary())
 
     inbox_header, inbox_rows = sheet_rows_to_dicts(inbox_values)
     archive_header, _ = sheet_rows_to_dicts(archive_values)
@@ -219,6 +219,7 @@ def main() -> None:
         return
 
     # 1) Archive append (Header ggf. zuerst)
+    sheets.invalidate()
     if archive_needs_header:
         info("Archive ist leer → schreibe Header.")
         append_rows(service, spreadsheet_id, TAB_ARCHIVE, [inbox_header])
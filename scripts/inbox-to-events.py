@@ -30,6 +30,7 @@ from googleapiclient.discovery import build
 from event_visual_keys import infer_event_visual_key, normalize_event_visual_key
 from event_visual_motifs import infer_event_visual_fit, normalize_event_visual_motif
 from event_description_quality import evaluate_event_description
+from sheets_client import SheetsClient
 
 
 # === BEGIN BLOCK: SHEET TAB CONFIG (ENV override, test-safe) ===
@@ -162,12 +163,6 @@ def normalize_event_category(raw: str) -> str:
     return mapping.get(s, "Sonstiges")
 
 
-def read_tab(service: object, sheet_id: str, tab_name: str) -> List[List[str]]:
-    rng = f"{tab_name}!A:ZZ"
-    res = service.spreadsheets().values().get(spreadsheetId=sheet_id, range=rng).execute()
-    return res.get("values", []) or []
-
-
 def append_rows(service: object, sheet_id: str, tab_name: str, rows: List[List[str]]) -> None:
     body = {"values": rows}
     service.spreadsheets().values().append(
@@ -279,8 +274,12 @@ def main() -> None:
     service = get_sheet_service()
 
     info("Lese Tabs aus Google Sheet …")
-    events_values = read_tab(service, sheet_id, TAB_EVENTS)
-    inbox_values = read_tab(service, sheet_id, TAB_INBOX)
+    sheets = SheetsClient(service, sheet_id)
+    # Schreibender Lauf: immer frisch lesen, Snapshots nur fuer nachfolgende Leser auffrischen.
+    tabs = sheets.read_tabs([TAB_EVENTS, TAB_INBOX], max_age=0)
+    events_values = tabs[TAB_EVENTS]
+    inbox_values = tabs[TAB_INBOX]
+    info(sheets.stats.summary())
 
     events_header, events_rows = sheet_rows_to_dicts(events_values)
     inbox_header, inbox_rows = sheet_rows_to_dicts(inbox_values)
@@ -453,6 +452,7 @@ def main() -> None:
         return
 
     # Append to Events first
+    sheets.invalidate()
     append_rows(service, sheet_id, TAB_EVENTS, import_rows)
     info("✅ Events: neue Zeilen appended.")
 
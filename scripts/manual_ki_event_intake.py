@@ -11,9 +11,16 @@ from typing import Any, Iterable
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 from event_description_quality import evaluate_event_description
-from event_identity import apply_event_identity_match, event_rows_from_sheet_values, find_best_event_match
+from event_identity import (
+    EventIdentityIndex,
+    EventIdentityNormalizer,
+    apply_event_identity_match,
+    event_rows_from_sheet_values,
+    load_event_identity_contract,
+)
 from event_visual_keys import infer_event_visual_key, normalize_event_visual_key
-from event_visual_motifs import infer_event_visual_fit
+from event_visual_motifs import EventVisualPoolIndex, infer_event_visual_fit
+from sheets_client import SheetsClient
 
 ROOT = Path(__file__).resolve().parents[1]
 MANUAL_JSON_PATH = ROOT / "data" / "inbox_manual.json"
@@ -139,7 +146,7 @@ def sheet_rows(values: Iterable[Iterable[Any]]) -> tuple[list[str], list[dict[st
     return header, result
 
 
-def normalized_candidate(item: dict[str, Any], created_at: str, pool_data: dict[str, Any]) -> dict[str, str]:
+def normalized_candidate(item: dict[str, Any], created_at: str, pool_index: EventVisualPoolIndex) -> dict[str, str]:
     normalized: dict[str, str] = {}
     for key, value in item.items():
         if value is None:
@@ -169,7 +176,7 @@ def normalized_candidate(item: dict[str, Any], created_at: str, pool_data: dict[
         location=normalized.get("location", ""),
         visual_key=visual_key_for_fit,
         visual_motif=normalized.get("visual_motif", ""),
-        pool_payload=pool_data,
+        pool_payload=pool_index,
     )
     normalized["visual_key"] = fit.get("visual_key", "") or visual_key_for_fit
     normalized["visual_motif"] = fit.get("visual_motif", "")
@@ -211,12 +218,17 @@ def prepare_rows(
     existing_events: list[dict[str, str]],
     pool_data: dict[str, Any],
     created_at: str,
+    identity_normalizer: EventIdentityNormalizer | None = None,
 ) -> tuple[list[list[str]], list[dict[str, str]], Counter[str]]:
+    normalizer = identity_normalizer or load_event_identity_contract().normalizer
+    existing_event_index = EventIdentityIndex(existing_events, normalizer=normalizer)
+    inbox_index = EventIdentityIndex(inbox_rows, normalizer=normalizer)
     exact_inbox_fps = {
         fingerprint
         for row in inbox_rows
         if (fingerprint := dedupe_fp(row.get("title"), row.get("date"), row.get("location"))) != "||"
     }
+    pool_index = EventVisualPoolIndex(pool_data)  # einmal pro Lauf statt pro Kandidat
     rows_to_append: list[list[str]] = []
     skipped_details: list[dict[str, str]] = []
     reasons: Counter[str] = Counter()
@@ -236,7 +248,7 @@ def prepare_rows(
         if not isinstance(raw, dict):
             fail(f"Element #{index} ist kein Objekt.")
         try:
-            candidate = normalized_candidate(raw, created_at, pool_data)
+            candidate = normalized_candidate(raw, created_at, pool_index)
         except ValueError as error:
             fail(f"Element #{index}: {error}")
 
@@ -245,7 +257,7 @@ def prepare_rows(
             skip(candidate, invalid_reason)
             continue
 
-        event_match = find_best_event_match(candidate, existing_events)
+        event_match = existing_event_index.find_best(candidate)
         event_match_status = norm(event_match.get("status"))
         if event_match_status in {"exact", "same_identity"}:
             skip(candidate, "duplicate_existing_event:" + norm(event_match.get("match_type")))
@@ -253,7 +265,7 @@ def prepare_rows(
         if event_match_status in {"possible", "identity_conflict"}:
             candidate = apply_event_identity_match(candidate, event_match, allow_same_identity=False)
 
-        inbox_match = find_best_event_match(candidate, inbox_rows)
+        inbox_match = inbox_index.find_best(candidate)
         if norm(inbox_match.get("status")) in {"possible", "exact", "same_identity", "identity_conflict"}:
             skip(candidate, "duplicate_open_inbox:" + norm(inbox_match.get("match_type")))
             continue
@@ -268,6 +280,7 @@ def prepare_rows(
         if fingerprint != "||":
             exact_inbox_fps.add(fingerprint)
         inbox_rows.append(candidate)
+        inbox_index.add(candidate)
 
     return rows_to_append, skipped_details, reasons
 
@@ -307,11 +320,11 @@ def main() -> None:
     )
     service = build("sheets", "v4", credentials=credentials, cache_discovery=False)
 
-    inbox_response = service.spreadsheets().values().get(
-        spreadsheetId=sheet_id,
-        range=f"{INBOX_TAB}!A:ZZ",
-    ).execute()
-    header, inbox_rows = sheet_rows(inbox_response.get("values", []) or [])
+    sheets = SheetsClient(service, sheet_id)
+    # Schreibender Lauf: Inbox und Events frisch in einem batchGet lesen.
+    tabs = sheets.read_tabs({INBOX_TAB: "A:ZZ", EVENTS_TAB: "A:AZ"}, max_age=0)
+    info(sheets.stats.summary())
+    header, inbox_rows = sheet_rows(tabs[INBOX_TAB])
     missing_columns = [column for column in INBOX_COLUMNS if column not in header]
     if missing_columns:
         fail(f"Inbox-Header unvollständig. Fehlende Spalten: {missing_columns}")
@@ -370,17 +383,14 @@ def main() -> None:
     ).execute()
     info(f"visual_key-Dropdown in {INBOX_TAB} gesetzt: {len(visual_key_options)} Optionen")
 
-    events_response = service.spreadsheets().values().get(
-        spreadsheetId=sheet_id,
-        range=f"{EVENTS_TAB}!A:AZ",
-    ).execute()
     try:
-        existing_events = event_rows_from_sheet_values(events_response.get("values", []) or [])
+        existing_events = event_rows_from_sheet_values(tabs[EVENTS_TAB])
     except ValueError as error:
         fail(f"{EVENTS_TAB}-Bestand ist nicht sicher auswertbar: {error}")
     info(f"Event-Identitätsbasis geladen: {len(existing_events)} Events")
 
     created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    identity_normalizer = load_event_identity_contract().normalizer
     rows_to_append, skipped_details, skip_reasons = prepare_rows(
         raw,
         header,
@@ -388,7 +398,9 @@ def main() -> None:
         existing_events,
         pool_data,
         created_at,
+        identity_normalizer,
     )
+    info(f"Event-Identität Cache (hits/lookups): {identity_normalizer.cache_summary()}")
 
     skipped_count = len(skipped_details)
     info(
@@ -400,6 +412,7 @@ def main() -> None:
         info(json.dumps(item, ensure_ascii=False))
 
     if rows_to_append:
+        sheets.invalidate()
         service.spreadsheets().values().append(
             spreadsheetId=sheet_id,
             range=f"{INBOX_TAB}!A1",
@@ -418,6 +431,7 @@ def main() -> None:
         skip_reasons=dict(skip_reasons),
         skipped_details=skipped_details[:80],
         event_identity_basis_count=len(existing_events),
+        event_identity_cache=identity_normalizer.cache_stats(),
     )
     set_output("appended_count", str(len(rows_to_append)))
 
@@ -7,22 +7,47 @@ The deploy is split into five phases:
 3. the public build marker;
 4. the service worker, stamped per build so existing browsers install a new worker;
 5. the deploy manifest, published only after the release phases were verified.
+
+Changed text assets above a size threshold get precompressed ``.gz`` (and,
+with the optional ``brotli`` package, ``.br``) siblings in the same phase; the
+siblings are listed in the deploy manifest like any other file. Siblings that
+would not be smaller are recorded under ``skipped_siblings`` with the source
+sha256, so an unchanged source is not compressed again on the next run.
+
+With ``--hash-cache`` the sha256 of files whose (size, mtime_ns, inode) did not
+change since the previous run is taken from a local cache; misses are hashed in
+a thread pool. The resulting manifest is identical to a cold run.
 """
 
 from __future__ import annotations
 
 import argparse
+import gzip
 import hashlib
 import json
+import os
+import random
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import brotli
+except ImportError:  # optional: without it only .gz siblings are written
+    brotli = None
+
 
 EXCLUDED_FROM_MANIFEST = {"meta/deploy-manifest.json"}
 BUILD_MARKER = "meta/build.txt"
 SERVICE_WORKER = "service-worker.js"
 DEPLOY_MANIFEST = "meta/deploy-manifest.json"
+PRECOMPRESS_MIN_BYTES = 1024
+PRECOMPRESS_SUFFIXES = {".css", ".html", ".js", ".json", ".mjs", ".svg", ".txt", ".webmanifest", ".xml"}
+# Build marker, worker and manifest are release switches and must stay single files.
+PRECOMPRESS_EXCLUDED = {BUILD_MARKER, SERVICE_WORKER, DEPLOY_MANIFEST}
+HASH_CACHE_VERSION = 1
+HASH_JOBS = min(8, os.cpu_count() or 1)
 
 
 def sha256(path: Path) -> str:
@@ -55,6 +80,16 @@ def load_remote_manifest(path: Path) -> dict[str, str]:
     return files if isinstance(files, dict) else {}
 
 
+def load_remote_skipped_siblings(path: Path) -> dict[str, str]:
+    """Siblings the previous plan left out because they were not smaller: {sibling path: source sha256}."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    skipped = payload.get("skipped_siblings", {}) if isinstance(payload, dict) else {}
+    return skipped if isinstance(skipped, dict) else {}
+
+
 def copy_payload(source: Path, destination: Path, relative_path: str) -> None:
     src = source / relative_path
     dst = destination / relative_path
@@ -62,6 +97,108 @@ def copy_payload(source: Path, destination: Path, relative_path: str) -> None:
     shutil.copy2(src, dst)
 
 
+# === BEGIN BLOCK: DEPLOY_STAT_HASH_CACHE_V1 | Zweck: sha256 nur fuer Dateien neu berechnen, deren (Groesse, mtime_ns, Inode) sich seit dem letzten Lauf geaendert hat, Fehltreffer parallel hashen; Umfang: Manifest-Hashing in prepare_deploy_plan, Manifest bleibt byte-identisch ===
+def stat_key(path: Path) -> list[int]:
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+
+def load_hash_cache(path: Path | None) -> dict[str, dict]:
+    if path is None:
+        return {}
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != HASH_CACHE_VERSION:
+        return {}
+    files = payload.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_hash_cache(path: Path, entries: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f"{path.name}.tmp")
+    temp.write_text(
+        json.dumps({"version": HASH_CACHE_VERSION, "files": entries}, sort_keys=True, separators=(",", ":")) + "\n",
+        encoding="utf-8",
+    )
+    temp.replace(path)
+
+
+def hash_source_files(
+    source: Path,
+    relatives: list[str],
+    cache: dict[str, dict],
+    jobs: int = HASH_JOBS,
+    verify_sample: int = 0,
+) -> tuple[dict[str, str], dict[str, dict], dict[str, int]]:
+    """Return (sha256 per file, new cache entries, hit/miss stats).
+
+    A cache entry is reused only if its stat key matches exactly. With verify_sample,
+    that many hits are rehashed; one stale hit discards the cache for this run.
+    """
+    keys = {relative: stat_key(source / relative) for relative in relatives}
+    hits = {
+        relative: cache[relative]["sha256"]
+        for relative in relatives
+        if isinstance(cache.get(relative), dict) and cache[relative].get("stat") == keys[relative]
+    }
+    sample: list[str] = []
+    stale = 0
+    if verify_sample and hits:
+        sample = random.sample(sorted(hits), min(verify_sample, len(hits)))
+        stale = sum(1 for relative in sample if sha256(source / relative) != hits[relative])
+        if stale:
+            hits = {}
+    misses = [relative for relative in relatives if relative not in hits]
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        hashed = dict(zip(misses, pool.map(lambda relative: sha256(source / relative), misses)))
+    digests = {relative: hits.get(relative) or hashed[relative] for relative in relatives}
+    entries = {relative: {"stat": keys[relative], "sha256": digests[relative]} for relative in relatives}
+    stats = {
+        "files": len(relatives),
+        "hits": len(hits),
+        "misses": len(misses),
+        "verified": len(sample),
+        "stale": stale,
+    }
+    return digests, entries, stats
+# === END BLOCK: DEPLOY_STAT_HASH_CACHE_V1 ===
+
+
+# === BEGIN BLOCK: DEPLOY_PRECOMPRESSED_SIBLINGS_V1 | Zweck: .gz/.br-Geschwister fuer grosse Text-Assets nur bei geaendertem sha256 erzeugen und im Deploy-Manifest fuehren; Umfang: Hilfsfunktionen fuer prepare_deploy_plan ===
+def precompress_candidate(source: Path, relative: str, min_bytes: int) -> bool:
+    return (
+        relative not in PRECOMPRESS_EXCLUDED
+        and Path(relative).suffix.lower() in PRECOMPRESS_SUFFIXES
+        and (source / relative).stat().st_size >= min_bytes
+    )
+
+
+def compressed_variants(data: bytes) -> dict[str, bytes]:
+    """Deterministic encodings (gzip mtime=0) so unchanged input keeps its sibling hash."""
+    variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(data, quality=11)
+    return variants
+
+
+def write_precompressed(destination: Path, relative: str, data: bytes) -> tuple[dict[str, tuple[str, int]], list[str]]:
+    """Write siblings that are actually smaller; returns ({sibling path: (sha256, size)}, [skipped sibling paths])."""
+    out: dict[str, tuple[str, int]] = {}
+    skipped: list[str] = []
+    for suffix, payload in compressed_variants(data).items():
+        if len(payload) >= len(data):
+            skipped.append(f"{relative}{suffix}")
+            continue
+        sibling = destination / f"{relative}{suffix}"
+        sibling.write_bytes(payload)
+        out[f"{relative}{suffix}"] = (hashlib.sha256(payload).hexdigest(), len(payload))
+    return out, skipped
+# === END BLOCK: DEPLOY_PRECOMPRESSED_SIBLINGS_V1 ===
+
+
 def prepare_deploy_plan(
     source: Path,
     remote_manifest: Path,
@@ -69,6 +206,10 @@ def prepare_deploy_plan(
     build_id: str,
     environment: str,
     output_root: Path,
+    precompress_min_bytes: int | None = PRECOMPRESS_MIN_BYTES,
+    hash_cache: Path | None = None,
+    hash_jobs: int = HASH_JOBS,
+    verify_cache: int = 0,
 ) -> dict[str, object]:
     if mode not in {"delta", "full", "full_repair"}:
         raise ValueError(f"unsupported deploy mode: {mode}")
@@ -92,22 +233,38 @@ def prepare_deploy_plan(
         shutil.rmtree(destination, ignore_errors=True)
         destination.mkdir(parents=True)
 
-    current = {
-        path.relative_to(source).as_posix(): sha256(path)
+    relatives = sorted(
+        path.relative_to(source).as_posix()
         for path in source.rglob("*")
         if path.is_file() and path.relative_to(source).as_posix() not in EXCLUDED_FROM_MANIFEST
-    }
+    )
+    current, cache_entries, cache_stats = hash_source_files(
+        source, relatives, load_hash_cache(hash_cache), jobs=hash_jobs, verify_sample=verify_cache
+    )
+    if hash_cache is not None:
+        save_hash_cache(hash_cache, cache_entries)
     previous = load_remote_manifest(remote_manifest)
+    previous_skipped = load_remote_skipped_siblings(remote_manifest)
     changed = (
         set(current)
         if mode != "delta"
         else {relative for relative, digest in current.items() if previous.get(relative) != digest}
     )
-    deleted = set() if mode == "full" else set(previous) - set(current)
 
     if "api/_config.php" in current:
         changed.add("api/_config.php")
 
+    sibling_suffixes = (".gz", ".br") if brotli is not None else (".gz",)
+    candidates = (
+        set()
+        if precompress_min_bytes is None
+        else {relative for relative in current if precompress_candidate(source, relative, precompress_min_bytes)}
+    )
+    precompressed: dict[str, str] = {}
+    skipped_siblings: dict[str, str] = {}
+    compression_report: dict[str, dict[str, int]] = {}
+    reused_siblings = 0
+
     phase_files: dict[str, list[str]] = {key: [] for key in destinations}
     for relative in sorted(changed):
         if relative == BUILD_MARKER:
@@ -121,12 +278,47 @@ def prepare_deploy_plan(
         copy_payload(source, destinations[phase], relative)
         phase_files[phase].append(relative)
 
+    for relative in sorted(candidates):
+        known = {f"{relative}{suffix}": previous.get(f"{relative}{suffix}") for suffix in sibling_suffixes}
+        settled = all(digest or previous_skipped.get(sibling) == current[relative] for sibling, digest in known.items())
+        if relative not in changed and settled:
+            # Source unchanged: its siblings already live remotely or were not worth writing for this sha256.
+            for sibling, digest in known.items():
+                if digest:
+                    precompressed[sibling] = digest
+                    reused_siblings += 1
+                else:
+                    skipped_siblings[sibling] = current[relative]
+            continue
+        phase = "entry" if relative.endswith(".html") else "assets"
+        destination = destinations[phase]
+        (destination / relative).parent.mkdir(parents=True, exist_ok=True)
+        data = (source / relative).read_bytes()
+        siblings, skipped = write_precompressed(destination, relative, data)
+        skipped_siblings.update(dict.fromkeys(skipped, current[relative]))
+        if not siblings:
+            continue
+        report = compression_report.setdefault(phase, {"files": 0, "raw_bytes": 0, "gzip_bytes": 0, "brotli_bytes": 0})
+        report["files"] += 1
+        report["raw_bytes"] += len(data)
+        for sibling, (digest, size) in siblings.items():
+            precompressed[sibling] = digest
+            phase_files[phase].append(sibling)
+            report["brotli_bytes" if sibling.endswith(".br") else "gzip_bytes"] += size
+    for report in compression_report.values():
+        report["saved_gzip_bytes"] = report["raw_bytes"] - report["gzip_bytes"] if report["gzip_bytes"] else 0
+        report["saved_brotli_bytes"] = report["raw_bytes"] - report["brotli_bytes"] if report["brotli_bytes"] else 0
+    for files in phase_files.values():
+        files.sort()
+
     manifest = {
         "schema": 1,
         "build": build_id,
         "environment": environment,
-        "files": current,
+        "files": {**current, **precompressed},
     }
+    if skipped_siblings:
+        manifest["skipped_siblings"] = dict(sorted(skipped_siblings.items()))
     manifest_path = destinations["manifest"] / DEPLOY_MANIFEST
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
     manifest_path.write_text(
@@ -135,6 +327,7 @@ def prepare_deploy_plan(
     )
     phase_files["manifest"].append(DEPLOY_MANIFEST)
 
+    deleted = set() if mode == "full" else set(previous) - set(manifest["files"])
     delete_lines = []
     for relative in sorted(deleted):
         if any(character in relative for character in ['"', "\n", "\r"]):
@@ -153,7 +346,16 @@ def prepare_deploy_plan(
         "changed": len(changed),
         "deleted": len(deleted),
         "phases": phase_files,
+        "precompression": {
+            "min_bytes": precompress_min_bytes,
+            "encodings": [suffix.lstrip(".") for suffix in sibling_suffixes] if precompress_min_bytes is not None else [],
+            "reused_siblings": reused_siblings,
+            "skipped_siblings": len(skipped_siblings),
+            "phases": compression_report,
+        },
     }
+    if hash_cache is not None:
+        summary["hash_cache"] = cache_stats
     (output_root / "deploy-plan.json").write_text(
         json.dumps(summary, sort_keys=True, indent=2) + "\n",
         encoding="utf-8",
@@ -169,6 +371,17 @@ def main() -> int:
     parser.add_argument("--build-id", required=True)
     parser.add_argument("--environment", required=True)
     parser.add_argument("--output-root", type=Path, default=Path("."))
+    parser.add_argument("--precompress-min-bytes", type=int, default=PRECOMPRESS_MIN_BYTES)
+    parser.add_argument("--no-precompress", action="store_true")
+    parser.add_argument("--hash-cache", type=Path, help="local sha256 cache keyed by (path, size, mtime_ns, inode)")
+    parser.add_argument("--hash-jobs", type=int, default=HASH_JOBS, help="threads for hashing cache misses")
+    parser.add_argument(
+        "--verify-cache",
+        type=int,
+        default=0,
+        metavar="N",
+        help="rehash N random cache hits; any mismatch discards the cache for this run",
+    )
     args = parser.parse_args()
 
     summary = prepare_deploy_plan(
@@ -178,6 +391,10 @@ def main() -> int:
         build_id=args.build_id,
         environment=args.environment,
         output_root=args.output_root,
+        precompress_min_bytes=None if args.no_precompress else args.precompress_min_bytes,
+        hash_cache=args.hash_cache,
+        hash_jobs=args.hash_jobs,
+        verify_cache=args.verify_cache,
     )
     print(json.dumps(summary, sort_keys=True))
     return 0
@@ -0,0 +1,178 @@
+"""Shared Google Sheets read client: one batchGet per script, short-lived disk snapshots.
+
+The sheet scripts used to call ``values().get`` once per tab. ``SheetsClient``
+reads every requested tab of a script in a single ``values().batchGet`` and
+keeps one JSON snapshot per range under ``.cache/sheets-snapshots`` for ``ttl``
+seconds, so steps that read the same Events/Inbox/Archive tabs minutes apart
+only fetch the tabs they are missing.
+
+The Sheets v4 API exposes no revision id or etag for values, and the service
+accounts only hold spreadsheet scopes (no Drive metadata), so snapshots are
+keyed by spreadsheet id + range and expire by age. Scripts that write back
+must read with ``max_age=0`` and call ``invalidate()`` after writing.
+
+Only the ``execute()`` chains of the API client are used; tests pass
+``tests/fake_sheets_service.py`` instead of a real service.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+SNAPSHOT_DIR = Path(os.environ.get("BE_SHEETS_SNAPSHOT_DIR", "").strip() or ROOT / ".cache" / "sheets-snapshots")
+SNAPSHOT_TTL_SECONDS = int(os.environ.get("BE_SHEETS_SNAPSHOT_TTL", "120") or "0")
+SNAPSHOT_VERSION = 1
+DEFAULT_RANGE = "A:ZZ"
+NUM_RETRIES = 4
+
+Values = List[List[str]]
+
+
+@dataclass
+class ReadStats:
+    api_calls: int = 0
+    ranges_read: int = 0
+    cache_hits: int = 0
+    api_seconds: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Sheets-Reads: {self.api_calls} API-Aufrufe, {self.ranges_read} Bereiche, "
+            f"{self.cache_hits} Cache-Treffer, {self.api_seconds * 1000:.0f} ms API-Latenz"
+        )
+
+
+class SheetsClient:
+    def __init__(
+        self,
+        service: Any,
+        spreadsheet_id: str,
+        snapshot_dir: Optional[Path] = SNAPSHOT_DIR,
+        ttl: int = SNAPSHOT_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.service = service
+        self.spreadsheet_id = spreadsheet_id
+        self.snapshot_dir = snapshot_dir
+        self.ttl = ttl
+        self.clock = clock
+        self.stats = ReadStats()
+        self._memo: Dict[str, Values] = {}
+        self._titles: Optional[set[str]] = None
+
+    # --- snapshots -------------------------------------------------------
+    def _prefix(self) -> str:
+        return hashlib.sha256(self.spreadsheet_id.encode("utf-8")).hexdigest()[:12]
+
+    def _snapshot_path(self, rng: str) -> Optional[Path]:
+        if self.snapshot_dir is None:
+            return None
+        key = hashlib.sha256(rng.encode("utf-8")).hexdigest()[:16]
+        return self.snapshot_dir / f"{self._prefix()}-{key}.json"
+
+    def _load_snapshot(self, rng: str, max_age: float) -> Optional[Values]:
+        path = self._snapshot_path(rng)
+        if path is None or max_age <= 0:
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if payload.get("version") != SNAPSHOT_VERSION or payload.get("range") != rng:
+            return None
+        if self.clock() - float(payload.get("fetched_at", 0)) > max_age:
+            return None
+        return payload.get("values")
+
+    def _store_snapshot(self, rng: str, values: Values, fetched_at: float) -> None:
+        path = self._snapshot_path(rng)
+        if path is None or self.ttl <= 0:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f"{path.name}.tmp")
+        payload = {"version": SNAPSHOT_VERSION, "fetched_at": fetched_at, "range": rng, "values": values}
+        temp.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        temp.replace(path)
+
+    def invalidate(self) -> None:
+        """Drop all snapshots of this spreadsheet, e.g. after appending rows."""
+        self._memo.clear()
+        self._titles = None
+        if self.snapshot_dir is not None and self.snapshot_dir.is_dir():
+            for path in self.snapshot_dir.glob(f"{self._prefix()}-*.json"):
+                path.unlink()
+
+    # --- API reads -------------------------------------------------------
+    def _execute(self, request: Any) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            return request.execute(num_retries=NUM_RETRIES)
+        finally:
+            self.stats.api_calls += 1
+            self.stats.api_seconds += time.perf_counter() - started
+
+    def _fetch(self, ranges: List[str]) -> List[Values]:
+        request = self.service.spreadsheets().values().batchGet(
+            spreadsheetId=self.spreadsheet_id, ranges=ranges, majorDimension="ROWS"
+        )
+        res = self._execute(request)
+        values = [value_range.get("values", []) or [] for value_range in res.get("valueRanges", [])]
+        if len(values) != len(ranges):
+            raise ValueError(f"batchGet lieferte {len(values)} statt {len(ranges)} Bereiche")
+        self.stats.ranges_read += len(ranges)
+        return values
+
+    def sheet_titles(self) -> set[str]:
+        """Tab titles, read once per client; used to skip optional tabs that do not exist."""
+        if self._titles is None:
+            res = self._execute(self.service.spreadsheets().get(spreadsheetId=self.spreadsheet_id, fields="sheets.properties.title"))
+            self._titles = {sheet.get("properties", {}).get("title") for sheet in res.get("sheets", [])}
+        return self._titles
+
+    def read_tabs(
+        self,
+        tabs: Iterable[str] | Mapping[str, str],
+        *,
+        optional: Iterable[str] = (),
+        max_age: Optional[float] = None,
+    ) -> Dict[str, Values]:
+        """Values per tab; tabs without a fresh enough snapshot are read in one batchGet.
+
+        tabs is a list of tab names (range A:ZZ) or a mapping tab -> A1 column range.
+        Optional tabs that do not exist come back as []. max_age=0 forces an API read.
+        """
+        spec = dict(tabs) if isinstance(tabs, Mapping) else {tab: DEFAULT_RANGE for tab in tabs}
+        ranges = {tab: f"{tab}!{rng}" for tab, rng in spec.items()}
+        age = self.ttl if max_age is None else max_age
+        out: Dict[str, Values] = {}
+        for tab, rng in ranges.items():
+            # Within one run a range is read at most once unless max_age=0 forces it.
+            cached = self._memo.get(rng) if max_age != 0 else None
+            if cached is None:
+                cached = self._load_snapshot(rng, age)
+            if cached is not None:
+                out[tab] = cached
+                self.stats.cache_hits += 1
+        missing = [tab for tab in ranges if tab not in out]
+        # A missing tab would fail the whole batchGet with HTTP 400, so optional tabs are checked first.
+        optional_missing = set(optional) & set(missing)
+        if optional_missing:
+            for tab in optional_missing - self.sheet_titles():
+                out[tab] = []
+            missing = [tab for tab in missing if tab not in out]
+        if missing:
+            fetched_at = self.clock()
+            for tab, values in zip(missing, self._fetch([ranges[tab] for tab in missing])):
+                out[tab] = values
+                self._store_snapshot(ranges[tab], values, fetched_at)
+        self._memo.update({ranges[tab]: out[tab] for tab in ranges})
+        return {tab: out[tab] for tab in ranges}
+
+    def read_tab(self, tab: str, rng: str = DEFAULT_RANGE, **kwargs: Any) -> Values:
+        return self.read_tabs({tab: rng}, **kwargs)[tab]
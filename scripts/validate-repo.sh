@@ -72,19 +72,37 @@ validate_repository() {
   python3 tests/test_pr_contract.py
   python3 tests/test_deploy_run_status.py
   python3 tests/test_deploy_release_coherence.py
+  python3 tests/test_deploy_precompression.py
+  python3 tests/test_deploy_hash_cache.py
+  python3 tests/test_growth_metrics_cache.py
+  python3 tests/test_growth_inventory_index.py
+  python3 tests/test_sheets_client.py
+  python3 tests/test_content_ops_sql_batching.py
+  python3 tests/test_content_ops_bulk_ingest.py
+  python3 tests/test_content_audit_issue_stream.py
+  python3 tests/test_weekly_coverage_index.py
+  python3 tests/test_content_ops_contract_golden.py
   bash tests/test_strato_sftp_phase_retry.sh
   python3 scripts/audit_control_center_product_contract.py
   python3 scripts/audit_control_center_editorial_contracts.py
   python3 tools/audit-css-governance.py
   python3 tests/test_event_visual_gap_backlog.py
+  python3 tests/test_event_visual_keys.py
   python3 tests/test_events_overlay_merge.py
   python3 tests/test_event_builder_control_center_contract.py
+  python3 tests/test_build_site_data.py
+  python3 tests/test_event_feed_shards.py
   python3 tests/test_event_identity.py
+  python3 tests/test_content_audit_network.py
+  python3 tests/test_source_text_extractor.py
+  python3 tests/test_bathing_water_fetch.py
   node tests/neutral-selection.test.mjs
   node tests/static-render-fixture.test.mjs
   python3 tests/test_seo_static_contract.py
   python3 tests/test_event_offer_contract.py
   python3 tests/test_event_detail_schema_contract.py
+  python3 tests/test_event_detail_incremental.py
+  python3 tests/test_event_detail_golden.py
 }
 
 case "$section" in
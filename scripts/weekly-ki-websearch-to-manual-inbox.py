@@ -32,6 +32,8 @@ from openai import OpenAI
 from event_visual_keys import infer_event_visual_key, normalize_event_visual_key
 from event_visual_motifs import infer_event_visual_fit
 from event_description_quality import evaluate_event_description
+from sheets_client import SheetsClient
+from weekly_coverage_index import CoverageIndex, TargetKeys
 
 
 # === BEGIN BLOCK: CONFIG ===
@@ -243,23 +245,6 @@ def build_sheets_service() -> tuple[Any, str]:
     return service, sheet_id
 
 
-def read_sheet_values(service: Any, sheet_id: str, tab_name: str) -> list[list[str]]:
-    res = service.spreadsheets().values().get(
-        spreadsheetId=sheet_id,
-        range=f"{tab_name}!A:ZZ",
-        majorDimension="ROWS",
-    ).execute(num_retries=4)
-    return res.get("values", []) or []
-
-
-def read_optional_sheet_values(service: Any, sheet_id: str, tab_name: str) -> list[list[str]]:
-    try:
-        return read_sheet_values(service, sheet_id, tab_name)
-    except Exception as exc:
-        info(f"Optionaler Sheet-Tab nicht lesbar: {tab_name} ({exc})")
-        return []
-
-
 def write_optional_tsv_snapshot(out_path: Path, values: list[list[str]]) -> int:
     ensure_parent(out_path)
     if not values:
@@ -307,31 +292,38 @@ def write_tsv_snapshot(out_path: Path, values: list[list[str]], required_columns
 
 def export_current_snapshots() -> None:
     service, sheet_id = build_sheets_service()
+    sheets = SheetsClient(service, sheet_id)
+    # Ein batchGet fuer alle Tabs; ein kurzlebiger Snapshot eines vorherigen Schritts wird wiederverwendet.
+    tabs = sheets.read_tabs(
+        [TAB_EVENTS, TAB_INBOX, TAB_ARCHIVE, TAB_CONTENT_SEARCH_FEEDBACK],
+        optional=[TAB_CONTENT_SEARCH_FEEDBACK],
+    )
+    info(sheets.stats.summary())
 
     events_rows = write_tsv_snapshot(
         TMP_EVENTS_TSV_PATH,
-        read_sheet_values(service, sheet_id, TAB_EVENTS),
+        tabs[TAB_EVENTS],
         ["id", "title", "date", "city", "location", "kategorie"],
     )
     info(f"Events-Snapshot exportiert: {events_rows} Zeilen")
 
     inbox_rows = write_tsv_snapshot(
         TMP_INBOX_TSV_PATH,
-        read_sheet_values(service, sheet_id, TAB_INBOX),
+        tabs[TAB_INBOX],
         ["status", "title", "source_url", "created_at"],
     )
     info(f"Inbox-Snapshot exportiert: {inbox_rows} Zeilen")
 
     archive_rows = write_tsv_snapshot(
         TMP_ARCHIVE_TSV_PATH,
-        read_sheet_values(service, sheet_id, TAB_ARCHIVE),
+        tabs[TAB_ARCHIVE],
         ["status", "title", "source_url", "created_at"],
     )
     info(f"Archive-Snapshot exportiert: {archive_rows} Zeilen")
 
     feedback_rows = write_optional_tsv_snapshot(
         TMP_CONTENT_SEARCH_FEEDBACK_TSV_PATH,
-        read_optional_sheet_values(service, sheet_id, TAB_CONTENT_SEARCH_FEEDBACK),
+        tabs[TAB_CONTENT_SEARCH_FEEDBACK],
     )
     info(f"Content-Search-Feedback-Snapshot exportiert: {feedback_rows} Zeilen")
 # === END BLOCK: SHEETS SNAPSHOT EXPORT ===
@@ -2140,59 +2132,33 @@ def target_aliases(target: Dict[str, Any]) -> List[str]:
     return aliases
 
 
-def target_matches_title(target: Dict[str, Any], title: str) -> bool:
-    title_key = norm_key(title)
-    if not title_key:
-        return False
-
-    for alias in target_aliases(target):
-        alias_key = norm_key(alias)
-        if alias_key and (alias_key in title_key or title_key in alias_key):
-            return True
-    return False
-
-
-def target_matches_url(target: Dict[str, Any], url_value: str) -> bool:
-    hint = norm_key(target.get("source_hint", ""))
-    url_key = norm_key(canonical_url(url_value))
-    return bool(hint and url_key and hint in url_key)
-
-
-def target_matches_candidate(target: Dict[str, Any], item: Dict[str, Any]) -> bool:
-    expected_date = norm(target.get("expected_date", ""))
-    item_date = norm(item.get("date", ""))
-    if expected_date and item_date != expected_date:
-        return False
-
-    return (
-        target_matches_title(target, clean_output_text(item.get("title", "")))
-        or target_matches_url(target, item.get("url", ""))
-        or target_matches_url(target, item.get("source_url", ""))
+# === BEGIN BLOCK: COVERAGE_MATCH_INDEX_V1 | Zweck: Titel-/URL-Schluessel aller Datensaetze einmal je Lauf berechnen, Targets ueber Datums-Buckets abgleichen | Umfang: ersetzt die paarweisen target_matches_*-Scans ===
+def coverage_target_keys(target: Dict[str, Any]) -> TargetKeys:
+    return TargetKeys(
+        expected_date=norm(target.get("expected_date", "")),
+        alias_keys=tuple(key for key in (norm_key(alias) for alias in target_aliases(target)) if key),
+        hint=norm_key(target.get("source_hint", "")),
     )
 
 
-def target_matches_record(target: Dict[str, Any], rec: RefRecord) -> bool:
-    expected_date = norm(target.get("expected_date", ""))
-    if expected_date and rec.date != expected_date:
-        return False
-
-    return (
-        target_matches_title(target, rec.title)
-        or target_matches_url(target, rec.url)
-        or target_matches_url(target, rec.source_url)
-    )
+def candidate_coverage_index(items: Iterable[Dict[str, Any]]) -> CoverageIndex:
+    index = CoverageIndex()
+    for item in items:
+        index.add(
+            item,
+            norm(item.get("date", "")),
+            norm_key(clean_output_text(item.get("title", ""))),
+            (norm_key(canonical_url(item.get("url", ""))), norm_key(canonical_url(item.get("source_url", "")))),
+        )
+    return index
 
 
-def first_matching_record_status(target: Dict[str, Any], label: str, records: List[RefRecord]) -> Dict[str, str] | None:
+def record_coverage_index(records: Iterable[RefRecord]) -> CoverageIndex:
+    index = CoverageIndex()
     for rec in records:
-        if target_matches_record(target, rec):
-            return {
-                "status": label,
-                "matched_title": rec.title,
-                "matched_date": rec.date,
-                "matched_url": rec.source_url or rec.url,
-            }
-    return None
+        index.add(rec, rec.date, norm_key(rec.title), (norm_key(canonical_url(rec.url)), norm_key(canonical_url(rec.source_url))))
+    return index
+# === END BLOCK: COVERAGE_MATCH_INDEX_V1 ===
 
 
 # === BEGIN BLOCK: COVERAGE_AUDIT_WITH_WINDOW_STATUS_V2 | Zweck: Coverage-Ziele gegen Selected/Raw/Bestand prüfen und abgelaufene bzw. außerhalb liegende Targets sauber diagnostizieren | Umfang: ersetzt coverage_audit vollständig ===
@@ -2209,6 +2175,18 @@ def coverage_audit(
     audit: List[Dict[str, str]] = []
     today = datetime.now().date()
     window_end = today + timedelta(days=SEARCH_WINDOW_DAYS)
+    if not targets:
+        return audit
+
+    selected_index = candidate_coverage_index(item for item in selected_candidates if isinstance(item, dict))
+    raw_index = candidate_coverage_index(normalize_candidate(item) for item in raw_candidates if isinstance(item, dict))
+    drop_index = candidate_coverage_index(d for d in drop_diagnostics if d.get("reason") != "selected")
+    record_indexes = [
+        ("IN_EVENTS", record_coverage_index(events_records)),
+        ("IN_INBOX", record_coverage_index(inbox_records)),
+        ("IN_INBOX_ARCHIVE", record_coverage_index(archive_records)),
+        ("IN_MANUAL_JSON", record_coverage_index(manual_records)),
+    ]
 
     for target in targets:
         target_id = clean_output_text(target.get("id", "")) or norm_key(target.get("title", ""))
@@ -2216,8 +2194,9 @@ def coverage_audit(
         priority = clean_output_text(target.get("priority", "")) or "should"
         cluster = clean_output_text(target.get("cluster", ""))
         expected_date_value = parse_iso_date(norm(target.get("expected_date", "")))
+        keys = coverage_target_keys(target)
 
-        selected_match = next((item for item in selected_candidates if target_matches_candidate(target, item)), None)
+        selected_match = selected_index.first_match(keys)
         if selected_match:
             audit.append({
                 "id": target_id,
@@ -2232,10 +2211,9 @@ def coverage_audit(
             })
             continue
 
-        raw_match = next((item for item in raw_candidates if isinstance(item, dict) and target_matches_candidate(target, normalize_candidate(item))), None)
-        if raw_match:
-            raw_norm = normalize_candidate(raw_match)
-            drop_match = next((d for d in drop_diagnostics if target_matches_candidate(target, d) and d.get("reason") != "selected"), None)
+        raw_norm = raw_index.first_match(keys)
+        if raw_norm:
+            drop_match = drop_index.first_match(keys)
             audit.append({
                 "id": target_id,
                 "title": title,
@@ -2249,13 +2227,8 @@ def coverage_audit(
             })
             continue
 
-        for label, records in [
-            ("IN_EVENTS", events_records),
-            ("IN_INBOX", inbox_records),
-            ("IN_INBOX_ARCHIVE", archive_records),
-            ("IN_MANUAL_JSON", manual_records),
-        ]:
-            record_match = first_matching_record_status(target, label, records)
+        for label, index in record_indexes:
+            record_match = index.first_match(keys)
             if record_match:
                 audit.append({
                     "id": target_id,
@@ -2263,9 +2236,9 @@ def coverage_audit(
                     "priority": priority,
                     "cluster": cluster,
                     "status": label,
-                    "matched_title": clean_output_text(record_match.get("matched_title", "")),
-                    "matched_date": clean_output_text(record_match.get("matched_date", "")),
-                    "matched_url": canonical_url(record_match.get("matched_url", "")),
+                    "matched_title": clean_output_text(record_match.title),
+                    "matched_date": clean_output_text(record_match.date),
+                    "matched_url": canonical_url(record_match.source_url or record_match.url),
                     "drop_reason": "",
                 })
                 break
@@ -0,0 +1,59 @@
+"""Coverage index for the weekly KI event search.
+
+``coverage_audit`` in ``weekly-ki-websearch-to-manual-inbox.py`` checks every
+coverage target against the selected and raw candidates, the drop diagnostics
+and the Events/Inbox/Archive/manual records. A target matches a record when
+one of its aliases (``norm_key``) is contained in the record title or the title
+in the alias, or when its ``source_hint`` is contained in one of the record's
+canonical URLs - restricted to ``expected_date`` when the target has one.
+
+These are substring rules, so a token index would change results. Instead,
+``CoverageIndex`` computes the title and URL keys of every record once per run.
+It also buckets the entries by date, so a dated target only checks the records
+of its day. Matching stays exact: the first match in record order wins, as
+with the former pairwise scans.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class TargetKeys:
+    expected_date: str
+    alias_keys: Tuple[str, ...]  # non-empty norm_key values of title + aliases
+    hint: str  # norm_key of source_hint
+
+    def matches(self, entry: "CoverageEntry") -> bool:
+        if entry.title_key:
+            for alias_key in self.alias_keys:
+                if alias_key in entry.title_key or entry.title_key in alias_key:
+                    return True
+        return bool(self.hint) and any(url_key and self.hint in url_key for url_key in entry.url_keys)
+
+
+@dataclass(frozen=True)
+class CoverageEntry:
+    date: str
+    title_key: str
+    url_keys: Tuple[str, ...]
+    item: Any
+
+
+@dataclass
+class CoverageIndex:
+    entries: List[CoverageEntry] = field(default_factory=list)
+    by_date: Dict[str, List[CoverageEntry]] = field(default_factory=dict)
+
+    def add(self, item: Any, date: str, title_key: str, url_keys: Sequence[str]) -> None:
+        entry = CoverageEntry(date=date, title_key=title_key, url_keys=tuple(url_keys), item=item)
+        self.entries.append(entry)
+        self.by_date.setdefault(date, []).append(entry)
+
+    def first_match(self, target: TargetKeys) -> Optional[Any]:
+        pool = self.by_date.get(target.expected_date, []) if target.expected_date else self.entries
+        for entry in pool:
+            if target.matches(entry):
+                return entry.item
+        return None
@@ -313,6 +313,22 @@ async function staleWhileRevalidate(request) {
   /* === END BLOCK: GS-01.5 OFFLINE ASSET FALLBACK (STATIC+RUNTIME) === */
 }
 
+/* === BEGIN BLOCK: EVENT_FEED_IMMUTABLE_SHARD_CACHE_V1 | Zweck: content-gehashte Event-Feed-Shards nie erneut laden; Umfang: cache-first nur fuer /data/event-feed/*.<hash>.json === */
+const EVENT_FEED_SHARD_RE = /^\/data\/event-feed\/[a-z0-9-]+\.[0-9a-f]{12}\.json$/;
+
+async function cacheFirst(request) {
+  const runtimeCache = await caches.open(RUNTIME_CACHE);
+  const cached = await runtimeCache.match(request);
+  if (cached) return cached;
+
+  const response = await fetch(request);
+  if (response && response.ok) {
+    await runtimeCache.put(request, response.clone());
+  }
+  return response;
+}
+/* === END BLOCK: EVENT_FEED_IMMUTABLE_SHARD_CACHE_V1 === */
+
 async function networkFirst(request) {
   const runtimeCache = await caches.open(RUNTIME_CACHE);
   const staticCache = await caches.open(STATIC_CACHE);
@@ -395,6 +411,12 @@ self.addEventListener("fetch", (event) => {
     return;
   }
 
+  // Gehashte Event-Feed-Shards sind unveränderlich; das Manifest bleibt network-first.
+  if (EVENT_FEED_SHARD_RE.test(url.pathname)) {
+    event.respondWith(cacheFirst(req));
+    return;
+  }
+
   /* === BEGIN BLOCK: PUBLIC_EVENT_FEED_NETWORK_FIRST_V1 | Zweck: hält dynamische öffentliche DB-Events nach finaler Freigabe sofort aktuell; Umfang: erweitert die Network-First-Datenrouten um /api/events/public.php === */
   if (
     (url.pathname.startsWith("/data/") && url.pathname.endsWith(".json")) ||
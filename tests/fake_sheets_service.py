@@ -0,0 +1,109 @@
+"""In-memory stand-in for the googleapiclient Sheets v4 service used by the sheet scripts.
+
+Supports the call chains the scripts use: ``spreadsheets().get``,
+``spreadsheets().batchUpdate`` and ``spreadsheets().values()`` with ``get``,
+``batchGet``, ``append``, ``update`` and ``batchUpdate``. Unknown tabs fail
+with HTTP 400 like the real API; every executed request is recorded in
+``calls``.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List
+
+
+class FakeHttpError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.resp = type("Resp", (), {"status": status})()
+        self.content = message.encode("utf-8")
+
+
+class FakeRequest:
+    def __init__(self, service: "FakeSheetsService", name: str, handler) -> None:
+        self.service = service
+        self.name = name
+        self.handler = handler
+
+    def execute(self, num_retries: int = 0) -> Dict[str, Any]:
+        self.service.calls.append(self.name)
+        return self.handler()
+
+
+class FakeValues:
+    def __init__(self, service: "FakeSheetsService") -> None:
+        self.service = service
+
+    def get(self, spreadsheetId: str, range: str, **_: Any) -> FakeRequest:
+        return FakeRequest(self.service, "values.get", lambda: {"range": range, "values": self.service.read(range)})
+
+    def batchGet(self, spreadsheetId: str, ranges: List[str], **_: Any) -> FakeRequest:
+        return FakeRequest(
+            self.service,
+            "values.batchGet",
+            lambda: {"valueRanges": [{"range": rng, "values": self.service.read(rng)} for rng in ranges]},
+        )
+
+    def append(self, spreadsheetId: str, range: str, body: Dict[str, Any], **_: Any) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            self.service.tab(range).extend([list(row) for row in body.get("values", [])])
+            return {}
+        return FakeRequest(self.service, "values.append", handler)
+
+    def update(self, spreadsheetId: str, range: str, body: Dict[str, Any], **_: Any) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            rows = self.service.tab(range)
+            match = re.search(r"!\D*(\d+)", range)
+            start = int(match.group(1)) - 1 if match else 0
+            for offset, row in enumerate(body.get("values", [])):
+                while len(rows) <= start + offset:
+                    rows.append([])
+                rows[start + offset] = list(row)
+            return {}
+        return FakeRequest(self.service, "values.update", handler)
+
+    def batchUpdate(self, spreadsheetId: str, body: Dict[str, Any]) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            for data in body.get("data", []):
+                self.update(spreadsheetId, data["range"], {"values": data["values"]}).handler()
+            return {}
+        return FakeRequest(self.service, "values.batchUpdate", handler)
+
+
+class FakeSpreadsheets:
+    def __init__(self, service: "FakeSheetsService") -> None:
+        self.service = service
+
+    def values(self) -> FakeValues:
+        return FakeValues(self.service)
+
+    def get(self, spreadsheetId: str, **_: Any) -> FakeRequest:
+        sheets = [{"properties": {"title": title, "sheetId": index}} for index, title in enumerate(self.service.tabs)]
+        return FakeRequest(self.service, "spreadsheets.get", lambda: {"sheets": sheets})
+
+    def batchUpdate(self, spreadsheetId: str, body: Dict[str, Any]) -> FakeRequest:
+        def handler() -> Dict[str, Any]:
+            for request in body.get("requests", []):
+                title = request.get("addSheet", {}).get("properties", {}).get("title")
+                if title:
+                    self.service.tabs.setdefault(title, [])
+            return {}
+        return FakeRequest(self.service, "spreadsheets.batchUpdate", handler)
+
+
+class FakeSheetsService:
+    def __init__(self, tabs: Dict[str, List[List[str]]]) -> None:
+        self.tabs = {name: [list(row) for row in rows] for name, rows in tabs.items()}
+        self.calls: List[str] = []
+
+    def spreadsheets(self) -> FakeSpreadsheets:
+        return FakeSpreadsheets(self)
+
+    def tab(self, rng: str) -> List[List[str]]:
+        name = rng.split("!", 1)[0].strip("'")
+        if name not in self.tabs:
+            raise FakeHttpError(400, f"Unable to parse range: {rng}")
+        return self.tabs[name]
+
+    def read(self, rng: str) -> List[List[str]]:
+        return [list(row) for row in self.tab(rng)]
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import importlib.util
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+LATENCY_SECONDS = 0.15
+TODAY = dt.date(2026, 7, 20)
+
+
+class SourceHandler(BaseHTTPRequestHandler):
+    """Stand-in for the NRW DataTables endpoint, zwemwater.nl and local pages with fixed latency."""
+
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    paths: list[str] = []
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return
+
+    def do_GET(self) -> None:  # noqa: N802
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+            cls.paths.append(self.path)
+        try:
+            time.sleep(LATENCY_SECONDS)
+            if self.path.startswith("/nrw/"):
+                ec = "2000" if "/nrw/22/" in self.path else "15"
+                body = json.dumps({"data": [{"datumProbenahme": "14.07.2026", "ecWithHinweis": ec, "ieWithHinweis": "<15", "badeverbotUI": "nein"}]})
+                content_type = "application/json"
+            elif self.path.startswith("/zwemwater"):
+                body = "<html><body><p>Actuele situatie: in orde</p></body></html>"
+                content_type = "text/html"
+            else:
+                body = "<html><body><p>Grüne Flagge: Baden möglich.</p></body></html>"
+                content_type = "text/html"
+            raw = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+
+def load_guard_module():
+    spec = importlib.util.spec_from_file_location("check_bathing_water_status", ROOT / "scripts" / "check-bathing-water-status.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def stable_groups(report: dict) -> list[dict]:
+    groups = json.loads(json.dumps(report["groups"]))
+    for group in groups:
+        for key in ("sources", "water_sources", "local_suitability_sources"):
+            for source in group[key]:
+                source.pop("checked_at")
+                source.pop("fetch")
+    return groups
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SourceHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    module = load_guard_module()
+    real_datatables_url = module.nrw_datatables_url
+    module.nrw_datatables_url = lambda nrw_id, *, year_diff=0: real_datatables_url(nrw_id, year_diff=year_diff).replace(
+        "https://db.badegewaesser.nrw.de/badegewaesser-nrw/", f"{base}/nrw/"
+    )
+    module.GROUPS = [
+        dataclasses.replace(
+            group,
+            sources=[dataclasses.replace(source, url=f"{base}/zwemwater?id={source.zwemwater_id}") if source.type == "zwemwater_page" else source for source in group.sources],
+            local_sources=[dataclasses.replace(source, url=f"{base}/local/{source.id}", valid_until=None) for source in group.local_sources],
+        )
+        for group in module.GROUPS
+    ]
+    source_count = sum(len(group.sources) + len(group.local_sources) for group in module.GROUPS)
+    try:
+        started = time.perf_counter()
+        sequential = module.build_report(TODAY, 45, 35, fetcher=module.SourceFetcher(per_host=1, host_delay=0.0), workers=1)
+        sequential_seconds = time.perf_counter() - started
+        assert SourceHandler.max_in_flight == 1
+
+        SourceHandler.max_in_flight = 0
+        SourceHandler.paths.clear()
+        started = time.perf_counter()
+        parallel = module.build_report(TODAY, 45, 35, fetcher=module.SourceFetcher(per_host=2, host_delay=0.0), workers=6)
+        parallel_seconds = time.perf_counter() - started
+        assert stable_groups(parallel) == stable_groups(sequential), "parallel checks must not change the report"
+        assert [group["group_id"] for group in parallel["groups"]] == [group.group_id for group in module.GROUPS]
+        assert SourceHandler.max_in_flight <= 2, SourceHandler.max_in_flight
+        assert len(SourceHandler.paths) == source_count
+        assert parallel_seconds < sequential_seconds * 0.75, (parallel_seconds, sequential_seconds)
+        states = {group["group_id"]: group["water_state"] for group in parallel["groups"]}
+        assert states["hilgelo-winterswijk"] == "ok" and states["auesee-wesel"] == "blocked", states
+        for group in parallel["groups"]:
+            for source in group["sources"]:
+                assert source["fetch"]["cache"] == "disabled" and source["fetch"]["latency_ms"] >= LATENCY_SECONDS * 1000 * 0.9, source["fetch"]
+
+        with tempfile.TemporaryDirectory(prefix="be-bathing-cache-") as temp_dir:
+            cache_path = Path(temp_dir) / "bathing-water-source-responses.json"
+            day = dt.date(2026, 7, 20)
+            SourceHandler.paths.clear()
+            first_cache = module.SourceResponseCache(cache_path, day)
+            first = module.build_report(TODAY, 45, 35, fetcher=module.SourceFetcher(first_cache, host_delay=0.0))
+            first_cache.save()
+            assert len(SourceHandler.paths) == source_count
+            assert all("|jahrDiff=0|" in key for key in first_cache.entries if "/nrw/" in key)
+
+            SourceHandler.paths.clear()
+            rerun = module.build_report(TODAY, 45, 35, fetcher=module.SourceFetcher(module.SourceResponseCache(cache_path, day), host_delay=0.0))
+            assert SourceHandler.paths == [], "same-day re-run must not refetch sources"
+            assert stable_groups(rerun) == stable_groups(first)
+            for group in rerun["groups"]:
+                for source in group["sources"]:
+                    assert source["fetch"]["cache"] == "hit" and source["fetch"]["latency_ms"] >= LATENCY_SECONDS * 1000 * 0.9
+
+            next_day = module.SourceResponseCache(cache_path, day + dt.timedelta(days=1))
+            assert next_day.entries == {}, "responses from another day must not be reused"
+
+        SourceHandler.paths.clear()
+        started = time.perf_counter()
+        module.build_report(TODAY, 45, 35, fetcher=module.SourceFetcher(per_host=4, host_delay=0.3), workers=6)
+        nrw_requests = sum(1 for path in SourceHandler.paths if path.startswith("/nrw/"))
+        assert time.perf_counter() - started >= 0.3 * (nrw_requests - 1), "politeness delay must space request starts per host"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("=== Bathing Water Source Fetch: OK ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import csv
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import event_builder  # noqa: E402
+import event_detail_pages  # noqa: E402
+
+COLUMNS = ["id", "title", "date", "endDate", "time", "city", "location", "kategorie", "url", "description"]
+
+
+def load_pipeline():
+    spec = importlib.util.spec_from_file_location("build_site_data", ROOT / "scripts" / "build-site-data.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def fixture_rows() -> list[dict[str, str]]:
+    today = date.today()
+    return [
+        {"id": "stadtfest-bocholt-fixture", "title": "Stadtfest Bocholt", "date": (today + timedelta(days=12)).isoformat(), "time": "12:00", "city": "Bocholt", "location": "Marktplatz", "kategorie": "Märkte & Feste", "url": "https://www.bocholt.de/stadtfest", "description": "Rund um den Marktplatz gibt es Musik, Stände lokaler Vereine und Mitmachangebote für Familien aus ganz Bocholt."},
+        {"id": "orgelkonzert-st-georg-fixture", "title": "Orgelkonzert St. Georg", "date": (today + timedelta(days=3)).isoformat(), "time": "19:30", "city": "Bocholt", "location": "St. Georg", "kategorie": "Musik", "description": "Die Organistin spielt Werke von Bach und Reger auf der großen Orgel, der Eintritt zum Abendkonzert ist frei."},
+        {"id": "textil-ausstellung-fixture", "title": "Textil Ausstellung", "date": (today - timedelta(days=20)).isoformat(), "endDate": (today + timedelta(days=40)).isoformat(), "city": "Bocholt", "location": "TextilWerk", "kategorie": "Ausstellung", "description": "Die Ausstellung zeigt Maschinen, Stoffe und Geschichten aus der Bocholter Textilindustrie von den Anfängen bis heute."},
+        {"id": "flohmarkt-rhede-fixture", "title": "Flohmarkt Rhede", "date": (today - timedelta(days=6)).isoformat(), "time": "08:00", "city": "Rhede", "location": "Rathausplatz", "kategorie": "Markt", "description": "Private Händlerinnen und Händler bieten auf dem Rathausplatz Trödel, Bücher und Spielzeug für Sammler an."},
+    ]
+
+
+def snapshot(base: Path) -> tuple[bytes, dict[str, bytes], dict]:
+    manifest = json.loads((base / "event_detail_pages.json").read_text(encoding="utf-8"))
+    manifest.pop("generated_at")
+    pages = {str(path.relative_to(base / "events")): path.read_bytes() for path in sorted((base / "events").rglob("*")) if path.is_file()}
+    return (base / "events.json").read_bytes(), pages, manifest
+
+
+def point_paths(base: Path, tsv: Path) -> None:
+    os.environ["BE_EVENT_BUILDER_TSV_PATH"] = str(tsv)
+    os.environ["BE_EVENT_BUILDER_JSON_PATH"] = str(base / "events.json")
+    event_detail_pages.EVENTS_JSON = base / "events.json"
+    event_detail_pages.EVENTS_TSV = tsv
+    event_detail_pages.EVENTS_DIR = base / "events"
+    event_detail_pages.MANIFEST_PATH = base / "event_detail_pages.json"
+
+
+def main() -> None:
+    pipeline = load_pipeline()
+    with tempfile.TemporaryDirectory(prefix="be-site-data-") as temp_dir:
+        temp = Path(temp_dir)
+        tsv = temp / "events.tsv"
+        with tsv.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=COLUMNS, delimiter="\t", lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(fixture_rows())
+
+        # Bisheriger Deploy: zwei Skripte, TSV zweimal gelesen, events.json zweimal geschrieben.
+        legacy = temp / "legacy"
+        legacy.mkdir()
+        point_paths(legacy, tsv)
+        event_builder.configure_entrypoint()
+        event_builder.main()
+        assert event_detail_pages.main([]) == 0
+        legacy_snapshot = snapshot(legacy)
+
+        single = temp / "single"
+        single.mkdir()
+        point_paths(single, tsv)
+        sitemap = single / "sitemap.xml"
+        sitemap.write_text('<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"><url><loc>https://bocholt-erleben.de/</loc></url></urlset>\n', encoding="utf-8")
+        reads = []
+        real_builder_read, real_detail_read = event_builder.read_tsv, event_detail_pages.read_tsv
+        event_builder.read_tsv = lambda path: reads.append(("builder", path)) or real_builder_read(path)
+        event_detail_pages.read_tsv = lambda path: reads.append(("detail", path)) or real_detail_read(path)
+        try:
+            assert pipeline.main(["--sitemap", str(sitemap)]) == 0
+        finally:
+            event_builder.read_tsv, event_detail_pages.read_tsv = real_builder_read, real_detail_read
+        assert reads == [("builder", tsv)], reads
+
+        single_snapshot = snapshot(single)
+        assert single_snapshot == legacy_snapshot, "single-pass build must match the two-step build"
+        events_json, pages, manifest = single_snapshot
+        assert [event["id"] for event in json.loads(events_json)] == ["textil-ausstellung-fixture", "orgelkonzert-st-georg-fixture", "stadtfest-bocholt-fixture"]
+        assert (manifest["active_count"], manifest["recent_past_count"]) == (3, 1)
+        assert "flohmarkt-rhede-fixture/index.html" in pages
+
+        sitemap_text = sitemap.read_text(encoding="utf-8")
+        assert sitemap_text.count("<loc>") == 4 and "flohmarkt-rhede-fixture" not in sitemap_text
+        assert event_detail_pages.augment_sitemap(sitemap, json.loads((single / "event_detail_pages.json").read_text(encoding="utf-8"))) == 0
+
+    print("=== Build Site Data: OK ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+spec = importlib.util.spec_from_file_location("content_ops_control_stream", ROOT / "scripts" / "content-ops-control.py")
+control = importlib.util.module_from_spec(spec)
+sys.modules["content_ops_control_stream"] = control
+spec.loader.exec_module(control)
+
+
+def issue(index: int, severity: str = "warning") -> dict:
+    return {
+        "issue_code": "event_visual_key_wrong" if index % 2 else "event_source_fact_evidence",
+        "content_type": "event",
+        "content_id": f"e{index}",
+        "title": f"Event {index}",
+        "severity": severity,
+        "process_category": "visual_resolver" if index % 2 else "source_check",
+    }
+
+
+def main() -> None:
+    issues = [issue(index) for index in range(6)] + [issue(6, "critical")]
+    header = {
+        "meta": {"scope": "daily", "generated_at": "2026-10-16T06:00:00Z"},
+        "summary": {"counts": {"warning": 6, "critical": 1}},
+        "observations_summary": {"total": 0},
+    }
+    with tempfile.TemporaryDirectory(prefix="be-content-audit-stream-") as temp_name:
+        temp = Path(temp_name)
+        report_path = temp / "content-quality-report.json"
+        issues_path = temp / "content-quality-issues.ndjson"
+        report_path.write_text(json.dumps({**header, "issues": issues}), encoding="utf-8")
+        issues_path.write_text("\n".join(json.dumps(row) for row in [{"_report": header}, *issues]) + "\n", encoding="utf-8")
+
+        from_report = control.normalize_content_audit(report_path)
+        streamed = control.normalize_content_audit(report_path, issues_path)
+        assert [asdict(item) for item in streamed.metrics] == [asdict(item) for item in from_report.metrics]
+        assert [asdict(item) for item in streamed.findings] == [asdict(item) for item in from_report.findings]
+        assert streamed.summary["issue_total"] == 7 and streamed.status == "technical_or_content_attention"
+
+        # Observation findings are capped while streaming; tasks and counters stay complete.
+        control.MAX_OBSERVATION_FINDINGS = 2
+        capped = control.normalize_content_audit(report_path, issues_path)
+        assert len(capped.findings) == 3 and sum(item.user_action_required for item in capped.findings) == 1
+        assert capped.summary["observation_findings_dropped"] == 4
+        assert capped.summary["decision_class_counts"] == from_report.summary["decision_class_counts"]
+
+        # Without --issues-ndjson the stream is looked up next to --report-json, never at the data/ default.
+        assert control.issues_ndjson_for_report(report_path) == issues_path
+        assert control.issues_ndjson_for_report(temp / "audit.json") == temp / "audit.issues.ndjson"
+        other_report = temp / "staging" / "content-quality-report.json"
+        other_report.parent.mkdir()
+        other_report.write_text(json.dumps({**header, "issues": issues[:2]}), encoding="utf-8")
+        os.utime(other_report, (1, 1))
+        args = argparse.Namespace(mode="record-audit", report_json=str(other_report), issues_ndjson=None)
+        assert control.resolve_payload(args).summary["issue_total"] == 2
+        args.report_json = str(report_path)
+        assert control.resolve_payload(args).summary["issue_total"] == 7
+
+        # An NDJSON file older than the report comes from an earlier audit and is ignored.
+        report_path.write_text(json.dumps({**header, "issues": issues[:1]}), encoding="utf-8")
+        os.utime(issues_path, (1, 1))
+        assert control.normalize_content_audit(report_path, issues_path).summary["issue_total"] == 1
+    print("Content audit issue stream: OK")
+
+
+if __name__ == "__main__":
+    main()
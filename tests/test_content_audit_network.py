@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import importlib.util
+import sys
+import threading
+import time
+from dataclasses import asdict
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+SLOW_SECONDS = 0.2
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Local stand-in for event source pages: status codes, redirects, HEAD refusal and latency."""
+
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    requests: list[tuple[str, str]] = []
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return
+
+    def _serve(self, method: str) -> None:
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+            cls.requests.append((method, self.path))
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(SLOW_SECONDS)
+            if self.path.startswith("/missing"):
+                self.send_response(404)
+                self.end_headers()
+                return
+            if self.path.startswith("/redirect"):
+                self.send_response(302)
+                self.send_header("Location", "/ok")
+                self.end_headers()
+                return
+            if self.path.startswith("/head-refused") and method == "HEAD":
+                self.send_response(405)
+                self.end_headers()
+                return
+            etag = '"cityart-v1"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            body = "<html><body><h1>Kunstmarkt CityArt</h1><p>30.08.2026 ab 11:00 Uhr, Marktplatz Bocholt</p></body></html>".encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            if method == "GET":
+                self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self._serve("HEAD")
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._serve("GET")
+
+
+def load_audit_module():
+    spec = importlib.util.spec_from_file_location("content_quality_audit", ROOT / "scripts" / "content-quality-audit.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def reset(module) -> None:
+    module.URL_CHECK_CACHE.clear()
+    module.SOURCE_TEXT_CACHE.clear()
+    StandInHandler.requests.clear()
+    StandInHandler.max_in_flight = 0
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    module = load_audit_module()
+    module.log_checkpoint = lambda message: None
+    try:
+        paths = ["/ok", "/missing", "/redirect", "/head-refused", "/slow/1", "/slow/2"]
+        urls = [base + path for path in paths]
+
+        reset(module)
+        sequential = {url: module.check_url(url) for url in urls}
+        assert sequential[base + "/ok"] == ("ok", "200")
+        assert sequential[base + "/missing"] == ("critical", "404")
+        assert sequential[base + "/redirect"][0] == "redirect"
+        assert sequential[base + "/head-refused"] == ("ok", "200")
+
+        reset(module)
+        stats = module.prefetch_network_checks(urls + urls, [base + "/ok"], workers=4, per_host=2, host_delay=0.0)
+        assert stats == {"check_urls": len(urls), "text_urls": 1, "hosts": 1}, stats
+        assert StandInHandler.max_in_flight <= 2, StandInHandler.max_in_flight
+        served = len(StandInHandler.requests)
+        assert {url: module.check_url(url) for url in urls} == sequential
+        assert module.text_probe_url(base + "/ok")[0] == "ok"
+        assert len(StandInHandler.requests) == served, "prefetched URLs must not be requested again"
+
+        slow_urls = [f"{base}/slow/{position}" for position in range(8)]
+        reset(module)
+        started = time.perf_counter()
+        module.prefetch_network_checks(slow_urls, workers=8, per_host=8, host_delay=0.0)
+        parallel_seconds = time.perf_counter() - started
+        assert parallel_seconds < len(slow_urls) * SLOW_SECONDS / 2, parallel_seconds
+
+        reset(module)
+        started = time.perf_counter()
+        module.prefetch_network_checks([f"{base}/ok/{position}" for position in range(3)], workers=3, per_host=3, host_delay=0.1)
+        assert time.perf_counter() - started >= 0.2, "politeness delay must space request starts per host"
+
+        today = date.today()
+        rows = [
+            {"id": f"event-{position}", "title": "Kunstmarkt CityArt", "date": (today + timedelta(days=position)).isoformat(), "city": "Bocholt", "location": "Marktplatz", "kategorie": "Kultur", "url": base + path}
+            for position, path in enumerate(paths * 2)
+        ]
+        check_urls, text_urls = module.event_network_targets(rows, {}, today, 14, "daily")
+        assert check_urls == [row["url"] for row in rows] and text_urls == check_urls
+
+        def run_audit(prefetch: bool) -> list[dict]:
+            reset(module)
+            module.AI_VERIFICATION_CANDIDATES.clear()
+            if prefetch:
+                module.prefetch_network_checks(check_urls, text_urls, workers=6, per_host=3, host_delay=0.0)
+            issues = module.audit_event_rows(rows, "fixture", {}, {}, today, 14, "daily", True, "https://bocholt-erleben.de")
+            return [asdict(item) for item in issues]
+
+        assert run_audit(False) == run_audit(True), "prefetch must not change the audit output"
+
+        with tempfile.TemporaryDirectory(prefix="be-http-evidence-cache-") as temp_dir:
+            cache_path = Path(temp_dir) / "content-http-evidence-cache.json"
+            started_at = datetime(2026, 10, 1, 8, 0, tzinfo=timezone.utc)
+            cached_urls = [base + "/ok", base + "/missing", base + "/redirect"]
+
+            def cached_run(now: datetime) -> tuple[dict, list[tuple[str, str]]]:
+                reset(module)
+                module.HTTP_EVIDENCE_CACHE = module.HttpEvidenceCache.load(cache_path, now=now)
+                results = {url: module.check_url(url) for url in cached_urls}
+                results["text"] = module.text_probe_url(base + "/ok")
+                module.HTTP_EVIDENCE_CACHE.save()
+                return results, list(StandInHandler.requests)
+
+            first, first_requests = cached_run(started_at)
+            assert first[base + "/ok"] == sequential[base + "/ok"] and first[base + "/missing"] == ("critical", "404")
+            assert first["text"][0] == "ok" and "cityart" in first["text"][2].tokens
+            stored = cache_path.read_text(encoding="utf-8")
+            assert "cityart-v1" in stored and "Marktplatz" not in stored, "text must be stored compressed"
+
+            fresh, fresh_requests = cached_run(started_at + timedelta(hours=1))
+            assert fresh == first and fresh_requests == [], fresh_requests
+
+            stale, stale_requests = cached_run(started_at + timedelta(hours=100))
+            assert stale == first
+            assert ("HEAD", "/ok") in stale_requests and ("GET", "/ok") in stale_requests
+            assert module.HTTP_EVIDENCE_CACHE.stats["check_not_modified"] >= 1
+            assert module.HTTP_EVIDENCE_CACHE.stats["text_not_modified"] == 1
+            module.HTTP_EVIDENCE_CACHE = module.HttpEvidenceCache()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("=== Content Audit Network Prefetch: OK ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import gzip
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPT = ROOT / "scripts" / "content-ops-http-ingest.py"
+TOKEN = "test-token"
+
+
+class IngestStandIn(ThreadingHTTPServer):
+    """Python stand-in for api/content-ops-ingest.php: gzip/NDJSON bulk, confirmed fingerprints, scripted failures."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), IngestHandler)
+        self.requests: List[Dict[str, Any]] = []
+        self.fail_next: List[int] = []
+        self.legacy = False  # old endpoint: plain JSON only
+
+
+class IngestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: IngestStandIn
+
+    def log_message(self, *_: Any) -> None:
+        return None
+
+    def respond(self, status: int, data: Dict[str, Any]) -> None:
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 503:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        raw = self.rfile.read(int(self.headers.get("Content-Length", "0")))
+        bulk = "x-ndjson" in self.headers.get("Content-Type", "")
+        self.server.requests.append({"port": self.client_address[1], "bulk": bulk, "gzip": self.headers.get("Content-Encoding") == "gzip"})
+        if self.headers.get("X-BE-Content-Ops-Token") != TOKEN:
+            return self.respond(401, {"status": "error"})
+        if self.server.fail_next:
+            return self.respond(self.server.fail_next.pop(0), {"status": "error"})
+        if bulk and self.server.legacy:
+            return self.respond(400, {"status": "error", "message": "Invalid JSON."})
+        if self.headers.get("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+        runs = [json.loads(line) for line in raw.splitlines() if line.strip()] if bulk else [json.loads(raw)]
+        data: Dict[str, Any] = {"status": "ok", "stored_runs": len(runs)}
+        if not self.server.legacy:
+            data["confirmed"] = [run["run_fingerprint"] for run in runs]
+        self.respond(200, data)
+
+
+def run_ingest(server: IngestStandIn, inputs: Path, ledger: Path, *extra: str) -> List[Dict[str, Any]]:
+    url = f"http://127.0.0.1:{server.server_address[1]}/content-ops-ingest.php"
+    proc = subprocess.run(
+        [sys.executable, str(SCRIPT), "--input", str(inputs), "--url", url, "--token", TOKEN,
+         "--ledger", str(ledger), "--backoff", "0.01", "--fail-on-error", *extra],
+        capture_output=True, text=True, check=True,
+    )
+    return [json.loads(line) for line in proc.stdout.splitlines() if line.startswith("{")]
+
+
+def main() -> None:
+    server = IngestStandIn()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with tempfile.TemporaryDirectory(prefix="be-content-ops-ingest-") as temp_name:
+            temp = Path(temp_name)
+            inputs = temp / "content-ops"
+            inputs.mkdir()
+            for index, mode in enumerate(["audit", "growth", "weekly_ki"]):
+                (inputs / f"{mode}-latest.json").write_text(json.dumps({"run_fingerprint": f"fp{index}", "source_mode": mode, "metrics": []}))
+            ledger = temp / "ledger.json"
+
+            server.fail_next = [503]
+            rows = run_ingest(server, inputs, ledger, "--bulk")
+            assert [row["result"] for row in rows] == ["persisted_http_ingest_bulk"] * 3
+            assert len(server.requests) == 2 and all(req["bulk"] and req["gzip"] for req in server.requests), server.requests
+            assert len({req["port"] for req in server.requests}) == 1, "retry reuses the keep-alive connection"
+            assert rows[0]["attempts"] == 2
+
+            server.requests.clear()
+            rows = run_ingest(server, inputs, ledger, "--bulk")
+            assert server.requests == [] and {row["result"] for row in rows} == {"skipped_already_confirmed"}
+
+            # Entries without a fingerprint (older ledgers) are dropped instead of matching anything.
+            stale = json.loads(ledger.read_text())
+            for confirmed in stale["endpoints"].values():
+                confirmed[""] = "2026-01-01T00:00:00Z"
+            ledger.write_text(json.dumps(stale))
+
+            # An endpoint without NDJSON support answers 400; the payloads go out one by one instead.
+            server.legacy = True
+            (inputs / "inbox-latest.json").write_text(json.dumps({"run_fingerprint": "fp3", "source_mode": "inbox_cleanup"}))
+            rows = run_ingest(server, inputs, ledger, "--bulk")
+            assert [req["bulk"] for req in server.requests] == [True, False]
+            assert [row["result"] for row in rows if row["run_fingerprint"] == "fp3"] == ["persisted_http_ingest"]
+            endpoints = json.loads(ledger.read_text())["endpoints"]
+            assert [sorted(confirmed) for confirmed in endpoints.values()] == [["fp0", "fp1", "fp2", "fp3"]]
+    finally:
+        server.shutdown()
+    print("Content Ops bulk ingest: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import copy
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import content_ops_decisions as decisions  # noqa: E402
+import content_ops_visual_feedback as visual  # noqa: E402
+
+# Erwartungen stammen aus den Klassifikatoren vor der Tabellen-Kompilierung (Vergleich ueber Text-Blob/Meta-Kopien).
+GOLDEN = ROOT / "tests" / "fixtures" / "content_ops_contract_golden.json"
+
+
+def covered_values(rows: list[dict]) -> set[str]:
+    return {decisions.norm_token(value) for row in rows for value in row.values()}
+
+
+def main() -> None:
+    golden = json.loads(GOLDEN.read_text(encoding="utf-8"))
+    today = date.fromisoformat(golden["today"])
+    decision_contract = decisions.load_decision_contract()
+    visual_contract = visual.load_visual_feedback_contract()
+
+    decision_rows = [case["row"] for case in golden["decision"]]
+    visual_rows = [case["row"] for case in golden["visual"]]
+    assert set(decision_contract["decision_classes"]) <= covered_values(decision_rows), "every decision class has a case"
+    assert set(decision_contract["status_aliases"]) <= covered_values(decision_rows), "every status alias has a case"
+    assert set(visual_contract["problem_types"]) <= covered_values(visual_rows), "every problem type has a case"
+    visual_text = " ".join(sorted(covered_values(visual_rows)))
+    missing_tokens = [token for _, _, tokens in visual.VISUAL_TEXT_RULES for token in tokens if token not in visual_text]
+    assert not missing_tokens, f"text rule tokens without a case: {missing_tokens}"
+
+    decisions.clear_decision_caches()
+    visual.clear_visual_caches()
+    for _ in range(2):  # zweiter Durchlauf trifft die Memos
+        for case in golden["decision"]:
+            assert decisions.target_effect(case["row"], today) == case["effect"], case["row"]
+            assert decisions.is_suppression_active(case["row"], today) == case["effect"]["suppress"], case["row"]
+            assert decisions.resolve_decision_class(case["row"]) == case["effect"]["decision_class"], case["row"]
+        for case in golden["visual"]:
+            assert visual.classify_visual_issue(case["row"]) == case["result"], case["row"]
+    assert decisions.decision_cache_stats()["effect_memo"]["hits"] >= len(golden["decision"])
+    assert visual.visual_cache_stats()["classify_memo"]["hits"] >= len(golden["visual"])
+
+    # Wechselnde Vertragsobjekte: Ergebnis bleibt gleich, es bleibt nur die letzte Kompilierung im Speicher.
+    for _ in range(3):
+        decision_copy = copy.deepcopy(decision_contract)
+        visual_copy = copy.deepcopy(visual_contract)
+        assert decisions.decision_tables(decision_copy) is decisions.decision_tables(decision_copy)
+        assert decisions.target_effect(golden["decision"][5]["row"], today, decision_copy) == golden["decision"][5]["effect"]
+        assert visual.classify_visual_issue(golden["visual"][5]["row"], visual_copy) == golden["visual"][5]["result"]
+    assert len(decisions._COMPILED) == 1 and len(visual._COMPILED) == 1
+
+    print("Content Ops contract golden: OK")
+
+
+if __name__ == "__main__":
+    main()
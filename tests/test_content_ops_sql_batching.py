@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+spec = importlib.util.spec_from_file_location("content_ops_control_sql", ROOT / "scripts" / "content-ops-control.py")
+control = importlib.util.module_from_spec(spec)
+sys.modules["content_ops_control_sql"] = control
+spec.loader.exec_module(control)
+
+
+class FakeDatabase:
+    """DB-API stand-in: records statements and keeps the schema version row across connections."""
+
+    def __init__(self, fail_on: str = "") -> None:
+        self.schema_version: Optional[str] = None
+        self.executed: List[str] = []
+        self.batches: List[Tuple[str, int]] = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.fail_on = fail_on
+
+    def connect(self) -> "FakeConnection":
+        return FakeConnection(self)
+
+
+class FakeCursor:
+    def __init__(self, db: FakeDatabase) -> None:
+        self.db = db
+        self.row: Any = None
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        return None
+
+    def execute(self, statement: str, params: Tuple[Any, ...] = ()) -> None:
+        text = " ".join(statement.split())
+        self.db.executed.append(text)
+        if text.startswith("SELECT schema_version"):
+            if self.db.schema_version is None:
+                raise RuntimeError("Table 'content_ops_schema_version' doesn't exist")
+            self.row = (self.db.schema_version,)
+        elif text.startswith("INSERT INTO content_ops_schema_version"):
+            self.db.schema_version = params[1]
+
+    def fetchone(self) -> Any:
+        return self.row
+
+    def executemany(self, statement: str, rows: List[Tuple[Any, ...]]) -> None:
+        table = statement.split("INSERT INTO", 1)[1].split()[0]
+        if table == self.db.fail_on:
+            raise RuntimeError("Deadlock found")
+        self.db.batches.append((table, len(rows)))
+
+
+class FakeConnection:
+    def __init__(self, db: FakeDatabase) -> None:
+        self.db = db
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self.db)
+
+    def commit(self) -> None:
+        self.db.commits += 1
+
+    def rollback(self) -> None:
+        self.db.rollbacks += 1
+
+    def close(self) -> None:
+        return None
+
+
+def payload() -> Any:
+    return control.RunPayload(
+        source_mode="audit",
+        metrics=[control.Metric(f"content.audit.m{index}", index) for index in range(7)],
+        findings=[control.Finding("missing_image", entity_id=f"e{index}", user_action_required=index == 0) for index in range(3)],
+        rule_effects=[control.RuleEffect("rule-a", "search_feedback", "skip")],
+    )
+
+
+def main() -> None:
+    db = FakeDatabase()
+    first = control.write_sql(db.connect(), payload(), batch_rows=5)
+    assert first.status == "persisted_sql" and first.schema_applied
+    assert sum(text.startswith("CREATE TABLE") for text in db.executed) == len(control.SCHEMA_SQL) + 1
+    assert db.batches == [
+        ("content_ops_run", 1),
+        ("content_ops_metric_daily", 5),
+        ("content_ops_metric_daily", 2),
+        ("content_ops_action_log", 3),
+        ("feedback_rule_effectiveness_daily", 1),
+    ], db.batches
+    assert first.tables["content_ops_metric_daily"].rows == 7 and first.tables["content_ops_metric_daily"].batches == 2
+    assert db.commits == 2 and db.rollbacks == 0, "one commit after DDL, one for all rows"
+    assert any("content_ops_action_log: `3 rows" in line for line in first.summary_lines())
+
+    # Same schema version: a single SELECT, no DDL.
+    db.executed.clear()
+    second = control.persist_sql(payload(), connect=db.connect)
+    assert not second.schema_applied and db.executed == [db.executed[0]] and db.executed[0].startswith("SELECT")
+
+    failing = FakeDatabase(fail_on="content_ops_action_log")
+    failing.schema_version = control.SCHEMA_VERSION
+    result = control.persist_sql(payload(), connect=failing.connect)
+    assert result.status.startswith("skipped_sql_error:RuntimeError"), result.status
+    assert failing.rollbacks == 1 and failing.commits == 1, "data transaction is rolled back as a whole"
+
+    # The run row keeps the findings the stream already capped; a task late in the list is not cut off.
+    large = payload()
+    large.findings = [control.Finding("missing_image", entity_id=f"e{index}", user_action_required=index == 349) for index in range(350)]
+    run_table, _, run_rows = control.sql_rows(large)[0]
+    stored = json.loads(run_rows[0][-1])
+    assert run_table == "content_ops_run" and len(stored) == 350 and stored[-1]["user_action_required"]
+    print("Content Ops SQL batching: OK")
+
+
+if __name__ == "__main__":
+    main()
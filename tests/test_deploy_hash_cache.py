@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SPEC = importlib.util.spec_from_file_location(
+    "deploy_plan_hash_cache", ROOT / "scripts" / "prepare_deploy_delta.py"
+)
+deploy_plan = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(deploy_plan)
+
+
+def write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def require(condition: bool, message: str) -> None:
+    if not condition:
+        raise AssertionError(message)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory(prefix="be-deploy-hash-cache-") as temp_name:
+        temp = Path(temp_name)
+        source = temp / "deploy"
+        write(source / "index.html", "<main>Bocholt erleben</main>")
+        write(source / "service-worker.js", "// worker\n")
+        write(source / "meta/build.txt", "abc123\n")
+        for position in range(12):
+            write(source / f"assets/visuals/event-{position}.svg", f"<svg>{position}</svg>")
+        remote = temp / "remote.json"
+        write(remote, "{}\n")
+        cache = temp / "cache/deploy-hash-cache.json"
+
+        def run(name: str, **options) -> tuple[dict, bytes]:
+            output_root = temp / name
+            output_root.mkdir()
+            summary = deploy_plan.prepare_deploy_plan(
+                source=source,
+                remote_manifest=remote,
+                mode="full",
+                build_id="abc123",
+                environment="staging",
+                output_root=output_root,
+                precompress_min_bytes=None,
+                **options,
+            )
+            return summary, (output_root / "deploy-manifest/meta/deploy-manifest.json").read_bytes()
+
+        _, cold_manifest = run("cold")
+        first, first_manifest = run("first", hash_cache=cache, hash_jobs=3)
+        require(first_manifest == cold_manifest, "cached run must produce the identical manifest")
+        require(first["hash_cache"]["misses"] == 15 and first["hash_cache"]["hits"] == 0, "empty cache hashes all files")
+
+        second, second_manifest = run("second", hash_cache=cache)
+        require(second_manifest == cold_manifest, "warm cache must produce the identical manifest")
+        # The service worker is restamped on every run and therefore always rehashed.
+        require(second["hash_cache"]["hits"] == 14 and second["hash_cache"]["misses"] == 1, "unchanged files must hit")
+
+        visual = source / "assets/visuals/event-3.svg"
+        stat = visual.stat()
+        write(visual, "<svg>X</svg>")
+        os.utime(visual, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        require(deploy_plan.stat_key(visual) == json.loads(cache.read_text(encoding="utf-8"))["files"]["assets/visuals/event-3.svg"]["stat"], "fixture must fake an unchanged stat key")
+        verified, verified_manifest = run("verified", hash_cache=cache, verify_cache=100)
+        require(verified["hash_cache"]["stale"] == 1, "verify mode must detect the stale entry")
+        require(verified["hash_cache"]["hits"] == 0, "a stale sample discards the cache for the run")
+        require(
+            json.loads(verified_manifest)["files"]["assets/visuals/event-3.svg"] == deploy_plan.sha256(visual),
+            "manifest must hash the real content after a stale cache",
+        )
+
+    print("Deploy hash cache contract: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import json
+import random
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SPEC = importlib.util.spec_from_file_location(
+    "deploy_plan_precompression", ROOT / "scripts" / "prepare_deploy_delta.py"
+)
+deploy_plan = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(deploy_plan)
+
+
+def write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def require(condition: bool, message: str) -> None:
+    if not condition:
+        raise AssertionError(message)
+
+
+def plan(source: Path, remote: dict, mode: str, output_root: Path) -> tuple[dict, dict]:
+    remote_path = output_root / "remote.json"
+    output_root.mkdir(parents=True, exist_ok=True)
+    write(remote_path, json.dumps(remote) + "\n")
+    summary = deploy_plan.prepare_deploy_plan(
+        source=source,
+        remote_manifest=remote_path,
+        mode=mode,
+        build_id="abc123",
+        environment="staging",
+        output_root=output_root,
+    )
+    manifest = json.loads((output_root / "deploy-manifest/meta/deploy-manifest.json").read_text(encoding="utf-8"))
+    return summary, manifest
+
+
+def main() -> None:
+    events = json.dumps([{"id": f"event-{n}", "title": "Konzert im Stadttheater", "city": "Bocholt"} for n in range(60)])
+    page = "<!doctype html><main>" + "<p>Bocholt erleben</p>" * 120 + "</main>"
+    with tempfile.TemporaryDirectory(prefix="be-deploy-precompress-") as temp_name:
+        temp = Path(temp_name)
+        source = temp / "deploy"
+        write(source / "data/events.json", events)
+        write(source / "events/index.html", page)
+        write(source / "css/home.css", ".event-card{}")
+        write(source / "img/logo.png", "x" * 4096)
+        write(source / "service-worker.js", "// worker\n" * 400)
+        write(source / "meta/build.txt", "abc123\n")
+        write(source / "api/_config.php", "<?php return [];\n")
+        noise = source / "data/noise.txt"
+        noise.write_bytes(random.Random(16).randbytes(4096))
+
+        full, first_manifest = plan(source, {}, "full", temp / "full")
+        gz = temp / "full/deploy-assets/data/events.json.gz"
+        require(gz.is_file(), "large JSON must get a .gz sibling in its phase")
+        require(gzip.decompress(gz.read_bytes()).decode("utf-8") == events, "gzip sibling must round-trip")
+        require((temp / "full/deploy-entry/events/index.html.gz").is_file(), "HTML sibling belongs to the entry phase")
+        require(not (temp / "full/deploy-assets/css/home.css.gz").exists(), "small files stay uncompressed")
+        require(not (temp / "full/deploy-assets/img/logo.png.gz").exists(), "binary assets stay uncompressed")
+        require(full["phases"]["worker"] == ["service-worker.js"], "worker phase must stay a single file")
+        require(full["phases"]["marker"] == ["meta/build.txt"], "marker phase must stay a single file")
+        require("data/events.json.gz" in full["phases"]["assets"], "sibling must be listed in its phase")
+        require(
+            first_manifest["files"]["data/events.json.gz"] == deploy_plan.sha256(gz),
+            "manifest must hash the compressed sibling",
+        )
+        report = full["precompression"]["phases"]["assets"]
+        require(report["files"] == 1 and report["raw_bytes"] == len(events.encode("utf-8")), "report counts raw bytes")
+        require(report["saved_gzip_bytes"] == report["raw_bytes"] - gz.stat().st_size > 0, "report must state bytes saved")
+
+        require(not (temp / "full/deploy-assets/data/noise.txt.gz").exists(), "siblings that are not smaller are skipped")
+        require(
+            first_manifest["skipped_siblings"]["data/noise.txt.gz"] == first_manifest["files"]["data/noise.txt"],
+            "skipped siblings are recorded with the source hash",
+        )
+
+        same, same_manifest = plan(source, first_manifest, "delta", temp / "same")
+        require(not (temp / "same/deploy-assets/data/events.json.gz").exists(), "unchanged source must not recompress")
+        require(same["precompression"]["phases"] == {}, "unchanged run has nothing to compress")
+        require(same["precompression"]["reused_siblings"] >= 2, "unchanged siblings keep their remote hashes")
+        require(same["deleted"] == 0, "unchanged siblings must not be scheduled for deletion")
+        require(same_manifest["files"]["data/events.json.gz"] == first_manifest["files"]["data/events.json.gz"], "hash carried over")
+        require(same_manifest["skipped_siblings"] == first_manifest["skipped_siblings"], "skip records carry over for unchanged sources")
+        require(same["precompression"]["skipped_siblings"] == len(first_manifest["skipped_siblings"]), "summary counts skipped siblings")
+
+        noise.write_bytes(random.Random(17).randbytes(4096))
+        retry, retry_manifest = plan(source, same_manifest, "delta", temp / "retry")
+        require(
+            retry_manifest["skipped_siblings"]["data/noise.txt.gz"] == retry_manifest["files"]["data/noise.txt"] != same_manifest["files"]["data/noise.txt"],
+            "a changed incompressible source is checked again and its skip record follows the new hash",
+        )
+        require(retry["precompression"]["phases"] == {}, "skipped siblings do not count as compressed bytes")
+
+        write(source / "data/events.json", events.replace("Konzert", "Lesung"))
+        (source / "events/index.html").unlink()
+        changed, _ = plan(source, same_manifest, "delta", temp / "changed")
+        require(changed["phases"]["assets"].count("data/events.json.gz") == 1, "changed source must recompress")
+        delete_script = (temp / "changed/deploy-delete.lftp").read_text(encoding="utf-8")
+        require('rm -f "events/index.html.gz"' in delete_script, "siblings of removed files must be deleted remotely")
+
+        disabled = deploy_plan.prepare_deploy_plan(
+            source=source,
+            remote_manifest=temp / "full/remote.json",
+            mode="full",
+            build_id="abc123",
+            environment="staging",
+            output_root=temp / "disabled",
+            precompress_min_bytes=None,
+        )
+        require(not any(name.endswith(".gz") for files in disabled["phases"].values() for name in files), "--no-precompress writes no siblings")
+
+    print("Deploy precompression contract: OK")
+
+
+if __name__ == "__main__":
+    main()
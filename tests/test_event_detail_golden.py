@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+GOLDEN_DIR = ROOT / "tests" / "fixtures" / "event_detail_golden"
+# Gerenderte Seiten liegen als *.html.golden, damit Repo-weite HTML-Audits (CSS-Governance) sie nicht als Seiten pruefen.
+
+
+def load_builder():
+    spec = importlib.util.spec_from_file_location("build_event_detail_pages_golden", ROOT / "scripts" / "event_detail_pages.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> None:
+    module = load_builder()
+    fixture = json.loads((GOLDEN_DIR / "cases.json").read_text(encoding="utf-8"))
+    module.SITE_ORIGIN = fixture["site_origin"]
+    visual_index = fixture["visual_index"]
+    seen: set[str] = set()
+    for case in fixture["cases"]:
+        event = module.build_detail_event(dict(case["raw"]), case["is_past"], case["noindex"], visual_index)
+        assert event, case["raw"]["id"]
+        golden = GOLDEN_DIR / f"{event.slug}.html.golden"
+        rendered = module.render_page(event).encode("utf-8")
+        if rendered != golden.read_bytes():
+            expected = golden.read_text(encoding="utf-8").splitlines()
+            actual = rendered.decode("utf-8").splitlines()
+            line = next((pos for pos, (a, b) in enumerate(zip(expected, actual)) if a != b), min(len(expected), len(actual)))
+            raise AssertionError(f"{golden.name} differs at line {line + 1}: {actual[line:line + 1]!r} != {expected[line:line + 1]!r}")
+        seen.add(golden.name)
+    assert seen == {path.name for path in GOLDEN_DIR.glob("*.html.golden")}, "every golden page needs a case"
+
+    # Bildauswahl aus dem Visual-Pool: exaktes Motiv, Fallback-Rolle, erstes Bild, Default ohne Pool.
+    heroes = {
+        "chorkonzert-liebfrauen-2026-11-15": ("/assets/event-visuals/music-concert-choir-01-16x9.webp", "Chor in einer Kirche"),
+        "jazzabend-kulturort-2026-11-20": ("/assets/event-visuals/music-concert-fallback-01-16x9.webp", "Notenständer &amp; Instrumente"),
+        "trodelmarkt-aasee-2026-09-27": ("/assets/event-visuals/market-flea-stalls-01-16x9.webp", "Symbolisches Eventbild zu Trödelmarkt am Aasee"),
+        "kinderflohmarkt-rathaus-2026-10-25": ("/assets/event-visuals/market-flea-crates-01-16x9.webp", "Kisten mit &quot;Schätzen&quot; &lt;alt&gt;"),
+        "stadtlauf-2026-09-06": ("/assets/event-visuals/default-city-02-16x9.webp", "Symbolisches Stadtmotiv für Bocholt erleben"),
+    }
+    for slug, (src, alt) in heroes.items():
+        page = (GOLDEN_DIR / f"{slug}.html.golden").read_text(encoding="utf-8")
+        assert f'<img class="event-detail-media__img" src="{src}" alt="{alt}"' in page, slug
+        assert f'<meta property="og:image" content="{fixture["site_origin"]}{src}">' in page, slug
+
+    template = module.page_template(module.STYLE_VERSION, module.DETAIL_PAGE_CSS_VERSION)
+    assert template is module.page_template(module.STYLE_VERSION, module.DETAIL_PAGE_CSS_VERSION), "skeleton must be compiled once"
+    assert "{{" not in template.pattern and module.STYLE_VERSION in template.pattern
+    assert "share_text" in template.slots and "style_version" not in template.slots
+
+    print("=== Event Detail Golden Pages: OK ===")
+
+
+if __name__ == "__main__":
+    main()
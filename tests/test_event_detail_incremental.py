@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+OLD_MTIME_NS = 1_600_000_000_000_000_000
+
+
+def load_builder():
+    spec = importlib.util.spec_from_file_location("build_event_detail_pages_incremental", ROOT / "scripts" / "event_detail_pages.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def page_files(events_dir: Path) -> dict[str, tuple[bytes, int]]:
+    return {
+        str(path.relative_to(events_dir)): (path.read_bytes(), path.stat().st_mtime_ns)
+        for path in sorted(events_dir.rglob("*"))
+        if path.is_file()
+    }
+
+
+def age_files(events_dir: Path) -> None:
+    for path in events_dir.rglob("*"):
+        if path.is_file():
+            os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+
+def main() -> None:
+    module = load_builder()
+    start = date.today() + timedelta(days=10)
+    events = [
+        {"id": f"fixture-{position}", "title": f"Fixture Konzert {position}", "date": (start + timedelta(days=position)).isoformat(), "time": "19:00", "location": "Stadttheater", "city": "Bocholt", "category": "Musik"}
+        for position in range(4)
+    ]
+    with tempfile.TemporaryDirectory(prefix="be-event-detail-incremental-") as temp_dir:
+        temp = Path(temp_dir)
+        module.EVENTS_JSON = temp / "events.json"
+        module.EVENTS_TSV = temp / "events.tsv"
+        module.EVENTS_DIR = temp / "events"
+        module.MANIFEST_PATH = temp / "event_detail_pages.json"
+        manual_dir = module.EVENTS_DIR / "handgepflegt"
+        manual_dir.mkdir(parents=True)
+        (manual_dir / "index.html").write_text("manuell\n", encoding="utf-8")
+
+        def build(rows: list[dict], *argv: str) -> dict[str, tuple[bytes, int]]:
+            module.EVENTS_JSON.write_text(json.dumps(rows, ensure_ascii=False), encoding="utf-8")
+            assert module.main(list(argv)) == 0
+            return page_files(module.EVENTS_DIR)
+
+        first = build(events)
+        slugs = [page["slug"] for page in json.loads(module.MANIFEST_PATH.read_text(encoding="utf-8"))["pages"]]
+        assert len(slugs) == 4 and all(f"{slug}/index.html" in first for slug in slugs)
+        manifest = json.loads(module.MANIFEST_PATH.read_text(encoding="utf-8"))
+        assert all(len(page["hash"]) == 64 for page in manifest["pages"])
+        assert manifest["template_version"] == module.DETAIL_PAGE_TEMPLATE_VERSION
+
+        age_files(module.EVENTS_DIR)
+        aged = page_files(module.EVENTS_DIR)
+        assert build(events) == aged, "unchanged events must keep bytes and mtime"
+
+        changed = [dict(event) for event in events]
+        changed[1]["title"] = "Fixture Konzert 1 – verlegt"
+        del changed[3]
+        after_change = build(changed)
+        new_slug = json.loads(module.MANIFEST_PATH.read_text(encoding="utf-8"))["pages"][1]["slug"]
+        assert f"{slugs[3]}/index.html" not in after_change, "orphaned slug must be removed"
+        assert after_change["handgepflegt/index.html"] == aged["handgepflegt/index.html"], "non-generated folders stay untouched"
+        for slug in (slugs[0], slugs[2]):
+            assert after_change[f"{slug}/index.html"] == aged[f"{slug}/index.html"], slug
+        assert after_change[f"{new_slug}/index.html"][1] != OLD_MTIME_NS
+        assert "verlegt" in after_change[f"{new_slug}/index.html"][0].decode("utf-8")
+
+        module.DETAIL_PAGE_TEMPLATE_VERSION = "fixture-template-bump"
+        age_files(module.EVENTS_DIR)
+        bumped = build(changed)
+        assert bumped == page_files(module.EVENTS_DIR) and all(mtime == OLD_MTIME_NS for _data, mtime in bumped.values()), "identical re-render must not rewrite files"
+        assert all(page["hash"] not in {old["hash"] for old in manifest["pages"]} for page in json.loads(module.MANIFEST_PATH.read_text(encoding="utf-8"))["pages"])
+
+        full = build(changed, "--full")
+        assert {name: data for name, (data, _mtime) in full.items()} == {name: data for name, (data, _mtime) in bumped.items()}
+        sequential_manifest = json.loads(module.MANIFEST_PATH.read_text(encoding="utf-8"))["pages"]
+
+        many = [dict(event, id=f"fixture-many-{position}", title=f"Fixture Lesung {position}") for position, event in enumerate(events * 10)]
+        parallel = build([*changed, *many], "--full", "--jobs", "3")
+        parallel_manifest = json.loads(module.MANIFEST_PATH.read_text(encoding="utf-8"))["pages"]
+        sequential = build([*changed, *many], "--full")
+        assert {name: data for name, (data, _mtime) in parallel.items()} == {name: data for name, (data, _mtime) in sequential.items()}
+        assert parallel_manifest == json.loads(module.MANIFEST_PATH.read_text(encoding="utf-8"))["pages"]
+        assert parallel_manifest[:3] == sequential_manifest and len(parallel_manifest) == 43
+        assert not list(module.EVENTS_DIR.rglob("*.tmp")), "atomic writes must not leave temp files"
+
+    print("=== Event Detail Incremental Build: OK ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ import re
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
-module_path = Path(__file__).resolve().parents[1] / "scripts" / "build-event-detail-pages.py"
+module_path = Path(__file__).resolve().parents[1] / "scripts" / "event_detail_pages.py"
 spec = importlib.util.spec_from_file_location("build_event_detail_pages", module_path)
 module = importlib.util.module_from_spec(spec)
 assert spec and spec.loader
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from event_feed_shards import FEED_SHARD_NEXT_DAYS, INDEX_FIELDS, write_event_feed_shards  # noqa: E402
+
+TODAY = date(2026, 10, 16)
+FEED = [
+    {"id": "ausstellung", "title": "Textil Ausstellung", "date": "2026-09-20", "endDate": "2026-11-30", "city": "Bocholt", "location": "TextilWerk", "kategorie": "Kultur & Kunst", "description": "Lang" * 40, "visual_key": "museum_exhibition"},
+    {"id": "konzert", "title": "Orgelkonzert", "date": "2026-10-18", "time": "19:30", "city": "Bocholt", "location": "St. Georg", "kategorie": "Musik & Bühne", "recommendation": {"situation_tags": ["abends"]}},
+    {"id": "markt", "title": "Herbstmarkt", "date": "2026-10-29", "time": "10:00", "city": "Rhede", "location": "Rathausplatz", "kategorie": "Märkte & Feste"},
+    {"id": "advent", "title": "Adventsmarkt", "date": "2026-12-01", "city": "Bocholt", "location": "Markt", "kategorie": "Märkte & Feste", "ticket_offers": [{"price": 0}]},
+]
+
+
+def read_shard(out_dir: Path, entry: dict) -> list:
+    data = (out_dir / entry["path"].rsplit("/", 1)[-1]).read_bytes()
+    assert hashlib.sha256(data).hexdigest() == entry["sha256"] and entry["sha256"][:12] in entry["path"]
+    assert len(data) == entry["bytes"]
+    return json.loads(data)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory(prefix="be-event-feed-shards-") as temp_dir:
+        out_dir = Path(temp_dir) / "event-feed"
+        manifest = write_event_feed_shards(FEED, out_dir, today=TODAY)
+        assert json.loads((out_dir / "manifest.json").read_text(encoding="utf-8")) == manifest
+
+        index = read_shard(out_dir, manifest["index"])
+        assert [entry["id"] for entry in index] == [item["id"] for item in FEED]
+        assert all(set(entry) <= set(INDEX_FIELDS) for entry in index)
+        assert index[0] == {"id": "ausstellung", "date": "2026-09-20", "endDate": "2026-11-30", "kategorie": "Kultur & Kunst", "visual_key": "museum_exhibition", "title": "Textil Ausstellung"}
+
+        assert (manifest["next_days"]["from"], manifest["next_days"]["until"]) == ("2026-10-16", "2026-11-12")
+        assert read_shard(out_dir, manifest["next_days"]) == FEED[:3], "running and upcoming events within 28 days, full items"
+        months = {entry["month"]: read_shard(out_dir, entry) for entry in manifest["months"]}
+        assert months == {"2026-09": FEED[:1], "2026-10": FEED[1:3], "2026-12": FEED[3:]}
+
+        before = {path.name: path.stat().st_mtime_ns for path in out_dir.iterdir()}
+        assert write_event_feed_shards(FEED, out_dir, today=TODAY)["months"] == manifest["months"]
+        assert {name: mtime for name, mtime in before.items() if name != "manifest.json"} == {
+            path.name: path.stat().st_mtime_ns for path in out_dir.iterdir() if path.name != "manifest.json"
+        }, "unchanged shards keep their name and file"
+
+        (out_dir / "notes.txt").write_text("fremd\n", encoding="utf-8")
+        changed = [dict(FEED[0], title="Textil Ausstellung verlängert"), *FEED[1:3]]
+        updated = write_event_feed_shards(changed, out_dir, today=TODAY)
+        assert updated["index"]["path"] != manifest["index"]["path"]
+        names = {path.name for path in out_dir.iterdir()}
+        expected = {entry["path"].rsplit("/", 1)[-1] for entry in [updated["index"], updated["next_days"], *updated["months"]]}
+        assert names == expected | {"manifest.json", "notes.txt"}, "stale shards are pruned, foreign files kept"
+
+    worker = (ROOT / "service-worker.js").read_text(encoding="utf-8")
+    today_home = (ROOT / "js" / "today-home.js").read_text(encoding="utf-8")
+    assert "EVENT_FEED_SHARD_RE.test(url.pathname)" in worker and "cacheFirst(req)" in worker
+    assert "/data/event-feed/manifest.json" in today_home and 'fetchJsonNoStore("/data/events.json", false)' in today_home
+    recommendations = (ROOT / "js" / "recommendations.js").read_text(encoding="utf-8")
+    horizon = int(re.search(r"days > 7 && days <= (\d+)", recommendations).group(1))
+    min_window = int(re.search(r"EVENT_FEED_MIN_WINDOW_DAYS = (\d+);", today_home).group(1))
+    assert min_window >= horizon and FEED_SHARD_NEXT_DAYS - 1 >= min_window, "shard covers the recommendation scoring horizon"
+
+    print("=== Event Feed Shards: OK ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,85 @@
 from __future__ import annotations
 
+import dataclasses
 import json
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "scripts"))
 
-from event_identity import apply_event_identity_match, event_rows_from_sheet_values, find_best_event_match  # noqa: E402
+from event_identity import (  # noqa: E402
+    EventIdentityContract,
+    EventIdentityIndex,
+    apply_event_identity_match,
+    event_rows_from_sheet_values,
+    find_best_event_match,
+    load_event_identity_contract,
+)
 
 
 def main() -> None:
     payload = json.loads((ROOT / "tests" / "fixtures" / "event_identity_cases.json").read_text(encoding="utf-8"))
+    contract = load_event_identity_contract()
+    assert load_event_identity_contract() is contract
+    assert contract.normalizer is load_event_identity_contract().normalizer
+    assert isinstance(contract.review_threshold, float) and isinstance(contract.stopwords, frozenset)
+    try:
+        contract.review_threshold = 0.1  # type: ignore[misc]
+    except dataclasses.FrozenInstanceError:
+        pass
+    else:
+        raise AssertionError("event identity contract must be immutable")
+    raw_contract = json.loads((ROOT / "data" / "event_identity_contract.json").read_text(encoding="utf-8"))
+    assert EventIdentityContract.from_payload(raw_contract) == contract
+    with tempfile.TemporaryDirectory(prefix="be-event-identity-contract-") as temp_dir:
+        contract_path = Path(temp_dir) / "event_identity_contract.json"
+        contract_path.write_text(json.dumps(raw_contract), encoding="utf-8")
+        first = load_event_identity_contract(contract_path)
+        assert load_event_identity_contract(contract_path) is first
+        previous_mtime = contract_path.stat().st_mtime_ns
+        contract_path.write_text(json.dumps(dict(raw_contract, review_threshold=0.5)), encoding="utf-8")
+        os.utime(contract_path, ns=(previous_mtime + 1_000_000, previous_mtime + 1_000_000))
+        reloaded = load_event_identity_contract(contract_path)
+        assert reloaded is not first and reloaded.review_threshold == 0.5
+        contract_path.write_text(json.dumps(dict(raw_contract, weights={"title": 1.0, "city": 0.5})), encoding="utf-8")
+        try:
+            load_event_identity_contract(contract_path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("invalid identity weights must fail closed")
+
+    normalizer = contract.normalizer
     for case in payload["cases"]:
         match = find_best_event_match(case["candidate"], case["existing"])
         assert match["status"] == case["expected_status"], (case["name"], match)
         assert match["matched_event_id"] == case["expected_id"], (case["name"], match)
         assert float(match["score"]) >= float(case["minimum_score"]), (case["name"], match)
+        assert EventIdentityIndex(case["existing"], normalizer=normalizer).find_best(case["candidate"]) == match, case["name"]
+
+    growing_sheet = [
+        {"id": "kunstmarkt-2026-05-02", "title": "Kunstmarkt am Rathaus", "date": "2026-05-02", "city": "Bocholt", "location": "Rathaus", "url": "https://bocholt.de/kunstmarkt"},
+        {"id": "kunstmarkt-2026-05-02-b", "title": "Kunstmarkt Rathaus", "date": "2026-05-02", "city": "Bocholt", "location": "Rathaus", "url": "https://www.bocholt.de/kunstmarkt?utm_source=x"},
+        {"id": "textil-ausstellung", "title": "Textil Ausstellung Sommer", "date": "2026-03-01", "endDate": "2026-09-30", "city": "Bocholt", "location": "Textilwerk"},
+        {"id": "sommer-ausstellung-textil", "title": "Sommer Ausstellung Textil", "date": "2026-06-10", "city": "Bocholt", "location": "Textilwerk"},
+        {"id": "verdrehter-termin", "title": "Orgelnacht St. Georg", "date": "2026-07-10", "endDate": "2026-07-01", "city": "Bocholt", "location": "St. Georg"},
+        {"id": "orgelnacht", "title": "Orgelnacht St. Georg", "date": "2026-06-20", "endDate": "2026-08-20", "city": "Bocholt", "location": "St. Georg"},
+        {"id": "kunstmarkt-2026-05-02", "title": "Flohmarkt", "date": "2027-01-09", "city": "Rhede", "location": "Markt"},
+        {"id": "ohne-datum", "title": "Kunstmarkt am Rathaus", "date": "", "city": "Bocholt", "location": "Rathaus"},
+    ]
+    index = EventIdentityIndex(normalizer=normalizer)
+    for position, row in enumerate(growing_sheet):
+        assert index.find_best(row) == find_best_event_match(row, growing_sheet[:position]), row["id"]
+        index.add(row)
+    assert len(index) == len(growing_sheet)
+    assert normalizer.tokens("Bocholter Kulturtage 2026 – Kunstmarkt CityArt", title=True) == {"kunstmarkt", "cityart"}
+    assert normalizer.url("https://WWW.Bocholt.de/weinfest/?utm_source=x&fbclid=1&a=1") == "https://www.bocholt.de/weinfest/?a=1"
+    assert normalizer.host("www.bocholt.de/weinfest") == "bocholt.de"
+    stats = normalizer.cache_stats()
+    assert stats["text"]["hits"] > 0 and stats["tokens"]["hits"] > 0, stats
 
     cityart = payload["cases"][0]
     match = find_best_event_match(cityart["candidate"], cityart["existing"])
@@ -56,7 +119,8 @@ def main() -> None:
     intake_script = (ROOT / "scripts" / "manual_ki_event_intake.py").read_text(encoding="utf-8")
     assert "python scripts/manual_ki_event_intake.py" in workflow
     assert "EVENTS_TAB: Events" in workflow
-    assert "find_best_event_match(candidate, existing_events)" in intake_script
+    assert "EventIdentityIndex(existing_events, normalizer=normalizer)" in intake_script
+    assert "existing_event_index.find_best(candidate)" in intake_script
     assert "apply_event_identity_match(candidate, event_match" in intake_script
 
     sheet_source = (ROOT / "api" / "control-center" / "_sheet_inbox_source.php").read_text(encoding="utf-8")
@@ -66,6 +130,7 @@ def main() -> None:
     assert "be_cc_event_identity_enrich_current(array_replace($stored, $row), true)" in current_source
     assert "$action === 'approve'" in action and "be_cc_inbox_direct_current_source($case)" in action
 
+    print(f"Event identity cache (hits/lookups): {normalizer.cache_summary()}")
     print("Event identity Python contract: OK")
 
 
@@ -11,6 +11,7 @@ sys.modules['content_ops_visual_feedback']=feedback_stub
 stub=types.ModuleType('event_visual_motifs')
 stub.infer_event_visual_fit=lambda **kwargs:{}
 stub.load_event_visual_pool=lambda:{}
+stub.EventVisualPoolIndex=lambda payload:payload
 sys.modules['event_visual_motifs']=stub
 path=ROOT/'scripts'/'build-event-visual-gap-backlog.py'
 spec=importlib.util.spec_from_file_location('visual_gap_builder',path)
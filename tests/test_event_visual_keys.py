@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from event_visual_keys import (  # noqa: E402
+    CATEGORY_VISUAL_KEY_FALLBACKS,
+    COMPILED_EVENT_VISUAL_KEY_RULES,
+    EVENT_VISUAL_KEY_RULES,
+    CompiledVisualKeyRules,
+    infer_event_visual_key,
+)
+
+# Erwartungen stammen aus infer_event_visual_key vor der Regel-Kompilierung (sequenzielle re.search-Kette).
+GOLDEN = ROOT / "tests" / "fixtures" / "event_visual_key_golden.json"
+
+
+def golden_cases() -> list[tuple[str, str, str, str, str]]:
+    golden = json.loads(GOLDEN.read_text(encoding="utf-8"))
+    assert golden["fields"] == ["title", "description", "category", "location", "visual_key"]
+    return [tuple(case) for case in golden["cases"]]
+
+
+def main() -> None:
+    from event_visual_motifs import (
+        EventVisualPoolIndex,
+        VisualClassifier,
+        event_visual_pool_index,
+        infer_event_visual_fit,
+        infer_event_visual_motif,
+        invalidate_event_visual_pool_index,
+        load_event_visual_pool_index,
+        ready_motifs_for_key,
+    )
+
+    golden = golden_cases()
+    rule_keys = {key for key, _ in EVENT_VISUAL_KEY_RULES} | {key for _, key in CATEGORY_VISUAL_KEY_FALLBACKS}
+    assert rule_keys <= {case[-1] for case in golden}, "every visual key has a golden case"
+    for title, description, category, location, expected in golden:
+        assert infer_event_visual_key(title, description, category, location) == expected, (title, description, category, location, expected)
+    cases = [case[:4] for case in golden]
+
+    assert infer_event_visual_key("Lachnacht im TextilWerk") == "comedy_cabaret"
+    assert infer_event_visual_key("Kunstmarkt mit Live-Musik") == "art_exhibition_gallery"
+    assert infer_event_visual_key("Sommerabend", category="Innenstadt & Leben") == "city_festival_street"
+    assert infer_event_visual_key("") == "default_city"
+    assert COMPILED_EVENT_VISUAL_KEY_RULES.first_match("nichts passendes") == ""
+
+    for broken in (r"(konzert)", r"\b(konzert\b", r"\b(a(b)\b"):
+        try:
+            CompiledVisualKeyRules([("x", broken)])
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"broken visual key rule must fail: {broken!r}")
+
+    pool = {"pools": {"art_exhibition_gallery": {"images": [{"id": "motif-gap-art-market-01", "status": "ready", "visual_motif": "art_market"}]}}}
+    classifier = VisualClassifier(pool)
+    cityart = classifier.classify("CityArt Bocholt – Bocholter Kunstmarkt")
+    assert (cityart.visual_key, cityart.visual_motif, cityart.visual_asset_status) == ("art_exhibition_gallery", "art_market", "ok")
+    broad = classifier.classify("Jazz im FARB", visual_key="local_history_heritage")
+    assert broad.visual_key == broad.inferred_visual_key == "live_music_stage", broad
+    assert classifier.classify("Orgelnacht", visual_key="classical_music", visual_motif="choir").visual_motif == "choir"
+    assert classifier.classify("Weinfest", with_asset_status=False).visual_asset_status == ""
+    for title, description, category, location in cases[:500]:
+        classification = classifier.classify(title, description, category, location)
+        assert classification.inferred_visual_key == infer_event_visual_key(title, description, category, location)
+        assert classification.visual_motif == infer_event_visual_motif(title, description, category, location, classification.visual_key)
+        assert classification.as_fit() == infer_event_visual_fit(title, description, category, location, pool_payload=pool)
+
+    pool_index = load_event_visual_pool_index()
+    assert load_event_visual_pool_index() is pool_index
+    assert event_visual_pool_index(pool) is event_visual_pool_index(pool)
+    assert ready_motifs_for_key(pool, "art_exhibition_gallery") == {"art_market": 1}
+    gallery_images = pool["pools"]["art_exhibition_gallery"]["images"]
+    gallery_images[0]["status"] = "planned"
+    invalidate_event_visual_pool_index()
+    assert ready_motifs_for_key(pool, "art_exhibition_gallery") == {}, "invalidation rebuilds the index after in-place edits"
+    gallery_images[0]["status"] = "ready"
+    gallery_images.append({**gallery_images[0], "id": "art-exhibition-gallery-copy"})
+    invalidate_event_visual_pool_index()
+    assert ready_motifs_for_key(pool, "art_exhibition_gallery") == {"art_market": 2}
+    gallery_images.pop()
+    invalidate_event_visual_pool_index()
+    assert ready_motifs_for_key(pool, "art_exhibition_gallery") == {"art_market": 1}
+    batch_index = EventVisualPoolIndex(pool)
+    assert event_visual_pool_index(batch_index) is batch_index
+    assert infer_event_visual_fit(title="Kunstmarkt", pool_payload=batch_index) == infer_event_visual_fit(title="Kunstmarkt", pool_payload=pool)
+    assert pool_index.ready_count("art_exhibition_gallery", "art_market") == pool_index.ready_motifs("art_exhibition_gallery").get("art_market", 0)
+    with tempfile.TemporaryDirectory(prefix="be-event-visual-pool-") as temp_dir:
+        pool_path = Path(temp_dir) / "event_visual_pool.json"
+        pool_path.write_text(json.dumps(pool), encoding="utf-8")
+        first = load_event_visual_pool_index(pool_path)
+        assert load_event_visual_pool_index(pool_path) is first and first.ready_count("art_exhibition_gallery", "art_market") == 1
+        previous_mtime = pool_path.stat().st_mtime_ns
+        pool["pools"]["art_exhibition_gallery"]["images"][0]["status"] = "planned"
+        pool_path.write_text(json.dumps(pool), encoding="utf-8")
+        os.utime(pool_path, ns=(previous_mtime + 1_000_000, previous_mtime + 1_000_000))
+        reloaded = load_event_visual_pool_index(pool_path)
+        assert reloaded is not first and reloaded.ready_count("art_exhibition_gallery", "art_market") == 0
+        assert VisualClassifier(reloaded).classify("Kunstmarkt CityArt").visual_asset_status == "needs_asset"
+
+    print(f"=== Event Visual Keys: OK ({len(cases)} Faelle) ===")
+
+
+if __name__ == "__main__":
+    main()
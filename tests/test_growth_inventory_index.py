@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from growth_inventory_index import InventoryIndex, InventoryRow, describe_rows  # noqa: E402
+
+
+def main() -> None:
+    index = InventoryIndex.from_tabs({
+        "Events": [
+            ["title", "location", "description"],
+            ["Badminton-Turnier", "Sporthalle Bocholt", "Offenes Turnier für alle"],
+            ["Kinderflohmarkt", "Schützenplatz", ""],
+        ],
+        "Activities": [
+            ["name", "kategorie"],
+            ["Hallenbad BAHIA", "Schwimmen"],
+            ["", ""],
+        ],
+        "Locations": [],
+    })
+    assert len(index.rows) == 3, "header and empty rows are not indexed"
+    assert "title" not in index.tokens
+
+    assert index.covering_rows("schwimmen hallenbad bahia") == [InventoryRow("Activities", 2, "Hallenbad BAHIA")]
+    assert index.covering_rows("schuetzenplatz") == [InventoryRow("Events", 3, "Kinderflohmarkt")], "umlauts fold like normalize_identity_text"
+    assert index.covering_rows("Schützenplatz") == index.covering_rows("schuetzenplatz")
+    assert index.covering_rows("baden") == [], "no partial-word hits"
+
+    # Legacy substring mode keeps the old behaviour, including its false hit.
+    assert index.covered_by_substring("badm")
+    assert not index.covering_rows("badm")
+    assert describe_rows(index.covering_rows("bocholt sporthalle")) == ["Events!2: Badminton-Turnier"]
+    print("Growth inventory index: OK")
+
+
+if __name__ == "__main__":
+    main()
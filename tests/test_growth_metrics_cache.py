@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import datetime as dt
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import growth_metrics_cache as cache  # noqa: E402
+
+
+class Response:
+    def __init__(self, payload: dict) -> None:
+        self.payload = payload
+
+    def execute(self) -> dict:
+        return self.payload
+
+
+class FakeSearchConsole:
+    """Serves fixture rows page by page like searchanalytics().query()."""
+
+    def __init__(self, rows_per_day: dict[str, list[dict]]) -> None:
+        self.rows_per_day = rows_per_day
+        self.calls: list[dict] = []
+
+    def searchanalytics(self) -> "FakeSearchConsole":
+        return self
+
+    def query(self, siteUrl: str, body: dict) -> Response:
+        assert body["startDate"] == body["endDate"]
+        self.calls.append(body)
+        rows = self.rows_per_day.get(body["startDate"], [])
+        return Response({"rows": rows[body["startRow"]:body["startRow"] + body["rowLimit"]]})
+
+
+class FakeAnalyticsData:
+    """Serves fixture rows page by page like properties().runReport()."""
+
+    def __init__(self, rows_per_day: dict[str, list[dict]]) -> None:
+        self.rows_per_day = rows_per_day
+        self.calls: list[dict] = []
+
+    def properties(self) -> "FakeAnalyticsData":
+        return self
+
+    def runReport(self, property: str, body: dict) -> Response:
+        day = body["dateRanges"][0]["startDate"]
+        self.calls.append(body)
+        rows = self.rows_per_day.get(day, [])
+        return Response({"rows": rows[body["offset"]:body["offset"] + body["limit"]], "rowCount": len(rows)})
+
+
+def gsc_row(query: str, page: str, clicks: int, impressions: int, position: float) -> dict:
+    return {"keys": [query, page], "clicks": clicks, "impressions": impressions, "ctr": clicks / impressions, "position": position}
+
+
+def ga4_row(page: str, channel: str, sessions: int, engagement: float, duration: float) -> dict:
+    return {
+        "dimensionValues": [{"value": page}, {"value": channel}],
+        "metricValues": [{"value": str(sessions)}, {"value": str(engagement)}, {"value": str(duration)}],
+    }
+
+
+def main() -> None:
+    today = dt.date(2026, 5, 20)
+    days = cache.day_range("2026-05-10", "2026-05-19")
+    gsc_days = {
+        day: [gsc_row(f"hallenbad bocholt {n}", "/aktivitaeten/", 1, 10, 4.0) for n in range(7)]
+        + [gsc_row("was ist los bocholt", "/events/", 2, 20 + position, 3.0 + position)]
+        for position, day in enumerate(days)
+    }
+    ga4_days = {
+        day: [ga4_row("/events/", "Organic Search", 10, 0.2, 10.0), ga4_row("/", "Direct", 5 + position, 0.8, 60.0)]
+        for position, day in enumerate(days)
+    }
+    with tempfile.TemporaryDirectory(prefix="be-growth-cache-") as temp_name:
+        cache_dir = Path(temp_name)
+        gsc = FakeSearchConsole(gsc_days)
+        directory = cache.scope_dir(cache_dir, "gsc", "sc-domain:bocholt-erleben.de")
+
+        daily, stats = cache.cached_daily_rows(
+            directory, days[0], days[-1], lambda day: cache.fetch_gsc_day(gsc, "sc-domain", day, page_size=3), today=today
+        )
+        assert stats == {"days": 10, "cached_days": 0, "fetched_days": 10}, stats
+        assert len(daily) == 80, "pagination must not drop rows past the first page"
+        assert len(gsc.calls) == 30 and gsc.calls[2]["startRow"] == 6, "8 rows with page size 3 need 3 pages per day"
+        settled = [day for day in days if dt.date.fromisoformat(day) <= today - dt.timedelta(days=cache.SETTLE_DAYS)]
+        assert sorted(path.stem for path in directory.glob("*.jsonl")) == settled, "unsettled days must not be cached"
+
+        gsc.calls.clear()
+        again, stats = cache.cached_daily_rows(
+            directory, days[0], days[-1], lambda day: cache.fetch_gsc_day(gsc, "sc-domain", day, page_size=3), today=today
+        )
+        assert stats["cached_days"] == len(settled) and stats["fetched_days"] == 10 - len(settled), stats
+        assert again == daily, "cached days must read back the fetched rows"
+
+        aggregated = {row["query"]: row for row in cache.aggregate_gsc(daily)}
+        today_row = aggregated["was ist los bocholt"]
+        impressions = sum(20 + position for position in range(10))
+        assert today_row["impressions"] == impressions and today_row["clicks"] == 20
+        assert abs(today_row["ctr"] - 20 / impressions) < 1e-12
+        expected_position = sum((3.0 + p) * (20 + p) for p in range(10)) / impressions
+        assert abs(today_row["position"] - expected_position) < 1e-12, "position must be impression-weighted"
+
+        cache.cached_daily_rows(directory, days[5], days[-1], lambda day: [], today=today)
+        assert min(path.stem for path in directory.glob("*.jsonl")) == days[5], "days before the window are pruned"
+
+        ga4 = FakeAnalyticsData(ga4_days)
+        ga4_daily, _ = cache.cached_daily_rows(
+            cache.scope_dir(cache_dir, "ga4", "properties/1"),
+            days[0],
+            days[-1],
+            lambda day: cache.fetch_ga4_day(ga4, "properties/1", day, page_size=1),
+            today=today,
+        )
+        assert len(ga4_daily) == 20 and len(ga4.calls) == 20, "GA4 pagination follows offset up to rowCount"
+        rows = {row["channel"]: row for row in cache.aggregate_ga4(ga4_daily)}
+        assert rows["Organic Search"]["sessions"] == 100 and abs(rows["Organic Search"]["engagement_rate"] - 0.2) < 1e-12
+        assert rows["Direct"]["sessions"] == sum(5 + p for p in range(10)) and abs(rows["Direct"]["avg_duration"] - 60.0) < 1e-9
+
+    print("Growth metrics cache: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+from fake_sheets_service import FakeHttpError, FakeSheetsService  # noqa: E402
+from sheets_client import SheetsClient  # noqa: E402
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def main() -> None:
+    service = FakeSheetsService({
+        "Events": [["id", "title"], ["e1", "Stadtfest"]],
+        "Inbox": [["status", "title"], ["neu", "Flohmarkt"]],
+        "Inbox_Archive": [["status", "title"]],
+    })
+    clock = Clock()
+    with tempfile.TemporaryDirectory(prefix="be-sheets-client-") as temp_name:
+        snapshots = Path(temp_name)
+
+        def client() -> SheetsClient:
+            return SheetsClient(service, "sheet-1", snapshot_dir=snapshots, ttl=120, clock=clock)
+
+        first = client()
+        tabs = first.read_tabs(["Events", "Inbox", "Content_Search_Feedback"], optional=["Content_Search_Feedback"])
+        assert service.calls == ["spreadsheets.get", "values.batchGet"], "one title lookup + one batchGet for all tabs"
+        assert tabs["Events"][1] == ["e1", "Stadtfest"] and tabs["Content_Search_Feedback"] == []
+        assert first.read_tab("Inbox") == tabs["Inbox"] and len(service.calls) == 2, "a run reads a tab once"
+        assert first.stats.api_calls == 2 and first.stats.ranges_read == 2 and first.stats.cache_hits == 1
+        assert "2 API-Aufrufe" in first.stats.summary()
+
+        # A later step within the TTL only fetches the tab it has not seen yet.
+        clock.now += 60
+        second = client()
+        tabs = second.read_tabs(["Inbox", "Inbox_Archive"])
+        assert service.calls[2:] == ["values.batchGet"] and second.stats.cache_hits == 1 and second.stats.ranges_read == 1
+
+        # Writers read fresh; invalidate() drops the snapshots after a write.
+        service.tabs["Inbox"].append(["neu", "Lesung"])
+        assert client().read_tab("Inbox") != service.tabs["Inbox"], "snapshot is reused within its TTL"
+        assert client().read_tab("Inbox", max_age=0) == service.tabs["Inbox"]
+        service.tabs["Events"].append(["e2", "Kirmes"])
+        client().invalidate()
+        assert client().read_tab("Events") == service.tabs["Events"]
+
+        clock.now += 121
+        calls = len(service.calls)
+        client().read_tab("Inbox_Archive")
+        assert len(service.calls) == calls + 1, "expired snapshots are fetched again"
+
+        try:
+            client().read_tab("Fehlt")
+        except FakeHttpError as exc:
+            assert exc.resp.status == 400
+        else:
+            raise AssertionError("required missing tab must raise like the API")
+
+        disabled = SheetsClient(service, "sheet-1", snapshot_dir=snapshots, ttl=0, clock=clock)
+        calls = len(service.calls)
+        disabled.read_tab("Events")
+        assert len(service.calls) == calls + 1, "ttl=0 disables snapshots"
+
+    print("Sheets client: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import html
+import importlib.util
+import io
+import re
+import sys
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+FIXTURES = ROOT / "tests" / "fixtures" / "source_pages"
+# Rohe Quellseiten als *.html.fixture: keine Seiten dieses Repos, daher ausserhalb der Repo-weiten HTML-Audits.
+RE_META_CHARSET = re.compile(rb"charset=[\"']?([a-z0-9_-]+)", re.I)
+
+
+def load_audit_module():
+    spec = importlib.util.spec_from_file_location("content_quality_audit", ROOT / "scripts" / "content-quality-audit.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def legacy_evidence_text(raw: str, charset: str) -> str:
+    value = raw
+    value = re.sub(r"<script\b[^>]*>.*?</script>", " ", value, flags=re.I | re.S)
+    value = re.sub(r"<style\b[^>]*>.*?</style>", " ", value, flags=re.I | re.S)
+    value = re.sub(r"<[^>]+>", " ", value)
+    value = re.sub(r"\s+", " ", html.unescape(value)).strip().lower()
+    for src, target in {"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss", "–": "-", "—": "-"}.items():
+        value = value.replace(src, target)
+    return re.sub(r"\s+", " ", value)
+
+
+def chunked(raw: bytes, size: int) -> list[bytes]:
+    return [raw[position:position + size] for position in range(0, len(raw), size)]
+
+
+def main() -> None:
+    module = load_audit_module()
+    fixtures = sorted(FIXTURES.glob("*.html.fixture"))
+    assert fixtures, "source page fixtures missing"
+
+    for path in fixtures:
+        raw = path.read_bytes()
+        charset_match = RE_META_CHARSET.search(raw)
+        charset = charset_match.group(1).decode("ascii") if charset_match else "utf-8"
+        extracted = module.extract_source_text([raw], charset)
+        assert extracted.text and extracted.text == module.evidence_text(extracted.text), path.name
+        assert extracted.tokens == frozenset(module.evidence_tokens(extracted.text)), path.name
+        for size in (1, 7, 64, 4096):
+            assert module.extract_source_text(chunked(raw, size), charset) == extracted, (path.name, size)
+        legacy = legacy_evidence_text(raw.decode(charset, errors="ignore"), charset)
+        assert extracted.tokens <= frozenset(module.evidence_tokens(legacy)), path.name
+        for script_only in ("12.12.2012", "01.01.2000", "30 augustus", "cookie{", "trackpageview"):
+            assert script_only not in extracted.text, (path.name, script_only)
+
+    stadt = module.extract_source_text([(FIXTURES / "stadt-kunstmarkt.html.fixture").read_bytes()])
+    assert "30. august 2026" in stadt.text and "kaiser-wilhelm-strasse" in stadt.tokens and "wilhelm" in stadt.tokens
+    assert "<info" not in stadt.text and "hinweis fuer redaktion" not in stadt.text
+    grenzland = module.extract_source_text([(FIXTURES / "grenzland-markt-nl.html.fixture").read_bytes()], "iso-8859-1")
+    assert "grenzueberschreitende" in grenzland.tokens and "<info@vvv-dinxperlo.example>" in grenzland.text
+
+    limited = list(module.read_source_chunks(io.BytesIO(b"x" * 100_000), limit=70_000))
+    assert sum(len(chunk) for chunk in limited) == 70_000 and len(limited) == 2
+
+    today = date(2026, 8, 1)
+    url = "https://www.bocholt.de/veranstaltungen/kunstmarkt-cityart"
+    module.SOURCE_TEXT_CACHE[url] = ("ok", "200", stadt)
+    row = {"id": "kunstmarkt", "title": "Kunstmarkt CityArt", "date": "2026-08-30", "time": "11:00–18:00", "city": "Bocholt", "location": "Marktplatz"}
+    evidence = module.evaluate_event_source_evidence(row, "fixture", url, today=today, network=True)
+    assert evidence["evidence_status"] == "source_confirms_core_facts_with_weak_location", evidence
+    assert evidence["evidence_missing_fields"] == "", evidence
+
+    shifted = dict(row, date="2026-08-31", time="19:30", location="Stadtgarten Rhede")
+    evidence = module.evaluate_event_source_evidence(shifted, "fixture", url, today=today, network=True)
+    assert evidence["evidence_status"] == "source_evidence_weak", evidence
+    assert evidence["evidence_missing_fields"] == "date, start_time, location", evidence
+
+    # Teilwort-Treffer bleiben erhalten: "markt" steckt nur in "kunstmarkt"/"marktplatz".
+    assert module.text_has_tokens(stadt, ["markt"]) and not module.text_has_tokens(stadt, ["flohmarkt"])
+    assert module.source_text_has_time_hint(stadt) and not module.source_text_has_time_hint(module.EMPTY_SOURCE_TEXT)
+
+    print("=== Source Text Extractor: OK ===")
+
+
+if __name__ == "__main__":
+    main()
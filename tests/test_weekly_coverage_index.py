@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import types
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from weekly_coverage_index import CoverageIndex, TargetKeys  # noqa: E402
+
+FIXTURES = ROOT / "tests" / "fixtures" / "weekly_coverage_audit"
+
+# (id, date, title_key, url_keys) as coverage_audit computes them with norm_key/canonical_url.
+RECORDS = [
+    ("events-1", "2026-04-29", "eröffnung: sandbachpark", ("https://bocholt.de/veranstaltungskalender/eroeffnung-sandbachpark",)),
+    ("events-2", "2026-05-01", "internationales familienfest am lwl-museum textilwerk", ("",)),
+    ("events-3", "2026-05-01", "familienfest", ("https://bocholt.de/familienfest",)),
+    ("events-4", "2026-05-02", "", ("https://bocholt.de/familienfest/programm",)),
+    ("events-5", "", "bands in town", ("",)),
+]
+TARGETS = [
+    ("sandbachpark", TargetKeys("2026-04-29", ("eröffnung: sandbachpark", "sandbachpark"), ""), "events-1"),
+    ("alias-in-title", TargetKeys("2026-05-01", ("internationales familienfest",), ""), "events-2"),
+    ("title-in-alias", TargetKeys("2026-05-01", ("familienfest am textilwerk",), ""), "events-3"),
+    ("hint-only", TargetKeys("2026-05-02", ("gibt es nicht",), "bocholt.de/familienfest"), "events-4"),
+    ("undated", TargetKeys("", ("bands in town 2026",), ""), "events-5"),
+    ("wrong-day", TargetKeys("2026-04-30", ("sandbachpark",), ""), None),
+]
+
+
+def linear_first_match(target: TargetKeys) -> str | None:
+    """Former pairwise rule: date filter, alias/title substring either way, or hint in a URL."""
+    for record_id, date, title_key, url_keys in RECORDS:
+        if target.expected_date and date != target.expected_date:
+            continue
+        if title_key and any(alias in title_key or title_key in alias for alias in target.alias_keys):
+            return record_id
+        if target.hint and any(url and target.hint in url for url in url_keys):
+            return record_id
+    return None
+
+
+def load_weekly_script() -> Any:
+    """Weekly-Skript ohne Google-/OpenAI-Clients laden; coverage_audit braucht keinen davon."""
+    def stub(name: str, **attrs: Any) -> types.ModuleType:
+        module = types.ModuleType(name)
+        module.__dict__.update(attrs)
+        sys.modules.setdefault(name, module)
+        return sys.modules[name]
+
+    stub("google")
+    stub("google.oauth2", service_account=stub("google.oauth2.service_account"))
+    stub("googleapiclient")
+    stub("googleapiclient.discovery", build=lambda *args, **kwargs: None)
+    stub("openai", OpenAI=object)
+    spec = importlib.util.spec_from_file_location("weekly_coverage_audit_script", ROOT / "scripts" / "weekly-ki-websearch-to-manual-inbox.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def check_coverage_audit() -> None:
+    """coverage_audit gegen die Golden-Zeilen (erzeugt mit den frueheren paarweisen Scans)."""
+    weekly = load_weekly_script()
+    inputs = json.loads((FIXTURES / "inputs.json").read_text(encoding="utf-8"))
+    expected = json.loads((FIXTURES / "expected.json").read_text(encoding="utf-8"))
+    run_date = datetime.fromisoformat(inputs["today"])
+
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz: Any = None) -> datetime:
+            return run_date
+
+    weekly.datetime = FixedDatetime
+    weekly.SEARCH_WINDOW_DAYS = inputs["search_window_days"]
+    records = {name: [weekly.RefRecord(**row) for row in inputs[name]] for name in ("events_records", "inbox_records", "archive_records", "manual_records")}
+    rows = weekly.coverage_audit(
+        inputs["targets"],
+        inputs["raw_candidates"],
+        inputs["selected_candidates"],
+        inputs["drop_diagnostics"],
+        records["events_records"],
+        records["inbox_records"],
+        records["archive_records"],
+        records["manual_records"],
+    )
+    assert [row["id"] for row in rows] == [row["id"] for row in expected]
+    for row, golden in zip(rows, expected):
+        assert row == golden, (row, golden)
+    assert {row["status"] for row in rows} == {
+        "FOUND_SELECTED", "FOUND_RAW_DROPPED", "IN_EVENTS", "IN_INBOX", "IN_INBOX_ARCHIVE", "IN_MANUAL_JSON",
+        "PAST_TARGET", "TARGET_OUT_OF_ACTIVE_WINDOW", "MISSING_FROM_RAW",
+    }, "fixtures cover every coverage status"
+
+
+def main() -> None:
+    index = CoverageIndex()
+    for record_id, date, title_key, url_keys in RECORDS:
+        index.add(record_id, date, title_key, url_keys)
+    assert [entry.item for entry in index.by_date["2026-05-01"]] == ["events-2", "events-3"], "buckets keep record order"
+    for name, target, expected in TARGETS:
+        assert index.first_match(target) == expected == linear_first_match(target), name
+    check_coverage_audit()
+    print("Weekly coverage index: OK")
+
+
+if __name__ == "__main__":
+    main()
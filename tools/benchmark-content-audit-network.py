@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# === BEGIN FILE: tools/benchmark-content-audit-network.py | Zweck: misst sequenzielle URL-Pruefung gegen den parallelen Network-Prefetch des Content-Audits an einem lokalen Stand-in-Server mit kuenstlicher Latenz; Umfang: komplette Datei ===
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+LATENCY_SECONDS = 0.05
+
+
+class LatencyHandler(BaseHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return
+
+    def _serve(self, with_body: bool) -> None:
+        time.sleep(LATENCY_SECONDS)
+        body = b"<html><body><p>Veranstaltung am 30.08.2026 um 11:00 Uhr</p></body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(body)
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self._serve(False)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._serve(True)
+
+
+def load_audit_module():
+    spec = importlib.util.spec_from_file_location("content_quality_audit", ROOT / "scripts" / "content-quality-audit.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> None:
+    global LATENCY_SECONDS
+    parser = argparse.ArgumentParser(description="Benchmark Content-Audit URL-Pruefung: sequenziell vs. Prefetch.")
+    parser.add_argument("--urls", type=int, default=120, help="Anzahl eindeutiger URLs (Haelfte auch als Textprobe).")
+    parser.add_argument("--hosts", type=int, default=4, help="Anzahl simulierter Hosts (127.0.0.x).")
+    parser.add_argument("--latency", type=float, default=LATENCY_SECONDS, help="Kuenstliche Serverlatenz in Sekunden.")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--per-host", type=int, default=2)
+    parser.add_argument("--host-delay", type=float, default=0.0)
+    args = parser.parse_args()
+    LATENCY_SECONDS = args.latency
+
+    server = ThreadingHTTPServer(("0.0.0.0", 0), LatencyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    module = load_audit_module()
+    try:
+        check_urls = [f"http://127.0.0.{position % args.hosts + 1}:{port}/event/{position}" for position in range(args.urls)]
+        text_urls = check_urls[::2]
+
+        started = time.perf_counter()
+        sequential = [module.check_url(url) for url in check_urls] + [module.text_probe_url(url)[:2] for url in text_urls]
+        sequential_seconds = time.perf_counter() - started
+
+        module.URL_CHECK_CACHE.clear()
+        module.SOURCE_TEXT_CACHE.clear()
+        started = time.perf_counter()
+        stats = module.prefetch_network_checks(check_urls, text_urls, workers=args.workers, per_host=args.per_host, host_delay=args.host_delay)
+        prefetch_seconds = time.perf_counter() - started
+        prefetched = [module.check_url(url) for url in check_urls] + [module.text_probe_url(url)[:2] for url in text_urls]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if prefetched != sequential:
+        raise SystemExit("❌ Prefetch-Ergebnisse weichen von der sequenziellen Pruefung ab.")
+    print(f"Requests: {stats['check_urls']} Checks + {stats['text_urls']} Textproben auf {stats['hosts']} Hosts, Latenz {args.latency:.3f}s")
+    print(f" sequenziell: {sequential_seconds:7.2f}s")
+    print(f"    prefetch: {prefetch_seconds:7.2f}s (workers={args.workers}, per_host={args.per_host}, host_delay={args.host_delay})")
+    print(f"      Faktor: {sequential_seconds / max(prefetch_seconds, 1e-9):7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# === BEGIN FILE: tools/benchmark-event-detail-render.py | Zweck: misst render_page je 1.000 Detailseiten fuer den bisherigen f-String-Renderer (aus einer Git-Revision) gegen das vorkompilierte Seitenskelett und prueft byte-identische Ausgabe; Umfang: komplette Datei ===
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+GOLDEN_CASES = ROOT / "tests" / "fixtures" / "event_detail_golden" / "cases.json"
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_legacy_builder(ref: str, temp_dir: Path):
+    source = subprocess.run(
+        ["git", "show", f"{ref}:scripts/build-event-detail-pages.py"],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout
+    path = temp_dir / "legacy_build_event_detail_pages.py"
+    path.write_text(source, encoding="utf-8")
+    return load_module("legacy_build_event_detail_pages", path)
+
+
+def corpus(events_json: str, pages: int) -> list[tuple[dict, bool, bool]]:
+    if events_json:
+        data = json.loads(Path(events_json).read_text(encoding="utf-8"))
+        rows = data.get("events", []) if isinstance(data, dict) else data
+        base = [(row, False, False) for row in rows if isinstance(row, dict)]
+    else:
+        base = [(case["raw"], case["is_past"], case["noindex"]) for case in json.loads(GOLDEN_CASES.read_text(encoding="utf-8"))["cases"]]
+    out = []
+    for position in range(max(pages, len(base))):
+        raw, is_past, noindex = base[position % len(base)]
+        out.append((dict(raw, id=f"{raw.get('id')}-{position}"), is_past, noindex))
+    return out
+
+
+def render_ms(render, events: list) -> float:
+    started = time.perf_counter()
+    for event in events:
+        render(event)
+    return (time.perf_counter() - started) * 1000
+
+
+def per_1k_ms(legacy, current, legacy_events: list, current_events: list, repeat: int) -> tuple[float, float]:
+    """Beide Varianten abwechselnd messen, damit Lastschwankungen beide gleich treffen; bester Lauf zaehlt."""
+    legacy_best = current_best = float("inf")
+    for _ in range(repeat):
+        legacy_best = min(legacy_best, render_ms(legacy.render_page, legacy_events))
+        current_best = min(current_best, render_ms(current.render_page, current_events))
+    return legacy_best * 1000 / len(legacy_events), current_best * 1000 / len(current_events)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Event-Detailseiten: f-String-Renderer vs. vorkompiliertes Skelett.")
+    parser.add_argument(
+        "--legacy-ref",
+        required=True,
+        help="Git-Revision mit dem bisherigen f-String-Renderer, z. B. $(git merge-base HEAD origin/main).",
+    )
+    parser.add_argument("--events-json", default="", help="Echter Feed (z. B. data/events.json); ohne Angabe die Golden-Fixtures.")
+    parser.add_argument("--pages", type=int, default=1000, help="Anzahl gerenderter Seiten je Durchlauf.")
+    parser.add_argument("--repeat", type=int, default=10, help="Messdurchlaeufe je Variante (bester Wert zaehlt).")
+    args = parser.parse_args()
+
+    current = load_module("build_event_detail_pages_benchmark", ROOT / "scripts" / "event_detail_pages.py")
+    with tempfile.TemporaryDirectory(prefix="be-detail-render-bench-") as temp_dir:
+        legacy = load_legacy_builder(args.legacy_ref, Path(temp_dir))
+    rows = corpus(args.events_json, args.pages)
+    current_events = [current.build_detail_event(dict(raw), is_past, noindex, {}) for raw, is_past, noindex in rows]
+    legacy_events = [legacy.build_detail_event(dict(raw), is_past, noindex, {}) for raw, is_past, noindex in rows]
+    current_events = [event for event in current_events if event]
+    legacy_events = [event for event in legacy_events if event]
+
+    mismatches = [new.slug for old, new in zip(legacy_events, current_events) if legacy.render_page(old) != current.render_page(new)]
+    print(f"Seiten: {len(current_events)}, abweichend: {len(mismatches)}" + (f" (z. B. {mismatches[0]})" if mismatches else ""))
+
+    legacy_ms, current_ms = per_1k_ms(legacy, current, legacy_events, current_events, args.repeat)
+    print(f"{'Renderer':<22} {'ms/1k Seiten':>13}")
+    print(f"{'f-String (' + args.legacy_ref + ')':<22} {legacy_ms:>13.1f}")
+    print(f"{'Skelett':<22} {current_ms:>13.1f}")
+    print(f"Faktor: {legacy_ms / current_ms:.2f}x")
+    raise SystemExit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
+# === END FILE: tools/benchmark-event-detail-render.py ===
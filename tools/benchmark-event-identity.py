@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# === BEGIN FILE: tools/benchmark-event-identity.py | Zweck: misst EventIdentityIndex gegen den linearen find_best_event_match-Scan auf synthetischen Events-Sheets; Umfang: komplette Datei ===
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from event_identity import EventIdentityIndex, find_best_event_match, load_event_identity_contract  # noqa: E402
+
+WORDS = [
+    "kunstmarkt", "weinfest", "flohmarkt", "konzert", "lesung", "stadtfest", "kirmes", "jazz", "orgel", "familie",
+    "kinder", "sommer", "herbst", "advent", "nacht", "lauf", "radtour", "fuehrung", "ausstellung", "theater",
+    "kabarett", "markt", "musik", "open", "air", "textil", "museum", "park", "wasser", "schloss",
+]
+CITIES = ["Bocholt", "Rhede", "Isselburg", "Borken", "Hamminkeln", "Aalten", "Winterswijk"]
+LOCATIONS = ["Marktplatz", "Innenstadt", "Stadtpark", "Textilwerk", "Kubaai", "Aasee", "Rathaus", "Stadtmuseum"]
+HOSTS = ["bocholt.de", "www.bocholt.de", "rhede.de", "textilwerk.lwl.org", "kubaai.de", "example.org"]
+
+
+def synthetic_sheet(size: int, seed: int = 7) -> list[dict[str, str]]:
+    rng = random.Random(seed)
+    first_day = date(2026, 1, 1)
+    rows: list[dict[str, str]] = []
+    for position in range(size):
+        start = first_day + timedelta(days=rng.randrange(0, 3 * 365))
+        span = rng.choice([0, 0, 0, 0, 0, 1, 2, 6, 30, 120])
+        title = " ".join(rng.sample(WORDS, rng.randint(2, 4))).title()
+        row = {
+            "id": f"event-{position:06d}",
+            "title": title,
+            "date": start.isoformat(),
+            "endDate": (start + timedelta(days=span)).isoformat() if span else "",
+            "city": rng.choice(CITIES),
+            "location": rng.choice(LOCATIONS),
+            "url": f"https://{rng.choice(HOSTS)}/events/{title.lower().replace(' ', '-')}?utm_source=sheet",
+        }
+        if rows and rng.random() < 0.03:
+            twin = dict(rng.choice(rows))
+            twin["id"] = f"event-{position:06d}"
+            row = twin
+        rows.append(row)
+    return rows
+
+
+def run_size(size: int, sample: int) -> None:
+    contract = load_event_identity_contract()
+    rows = synthetic_sheet(size)
+
+    started = time.perf_counter()
+    index = EventIdentityIndex(contract=contract)
+    indexed_results = []
+    for row in rows:
+        indexed_results.append(index.find_best(row))
+        index.add(row)
+    indexed_seconds = time.perf_counter() - started
+
+    rng = random.Random(size)
+    positions = sorted(rng.sample(range(size), min(sample, size)))
+    started = time.perf_counter()
+    for position in positions:
+        linear = find_best_event_match(rows[position], rows[:position], contract)
+        if linear != indexed_results[position]:
+            raise SystemExit(f"❌ Abweichung bei Zeile {position}: {linear!r} != {indexed_results[position]!r}")
+    linear_per_lookup = (time.perf_counter() - started) / max(1, len(positions))
+    linear_estimate = linear_per_lookup * size
+
+    matches = sum(1 for result in indexed_results if result["status"] != "none")
+    print(
+        f"{size:>6} Zeilen | Index {indexed_seconds:8.2f}s | linear ~{linear_estimate:9.2f}s "
+        f"(hochgerechnet aus {len(positions)} Lookups) | Faktor ~{linear_estimate / max(indexed_seconds, 1e-9):7.1f} | Treffer {matches}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark EventIdentityIndex vs. linearer Identitaetsabgleich.")
+    parser.add_argument("--sizes", default="1000,10000,50000", help="Kommagetrennte Sheet-Groessen.")
+    parser.add_argument("--sample", type=int, default=200, help="Anzahl linearer Vergleichs-Lookups pro Groesse.")
+    args = parser.parse_args()
+    for raw in args.sizes.split(","):
+        run_size(int(raw), args.sample)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# === BEGIN FILE: tools/benchmark-event-visual-keys.py | Zweck: misst die kompilierte Visual-Key-Regel-Engine gegen die sequenzielle re.search-Kette; Umfang: komplette Datei ===
+from __future__ import annotations
+
+import argparse
+import csv
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from event_visual_keys import COMPILED_EVENT_VISUAL_KEY_RULES, EVENT_VISUAL_KEY_RULES  # noqa: E402
+
+FILLER = (
+    "Ein schöner Abend mit vielen Gästen in der Innenstadt von Bocholt, es gibt Speisen und Getränke "
+    "und ein buntes Programm für die ganze Familie. "
+)
+
+
+def haystacks() -> list[str]:
+    titles: list[str] = []
+    with (ROOT / "data" / "event_visual_motif_matrix.tsv").open(encoding="utf-8", newline="") as handle:
+        for row in csv.DictReader(handle, delimiter="\t"):
+            titles.extend(part.rsplit(" (", 1)[0] for part in (row.get("sheet_example_events") or "").split(" | ") if part)
+    return [f"{title} {FILLER * 3} Marktplatz".lower() for title in titles]
+
+
+def sequential(hay: str) -> str:
+    return next((key for key, pattern in EVENT_VISUAL_KEY_RULES if re.search(pattern, hay, re.IGNORECASE)), "")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark kompilierte Visual-Key-Regeln vs. sequenzielle Regex-Kette.")
+    parser.add_argument("--rounds", type=int, default=20, help="Durchlaeufe ueber alle Beispiel-Events.")
+    args = parser.parse_args()
+    texts = haystacks()
+    for hay in texts:
+        if sequential(hay) != COMPILED_EVENT_VISUAL_KEY_RULES.first_match(hay):
+            raise SystemExit(f"❌ Abweichung: {hay[:80]!r}")
+    calls = len(texts) * args.rounds
+    results = {}
+    for label, function in (("sequenziell", sequential), ("kompiliert", COMPILED_EVENT_VISUAL_KEY_RULES.first_match)):
+        started = time.perf_counter()
+        for _ in range(args.rounds):
+            for hay in texts:
+                function(hay)
+        results[label] = (time.perf_counter() - started) / calls
+        print(f"{label:>12}: {results[label] * 1e6:8.1f} µs/Event ({calls} Aufrufe)")
+    print(f"{'Faktor':>12}: {results['sequenziell'] / max(results['kompiliert'], 1e-12):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# === BEGIN FILE: tools/benchmark-source-text-extractor.py | Zweck: misst die bisherige Regex-HTML-Bereinigung plus evidence_text je Feldpruefung gegen den Streaming-Extraktor mit Token-Menge an gespeicherten Quellseiten; Umfang: komplette Datei ===
+from __future__ import annotations
+
+import argparse
+import html
+import importlib.util
+import re
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+FIXTURES = ROOT / "tests" / "fixtures" / "source_pages"
+ROWS = [
+    {"id": "kunstmarkt", "title": "Kunstmarkt CityArt", "date": "2026-08-30", "time": "11:00–18:00", "city": "Bocholt", "location": "Marktplatz"},
+    {"id": "sommerfest", "title": "Sommerfest im TextilWerk", "date": "2026-06-20", "time": "15:00", "city": "Bocholt", "location": "TextilWerk Bocholt"},
+    {"id": "grenzland", "title": "Grenzlandmarkt Dinxperlo Suderwick", "date": "2026-09-06", "endDate": "2026-09-07", "time": "10:00–17:00", "city": "Bocholt", "location": "Heelweg"},
+    {"id": "fehlt", "title": "Weihnachtsmarkt Stadtgarten", "date": "2026-12-01", "time": "", "city": "Rhede", "location": "Stadtgarten"},
+]
+
+
+def load_audit_module():
+    spec = importlib.util.spec_from_file_location("content_quality_audit", ROOT / "scripts" / "content-quality-audit.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def legacy_html_to_text(value: str) -> str:
+    value = re.sub(r"<script\b[^>]*>.*?</script>", " ", value, flags=re.I | re.S)
+    value = re.sub(r"<style\b[^>]*>.*?</style>", " ", value, flags=re.I | re.S)
+    value = re.sub(r"<[^>]+>", " ", value)
+    value = html.unescape(value)
+    value = re.sub(r"\s+", " ", value)
+    return value.strip()
+
+
+def legacy_field_checks(module, text: str, row: dict) -> int:
+    """Bisheriger Ablauf: jede Feldpruefung normalisiert den kompletten Quelltext erneut."""
+    hits = 0
+    for tokens in (module.significant_tokens(row["title"]), module.significant_tokens(row["city"], min_len=3, max_tokens=4), module.location_specific_tokens(row["location"], row["city"])):
+        haystack = module.evidence_text(text)
+        hits += sum(1 for token in tokens if token in haystack)
+    for variants in [module.date_variants(row["date"]), module.date_variants(row.get("endDate", ""))] + list(module.parse_time_range(row["time"]).values()):
+        haystack = module.evidence_text(text)
+        hits += any(variant in haystack for variant in variants)
+    if not row["time"]:
+        hits += bool(re.search(r"\b(?:[01]?\d|2[0-3])[:.][0-5]\d\b", module.evidence_text(text)))
+    return hits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Quellseiten-Textextraktion: Regex + evidence_text vs. Streaming-Extraktor.")
+    parser.add_argument("--repeat", type=int, default=30, help="Messdurchlaeufe je Variante.")
+    parser.add_argument("--page-kb", type=int, default=300, help="Zielgroesse der aufgeblaehten Testseite (Fixtures werden wiederholt).")
+    args = parser.parse_args()
+
+    module = load_audit_module()
+    module.log_checkpoint = lambda message: None
+    pages: list[tuple[str, bytes, str]] = []
+    for path in sorted(FIXTURES.glob("*.html.fixture")):
+        raw = path.read_bytes()
+        charset = "iso-8859-1" if b"iso-8859-1" in raw.lower() else "utf-8"
+        pages.append((path.name.removesuffix(".fixture"), raw, charset))
+    big = b"\n".join(raw for _name, raw, charset in pages if charset == "utf-8")
+    pages.append((f"aufgeblaeht-{args.page_kb}kb", big * max(1, args.page_kb * 1024 // len(big)), "utf-8"))
+
+    print(f"{'Seite':<28} {'Bytes':>9} {'alt ms':>9} {'neu ms':>9} {'Faktor':>7}")
+    today = date(2026, 8, 1)
+    for name, raw, charset in pages:
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            text = legacy_html_to_text(raw[:module.SOURCE_TEXT_MAX_BYTES].decode(charset, errors="ignore"))
+            for row in ROWS:
+                legacy_field_checks(module, text, row)
+        legacy_ms = (time.perf_counter() - started) * 1000 / args.repeat
+
+        url = f"https://example.test/{name}"
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            module.SOURCE_TEXT_CACHE[url] = ("ok", "200", module.extract_source_text(module.read_source_chunks(_BytesResponse(raw)), charset))
+            module.OBSERVATIONS.clear()
+            for row in ROWS:
+                module.evaluate_event_source_evidence(row, "benchmark", url, today=today, network=True)
+        new_ms = (time.perf_counter() - started) * 1000 / args.repeat
+        print(f"{name:<28} {len(raw):>9} {legacy_ms:>9.2f} {new_ms:>9.2f} {legacy_ms / new_ms:>6.1f}x")
+
+
+class _BytesResponse:
+    def __init__(self, raw: bytes) -> None:
+        self._raw = raw
+        self._position = 0
+
+    def read(self, size: int) -> bytes:
+        chunk = self._raw[self._position:self._position + size]
+        self._position += len(chunk)
+        return chunk
+
+
+if __name__ == "__main__":
+    main()
+# === END FILE: tools/benchmark-source-text-extractor.py ===